@@ -0,0 +1,286 @@
+"""
+Bounded session activity store.
+
+Keeps the session activity served by /api/activity in fixed memory:
+
+- The timeline is a ring buffer of TIMELINE_SIZE tool calls with a
+  tool id -> slot index, so starting and completing a call is O(1). The
+  oldest call is evicted when the buffer is full.
+- Full tool outputs (for drill-down) live in an LRU store capped at
+  OUTPUT_CACHE_BYTES. Outputs pushed out of memory are written to a spill
+  directory when one is configured, otherwise dropped (the entry keeps its
+  output summary). Outputs of evicted calls are dropped too.
+- Every change gets a version number. A cursor ("<epoch>-<version>")
+  returned with each snapshot lets callers fetch only the calls started or
+  completed since (`snapshot(since=cursor)`). A cleared store or a
+  restarted server has a new epoch, so old cursors get a full snapshot
+  flagged `reset`.
+
+Self-contained (stdlib only); all methods are thread-safe.
+"""
+
+import logging
+import secrets
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Tool calls kept in the timeline
+TIMELINE_SIZE = 1000
+# Bytes of full tool outputs kept in memory
+OUTPUT_CACHE_BYTES = 16 * 1024 * 1024
+
+
+class _OutputStore:
+    """LRU map of tool id -> full output, bounded by total size."""
+
+    def __init__(self, max_bytes: int, spill_dir: Optional[Path] = None):
+        self.max_bytes = max_bytes
+        self.spill_dir = spill_dir
+        self._outputs: "OrderedDict[str, str]" = OrderedDict()
+        self._spilled: set = set()
+        self.size = 0
+
+    def put(self, tool_id: str, output: str):
+        self.discard(tool_id)
+        self._outputs[tool_id] = output
+        self.size += len(output)
+        while self.size > self.max_bytes and self._outputs:
+            evicted_id, evicted = self._outputs.popitem(last=False)
+            self.size -= len(evicted)
+            self._spill(evicted_id, evicted)
+
+    def get(self, tool_id: str) -> Optional[str]:
+        output = self._outputs.get(tool_id)
+        if output is not None:
+            self._outputs.move_to_end(tool_id)
+            return output
+        if tool_id in self._spilled:
+            try:
+                return self._spill_path(tool_id).read_text()
+            except OSError as e:
+                logger.warning(f"Could not read spilled output for {tool_id}: {e}")
+        return None
+
+    def discard(self, tool_id: str):
+        output = self._outputs.pop(tool_id, None)
+        if output is not None:
+            self.size -= len(output)
+        if tool_id in self._spilled:
+            self._spilled.discard(tool_id)
+            try:
+                self._spill_path(tool_id).unlink()
+            except OSError:
+                pass
+
+    def clear(self):
+        for tool_id in list(self._spilled):
+            self.discard(tool_id)
+        self._outputs.clear()
+        self.size = 0
+
+    def _spill(self, tool_id: str, output: str):
+        if self.spill_dir is None:
+            return
+        try:
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+            self._spill_path(tool_id).write_text(output)
+            self._spilled.add(tool_id)
+        except OSError as e:
+            logger.warning(f"Could not spill output for {tool_id}: {e}")
+
+    def _spill_path(self, tool_id: str) -> Path:
+        # Tool ids come from the runtime; keep them to a safe file name
+        safe = "".join(c if c.isalnum() or c in "-_" else "_" for c in tool_id)
+        return self.spill_dir / f"{safe}.out"
+
+
+class ActivityStore:
+    """Session activity: status, counters, bounded timeline and tool outputs."""
+
+    def __init__(
+        self,
+        timeline_size: int = TIMELINE_SIZE,
+        output_cache_bytes: int = OUTPUT_CACHE_BYTES,
+        spill_dir: Optional[str] = None,
+    ):
+        self.timeline_size = timeline_size
+        self._lock = threading.Lock()
+        self._outputs = _OutputStore(output_cache_bytes, Path(spill_dir) if spill_dir else None)
+        self._version = 0
+        self._reset()
+
+    def _reset(self):
+        self._slots: List[Optional[Dict[str, Any]]] = [None] * self.timeline_size
+        self._index: Dict[str, int] = {}  # tool id -> slot
+        self._next_seq = 0
+        # tool id -> version of its last change, oldest change first
+        self._changes: "OrderedDict[str, int]" = OrderedDict()
+        self._running = 0
+        self._epoch = secrets.token_hex(4)
+        self.status = "idle"
+        self.active_tool: Optional[Dict[str, Any]] = None
+        self.tool_counts: Dict[str, int] = {}
+        self.totals = {"calls": 0, "duration_ms": 0, "started_at": None}
+
+    @property
+    def cursor(self) -> str:
+        return f"{self._epoch}-{self._version}"
+
+    def clear(self):
+        """Drop all activity; outstanding cursors get a full snapshot next."""
+        with self._lock:
+            self._outputs.clear()
+            self._reset()
+
+    def start(self, tool_id: str, tool: str, input_data: Any, input_summary: str, now: datetime):
+        """Record the start of a tool call."""
+        started_at = now.isoformat()
+        with self._lock:
+            self.status = "running"
+            self.active_tool = {
+                "name": tool,
+                "input_summary": input_summary,
+                "started_at": started_at,
+            }
+            if self.totals["started_at"] is None:
+                self.totals["started_at"] = started_at
+            self.tool_counts[tool] = self.tool_counts.get(tool, 0) + 1
+            self.totals["calls"] += 1
+
+            if tool_id in self._index:
+                # Same id reported twice: the newer call replaces the older
+                self._evict(self._index[tool_id])
+
+            slot = self._next_seq % self.timeline_size
+            if self._slots[slot] is not None:
+                self._evict(slot)
+            self._slots[slot] = {
+                "id": tool_id,
+                "seq": self._next_seq,
+                "tool": tool,
+                "input": input_data,
+                "input_summary": input_summary,
+                "output_summary": None,
+                "duration_ms": None,
+                "started_at": started_at,
+                "ended_at": None,
+                "success": None,
+                "status": "running",
+            }
+            self._index[tool_id] = slot
+            self._next_seq += 1
+            self._running += 1
+            self._touch(tool_id)
+
+    def complete(
+        self,
+        tool_id: str,
+        success: bool,
+        now: datetime,
+        output_summary: Optional[str] = None,
+        output: Optional[str] = None,
+    ):
+        """Record the completion of a running tool call (unknown ids are ignored)."""
+        with self._lock:
+            slot = self._index.get(tool_id)
+            entry = self._slots[slot] if slot is not None else None
+            if entry is not None and entry["status"] == "running":
+                started_at = datetime.fromisoformat(entry["started_at"])
+                duration_ms = int((now - started_at).total_seconds() * 1000)
+                entry["ended_at"] = now.isoformat()
+                entry["duration_ms"] = duration_ms
+                entry["success"] = success
+                entry["status"] = "completed"
+                entry["output_summary"] = output_summary
+                self.totals["duration_ms"] += duration_ms
+                self._running -= 1
+                if output:
+                    self._outputs.put(tool_id, output)
+                self._touch(tool_id)
+
+            self.active_tool = None
+            if self._running == 0:
+                self.status = "idle"
+
+    def get(self, tool_id: str) -> Optional[Dict[str, Any]]:
+        """Copy of a timeline entry, or None if unknown or evicted."""
+        with self._lock:
+            slot = self._index.get(tool_id)
+            return dict(self._slots[slot]) if slot is not None else None
+
+    def get_output(self, tool_id: str) -> Optional[str]:
+        """Full output of a completed call, if still kept."""
+        with self._lock:
+            return self._outputs.get(tool_id)
+
+    def snapshot(self, since: Optional[str] = None, limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Session activity in the /api/activity shape.
+
+        Without `since`, `timeline` holds every kept call, newest first.
+        With a cursor from an earlier snapshot it holds only the calls
+        started or completed after it (also newest first by start), unless
+        the cursor is from another epoch, which returns everything with
+        `reset: true`. `limit` caps the number of timeline entries.
+        """
+        with self._lock:
+            reset = False
+            version = self._parse_cursor(since)
+            if since is not None and version is None:
+                reset = True
+
+            if version is None:
+                oldest = max(0, self._next_seq - self.timeline_size)
+                slots = (self._slots[seq % self.timeline_size] for seq in range(self._next_seq - 1, oldest - 1, -1))
+                entries = [entry for entry in slots if entry is not None]
+            else:
+                changed = []
+                for tool_id in reversed(self._changes):
+                    if self._changes[tool_id] <= version:
+                        break
+                    changed.append(self._slots[self._index[tool_id]])
+                entries = sorted(changed, key=lambda e: e["seq"], reverse=True)
+
+            if limit is not None:
+                entries = entries[:limit]
+
+            return {
+                "status": self.status,
+                "active_tool": dict(self.active_tool) if self.active_tool else None,
+                "tool_counts": dict(self.tool_counts),
+                "timeline": [dict(e) for e in entries],
+                "totals": dict(self.totals),
+                "cursor": self.cursor,
+                "reset": reset,
+            }
+
+    def _parse_cursor(self, cursor: Optional[str]) -> Optional[int]:
+        """Version of a cursor from the current epoch, else None."""
+        if not cursor:
+            return None
+        epoch, _, version = cursor.partition("-")
+        if epoch != self._epoch or not version.isdigit():
+            return None
+        version = int(version)
+        return version if version <= self._version else None
+
+    def _touch(self, tool_id: str):
+        self._version += 1
+        self._changes[tool_id] = self._version
+        self._changes.move_to_end(tool_id)
+
+    def _evict(self, slot: int):
+        entry = self._slots[slot]
+        self._slots[slot] = None
+        tool_id = entry["id"]
+        if self._index.get(tool_id) == slot:
+            del self._index[tool_id]
+            self._changes.pop(tool_id, None)
+            self._outputs.discard(tool_id)
+        if entry["status"] == "running":
+            self._running -= 1
@@ -38,3 +38,8 @@ GEMINI_CONTEXT_WINDOW = 1000000  # 1M tokens
 # Git configuration
 GIT_TIMEOUT_SECONDS = 60
 
+
+# Session activity store (/api/activity)
+ACTIVITY_TIMELINE_SIZE = int(os.getenv("ACTIVITY_TIMELINE_SIZE", "1000"))  # tool calls kept
+ACTIVITY_OUTPUT_CACHE_BYTES = int(os.getenv("ACTIVITY_OUTPUT_CACHE_BYTES", str(16 * 1024 * 1024)))
+ACTIVITY_OUTPUT_SPILL_DIR = os.getenv("ACTIVITY_OUTPUT_SPILL_DIR") or None  # unset: evicted outputs dropped
@@ -77,11 +77,14 @@ def run_server():
 
     # Bind to 0.0.0.0 for Docker internal network communication
     # Port is NOT exposed externally - backend proxies requests via Docker network
+    # Keep-alive outlives the backend's pooled idle connections (AGENT_HTTP_KEEPALIVE_EXPIRY)
+    # so reused connections are not closed by the server mid-request
     uvicorn.run(
         app,
         host="0.0.0.0",
         port=port,
-        log_level="info"
+        log_level="info",
+        timeout_keep_alive=75
     )
 
 
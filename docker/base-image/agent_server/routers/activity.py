@@ -1,7 +1,9 @@
 """
 Session activity endpoints for real-time monitoring.
 """
-from fastapi import APIRouter, HTTPException
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query
 
 from ..state import agent_state
 
@@ -9,7 +11,10 @@ router = APIRouter()
 
 
 @router.get("/api/activity")
-async def get_session_activity():
+async def get_session_activity(
+    since: Optional[str] = Query(None, description="Cursor from a previous response"),
+    limit: Optional[int] = Query(None, ge=1, description="Max timeline entries"),
+):
     """
     Get session activity summary for real-time monitoring.
 
@@ -17,10 +22,14 @@ async def get_session_activity():
     - status: "running" or "idle"
     - active_tool: currently executing tool (if any)
     - tool_counts: count of each tool used
-    - timeline: list of tool executions (newest first)
+    - timeline: list of tool executions (newest first, bounded)
     - totals: aggregate statistics
+    - cursor: pass as `since` to get only tool calls started or
+      completed after this response
+    - reset: true when `since` was not usable (activity cleared or agent
+      restarted) and the full timeline was returned instead
     """
-    return agent_state.session_activity
+    return agent_state.activity.snapshot(since=since, limit=limit)
 
 
 @router.get("/api/activity/{tool_id}")
@@ -30,24 +39,25 @@ async def get_tool_call_detail(tool_id: str):
 
     Returns the complete input and output for drill-down inspection.
     """
-    # Find the timeline entry
-    for entry in agent_state.session_activity["timeline"]:
-        if entry["id"] == tool_id:
-            # Get full output from tool_outputs if available
-            full_output = agent_state.tool_outputs.get(tool_id, entry.get("output_summary", ""))
+    entry = agent_state.activity.get(tool_id)
+    if entry is None:
+        raise HTTPException(status_code=404, detail=f"Tool call {tool_id} not found")
 
-            return {
-                "id": entry["id"],
-                "tool": entry["tool"],
-                "input": entry["input"],
-                "output": full_output,
-                "duration_ms": entry["duration_ms"],
-                "started_at": entry["started_at"],
-                "ended_at": entry["ended_at"],
-                "success": entry["success"]
-            }
+    # Full output if still kept, else the summary
+    full_output = agent_state.activity.get_output(tool_id)
+    if full_output is None:
+        full_output = entry.get("output_summary", "")
 
-    raise HTTPException(status_code=404, detail=f"Tool call {tool_id} not found")
+    return {
+        "id": entry["id"],
+        "tool": entry["tool"],
+        "input": entry["input"],
+        "output": full_output,
+        "duration_ms": entry["duration_ms"],
+        "started_at": entry["started_at"],
+        "ended_at": entry["ended_at"],
+        "success": entry["success"]
+    }
 
 
 @router.delete("/api/activity")
@@ -58,8 +68,7 @@ async def clear_session_activity():
     This only clears the activity tracking, not the conversation history.
     Use DELETE /api/chat/history to clear everything.
     """
-    agent_state.session_activity = agent_state._create_empty_activity()
-    agent_state.tool_outputs = {}
+    agent_state.activity.clear()
     return {
         "status": "cleared",
         "message": "Session activity cleared"
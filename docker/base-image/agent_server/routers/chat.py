@@ -4,11 +4,11 @@ Chat endpoints for the agent server.
 Now supports multiple runtimes (Claude Code, Gemini CLI) via runtime adapter.
 """
 import json
-import asyncio
 import logging
 from datetime import datetime
+from typing import Optional
 
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect, HTTPException
+from fastapi import APIRouter, Header, WebSocket, WebSocketDisconnect, HTTPException
 from fastapi.responses import StreamingResponse
 
 from ..models import ChatRequest, ModelRequest, ParallelTaskRequest
@@ -270,6 +270,29 @@ async def terminate_execution(execution_id: str):
         raise HTTPException(status_code=500, detail=result.get("error", "Termination failed"))
 
 
+@router.post("/api/executions/terminate-all")
+async def terminate_all_executions(graceful_timeout: float = 5):
+    """
+    Terminate every running execution (e.g. platform emergency stop).
+
+    Returns once SIGINT has been sent to each execution; SIGKILL follows
+    after graceful_timeout seconds for those still running.
+    """
+    registry = get_process_registry()
+    results = registry.terminate_all(graceful_timeout=graceful_timeout)
+    terminated = [exec_id for exec_id, result in results.items() if result["success"]]
+    if terminated:
+        logger.info(f"[Terminate] Terminating {len(terminated)} executions: {', '.join(terminated)}")
+    return {
+        "terminated": terminated,
+        "errors": {
+            exec_id: result.get("error", result["reason"])
+            for exec_id, result in results.items()
+            if not result["success"] and result["reason"] == "error"
+        }
+    }
+
+
 @router.get("/api/executions/running")
 async def list_running_executions():
     """
@@ -299,71 +322,57 @@ async def get_execution_status(execution_id: str):
 # Live Execution Streaming Endpoints
 # ============================================================================
 
+def _sse_event(entry: dict, seq=None) -> str:
+    """Format an SSE event; log entries carry their sequence id as the event id."""
+    event_id = f"id: {seq}\n" if seq is not None else ""
+    return f"{event_id}data: {json.dumps(entry)}\n\n"
+
+
 @router.get("/api/executions/{execution_id}/stream")
-async def stream_execution_log(execution_id: str):
+async def stream_execution_log(
+    execution_id: str,
+    last_event_id: Optional[str] = Header(None),
+):
     """
     Stream execution log entries via Server-Sent Events (SSE).
 
     Sends log entries in real-time as they are produced by Claude Code.
-    If the execution is already running, first sends all buffered entries,
-    then streams new ones.
+    First sends the buffered entries (up to the last 1000), then streams new
+    ones. Executions that finished within the last minute are still served.
 
     SSE Event format:
+    - id: sequence id of the log entry (1, 2, ...)
     - data: JSON-encoded log entry from Claude Code
+    - {"type": "stream_gap", "missed": n} (no id) if entries this client
+      should have received are no longer buffered
     - Final message: {"type": "stream_end"}
 
+    A client that reconnects with a Last-Event-ID header only receives the
+    entries after that id.
+
     Note: This endpoint has no authentication - security is handled by the
     backend proxy which validates user access before proxying to agent.
     """
     registry = get_process_registry()
 
-    # Check if execution exists
-    if not registry.is_execution_running(execution_id):
-        # Try to get buffered logs for recently completed execution
-        buffered = registry.get_buffered_logs(execution_id)
-        if buffered is None:
-            raise HTTPException(status_code=404, detail="Execution not found")
-
-        # Return buffered logs as static stream (for completed executions)
-        async def static_generator():
-            for entry in buffered:
-                yield f"data: {json.dumps(entry)}\n\n"
-            yield f"data: {json.dumps({'type': 'stream_end'})}\n\n"
-
-        return StreamingResponse(
-            static_generator(),
-            media_type="text/event-stream",
-            headers={
-                "Cache-Control": "no-cache",
-                "Connection": "keep-alive",
-                "X-Accel-Buffering": "no"
-            }
-        )
-
-    # Subscribe to live stream
-    queue = registry.subscribe_logs(execution_id)
-    if queue is None:
+    # Running, or finished recently enough that the buffer is still kept
+    if not registry.has_logs(execution_id):
         raise HTTPException(status_code=404, detail="Execution not found")
 
+    try:
+        after_seq = max(int(last_event_id), 0) if last_event_id else 0
+    except ValueError:
+        after_seq = 0
+
     async def event_generator():
-        """Generate SSE events from the log queue."""
-        try:
-            while True:
-                try:
-                    # Wait for next entry with timeout (allows checking if client disconnected)
-                    entry = await asyncio.wait_for(queue.get(), timeout=30.0)
-
-                    yield f"data: {json.dumps(entry)}\n\n"
-
-                    # Check if stream ended
-                    if entry.get("type") == "stream_end":
-                        break
-                except asyncio.TimeoutError:
-                    # Send keepalive comment
-                    yield ": keepalive\n\n"
-        finally:
-            # Unsubscribe when client disconnects
-            registry.unsubscribe_logs(execution_id, queue)
+        """Generate SSE events from the execution's log."""
+        async for item in registry.iter_logs(execution_id, after_seq=after_seq, idle_timeout=30.0):
+            if item is None:
+                # Send keepalive comment
+                yield ": keepalive\n\n"
+                continue
+            seq, entry = item
+            yield _sse_event(entry, seq)
 
     return StreamingResponse(
         event_generator(),
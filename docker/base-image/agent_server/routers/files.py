@@ -1,16 +1,25 @@
 """
 File browser endpoints.
 """
+import asyncio
 import logging
 import mimetypes
 import shutil
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import PlainTextResponse, FileResponse
+from fastapi import APIRouter, Header, HTTPException, Query
+from fastapi.responses import PlainTextResponse, FileResponse, JSONResponse, Response
 from pydantic import BaseModel
 
+from ..services.file_tree import (
+    MAX_PAGE_SIZE,
+    etag_matches,
+    get_file_tree,
+    parse_ignore,
+)
+
 
 class FileUpdateRequest(BaseModel):
     """Request body for file updates."""
@@ -21,16 +30,31 @@ router = APIRouter()
 
 
 @router.get("/api/files")
-async def list_files(path: str = "/home/developer", show_hidden: bool = False):
+async def list_files(
+    path: str = "/home/developer",
+    show_hidden: bool = False,
+    depth: Optional[int] = Query(None, ge=1),
+    offset: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    ignore: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None),
+):
     """
-    List files in the workspace directory recursively.
+    List files in the workspace directory.
     Only allows access to /home/developer for security.
 
     Args:
         path: Directory path to list
         show_hidden: If True, include hidden files (starting with .)
-
-    Returns a hierarchical tree structure with folders and files.
+        depth: Directory levels to include (1 = only this directory); whole tree if omitted
+        offset: Entries of the requested directory to skip
+        limit: Maximum entries returned per directory; all if omitted
+        ignore: Comma-separated name patterns not to walk (e.g. node_modules,.git)
+
+    Returns a hierarchical tree structure with folders and files. Folders
+    that were not walked have "loaded": false; folders with more entries
+    than limit have "has_more": true. Answers 304 when If-None-Match
+    matches the listing's ETag.
     """
     # Security: Only allow workspace access
     allowed_base = Path("/home/developer")
@@ -43,71 +67,29 @@ async def list_files(path: str = "/home/developer", show_hidden: bool = False):
     if not requested_path.exists():
         raise HTTPException(status_code=404, detail=f"Path not found: {path}")
 
-    def build_tree(directory: Path, base_path: Path, include_hidden: bool) -> dict:
-        """Build a hierarchical tree structure from a directory."""
-        items = []
-        total_files = 0
-
-        try:
-            # Get all items in directory
-            dir_items = sorted(directory.iterdir(), key=lambda x: (not x.is_dir(), x.name.lower()))
-
-            for item in dir_items:
-                # Skip hidden items unless show_hidden is True
-                if item.name.startswith('.') and not include_hidden:
-                    continue
-
-                try:
-                    stat = item.stat()
-                    relative_path = item.relative_to(base_path)
-
-                    if item.is_dir():
-                        # Recursively build tree for subdirectory
-                        subtree = build_tree(item, base_path, include_hidden)
-                        items.append({
-                            "name": item.name,
-                            "path": str(relative_path),
-                            "type": "directory",
-                            "children": subtree["children"],
-                            "file_count": subtree["file_count"],
-                            "modified": datetime.fromtimestamp(stat.st_mtime).isoformat()
-                        })
-                        total_files += subtree["file_count"]
-                    else:
-                        # It's a file
-                        items.append({
-                            "name": item.name,
-                            "path": str(relative_path),
-                            "type": "file",
-                            "size": stat.st_size,
-                            "modified": datetime.fromtimestamp(stat.st_mtime).isoformat()
-                        })
-                        total_files += 1
-
-                except Exception as e:
-                    logger.warning(f"Failed to process item {item}: {e}")
-                    continue
-
-        except Exception as e:
-            logger.error(f"Failed to read directory {directory}: {e}")
-
-        return {"children": items, "file_count": total_files}
+    if not requested_path.is_dir():
+        raise HTTPException(status_code=400, detail=f"Not a directory: {path}")
 
     try:
-        tree_data = build_tree(requested_path, allowed_base, show_hidden)
-
-        return {
-            "base_path": str(allowed_base),
-            "requested_path": str(requested_path.relative_to(allowed_base)) if requested_path != allowed_base else ".",
-            "tree": tree_data["children"],
-            "total_files": tree_data["file_count"],
-            "show_hidden": show_hidden
-        }
-
+        listing, etag = await asyncio.to_thread(
+            get_file_tree().list,
+            requested_path,
+            depth=depth,
+            offset=offset,
+            limit=limit,
+            show_hidden=show_hidden,
+            ignore=parse_ignore(ignore),
+        )
     except Exception as e:
         logger.error(f"File listing error: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to list files: {str(e)}")
 
+    # no-cache: clients may keep the listing but must revalidate it
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return JSONResponse(listing, headers=headers)
+
 
 @router.get("/api/files/download")
 async def download_file(path: str):
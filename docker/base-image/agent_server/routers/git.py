@@ -1,6 +1,8 @@
 """
 Git sync endpoints for GitHub bidirectional sync.
 """
+import asyncio
+import functools
 import subprocess
 import logging
 from datetime import datetime
@@ -9,130 +11,35 @@ from pathlib import Path
 from fastapi import APIRouter, HTTPException
 
 from ..models import GitSyncRequest, GitPullRequest
+from ..services.git_status import get_git_status_service
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+def _invalidates_git_status(endpoint):
+    """Drop the cached git status once the endpoint is done (it may move HEAD or remote refs)."""
+    @functools.wraps(endpoint)
+    async def wrapper(*args, **kwargs):
+        try:
+            return await endpoint(*args, **kwargs)
+        finally:
+            get_git_status_service().invalidate()
+    return wrapper
+
+
 @router.get("/api/git/status")
 async def get_git_status():
     """
     Get git repository status including current branch, changes, and sync state.
     Only available for agents with git sync enabled.
-    """
-    home_dir = Path("/home/developer")
-    git_dir = home_dir / ".git"
-
-    if not git_dir.exists():
-        return {
-            "git_enabled": False,
-            "message": "Git sync not enabled for this agent"
-        }
 
+    Served from a short-lived cache that is keyed on git metadata
+    (see services/git_status.py).
+    """
     try:
-        # Get current branch
-        branch_result = subprocess.run(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-            capture_output=True,
-            text=True,
-            cwd=str(home_dir),
-            timeout=10
-        )
-        current_branch = branch_result.stdout.strip() if branch_result.returncode == 0 else "unknown"
-
-        # Get status (modified, untracked files)
-        status_result = subprocess.run(
-            ["git", "status", "--porcelain"],
-            capture_output=True,
-            text=True,
-            cwd=str(home_dir),
-            timeout=10
-        )
-        changes = []
-        if status_result.returncode == 0 and status_result.stdout.strip():
-            for line in status_result.stdout.strip().split('\n'):
-                if line:
-                    status_code = line[:2]
-                    filepath = line[3:]
-                    changes.append({
-                        "status": status_code.strip(),
-                        "path": filepath
-                    })
-
-        # Get last commit
-        log_result = subprocess.run(
-            ["git", "log", "-1", "--format=%H|%h|%s|%an|%ai"],
-            capture_output=True,
-            text=True,
-            cwd=str(home_dir),
-            timeout=10
-        )
-        last_commit = None
-        if log_result.returncode == 0 and log_result.stdout.strip():
-            parts = log_result.stdout.strip().split('|')
-            if len(parts) >= 5:
-                last_commit = {
-                    "sha": parts[0],
-                    "short_sha": parts[1],
-                    "message": parts[2],
-                    "author": parts[3],
-                    "date": parts[4]
-                }
-
-        # Check if we're ahead/behind remote
-        fetch_result = subprocess.run(
-            ["git", "fetch", "--dry-run"],
-            capture_output=True,
-            text=True,
-            cwd=str(home_dir),
-            timeout=30
-        )
-
-        ahead_behind_result = subprocess.run(
-            ["git", "rev-list", "--left-right", "--count", f"origin/{current_branch}...HEAD"],
-            capture_output=True,
-            text=True,
-            cwd=str(home_dir),
-            timeout=10
-        )
-        ahead = 0
-        behind = 0
-        if ahead_behind_result.returncode == 0:
-            parts = ahead_behind_result.stdout.strip().split()
-            if len(parts) == 2:
-                behind = int(parts[0])
-                ahead = int(parts[1])
-
-        # Get remote URL (without credentials)
-        remote_result = subprocess.run(
-            ["git", "remote", "get-url", "origin"],
-            capture_output=True,
-            text=True,
-            cwd=str(home_dir),
-            timeout=10
-        )
-        remote_url = ""
-        if remote_result.returncode == 0:
-            url = remote_result.stdout.strip()
-            # Remove credentials from URL for display
-            if '@github.com' in url:
-                remote_url = "https://github.com/" + url.split('@github.com/')[1]
-            else:
-                remote_url = url
-
-        return {
-            "git_enabled": True,
-            "branch": current_branch,
-            "remote_url": remote_url,
-            "last_commit": last_commit,
-            "changes": changes,
-            "changes_count": len(changes),
-            "ahead": ahead,
-            "behind": behind,
-            "sync_status": "up_to_date" if ahead == 0 and len(changes) == 0 else "pending_sync"
-        }
-
-    except subprocess.TimeoutExpired:
+        return await get_git_status_service().get_status()
+    except asyncio.TimeoutError:
         raise HTTPException(status_code=504, detail="Git operation timed out")
     except Exception as e:
         logger.error(f"Git status error: {e}")
@@ -140,6 +47,7 @@ async def get_git_status():
 
 
 @router.post("/api/git/sync")
+@_invalidates_git_status
 async def sync_to_github(request: GitSyncRequest):
     """
     Sync local changes to GitHub by staging, committing, and pushing.
@@ -442,6 +350,7 @@ async def get_git_log(limit: int = 10):
 
 
 @router.post("/api/git/pull")
+@_invalidates_git_status
 async def pull_from_github(request: GitPullRequest = GitPullRequest()):
     """
     Pull latest changes from the remote branch with conflict resolution strategies.
@@ -6,13 +6,13 @@ Now implements AgentRuntime interface for multi-provider support.
 import os
 import json
 import uuid
+import signal
 import asyncio
 import subprocess
 import logging
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor
 
 from fastapi import HTTPException
 
@@ -20,7 +20,7 @@ from ..models import ExecutionLogEntry, ExecutionMetadata
 from ..state import agent_state
 from .activity_tracking import start_tool_execution, complete_tool_execution
 from .runtime_adapter import AgentRuntime
-from .process_registry import get_process_registry
+from .process_registry import get_process_registry, signal_process
 from ..utils.credential_sanitizer import (
     sanitize_text,
     sanitize_dict,
@@ -29,10 +29,12 @@ from ..utils.credential_sanitizer import (
 
 logger = logging.getLogger(__name__)
 
-# Thread pool for running blocking subprocess operations
-# This allows FastAPI to handle other requests (like /api/activity polling) during execution
-# max_workers=1 ensures only one execution at a time within this container
-_executor = ThreadPoolExecutor(max_workers=1)
+# Subprocess output is read with asyncio StreamReaders on the event loop, so
+# FastAPI keeps serving other requests (like /api/activity polling) during
+# execution and parallel headless tasks do not each hold worker threads.
+# A single stream-json line can carry a large tool result; readline() fails
+# on lines longer than the reader limit, so raise it well above the 64 KiB default.
+_STREAM_LINE_LIMIT = 32 * 1024 * 1024
 
 # Asyncio lock for execution serialization (safety net for parallel request prevention)
 # The platform-level execution queue is the primary protection, but this is defense-in-depth
@@ -431,6 +433,52 @@ def process_stream_line(line: str, execution_log: List[ExecutionLogEntry], metad
                     response_parts.append(text)
 
 
+async def _start_claude_process(cmd: List[str], prompt: str) -> asyncio.subprocess.Process:
+    """Start Claude Code as an asyncio subprocess and send the prompt on stdin."""
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        limit=_STREAM_LINE_LIMIT,
+        # Own process group, so termination also reaches tool subprocesses
+        start_new_session=True
+    )
+    try:
+        process.stdin.write(prompt.encode())
+        await process.stdin.drain()
+    except (BrokenPipeError, ConnectionResetError):
+        # Process exited before reading the prompt; its exit code reports why
+        pass
+    finally:
+        process.stdin.close()
+    return process
+
+
+async def _iter_stream_lines(stream: asyncio.StreamReader):
+    """Yield decoded lines from a subprocess stream until EOF."""
+    while True:
+        try:
+            line = await stream.readline()
+        except ValueError as e:
+            # Line longer than _STREAM_LINE_LIMIT: the reader discards it
+            logger.warning(f"Skipping oversized output line: {e}")
+            continue
+        if not line:
+            break
+        yield line.decode("utf-8", errors="replace")
+
+
+async def _kill_process(process: asyncio.subprocess.Process) -> None:
+    """Kill a subprocess (and its process group) if it is still running and reap it."""
+    if process.returncode is None:
+        try:
+            signal_process(process, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+    await process.wait()
+
+
 async def execute_claude_code(prompt: str, stream: bool = False, model: Optional[str] = None, system_prompt: Optional[str] = None, execution_id: Optional[str] = None) -> tuple[str, List[ExecutionLogEntry], ExecutionMetadata, List[Dict]]:
     """
     Execute Claude Code in headless mode with the given prompt.
@@ -518,15 +566,8 @@ async def execute_claude_code(prompt: str, stream: bool = False, model: Optional
         # Mark session as potentially running (will be set to running when first tool starts)
         logger.info(f"Starting Claude Code with streaming: {' '.join(cmd[:5])}...")
 
-        # Use Popen for real-time streaming instead of blocking run()
-        process = subprocess.Popen(
-            cmd,
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            bufsize=1  # Line buffered
-        )
+        # Stream output through asyncio pipes instead of blocking run()
+        process = await _start_claude_process(cmd, prompt)
 
         # Register process for potential termination
         registry = get_process_registry()
@@ -535,49 +576,49 @@ async def execute_claude_code(prompt: str, stream: bool = False, model: Optional
             "message_preview": prompt[:100]
         })
 
-        # Write prompt to stdin and close it
-        process.stdin.write(prompt)
-        process.stdin.close()
-
-        # Helper function that reads subprocess output (runs in thread pool)
-        def read_subprocess_output():
-            """Blocking function to read subprocess output line by line"""
+        async def read_subprocess_output():
+            """Read subprocess output line by line as it arrives"""
+            # Drain stderr concurrently so a full stderr pipe cannot stall stdout
+            stderr_task = asyncio.create_task(process.stderr.read())
             try:
-                for line in iter(process.stdout.readline, ''):
-                    if not line:
-                        break
-                    # Capture raw JSON for full execution log (same as execute_headless_task)
-                    try:
-                        raw_msg = json.loads(line.strip())
-                        if not isinstance(raw_msg, dict):
-                            # stream-json can emit string literals; skip them
-                            continue
-                        # SECURITY: Sanitize credentials from output before storing
-                        raw_msg = sanitize_dict(raw_msg)
-                        raw_messages.append(raw_msg)
-                        # Publish to live streaming subscribers
-                        registry.publish_log_entry(execution_id, raw_msg)
-                    except json.JSONDecodeError:
-                        pass
-                    # SECURITY: Sanitize the line before processing
-                    sanitized_line = sanitize_subprocess_line(line)
-                    # Process each line immediately - updates session_activity in real-time
-                    process_stream_line(sanitized_line, execution_log, metadata, tool_start_times, response_parts)
-            except Exception as e:
-                logger.error(f"Error reading Claude output: {e}")
-
-            # Wait for process to complete and get stderr
-            stderr = process.stderr.read()
-            # SECURITY: Sanitize stderr output
-            stderr = sanitize_text(stderr) if stderr else stderr
-            return_code = process.wait()
-            return stderr, return_code
+                try:
+                    async for line in _iter_stream_lines(process.stdout):
+                        # Capture raw JSON for full execution log (same as execute_headless_task)
+                        try:
+                            raw_msg = json.loads(line.strip())
+                            if not isinstance(raw_msg, dict):
+                                # stream-json can emit string literals; skip them
+                                continue
+                            # SECURITY: Sanitize credentials from output before storing
+                            raw_msg = sanitize_dict(raw_msg)
+                            raw_messages.append(raw_msg)
+                            # Publish to live streaming subscribers (waits briefly for slow ones)
+                            await registry.publish_log_entry_async(execution_id, raw_msg)
+                        except json.JSONDecodeError:
+                            pass
+                        # SECURITY: Sanitize the line before processing
+                        sanitized_line = sanitize_subprocess_line(line)
+                        # Process each line immediately - updates the activity store in real-time
+                        process_stream_line(sanitized_line, execution_log, metadata, tool_start_times, response_parts)
+                except Exception as e:
+                    logger.error(f"Error reading Claude output: {e}")
+
+                # Wait for process to complete and get stderr
+                stderr = (await stderr_task).decode("utf-8", errors="replace")
+                # SECURITY: Sanitize stderr output
+                stderr = sanitize_text(stderr) if stderr else stderr
+                return_code = await process.wait()
+                return stderr, return_code
+            finally:
+                # Timed out or cancelled: don't leave the stderr reader running
+                stderr_task.cancel()
 
-        # Run the blocking subprocess reading in a thread pool to allow FastAPI
-        # to handle other requests (like /api/activity polling) during execution
-        loop = asyncio.get_event_loop()
         try:
-            stderr_output, return_code = await loop.run_in_executor(_executor, read_subprocess_output)
+            try:
+                stderr_output, return_code = await read_subprocess_output()
+            finally:
+                # Don't leave an unread process behind if the request is cancelled
+                await _kill_process(process)
 
             # Check for rate limit detected during stream parsing (takes priority)
             if metadata.error_type == "rate_limit":
@@ -758,8 +799,6 @@ async def execute_headless_task(
 
     Returns: (response_text, execution_log, metadata, session_id)
     """
-    import signal
-
     # Issue #81: Default to "sonnet" when model is not specified.
     # Without this, Claude Code uses the agent's ~/.claude/settings.json model,
     # which may be incompatible with the assigned subscription (e.g., haiku on
@@ -837,15 +876,8 @@ async def execute_headless_task(
 
         logger.info(f"[Headless Task] Starting task {task_session_id}: {' '.join(cmd[:5])}...")
 
-        # Use Popen for real-time streaming
-        process = subprocess.Popen(
-            cmd,
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            bufsize=1  # Line buffered
-        )
+        # Stream output through asyncio pipes; no worker thread per task
+        process = await _start_claude_process(cmd, prompt)
 
         # Register process for potential termination
         registry = get_process_registry()
@@ -854,33 +886,22 @@ async def execute_headless_task(
             "message_preview": prompt[:100]
         })
 
-        # Write prompt to stdin and close it
-        process.stdin.write(prompt)
-        process.stdin.close()
-
-        # Helper function that reads subprocess output (runs in thread pool)
-        def read_subprocess_output_with_timeout():
-            """Blocking function to read subprocess output line by line with timeout"""
-            import threading
-
-            # Read stderr in separate thread (verbose output with thinking/tool calls)
-            def read_stderr():
-                try:
-                    for line in iter(process.stderr.readline, ''):
-                        if not line:
-                            break
-                        verbose_output_lines.append(line.rstrip('\n'))
-                except Exception as e:
-                    logger.error(f"[Headless Task] Error reading stderr: {e}")
+        async def read_stderr():
+            """Collect verbose output (thinking/tool calls) from stderr"""
+            try:
+                async for line in _iter_stream_lines(process.stderr):
+                    verbose_output_lines.append(line.rstrip('\n'))
+            except Exception as e:
+                logger.error(f"[Headless Task] Error reading stderr: {e}")
 
-            stderr_thread = threading.Thread(target=read_stderr)
-            stderr_thread.start()
+        async def read_subprocess_output():
+            """Read subprocess output line by line as it arrives"""
+            nonlocal permission_mode_validated
+            stderr_task = asyncio.create_task(read_stderr())
 
             # Read stdout (stream-json for metadata)
             try:
-                for line in iter(process.stdout.readline, ''):
-                    if not line:
-                        break
+                async for line in _iter_stream_lines(process.stdout):
                     # Capture raw JSON for full execution log
                     try:
                         raw_msg = json.loads(line.strip())
@@ -890,8 +911,8 @@ async def execute_headless_task(
                         # SECURITY: Sanitize credentials from output before storing
                         raw_msg = sanitize_dict(raw_msg)
                         raw_messages.append(raw_msg)
-                        # Publish to live streaming subscribers
-                        registry.publish_log_entry(task_session_id, raw_msg)
+                        # Publish to live streaming subscribers (waits briefly for slow ones)
+                        await registry.publish_log_entry_async(task_session_id, raw_msg)
 
                         # Validate permissionMode on init message (first message from Claude Code).
                         # If permission bypass isn't active, kill immediately instead of timing out
@@ -908,8 +929,7 @@ async def execute_headless_task(
                                     f"Killing process to prevent silent timeout. "
                                     f"Task: {task_session_id}"
                                 )
-                                process.kill()
-                                process.wait()
+                                await _kill_process(process)
                                 raise RuntimeError(
                                     f"Permission bypass failed: permissionMode={perm_mode}. "
                                     f"This may be caused by a stale Claude Code session process "
@@ -923,27 +943,28 @@ async def execute_headless_task(
                     # Process each line for metadata/tool tracking
                     process_stream_line(sanitized_line, execution_log, metadata, tool_start_times, response_parts)
             except RuntimeError:
+                stderr_task.cancel()
                 raise  # Re-raise permission mode failures
             except Exception as e:
                 logger.error(f"[Headless Task] Error reading stdout: {e}")
 
-            # Wait for stderr thread and process to complete
-            stderr_thread.join(timeout=5)
-            return_code = process.wait()
-            return return_code
+            # Wait for stderr reader and process to complete
+            try:
+                await asyncio.wait_for(stderr_task, timeout=5)
+            except asyncio.TimeoutError:
+                pass
+            return await process.wait()
 
         # Run with timeout using asyncio
-        loop = asyncio.get_event_loop()
         try:
             try:
                 return_code = await asyncio.wait_for(
-                    loop.run_in_executor(None, read_subprocess_output_with_timeout),
+                    read_subprocess_output(),
                     timeout=timeout_seconds
                 )
             except asyncio.TimeoutError:
                 # Kill the process on timeout
-                process.kill()
-                process.wait()
+                await _kill_process(process)
                 logger.error(f"[Headless Task] Task {task_session_id} timed out after {timeout_seconds}s")
                 raise HTTPException(
                     status_code=504,
@@ -957,6 +978,9 @@ async def execute_headless_task(
                         detail=str(e)
                     )
                 raise
+            finally:
+                # Don't leave an unread process behind if the request is cancelled
+                await _kill_process(process)
 
             # Build verbose transcript from stderr (the human-readable execution log)
             # SECURITY: Sanitize stderr output
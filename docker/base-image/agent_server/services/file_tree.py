@@ -0,0 +1,264 @@
+"""
+Lazy, paginated workspace file tree (FILE-TREE-001).
+
+The file browser used to get the whole workspace in one response: a
+recursive Path.iterdir walk that stat()ed every entry, node_modules and data
+directories included. Listings are now built here:
+
+- Directories are read with os.scandir and kept in a bounded cache keyed on
+  the directory's mtime, so an unchanged directory is not read again. File
+  edits in place do not change the directory mtime, so a cached listing is
+  also re-read after DIR_CACHE_TTL seconds to refresh sizes and times.
+- depth limits how far the walk goes; directories below it come back with
+  "loaded": false and are expanded by listing them on their own.
+- With a `limit`, each directory returns at most that many entries
+  ("has_more" and "total_entries" say what is left); `offset` pages the
+  requested directory.
+- Entries matching an ignore pattern are not walked: directories come back
+  unloaded, files are left out. Symlinked directories are not walked either.
+- Depth, paging and ignore patterns are opt-in: without them the listing is
+  the full tree the endpoint always returned.
+- Every listing has an ETag derived from the cached directory contents, so
+  an unchanged tree can be answered with 304 Not Modified.
+
+Stdlib only, so it can be loaded without the rest of the agent server.
+"""
+
+import fnmatch
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+WORKSPACE = Path("/home/developer")
+
+# Largest page size a caller may ask for
+MAX_PAGE_SIZE = 5000
+# Seconds a cached directory listing is used without re-reading the directory
+DIR_CACHE_TTL = 2.0
+# Directory listings kept in the cache
+DIR_CACHE_SIZE = 2048
+
+# (name, is_dir, size, mtime, is_symlink)
+_Entry = Tuple[str, bool, int, float, bool]
+
+
+class _CachedDirectory:
+    __slots__ = ("mtime_ns", "read_at", "entries", "fingerprint")
+
+    def __init__(self, mtime_ns: int, entries: List[_Entry]):
+        self.mtime_ns = mtime_ns
+        self.read_at = time.monotonic()
+        self.entries = entries
+        self.fingerprint = hashlib.sha1(repr(entries).encode()).hexdigest()[:16]
+
+
+def _scan(directory: str) -> List[_Entry]:
+    """Read a directory: directories first, then files, by case-insensitive name."""
+    entries = []
+    with os.scandir(directory) as it:
+        for entry in it:
+            try:
+                stat = entry.stat()
+                entries.append((entry.name, entry.is_dir(), stat.st_size, stat.st_mtime, entry.is_symlink()))
+            except OSError as e:
+                logger.warning(f"Failed to process item {entry.path}: {e}")
+    entries.sort(key=lambda e: (not e[1], e[0].lower()))
+    return entries
+
+
+class FileTree:
+    """Builds workspace listings from a bounded, mtime-keyed directory cache."""
+
+    def __init__(
+        self,
+        base: Path = WORKSPACE,
+        cache_size: int = DIR_CACHE_SIZE,
+        cache_ttl: float = DIR_CACHE_TTL,
+    ):
+        self.base = Path(base)
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self._cache: "OrderedDict[str, _CachedDirectory]" = OrderedDict()
+        # Listings run in worker threads
+        self._lock = threading.Lock()
+        # Directories read from disk (not served from cache)
+        self.scans = 0
+
+    def _read_directory(self, directory: str) -> _CachedDirectory:
+        mtime_ns = os.stat(directory).st_mtime_ns
+        with self._lock:
+            cached = self._cache.get(directory)
+            if (
+                cached is not None
+                and cached.mtime_ns == mtime_ns
+                and time.monotonic() - cached.read_at < self.cache_ttl
+            ):
+                self._cache.move_to_end(directory)
+                return cached
+
+        cached = _CachedDirectory(mtime_ns, _scan(directory))
+        with self._lock:
+            self.scans += 1
+            self._cache[directory] = cached
+            self._cache.move_to_end(directory)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return cached
+
+    def list(
+        self,
+        directory: Path,
+        depth: Optional[int] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        show_hidden: bool = False,
+        ignore: Sequence[str] = (),
+    ) -> Tuple[dict, str]:
+        """
+        List a workspace directory.
+
+        Args:
+            directory: Resolved directory inside the workspace
+            depth: Directory levels to include (1 = only this directory's
+                entries); None walks the whole tree
+            offset: Entries of this directory to skip
+            limit: Maximum entries returned per directory; None for all
+            show_hidden: If True, include hidden entries (starting with .)
+            ignore: fnmatch patterns for entry names that are not walked
+
+        Returns:
+            (listing, ETag). The listing has the tree of entries plus paging
+            info for the requested directory.
+        """
+        fingerprints: List[str] = []
+        relative = "" if directory == self.base else str(directory.relative_to(self.base))
+        children, file_count, total, has_more = self._build(
+            str(directory), relative, depth, offset, limit, show_hidden, tuple(ignore), fingerprints
+        )
+
+        params = (relative, depth, offset, limit, show_hidden, tuple(ignore))
+        etag = 'W/"' + hashlib.sha1(repr((params, fingerprints)).encode()).hexdigest()[:32] + '"'
+
+        return {
+            "base_path": str(self.base),
+            "requested_path": relative or ".",
+            "tree": children,
+            "total_files": file_count,
+            "show_hidden": show_hidden,
+            "depth": depth,
+            "offset": offset,
+            "limit": limit,
+            "total_entries": total,
+            "has_more": has_more,
+        }, etag
+
+    def _build(
+        self,
+        directory: str,
+        relative: str,
+        depth: Optional[int],
+        offset: int,
+        limit: Optional[int],
+        show_hidden: bool,
+        ignore: Tuple[str, ...],
+        fingerprints: List[str],
+    ) -> Tuple[List[dict], int, int, bool]:
+        """(children, files listed, visible entries, has more) for one directory."""
+        cached = self._read_directory(directory)
+        fingerprints.append(f"{relative}:{cached.fingerprint}")
+
+        visible = [
+            entry for entry in cached.entries
+            if (show_hidden or not entry[0].startswith('.'))
+            and not (not entry[1] and _ignored(entry[0], ignore))
+        ]
+        page = visible[offset:] if limit is None else visible[offset:offset + limit]
+
+        items = []
+        file_count = 0
+        for name, is_dir, size, mtime, is_symlink in page:
+            path = os.path.join(relative, name) if relative else name
+            modified = datetime.fromtimestamp(mtime).isoformat()
+            if not is_dir:
+                items.append({
+                    "name": name,
+                    "path": path,
+                    "type": "file",
+                    "size": size,
+                    "modified": modified
+                })
+                file_count += 1
+                continue
+
+            item = {
+                "name": name,
+                "path": path,
+                "type": "directory",
+                "children": [],
+                "file_count": None,
+                "modified": modified,
+                "loaded": False
+            }
+            # Symlinked directories are not walked (they may loop back)
+            if (depth is None or depth > 1) and not is_symlink and not _ignored(name, ignore):
+                try:
+                    children, count, total, more = self._build(
+                        os.path.join(directory, name), path,
+                        None if depth is None else depth - 1,
+                        0, limit, show_hidden, ignore, fingerprints
+                    )
+                except OSError as e:
+                    logger.warning(f"Failed to read directory {path}: {e}")
+                else:
+                    item.update(children=children, file_count=count, loaded=True)
+                    if more:
+                        item.update(has_more=True, total_entries=total)
+                    file_count += count
+            items.append(item)
+
+        return items, file_count, len(visible), offset + len(page) < len(visible)
+
+
+def _ignored(name: str, patterns: Tuple[str, ...]) -> bool:
+    return any(fnmatch.fnmatchcase(name, pattern) for pattern in patterns)
+
+
+def parse_ignore(ignore: Optional[str]) -> Tuple[str, ...]:
+    """Ignore patterns from a comma-separated query value (None or "" = none)."""
+    if not ignore:
+        return ()
+    return tuple(pattern.strip() for pattern in ignore.split(",") if pattern.strip())
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header matches etag (weak comparison)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    weak = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if (candidate[2:] if candidate.startswith("W/") else candidate) == weak:
+            return True
+    return False
+
+
+# Global instance
+_file_tree: Optional[FileTree] = None
+
+
+def get_file_tree() -> FileTree:
+    """Get the global workspace file tree."""
+    global _file_tree
+    if _file_tree is None:
+        _file_tree = FileTree()
+    return _file_tree
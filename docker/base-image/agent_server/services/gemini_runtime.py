@@ -6,6 +6,7 @@ Implements AgentRuntime interface for Google's Gemini models.
 import os
 import json
 import uuid
+import signal
 import asyncio
 import subprocess
 import logging
@@ -19,6 +20,7 @@ from ..models import ExecutionLogEntry, ExecutionMetadata
 from ..state import agent_state
 from .activity_tracking import start_tool_execution, complete_tool_execution
 from .runtime_adapter import AgentRuntime
+from .process_registry import signal_process
 
 logger = logging.getLogger(__name__)
 
@@ -179,7 +181,8 @@ class GeminiRuntime(AgentRuntime):
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 text=True,
-                bufsize=1  # Line buffered
+                bufsize=1,  # Line buffered
+                start_new_session=True  # Own process group for group-wide kills
             )
 
             # Write prompt to stdin and close it
@@ -576,7 +579,8 @@ class GeminiRuntime(AgentRuntime):
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 text=True,
-                bufsize=1
+                bufsize=1,
+                start_new_session=True  # Own process group for group-wide kills
             )
 
             # Write prompt to stdin and close it
@@ -593,7 +597,7 @@ class GeminiRuntime(AgentRuntime):
                         if not line:
                             break
                         if time.time() - start_time > timeout_seconds:
-                            process.kill()
+                            signal_process(process, signal.SIGKILL)
                             raise TimeoutError(f"Task exceeded {timeout_seconds}s timeout")
                         self._process_stream_line(line, execution_log, metadata, tool_start_times, tool_names, response_parts, model)
                 except Exception as e:
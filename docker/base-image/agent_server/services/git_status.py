@@ -0,0 +1,230 @@
+"""
+Cached git status for the agent workspace (GIT-STATUS-001).
+
+The status endpoint used to run six blocking git commands in a row inside
+the async handler, including a `git fetch --dry-run` that went to GitHub
+on every UI poll without updating any ref. The service here:
+
+- Runs one `git status --porcelain=v2 --branch` (branch, upstream,
+  ahead/behind and the change list in a single call) plus the last commit
+  and the remote URL, concurrently as asyncio subprocesses.
+- Caches the result, keyed on the mtimes of .git/index, HEAD and the other
+  files git rewrites on staging, commits, checkouts and fetches. Working
+  tree edits do not touch .git, so a cached status is reused for at most
+  STATUS_CACHE_TTL seconds.
+- Shares one computation between concurrent callers.
+
+Stdlib only, so it can be loaded without the rest of the agent server.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+HOME_DIR = Path("/home/developer")
+
+# Seconds a cached status is reused while git metadata is unchanged
+STATUS_CACHE_TTL = 10.0
+# Seconds before a git command is killed
+GIT_TIMEOUT = 10.0
+
+# Files under .git rewritten by staging, commits, checkouts, resets and fetches
+_CACHE_KEY_FILES = ("index", "HEAD", "logs/HEAD", "FETCH_HEAD", "packed-refs")
+
+
+async def run_git(*args: str, cwd: Path, timeout: float = GIT_TIMEOUT) -> Tuple[int, str]:
+    """
+    Run a git command without blocking the event loop.
+
+    Returns (returncode, stdout). Raises asyncio.TimeoutError (after
+    killing git) if it takes longer than timeout seconds.
+    """
+    process = await asyncio.create_subprocess_exec(
+        "git", *args,
+        cwd=str(cwd),
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        stdout, _ = await asyncio.wait_for(process.communicate(), timeout=timeout)
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        raise
+    return process.returncode, stdout.decode(errors="replace")
+
+
+def _change(xy: str, path: str) -> dict:
+    # Porcelain v2 writes "." for an unchanged side; v1 wrote a space
+    return {"status": xy.replace(".", " ").strip(), "path": path}
+
+
+def parse_porcelain_v2(output: str) -> dict:
+    """
+    Parse `git status --porcelain=v2 --branch` output.
+
+    Returns {"branch", "upstream", "ahead", "behind", "changes"}. ahead and
+    behind are None without an upstream. Changes use the porcelain v1
+    format the status endpoint always returned: {"status": "M", "path": ...},
+    renames as "old -> new".
+    """
+    result = {"branch": None, "upstream": None, "ahead": None, "behind": None}
+    changes: List[dict] = []
+    for line in output.splitlines():
+        if line.startswith("# branch.head "):
+            head = line[len("# branch.head "):]
+            # rev-parse --abbrev-ref reports a detached HEAD as "HEAD"
+            result["branch"] = "HEAD" if head == "(detached)" else head
+        elif line.startswith("# branch.upstream "):
+            result["upstream"] = line[len("# branch.upstream "):]
+        elif line.startswith("# branch.ab "):
+            ahead, behind = line[len("# branch.ab "):].split()
+            result["ahead"], result["behind"] = int(ahead), -int(behind)
+        elif line.startswith("1 "):
+            fields = line.split(" ", 8)
+            changes.append(_change(fields[1], fields[8]))
+        elif line.startswith("2 "):
+            fields = line.split(" ", 9)
+            path, original = fields[9].split("\t", 1)
+            changes.append(_change(fields[1], f"{original} -> {path}"))
+        elif line.startswith("u "):
+            fields = line.split(" ", 10)
+            changes.append(_change(fields[1], fields[10]))
+        elif line.startswith("? "):
+            changes.append({"status": "??", "path": line[2:]})
+    result["changes"] = changes
+    return result
+
+
+def _parse_last_commit(output: str) -> Optional[dict]:
+    parts = output.strip().split('|')
+    if len(parts) < 5:
+        return None
+    return {
+        "sha": parts[0],
+        "short_sha": parts[1],
+        "message": parts[2],
+        "author": parts[3],
+        "date": parts[4]
+    }
+
+
+def _display_remote_url(url: str) -> str:
+    # Remove credentials from URL for display
+    if '@github.com' in url:
+        return "https://github.com/" + url.split('@github.com/')[1]
+    return url
+
+
+class GitStatusService:
+    """Computes and caches the git status of one working tree."""
+
+    def __init__(self, home_dir: Path = HOME_DIR, ttl: float = STATUS_CACHE_TTL):
+        self.home_dir = Path(home_dir)
+        self.git_dir = self.home_dir / ".git"
+        self.ttl = ttl
+        self._cached: Optional[dict] = None
+        self._cached_key: Optional[tuple] = None
+        self._cached_at = 0.0
+        self._lock = asyncio.Lock()
+        # Number of statuses computed (not served from cache)
+        self.computed = 0
+
+    def _cache_key(self) -> tuple:
+        key = []
+        for name in _CACHE_KEY_FILES:
+            try:
+                key.append(os.stat(self.git_dir / name).st_mtime_ns)
+            except FileNotFoundError:
+                key.append(None)
+        return tuple(key)
+
+    def invalidate(self):
+        """Drop the cached status, e.g. after a sync or pull moved remote refs."""
+        self._cached = None
+
+    async def get_status(self) -> dict:
+        """
+        Git status of the working tree: branch, remote, last commit, changes
+        and ahead/behind counts. Served from cache while git metadata is
+        unchanged and the cached status is younger than the TTL.
+        """
+        if not self.git_dir.exists():
+            return {
+                "git_enabled": False,
+                "message": "Git sync not enabled for this agent"
+            }
+
+        async with self._lock:
+            # Taken before computing: changes made meanwhile miss the cache next time
+            key = self._cache_key()
+            if (
+                self._cached is not None
+                and key == self._cached_key
+                and time.monotonic() - self._cached_at < self.ttl
+            ):
+                return self._cached
+
+            status = await self._compute()
+            self.computed += 1
+            self._cached, self._cached_key, self._cached_at = status, key, time.monotonic()
+            return status
+
+    async def _compute(self) -> dict:
+        (status_code, status_out), (log_code, log_out), (remote_code, remote_out) = await asyncio.gather(
+            # No optional locks: don't take index.lock (or rewrite the index) just to read status
+            run_git("--no-optional-locks", "status", "--porcelain=v2", "--branch", cwd=self.home_dir),
+            run_git("log", "-1", "--format=%H|%h|%s|%an|%ai", cwd=self.home_dir),
+            run_git("remote", "get-url", "origin", cwd=self.home_dir),
+        )
+
+        if status_code == 0:
+            parsed = parse_porcelain_v2(status_out)
+        else:
+            logger.warning(f"[GitStatus] git status failed with code {status_code}")
+            parsed = parse_porcelain_v2("")
+        branch = parsed["branch"] or "unknown"
+
+        ahead, behind = parsed["ahead"], parsed["behind"]
+        if ahead is None:
+            # No upstream configured: compare with the same branch on origin
+            ahead, behind = await self._ahead_behind(branch)
+
+        changes = parsed["changes"]
+        return {
+            "git_enabled": True,
+            "branch": branch,
+            "remote_url": _display_remote_url(remote_out.strip()) if remote_code == 0 else "",
+            "last_commit": _parse_last_commit(log_out) if log_code == 0 else None,
+            "changes": changes,
+            "changes_count": len(changes),
+            "ahead": ahead,
+            "behind": behind,
+            "sync_status": "up_to_date" if ahead == 0 and len(changes) == 0 else "pending_sync"
+        }
+
+    async def _ahead_behind(self, branch: str) -> Tuple[int, int]:
+        returncode, output = await run_git(
+            "rev-list", "--left-right", "--count", f"origin/{branch}...HEAD", cwd=self.home_dir
+        )
+        parts = output.split()
+        if returncode != 0 or len(parts) != 2:
+            return 0, 0
+        return int(parts[1]), int(parts[0])
+
+
+# Global instance
+_git_status_service: Optional[GitStatusService] = None
+
+
+def get_git_status_service() -> GitStatusService:
+    """Get the global git status service."""
+    global _git_status_service
+    if _git_status_service is None:
+        _git_status_service = GitStatusService()
+    return _git_status_service
@@ -5,18 +5,115 @@ Enables termination of executions by execution_id.
 Used by both Claude Code and Gemini runtimes.
 
 Also provides log streaming infrastructure for live execution monitoring.
+Log entries get per-execution sequence ids so SSE clients can resume with
+Last-Event-ID (LOG-STREAM-001).
+
+Accepts both subprocess.Popen handles (Gemini runtime) and
+asyncio.subprocess.Process handles (Claude Code runtime).
+
+Registered processes are supervised without blocking the event loop
+(PROC-SUPERVISOR-001): a reaper task per process waits for its exit (the
+event loop's child watcher for asyncio processes, a pidfd for Popen
+handles), termination escalates SIGINT -> SIGKILL in a background task,
+and processes started with start_new_session=True are signalled as a
+whole process group so tool subprocesses go down with the CLI.
 """
 
+import os
 import signal
 import subprocess
 import asyncio
 import logging
+import threading
+import time
+from collections import OrderedDict, deque
 from datetime import datetime
-from typing import Dict, Optional, List, AsyncIterator
+from itertools import islice
+from typing import Dict, Optional, List, AsyncIterator, Tuple, Union
 from threading import Lock
 
 logger = logging.getLogger(__name__)
 
+ProcessHandle = Union[subprocess.Popen, asyncio.subprocess.Process]
+
+# (sequence id, entry); the sequence id is None for stream control entries
+LogItem = Tuple[Optional[int], dict]
+
+STREAM_END = {"type": "stream_end"}
+
+
+def _returncode(process: Optional[ProcessHandle]) -> Optional[int]:
+    """Exit code of a process handle, or None while it is still running."""
+    if process is None:
+        return None
+    if isinstance(process, subprocess.Popen):
+        return process.poll()
+    return process.returncode
+
+
+def _process_group(process: Optional[ProcessHandle]) -> Optional[int]:
+    """Process group id if the process leads its own group (started with start_new_session)."""
+    if process is None:
+        return None
+    try:
+        return process.pid if os.getpgid(process.pid) == process.pid else None
+    except OSError:
+        return None
+
+
+def signal_process(process: ProcessHandle, sig: int, pgid: Optional[int] = None):
+    """
+    Send a signal to a process, or to its whole process group if it leads one.
+
+    Raises ProcessLookupError if there is nothing left to signal.
+    """
+    if pgid is None:
+        pgid = _process_group(process)
+    if pgid is not None:
+        os.killpg(pgid, sig)
+    elif isinstance(process, subprocess.Popen) and process.poll() is not None:
+        raise ProcessLookupError(process.pid)
+    else:
+        process.send_signal(sig)
+
+
+async def wait_for_exit(process: ProcessHandle) -> int:
+    """
+    Wait for a process to exit without blocking the event loop.
+
+    asyncio processes are reaped by the event loop's child watcher. For a
+    Popen handle the loop watches a pidfd, which becomes readable when the
+    child exits (Linux 5.3+); elsewhere a worker thread waits.
+    """
+    if not isinstance(process, subprocess.Popen):
+        return await process.wait()
+    if process.poll() is not None:
+        return process.returncode
+
+    loop = asyncio.get_running_loop()
+    try:
+        pidfd = os.pidfd_open(process.pid)
+    except (AttributeError, OSError):
+        pidfd = None
+
+    if pidfd is not None:
+        exited = loop.create_future()
+        try:
+            loop.add_reader(pidfd, lambda: exited.done() or exited.set_result(None))
+            try:
+                await exited
+            finally:
+                loop.remove_reader(pidfd)
+        except NotImplementedError:
+            pass
+        finally:
+            os.close(pidfd)
+        # Reaps the zombie; None only if another thread is reaping it right now
+        if process.poll() is not None:
+            return process.returncode
+
+    return await loop.run_in_executor(None, process.wait)
+
 
 class ProcessRegistry:
     """
@@ -25,10 +122,30 @@ class ProcessRegistry:
 
     Thread-safe via mutex lock for all operations.
 
+    Process supervision:
+    - register() starts a reaper task that waits for the process to exit, so
+      status and listing read the exit code the reaper collected instead of
+      polling each process
+    - terminate() never blocks: it sends SIGINT (to the process group if the
+      process leads one) and a background task escalates to SIGKILL after
+      graceful_timeout, then kills whatever is left of the group
+    - terminate_all() does the same for every running execution at once
+
     Also provides log streaming infrastructure:
-    - Each execution can have multiple log subscribers (asyncio.Queue)
-    - Log entries are published to all subscribers as they arrive
-    - Subscribers receive entries until execution completes
+    - Each log entry gets a sequence id (1, 2, ...) per execution and is kept
+      in a fixed-capacity ring buffer, so late joiners and reconnecting
+      clients can replay everything after the last id they saw
+    - Each execution can have multiple log subscribers (bounded asyncio.Queue)
+      receiving (seq, entry) items as they arrive, until execution completes
+    - publish_log_entry_async() applies backpressure: when a subscriber's
+      queue is full the publisher waits (up to _publish_timeout) before
+      dropping, which pauses reading of the subprocess output
+    - Dropped entries are not lost for good: iter_logs() notices the jump in
+      sequence ids and backfills from the ring buffer, reporting a
+      stream_gap only for entries that have already left it
+    - Buffers of finished executions are kept for _finished_retention
+      seconds so a client that reconnects right after the end still gets
+      the tail and the stream_end
     """
 
     def __init__(self):
@@ -36,29 +153,48 @@ class ProcessRegistry:
         self._lock = Lock()
         # Log streaming: execution_id -> list of subscriber queues
         self._log_subscribers: Dict[str, List[asyncio.Queue]] = {}
-        # Buffered logs: execution_id -> list of log entries (for late joiners)
-        self._log_buffers: Dict[str, List[dict]] = {}
+        # Buffered logs: execution_id -> ring buffer of (seq, entry) (for late joiners)
+        self._log_buffers: Dict[str, deque] = {}
+        # Last sequence id handed out per execution
+        self._log_sequences: Dict[str, int] = {}
         # Maximum buffer size per execution (prevents memory bloat)
         self._max_buffer_size = 1000
-
-    def register(self, execution_id: str, process: subprocess.Popen, metadata: dict = None):
+        # Queue size for each log subscriber
+        self._subscriber_queue_size = 500
+        # Finished executions whose buffers are still kept: execution_id -> finish time
+        self._finished_logs: "OrderedDict[str, float]" = OrderedDict()
+        # Seconds (and max count) finished execution buffers are kept for reconnects
+        self._finished_retention = 60.0
+        self._max_finished_buffers = 16
+        # Max seconds a publisher waits for a full subscriber queue before dropping
+        self._publish_timeout = 1.0
+        # Subscriber queues that timed out; they get drops, not waits, until they catch up
+        self._lagging_subscribers: Dict[str, set] = {}
+
+    def register(self, execution_id: str, process: ProcessHandle, metadata: dict = None):
         """
         Register a running process.
 
         Args:
             execution_id: Unique identifier for this execution
-            process: The subprocess.Popen handle
+            process: The subprocess.Popen or asyncio.subprocess.Process handle
             metadata: Optional metadata (type, message preview, etc.)
         """
+        entry = {
+            "process": process,
+            "started_at": datetime.utcnow(),
+            "metadata": metadata or {},
+            # Signal the whole group if the process leads one
+            "pgid": _process_group(process),
+            "reaper": self._start_reaper(execution_id, process),
+        }
         with self._lock:
-            self._processes[execution_id] = {
-                "process": process,
-                "started_at": datetime.utcnow(),
-                "metadata": metadata or {}
-            }
+            self._processes[execution_id] = entry
             # Initialize log streaming structures
             self._log_subscribers[execution_id] = []
-            self._log_buffers[execution_id] = []
+            self._log_buffers[execution_id] = deque(maxlen=self._max_buffer_size)
+            self._log_sequences[execution_id] = 0
+            self._finished_logs.pop(execution_id, None)
             logger.info(f"[ProcessRegistry] Registered execution {execution_id}")
 
     def unregister(self, execution_id: str):
@@ -68,25 +204,73 @@ class ProcessRegistry:
                 del self._processes[execution_id]
                 logger.info(f"[ProcessRegistry] Unregistered execution {execution_id}")
 
-            # Signal end of stream to all subscribers
+            # Signal end of stream to all subscribers. A subscriber whose
+            # queue is full misses it; iter_logs() checks for the end itself.
             if execution_id in self._log_subscribers:
                 for queue in self._log_subscribers[execution_id]:
                     try:
-                        queue.put_nowait({"type": "stream_end"})
+                        queue.put_nowait((None, STREAM_END))
                     except asyncio.QueueFull:
                         pass
                 del self._log_subscribers[execution_id]
+            self._lagging_subscribers.pop(execution_id, None)
 
-            # Clean up buffer (keep for a bit for late requests, but this is fine)
+            # Keep the buffer for a while for late requests and reconnects
             if execution_id in self._log_buffers:
-                del self._log_buffers[execution_id]
+                self._finished_logs[execution_id] = time.monotonic()
+            self._prune_finished_logs()
+
+    def _prune_finished_logs(self):
+        """Drop buffers of executions that finished too long ago. Caller holds the lock."""
+        cutoff = time.monotonic() - self._finished_retention
+        while self._finished_logs:
+            execution_id, finished_at = next(iter(self._finished_logs.items()))
+            if finished_at > cutoff and len(self._finished_logs) <= self._max_finished_buffers:
+                break
+            del self._finished_logs[execution_id]
+            self._log_buffers.pop(execution_id, None)
+            self._log_sequences.pop(execution_id, None)
+
+    @staticmethod
+    def _start_reaper(execution_id: str, process: Optional[ProcessHandle]) -> Optional[asyncio.Task]:
+        """Start a task that waits for the process to exit, if called on an event loop."""
+        if process is None:
+            return None
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Registered from a worker thread: status falls back to polling
+            return None
+
+        async def reap() -> Optional[int]:
+            try:
+                returncode = await wait_for_exit(process)
+            except Exception as e:
+                logger.warning(f"[ProcessRegistry] Could not wait for execution {execution_id}: {e}")
+                return None
+            logger.info(f"[ProcessRegistry] Execution {execution_id} exited with code {returncode}")
+            return returncode
+
+        return loop.create_task(reap())
 
-    def terminate(self, execution_id: str, graceful_timeout: int = 5) -> dict:
+    @staticmethod
+    def _exit_code(entry: dict) -> Optional[int]:
+        """Exit code of a registered process, or None while it is still running."""
+        reaper = entry["reaper"]
+        if reaper is not None and not reaper.done():
+            # Set on the handle by the reaper's wait; no syscall needed
+            return entry["process"].returncode
+        return _returncode(entry["process"])
+
+    def terminate(self, execution_id: str, graceful_timeout: float = 5) -> dict:
         """
         Terminate a running process.
 
         Uses graceful termination (SIGINT) first, then force kills (SIGKILL)
-        if the process doesn't respond within the timeout.
+        if the process doesn't respond within the timeout. Returns as soon
+        as SIGINT is sent; escalation runs in a background task (a thread
+        when called without an event loop). Processes that lead a process
+        group are signalled as a group.
 
         Args:
             execution_id: The execution to terminate
@@ -94,7 +278,7 @@ class ProcessRegistry:
 
         Returns:
             dict with termination status:
-            - {"success": True, "returncode": int} on success
+            - {"success": True, "returncode": None} once SIGINT is sent
             - {"success": False, "reason": "not_found"} if not registered
             - {"success": False, "reason": "already_finished", "returncode": int}
             - {"success": False, "reason": "error", "error": str}
@@ -104,41 +288,87 @@ class ProcessRegistry:
             if not entry:
                 return {"success": False, "reason": "not_found"}
 
-            process = entry["process"]
-            if process.poll() is not None:
+            returncode = self._exit_code(entry)
+            if returncode is not None:
                 # Already finished
-                returncode = process.returncode
                 del self._processes[execution_id]
                 return {"success": False, "reason": "already_finished", "returncode": returncode}
 
-        # Terminate outside lock to avoid blocking other operations
+        process = entry["process"]
         try:
             # Graceful termination first (SIGINT = Ctrl+C)
             # Claude Code handles SIGINT gracefully, finishing current tool
             logger.info(f"[ProcessRegistry] Sending SIGINT to execution {execution_id}")
-            process.send_signal(signal.SIGINT)
-
-            try:
-                process.wait(timeout=graceful_timeout)
-                logger.info(f"[ProcessRegistry] Execution {execution_id} terminated gracefully")
-            except subprocess.TimeoutExpired:
-                # Force kill if graceful didn't work
-                logger.warning(f"[ProcessRegistry] Force killing execution {execution_id}")
-                process.kill()
-                process.wait(timeout=2)
+            signal_process(process, signal.SIGINT, entry["pgid"])
+        except ProcessLookupError:
+            return {"success": False, "reason": "already_finished", "returncode": _returncode(process)}
+        except Exception as e:
+            logger.error(f"[ProcessRegistry] Error terminating {execution_id}: {e}")
+            return {"success": False, "reason": "error", "error": str(e)}
 
-            returncode = process.returncode
+        try:
+            asyncio.get_running_loop().create_task(self._escalate(execution_id, entry, graceful_timeout))
+        except RuntimeError:
+            threading.Thread(
+                target=self._escalate_blocking, args=(execution_id, entry, graceful_timeout), daemon=True
+            ).start()
+        return {"success": True, "returncode": None}
+
+    def terminate_all(self, graceful_timeout: float = 5) -> Dict[str, dict]:
+        """Terminate every running execution at once. Returns terminate() results by execution_id."""
+        with self._lock:
+            running = [
+                exec_id for exec_id, entry in self._processes.items()
+                if entry["process"] is not None and self._exit_code(entry) is None
+            ]
+        return {exec_id: self.terminate(exec_id, graceful_timeout) for exec_id in running}
 
+    async def _escalate(self, execution_id: str, entry: dict, graceful_timeout: float):
+        """Wait for a SIGINTed process, SIGKILL it after graceful_timeout, then clean up its group."""
+        process = entry["process"]
+        exited = entry["reaper"] or asyncio.ensure_future(wait_for_exit(process))
+        try:
+            await asyncio.wait_for(asyncio.shield(exited), timeout=graceful_timeout)
+            logger.info(f"[ProcessRegistry] Execution {execution_id} terminated gracefully")
+        except asyncio.TimeoutError:
+            logger.warning(f"[ProcessRegistry] Force killing execution {execution_id}")
+            self._kill(process, entry["pgid"])
+            await exited
+        self._finish_termination(execution_id, entry)
+
+    def _escalate_blocking(self, execution_id: str, entry: dict, graceful_timeout: float):
+        """_escalate() for a Popen terminated from a thread without an event loop."""
+        process = entry["process"]
+        try:
+            process.wait(timeout=graceful_timeout)
+            logger.info(f"[ProcessRegistry] Execution {execution_id} terminated gracefully")
+        except subprocess.TimeoutExpired:
+            logger.warning(f"[ProcessRegistry] Force killing execution {execution_id}")
+            self._kill(process, entry["pgid"])
+            process.wait()
+        self._finish_termination(execution_id, entry)
+
+    @staticmethod
+    def _kill(process: ProcessHandle, pgid: Optional[int]):
+        try:
+            signal_process(process, signal.SIGKILL, pgid)
+        except ProcessLookupError:
+            pass
+
+    def _finish_termination(self, execution_id: str, entry: dict):
+        """Kill what is left of a terminated process group and drop finished Popen entries."""
+        if entry["pgid"] is not None:
+            # Tool subprocesses that ignored SIGINT or outlived the CLI
+            try:
+                os.killpg(entry["pgid"], signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+        # asyncio processes are unregistered by the runtime that reads their output
+        if isinstance(entry["process"], subprocess.Popen):
             with self._lock:
-                if execution_id in self._processes:
+                if self._processes.get(execution_id) is entry:
                     del self._processes[execution_id]
 
-            return {"success": True, "returncode": returncode}
-
-        except Exception as e:
-            logger.error(f"[ProcessRegistry] Error terminating {execution_id}: {e}")
-            return {"success": False, "reason": "error", "error": str(e)}
-
     def get_status(self, execution_id: str) -> Optional[dict]:
         """
         Get status of a registered process.
@@ -150,8 +380,7 @@ class ProcessRegistry:
             if not entry:
                 return None
 
-            process = entry["process"]
-            poll_result = process.poll()
+            poll_result = self._exit_code(entry)
 
             return {
                 "execution_id": execution_id,
@@ -166,8 +395,7 @@ class ProcessRegistry:
         with self._lock:
             result = []
             for exec_id, entry in self._processes.items():
-                process = entry["process"]
-                if process.poll() is None:
+                if self._exit_code(entry) is None:
                     result.append({
                         "execution_id": exec_id,
                         "started_at": entry["started_at"].isoformat(),
@@ -184,7 +412,7 @@ class ProcessRegistry:
         with self._lock:
             finished = [
                 exec_id for exec_id, entry in self._processes.items()
-                if entry["process"].poll() is not None
+                if self._exit_code(entry) is not None
             ]
             for exec_id in finished:
                 del self._processes[exec_id]
@@ -196,41 +424,86 @@ class ProcessRegistry:
     # Log Streaming Methods
     # ========================================================================
 
+    def _buffer_log_entry(self, execution_id: str, entry: dict) -> Tuple[Optional[int], List[asyncio.Queue]]:
+        """
+        Assign the next sequence id, buffer the entry for late joiners and
+        return (seq, current subscriber queues). seq is None if the execution
+        is unknown or already finished.
+        """
+        with self._lock:
+            buffer = self._log_buffers.get(execution_id)
+            if buffer is None or execution_id in self._finished_logs:
+                return None, []
+
+            seq = self._log_sequences[execution_id] + 1
+            self._log_sequences[execution_id] = seq
+            # Ring buffer: the oldest entry falls out once it is full
+            buffer.append((seq, entry))
+
+            return seq, list(self._log_subscribers.get(execution_id, ()))
+
     def publish_log_entry(self, execution_id: str, entry: dict):
         """
         Publish a log entry to all subscribers for an execution.
 
-        Called from claude_code.py as each line is processed.
+        Called from runtimes that read output in a worker thread.
         Non-blocking: if a subscriber's queue is full, the entry is dropped for that subscriber.
 
         Args:
             execution_id: The execution ID
             entry: The raw JSON log entry from Claude Code
         """
-        with self._lock:
-            # Add to buffer for late joiners
-            if execution_id in self._log_buffers:
-                buffer = self._log_buffers[execution_id]
-                buffer.append(entry)
-                # Trim buffer if too large
-                if len(buffer) > self._max_buffer_size:
-                    self._log_buffers[execution_id] = buffer[-self._max_buffer_size:]
+        seq, queues = self._buffer_log_entry(execution_id, entry)
+        # Publish to all subscribers
+        for queue in queues:
+            try:
+                queue.put_nowait((seq, entry))
+            except asyncio.QueueFull:
+                # Drop entry for this slow subscriber (backfilled from the buffer later)
+                logger.warning(f"[ProcessRegistry] Log queue full for execution {execution_id}, dropping entry")
 
-            # Publish to all subscribers
-            if execution_id in self._log_subscribers:
-                for queue in self._log_subscribers[execution_id]:
-                    try:
-                        queue.put_nowait(entry)
-                    except asyncio.QueueFull:
-                        # Drop entry for this slow subscriber
-                        logger.warning(f"[ProcessRegistry] Log queue full for execution {execution_id}, dropping entry")
+    async def publish_log_entry_async(self, execution_id: str, entry: dict):
+        """
+        Publish a log entry to all subscribers, waiting for slow ones.
+
+        Called from claude_code.py as each line is read. While a subscriber's
+        queue is full the caller waits up to _publish_timeout, so the reader
+        stops draining the subprocess pipe and Claude Code is slowed down to
+        the subscriber's pace. A subscriber that times out is marked lagging
+        and gets drops instead of waits until it has room again, so a stalled
+        client costs one timeout rather than one per entry.
+
+        Args:
+            execution_id: The execution ID
+            entry: The raw JSON log entry from Claude Code
+        """
+        seq, queues = self._buffer_log_entry(execution_id, entry)
+        item = (seq, entry)
+        for queue in queues:
+            lagging = self._lagging_subscribers.setdefault(execution_id, set())
+            try:
+                queue.put_nowait(item)
+                lagging.discard(id(queue))
+                continue
+            except asyncio.QueueFull:
+                if id(queue) in lagging:
+                    continue
+
+            try:
+                await asyncio.wait_for(queue.put(item), timeout=self._publish_timeout)
+            except asyncio.TimeoutError:
+                lagging.add(id(queue))
+                logger.warning(f"[ProcessRegistry] Log subscriber lagging for execution {execution_id}, dropping entries")
 
-    def subscribe_logs(self, execution_id: str) -> asyncio.Queue:
+    def subscribe_logs(self, execution_id: str) -> Optional[asyncio.Queue]:
         """
         Subscribe to log entries for an execution.
 
-        Returns a queue that will receive log entries as they arrive.
-        First sends all buffered entries, then streams new ones.
+        Returns a bounded queue that will receive (seq, entry) items as they
+        are published, and (None, {"type": "stream_end"}) when the execution
+        finishes. Buffered entries are not replayed into the queue - read
+        them with get_buffered_logs() after subscribing and skip sequence ids
+        already seen, or use iter_logs() which does both.
         Returns None if execution not found.
 
         Args:
@@ -239,30 +512,19 @@ class ProcessRegistry:
         Returns:
             asyncio.Queue to receive log entries, or None if not found
         """
-        queue = asyncio.Queue(maxsize=500)
+        queue = asyncio.Queue(maxsize=self._subscriber_queue_size)
 
         with self._lock:
             # Check if execution exists (or recently existed with buffer)
             if execution_id not in self._log_subscribers and execution_id not in self._log_buffers:
                 return None
 
-            # Send buffered entries first
-            if execution_id in self._log_buffers:
-                for entry in self._log_buffers[execution_id]:
-                    try:
-                        queue.put_nowait(entry)
-                    except asyncio.QueueFull:
-                        break
-
             # Register as subscriber if execution is still running
             if execution_id in self._log_subscribers:
                 self._log_subscribers[execution_id].append(queue)
             else:
                 # Execution finished, just send stream_end
-                try:
-                    queue.put_nowait({"type": "stream_end"})
-                except asyncio.QueueFull:
-                    pass
+                queue.put_nowait((None, STREAM_END))
 
         return queue
 
@@ -280,22 +542,120 @@ class ProcessRegistry:
                     self._log_subscribers[execution_id].remove(queue)
                 except ValueError:
                     pass
+            self._lagging_subscribers.get(execution_id, set()).discard(id(queue))
+
+    def _is_subscribed(self, execution_id: str, queue: asyncio.Queue) -> bool:
+        with self._lock:
+            return queue in self._log_subscribers.get(execution_id, ())
+
+    @staticmethod
+    def _entries_after(buffer: deque, after_seq: int) -> List[LogItem]:
+        """Buffered items with seq > after_seq. Sequence ids in a buffer are contiguous."""
+        if not buffer:
+            return []
+        skip = max(0, after_seq - buffer[0][0] + 1)
+        return list(islice(buffer, skip, None))
+
+    def _catch_up(self, execution_id: str, last_seq: int, before_seq: Optional[int] = None) -> List[LogItem]:
+        """
+        Buffered items after last_seq (and before before_seq), preceded by a
+        stream_gap item if some of them have already left the ring buffer.
+        """
+        with self._lock:
+            buffer = self._log_buffers.get(execution_id)
+            if buffer is None:
+                return []
+            end = before_seq if before_seq is not None else self._log_sequences[execution_id] + 1
+            items = [item for item in self._entries_after(buffer, last_seq) if item[0] < end]
+
+        first = items[0][0] if items else end
+        missed = first - last_seq - 1
+        if missed > 0:
+            items.insert(0, (None, {"type": "stream_gap", "missed": missed}))
+        return items
+
+    async def iter_logs(
+        self, execution_id: str, after_seq: int = 0, idle_timeout: float = 30.0
+    ) -> AsyncIterator[Optional[LogItem]]:
+        """
+        Stream an execution's log entries after after_seq until it ends.
+
+        Yields (seq, entry) in sequence order: first what the ring buffer
+        holds, then live entries. Entries this subscriber missed (dropped
+        while lagging) are backfilled from the buffer; a
+        (None, {"type": "stream_gap", "missed": n}) item stands in for any
+        that are no longer there. The last item is
+        (None, {"type": "stream_end"}). Yields None after idle_timeout
+        seconds without entries so the caller can send a keepalive.
+        Yields nothing for an unknown execution.
+
+        Args:
+            execution_id: The execution ID
+            after_seq: Last sequence id the client has seen (0 for all)
+            idle_timeout: Seconds without entries before yielding None
+        """
+        queue = self.subscribe_logs(execution_id)
+        if queue is None:
+            return
+
+        last_seq = after_seq
+        try:
+            for item in self._catch_up(execution_id, last_seq):
+                if item[0] is not None:
+                    last_seq = item[0]
+                yield item
+
+            while True:
+                if queue.empty() and not self._is_subscribed(execution_id, queue):
+                    # Finished while our queue was full: the stream_end was dropped
+                    seq, entry = None, STREAM_END
+                else:
+                    try:
+                        seq, entry = await asyncio.wait_for(queue.get(), timeout=idle_timeout)
+                    except asyncio.TimeoutError:
+                        yield None
+                        continue
+
+                if seq is None:
+                    for item in self._catch_up(execution_id, last_seq):
+                        yield item
+                    yield None, entry
+                    return
+
+                if seq <= last_seq:
+                    # Already sent from the buffer
+                    continue
+                if seq > last_seq + 1:
+                    for item in self._catch_up(execution_id, last_seq, before_seq=seq):
+                        yield item
+
+                yield seq, entry
+                last_seq = seq
+        finally:
+            # Unsubscribe when the client disconnects or the stream ends
+            self.unsubscribe_logs(execution_id, queue)
+
+    def has_logs(self, execution_id: str) -> bool:
+        """Whether the execution is running or finished recently enough to still have its log buffer."""
+        with self._lock:
+            return execution_id in self._log_buffers
 
-    def get_buffered_logs(self, execution_id: str) -> Optional[List[dict]]:
+    def get_buffered_logs(self, execution_id: str, after_seq: int = 0) -> Optional[List[LogItem]]:
         """
-        Get all buffered log entries for an execution.
+        Get buffered log entries for an execution.
 
         Used for non-streaming requests (e.g., page refresh on completed execution).
 
         Args:
             execution_id: The execution ID
+            after_seq: Only return entries with a higher sequence id
 
         Returns:
-            List of log entries, or None if execution not found
+            List of (seq, entry) tuples, or None if execution not found
         """
         with self._lock:
             if execution_id in self._log_buffers:
-                return list(self._log_buffers[execution_id])
+                return self._entries_after(self._log_buffers[execution_id], after_seq)
             return None
 
     def is_execution_running(self, execution_id: str) -> bool:
@@ -4,10 +4,12 @@ Agent state management for the agent server.
 import os
 import subprocess
 import logging
-from typing import List, Dict, Optional
+from typing import List, Optional
 from datetime import datetime
 
 from .models import ChatMessage
+from .activity_store import ActivityStore
+from .config import ACTIVITY_TIMELINE_SIZE, ACTIVITY_OUTPUT_CACHE_BYTES, ACTIVITY_OUTPUT_SPILL_DIR
 
 logger = logging.getLogger(__name__)
 
@@ -34,10 +36,13 @@ class AgentState:
         self.session_context_window: int = self._get_default_context_window()
         # Model selection (persists across session)
         self.current_model: Optional[str] = os.getenv("AGENT_RUNTIME_MODEL", None) or os.getenv("CLAUDE_MODEL", None)
-        # Session activity tracking (for real-time monitoring)
-        self.session_activity = self._create_empty_activity()
-        # Store full tool outputs for drill-down (separate from timeline summaries)
-        self.tool_outputs: Dict[str, str] = {}
+        # Session activity tracking (for real-time monitoring): bounded
+        # timeline plus full tool outputs for drill-down
+        self.activity = ActivityStore(
+            timeline_size=ACTIVITY_TIMELINE_SIZE,
+            output_cache_bytes=ACTIVITY_OUTPUT_CACHE_BYTES,
+            spill_dir=ACTIVITY_OUTPUT_SPILL_DIR,
+        )
 
     def _get_default_context_window(self) -> int:
         """Get default context window based on runtime"""
@@ -65,20 +70,6 @@ class AgentState:
             logger.error(f"Gemini CLI check failed: {e}")
             return False
 
-    def _create_empty_activity(self) -> Dict:
-        """Create empty session activity structure"""
-        return {
-            "status": "idle",
-            "active_tool": None,
-            "tool_counts": {},
-            "timeline": [],
-            "totals": {
-                "calls": 0,
-                "duration_ms": 0,
-                "started_at": None
-            }
-        }
-
     def _check_claude_code(self) -> bool:
         """Check if Claude Code CLI is available"""
         try:
@@ -112,8 +103,7 @@ class AgentState:
         self.session_context_tokens = 0
         # Note: current_model is NOT reset - it persists until explicitly changed
         # Reset session activity tracking
-        self.session_activity = self._create_empty_activity()
-        self.tool_outputs = {}
+        self.activity.clear()
 
 
 # Global agent state instance
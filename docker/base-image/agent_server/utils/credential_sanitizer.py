@@ -6,6 +6,12 @@ via execution logs, subprocess output, and agent responses.
 
 Security: This module is critical for preventing credential exposure.
 All subprocess output and agent responses should be filtered through this.
+
+Performance: sanitize_text() runs on every stream-json string field, and most
+fields contain nothing to redact. Each redaction pass is therefore guarded by
+one precompiled combined pattern (a necessary condition for the pass to change
+anything); only text that hits a guard runs the exact per-pattern pass.
+Redaction results are identical to running every pass unconditionally.
 """
 
 import os
@@ -69,14 +75,41 @@ SECRET_VALUE_PATTERNS = [
     r'Basic\s+[a-zA-Z0-9+/=]+',       # Basic auth
 ]
 
+REDACTION_PLACEHOLDER = "***REDACTED***"
+
 # Compiled patterns for performance
 _sensitive_var_re = [re.compile(p, re.IGNORECASE) for p in SENSITIVE_VAR_PATTERNS]
 _secret_value_re = [re.compile(p) for p in SECRET_VALUE_PATTERNS]
 
+# Matches wherever any secret value pattern matches
+_secret_value_any_re = re.compile("|".join(f"(?:{p})" for p in SECRET_VALUE_PATTERNS))
+
+# KEY=value redaction: one (guard, pattern) pair per sensitive variable pattern.
+# A guard is the variable pattern without its leading/trailing ".*" followed by
+# a "=" later on the same line; the leading ".*" otherwise makes every search
+# quadratic in the line length.
+def _sensitive_var_guard(pattern: str) -> str:
+    return pattern.removeprefix('.*').removesuffix('.*')
+
+
+_sensitive_kv_re = [
+    (
+        re.compile(_sensitive_var_guard(p) + r'[^\n]*=', re.IGNORECASE),
+        re.compile(r'(' + p + r')=(["\']?)([^\s"\']+)\2', re.IGNORECASE),
+    )
+    for p in SENSITIVE_VAR_PATTERNS
+]
+_sensitive_kv_any_re = re.compile(
+    "(?:" + "|".join(_sensitive_var_guard(p) for p in SENSITIVE_VAR_PATTERNS) + r')[^\n]*=',
+    re.IGNORECASE
+)
+_kv_replacement = r'\1=' + REDACTION_PLACEHOLDER
+
 # Cache for known credential values (loaded from environment)
 _credential_values: Optional[Set[str]] = None
-
-REDACTION_PLACEHOLDER = "***REDACTED***"
+# Alternation of the cached credential values, rebuilt with the cache
+_credential_values_re: Optional[re.Pattern] = None
+_credential_values_compiled_for: Optional[Set[str]] = None
 
 
 def _load_credential_values() -> Set[str]:
@@ -116,6 +149,14 @@ def _load_credential_values() -> Set[str]:
     return values
 
 
+def _compile_credential_values(values: Set[str]) -> Optional[re.Pattern]:
+    """Compile credential values into one alternation (longest first)."""
+    if not values:
+        return None
+    ordered = sorted(values, key=len, reverse=True)
+    return re.compile("|".join(re.escape(value) for value in ordered))
+
+
 def get_credential_values() -> Set[str]:
     """Get cached set of known credential values."""
     global _credential_values
@@ -125,10 +166,22 @@ def get_credential_values() -> Set[str]:
     return _credential_values
 
 
+def _get_credential_values_re() -> Optional[re.Pattern]:
+    """Get the compiled alternation for the current credential values cache."""
+    global _credential_values_re, _credential_values_compiled_for
+    values = get_credential_values()
+    if values is not _credential_values_compiled_for:
+        _credential_values_re = _compile_credential_values(values)
+        _credential_values_compiled_for = values
+    return _credential_values_re
+
+
 def refresh_credential_values():
     """Refresh the credential values cache (call after credential injection)."""
-    global _credential_values
+    global _credential_values, _credential_values_re, _credential_values_compiled_for
     _credential_values = _load_credential_values()
+    _credential_values_re = _compile_credential_values(_credential_values)
+    _credential_values_compiled_for = _credential_values
     logger.info(f"Refreshed credential cache with {len(_credential_values)} values")
 
 
@@ -152,24 +205,27 @@ def sanitize_text(text: str) -> str:
 
     result = text
 
+    # Each pass is skipped when its guard does not match, i.e. when every
+    # pattern in the pass would leave the text unchanged.
+
     # 1. Replace known credential values (exact match)
-    for value in get_credential_values():
-        if value in result:
-            result = result.replace(value, REDACTION_PLACEHOLDER)
+    values_re = _get_credential_values_re()
+    if values_re is not None and values_re.search(result):
+        for value in get_credential_values():
+            if value in result:
+                result = result.replace(value, REDACTION_PLACEHOLDER)
 
     # 2. Replace values matching secret patterns
-    for pattern in _secret_value_re:
-        result = pattern.sub(REDACTION_PLACEHOLDER, result)
+    if _secret_value_any_re.search(result):
+        for pattern in _secret_value_re:
+            result = pattern.sub(REDACTION_PLACEHOLDER, result)
 
     # 3. Redact key=value pairs where key is sensitive
     # Handle: KEY=value, KEY="value", KEY='value'
-    for var_pattern in _sensitive_var_re:
-        # Match: SENSITIVE_VAR=somevalue or SENSITIVE_VAR="somevalue"
-        kv_pattern = re.compile(
-            r'(' + var_pattern.pattern + r')=(["\']?)([^\s"\']+)\2',
-            re.IGNORECASE
-        )
-        result = kv_pattern.sub(r'\1=' + REDACTION_PLACEHOLDER, result)
+    if '=' in result and _sensitive_kv_any_re.search(result):
+        for guard, kv_pattern in _sensitive_kv_re:
+            if guard.search(result):
+                result = kv_pattern.sub(_kv_replacement, result)
 
     return result
 
@@ -15,13 +15,21 @@ The actual implementations are organized in submodules under db/:
 For backward compatibility, all models and the global `db` instance are
 re-exported from this module.
 
+Async request handlers should use `async_db` instead of `db`: it exposes the
+same methods as coroutines that run on a dedicated DB thread pool, so SQLite
+work never blocks the event loop.
+
 Redis is still used for:
 - Credential secrets (fast access)
 - OAuth state (ephemeral, TTL-based)
 - Sessions/cache
 """
 
+import asyncio
+import contextvars
+import functools
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -96,10 +104,10 @@ from db_models import (
 )
 
 # Re-export connection utilities
-from db.connection import get_db_connection, DB_PATH
+from db.connection import get_db_connection, close_db_connections, DB_PATH, DB_POOL_SIZE
 
 # Import schema and migration utilities
-from db.migrations import run_all_migrations
+from db.migrations import run_all_migrations, ensure_schedule_change_feed
 from db.schema import init_schema
 
 # Import operation classes
@@ -126,6 +134,7 @@ from db.slack import SlackOperations
 from db.slack_channels import SlackChannelOperations
 from db.nevermined import NeverminedOperations
 from db.operator_queue import OperatorQueueOperations
+from db.scheduler_events import publish_schedules_changed
 
 
 def init_database():
@@ -134,7 +143,8 @@ def init_database():
     1. Creates database directory if needed
     2. Runs all migrations (idempotent)
     3. Creates schema (tables and indexes)
-    4. Ensures admin user exists
+    4. Creates the schedule change feed (SCHED-SYNC-001)
+    5. Ensures admin user exists
     """
     db_path = Path(DB_PATH)
     db_path.parent.mkdir(parents=True, exist_ok=True)
@@ -148,6 +158,9 @@ def init_database():
         # Create schema (tables and indexes)
         init_schema(cursor, conn)
 
+        # Change-feed triggers are created on the schedule tables
+        ensure_schedule_change_feed(cursor, conn)
+
         # Create default admin user if not exists
         _ensure_admin_user(cursor, conn)
 
@@ -413,6 +426,16 @@ class DatabaseManager:
     def get_all_agents_parallel_capacity(self):
         return self._agent_ops.get_all_agents_parallel_capacity()
 
+    # =========================================================================
+    # Execution Queue Depth (delegated to db/agents.py) - QUEUE-FAIR-001
+    # =========================================================================
+
+    def get_max_queue_depth(self, agent_name: str) -> int:
+        return self._agent_ops.get_max_queue_depth(agent_name)
+
+    def set_max_queue_depth(self, agent_name: str, depth: int) -> bool:
+        return self._agent_ops.set_max_queue_depth(agent_name, depth)
+
     # =========================================================================
     # Execution Timeout (delegated to db/agents.py) - TIMEOUT-001
     # =========================================================================
@@ -461,6 +484,12 @@ class DatabaseManager:
     def validate_mcp_api_key(self, api_key: str):
         return self._mcp_key_ops.validate_mcp_api_key(api_key)
 
+    def record_mcp_key_usage(self, key_id: str):
+        return self._mcp_key_ops.record_usage(key_id)
+
+    def flush_mcp_key_usage(self):
+        return self._mcp_key_ops.flush_usage()
+
     def get_mcp_api_key(self, key_id: str, username: str):
         return self._mcp_key_ops.get_mcp_api_key(key_id, username)
 
@@ -481,7 +510,11 @@ class DatabaseManager:
     # =========================================================================
 
     def create_schedule(self, agent_name: str, username: str, schedule_data: ScheduleCreate):
-        return self._schedule_ops.create_schedule(agent_name, username, schedule_data)
+        schedule = self._schedule_ops.create_schedule(agent_name, username, schedule_data)
+        if schedule:
+            # Wake the scheduler's incremental sync (SCHED-SYNC-001)
+            publish_schedules_changed(schedule.id)
+        return schedule
 
     def get_schedule(self, schedule_id: str):
         return self._schedule_ops.get_schedule(schedule_id)
@@ -500,19 +533,31 @@ class DatabaseManager:
         return self._schedule_ops.list_all_schedules()
 
     def update_schedule(self, schedule_id: str, username: str, updates: dict):
-        return self._schedule_ops.update_schedule(schedule_id, username, updates)
+        schedule = self._schedule_ops.update_schedule(schedule_id, username, updates)
+        if schedule:
+            publish_schedules_changed(schedule_id)
+        return schedule
 
     def delete_schedule(self, schedule_id: str, username: str):
-        return self._schedule_ops.delete_schedule(schedule_id, username)
+        deleted = self._schedule_ops.delete_schedule(schedule_id, username)
+        if deleted:
+            publish_schedules_changed(schedule_id)
+        return deleted
 
     def set_schedule_enabled(self, schedule_id: str, enabled: bool):
-        return self._schedule_ops.set_schedule_enabled(schedule_id, enabled)
+        updated = self._schedule_ops.set_schedule_enabled(schedule_id, enabled)
+        if updated:
+            publish_schedules_changed(schedule_id)
+        return updated
 
     def update_schedule_run_times(self, schedule_id: str, last_run_at=None, next_run_at=None):
         return self._schedule_ops.update_schedule_run_times(schedule_id, last_run_at, next_run_at)
 
     def delete_agent_schedules(self, agent_name: str):
-        return self._schedule_ops.delete_agent_schedules(agent_name)
+        deleted = self._schedule_ops.delete_agent_schedules(agent_name)
+        if deleted:
+            publish_schedules_changed()
+        return deleted
 
     # =========================================================================
     # Schedule Execution Management (delegated to db/schedules.py)
@@ -1107,6 +1152,9 @@ class DatabaseManager:
             network_metrics, business_metrics, error_message
         )
 
+    def create_health_checks(self, records: list):
+        return self._monitoring_ops.create_health_checks(records)
+
     def get_latest_health_check(self, agent_name: str, check_type: str = "aggregate"):
         return self._monitoring_ops.get_latest_health_check(agent_name, check_type)
 
@@ -1351,3 +1399,50 @@ class DatabaseManager:
 
 # Global database manager instance
 db = DatabaseManager()
+
+
+class AsyncDatabaseManager:
+    """
+    Awaitable facade over DatabaseManager.
+
+    Every public DatabaseManager method is available under the same name as a
+    coroutine function:
+
+        user = await async_db.get_user_by_username(username)
+
+    Calls run on a dedicated executor sized to the connection pool, so slow
+    queries cannot starve the default executor (used for Docker calls) and
+    concurrent requests never wait for more connections than the pool keeps.
+    """
+
+    def __init__(self, manager: DatabaseManager, max_workers: int = DB_POOL_SIZE):
+        self._manager = manager
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="trinity-db")
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        method = getattr(self._manager, name)
+        if not callable(method):
+            raise AttributeError(f"DatabaseManager.{name} is not a method")
+
+        @functools.wraps(method)
+        async def call(*args, **kwargs):
+            loop = asyncio.get_running_loop()
+            # Propagate contextvars (request-scoped logging context) like asyncio.to_thread
+            ctx = contextvars.copy_context()
+            return await loop.run_in_executor(
+                self._executor, functools.partial(ctx.run, method, *args, **kwargs)
+            )
+
+        # Cache the wrapper so subsequent lookups skip __getattr__
+        setattr(self, name, call)
+        return call
+
+    def shutdown(self):
+        """Stop the DB executor (called on application shutdown)."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Async facade for request handlers
+async_db = AsyncDatabaseManager(db)
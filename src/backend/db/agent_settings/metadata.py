@@ -8,6 +8,7 @@ import sqlite3
 from typing import List, Dict
 
 from db.connection import get_db_connection
+from db.auth_cache import principal_cache
 
 
 class MetadataMixin:
@@ -206,6 +207,8 @@ class MetadataMixin:
                 )
 
                 conn.commit()
+                # Cached MCP principals still carry the old agent name
+                principal_cache.invalidate_agent(old_name)
                 return True
 
             except sqlite3.IntegrityError:
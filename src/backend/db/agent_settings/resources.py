@@ -1,7 +1,7 @@
 """
-Agent resource limits, parallel capacity, and execution timeout operations.
+Agent resource limits, parallel capacity, queue depth, and execution timeout operations.
 
-Handles memory/CPU limits, max parallel tasks, and task timeout settings.
+Handles memory/CPU limits, max parallel tasks, execution queue depth, and task timeout settings.
 """
 
 from typing import Optional, Dict
@@ -10,7 +10,7 @@ from db.connection import get_db_connection
 
 
 class ResourcesMixin:
-    """Mixin for agent resource limits, parallel capacity, and execution timeout."""
+    """Mixin for agent resource limits, parallel capacity, queue depth, and execution timeout."""
 
     # =========================================================================
     # Resource Limits
@@ -128,6 +128,55 @@ class ResourcesMixin:
             """)
             return {row["agent_name"]: row["max_parallel_tasks"] for row in cursor.fetchall()}
 
+    # =========================================================================
+    # Execution Queue Depth (QUEUE-FAIR-001)
+    # =========================================================================
+
+    def get_max_queue_depth(self, agent_name: str) -> int:
+        """
+        Get max_queue_depth for an agent (default: 3).
+
+        Args:
+            agent_name: Name of the agent
+
+        Returns:
+            Maximum number of requests waiting in the execution queue (1-50, default 3)
+        """
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT COALESCE(max_queue_depth, 3) as max_queue_depth
+                FROM agent_ownership WHERE agent_name = ?
+            """, (agent_name,))
+            row = cursor.fetchone()
+            if row:
+                return row["max_queue_depth"]
+            return 3  # Default
+
+    def set_max_queue_depth(self, agent_name: str, depth: int) -> bool:
+        """
+        Set max_queue_depth for an agent.
+
+        Args:
+            agent_name: Name of the agent
+            depth: Maximum waiting requests (must be 1-50)
+
+        Returns:
+            True if update succeeded
+        """
+        # Validate range
+        if depth < 1 or depth > 50:
+            return False
+
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                UPDATE agent_ownership SET max_queue_depth = ?
+                WHERE agent_name = ?
+            """, (depth, agent_name))
+            conn.commit()
+            return cursor.rowcount > 0
+
     # =========================================================================
     # Execution Timeout (TIMEOUT-001)
     # =========================================================================
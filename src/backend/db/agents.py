@@ -83,7 +83,7 @@ class AgentOperations(
 
     def get_agent_owner(self, agent_name: str) -> Optional[Dict]:
         """Get the owner of an agent, including is_system flag."""
-        with get_db_connection() as conn:
+        with get_db_connection(readonly=True) as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT ao.id, ao.agent_name, ao.owner_id, u.username as owner_username,
@@ -105,7 +105,7 @@ class AgentOperations(
         if not user:
             return []
 
-        with get_db_connection() as conn:
+        with get_db_connection(readonly=True) as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT agent_name FROM agent_ownership WHERE owner_id = ?
@@ -0,0 +1,214 @@
+"""
+Authentication caches.
+
+Every authenticated request used to decode its JWT and read the user row, and
+every MCP-key request ran a JOIN plus an `UPDATE mcp_api_keys SET usage_count`
+write. This module holds:
+
+- `principal_cache`: TTL/LRU cache of resolved principals keyed by a hash of
+  the presented token. Entries are tagged with the username / key id / agent
+  name they depend on so writes to users and MCP keys can invalidate them.
+- `UsageBuffer`: in-memory MCP key usage counters flushed to the database in
+  batches by a background thread.
+
+The cache is per process. Writes invalidate entries in the worker that made
+them, and once the cache is attached to the cross-worker event relay
+(`attach_relay`) the invalidation is sent to every other worker as well, so a
+revoked key or deactivated user stops authenticating everywhere. While the
+relay is disconnected invalidations can be missed, so cached principals are
+not served until it reconnects.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+AUTH_CACHE_TTL = float(os.getenv("AUTH_CACHE_TTL", "60"))  # seconds
+AUTH_CACHE_MAX_ENTRIES = int(os.getenv("AUTH_CACHE_MAX_ENTRIES", "4096"))
+MCP_KEY_USAGE_FLUSH_INTERVAL = float(os.getenv("MCP_KEY_USAGE_FLUSH_INTERVAL", "10"))  # seconds
+
+# Event relay topic for invalidations made in another worker
+AUTH_INVALIDATE_TOPIC = "auth.invalidate"
+_TAGS = ("username", "key_id", "agent_name")
+
+
+def hash_token(token: str) -> str:
+    """Hash a bearer token for use as a cache key (tokens are never stored)."""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+class PrincipalCache:
+    """Thread-safe TTL + LRU cache with tag-based invalidation."""
+
+    def __init__(self, max_entries: int = AUTH_CACHE_MAX_ENTRIES, ttl: float = AUTH_CACHE_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Any, Dict[str, str]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._relay = None
+        self.hits = 0
+        self.misses = 0
+
+    def attach_relay(self, relay) -> None:
+        """
+        Share invalidations with the other workers through the event relay.
+
+        Invalidations made here are published on AUTH_INVALIDATE_TOPIC and
+        the other workers' invalidations are applied locally.
+        """
+        self._relay = relay
+        relay.add_handler(AUTH_INVALIDATE_TOPIC, self._apply_remote)
+
+    def _apply_remote(self, payload: dict) -> None:
+        tag, value = payload.get("tag"), payload.get("value")
+        if tag in _TAGS and isinstance(value, str):
+            self._invalidate(tag, value, propagate=False)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        now = time.monotonic()
+        with self._lock:
+            if self._relay is not None and not self._relay.is_connected:
+                # Other workers' invalidations may be lost: fail closed
+                self._entries.clear()
+                self.misses += 1
+                return None
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value, _ = entry
+            if expires_at <= now:
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[float] = None,
+        username: Optional[str] = None,
+        key_id: Optional[str] = None,
+        agent_name: Optional[str] = None,
+    ) -> None:
+        """Cache a value. Tags identify the records it was derived from."""
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if ttl <= 0:
+            return
+        tags = {"username": username, "key_id": key_id, "agent_name": agent_name}
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value, tags)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _invalidate(self, tag: str, value: str, propagate: bool = True) -> int:
+        with self._lock:
+            stale = [k for k, (_, _, tags) in self._entries.items() if tags.get(tag) == value]
+            for k in stale:
+                del self._entries[k]
+        if propagate and self._relay is not None:
+            self._relay.publish(AUTH_INVALIDATE_TOPIC, {"tag": tag, "value": value})
+        return len(stale)
+
+    def invalidate_user(self, username: str) -> int:
+        """Drop entries resolved for a user (role/email/profile changed)."""
+        return self._invalidate("username", username)
+
+    def invalidate_key(self, key_id: str) -> int:
+        """Drop entries for an MCP API key (revoked, deleted or re-scoped)."""
+        return self._invalidate("key_id", key_id)
+
+    def invalidate_agent(self, agent_name: str) -> int:
+        """Drop entries for an agent-scoped key (agent deleted or renamed)."""
+        return self._invalidate("agent_name", agent_name)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class UsageBuffer:
+    """
+    Accumulates MCP key usage in memory and flushes it in batches.
+
+    `flush_fn` receives `{key_id: (count, last_used_at)}` and writes it to the
+    database. A failed flush puts the counts back so they are retried.
+    """
+
+    def __init__(self, flush_fn: Callable[[Dict[str, Tuple[int, str]]], None],
+                 interval: float = MCP_KEY_USAGE_FLUSH_INTERVAL):
+        self._flush_fn = flush_fn
+        self.interval = interval
+        self._pending: Dict[str, Tuple[int, str]] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def record(self, key_id: str, used_at: str) -> None:
+        """Count one use of a key (no database access)."""
+        with self._lock:
+            count, _ = self._pending.get(key_id, (0, used_at))
+            self._pending[key_id] = (count + 1, used_at)
+        self._ensure_flusher()
+
+    def pending(self) -> Dict[str, Tuple[int, str]]:
+        with self._lock:
+            return dict(self._pending)
+
+    def flush(self) -> int:
+        """Write pending counts to the database. Returns number of keys flushed."""
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+            if not batch:
+                return 0
+            try:
+                self._flush_fn(batch)
+            except Exception as e:
+                logger.warning(f"Failed to flush MCP key usage ({len(batch)} keys): {e}")
+                with self._lock:
+                    for key_id, (count, used_at) in batch.items():
+                        pending_count, pending_at = self._pending.get(key_id, (0, used_at))
+                        self._pending[key_id] = (count + pending_count, max(used_at, pending_at))
+                return 0
+            return len(batch)
+
+    def _ensure_flusher(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="mcp-key-usage-flusher", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.flush()
+
+    def stop(self) -> None:
+        """Stop the background flusher and write remaining counts."""
+        self._stop.set()
+        self.flush()
+
+
+# Global principal cache shared by the DB layer and auth dependencies
+principal_cache = PrincipalCache()
@@ -11,6 +11,7 @@ from datetime import datetime
 from typing import Optional, List, Dict
 
 from .connection import get_db_connection
+from .auth_cache import principal_cache, UsageBuffer
 from db_models import McpApiKey, McpApiKeyCreate, McpApiKeyWithSecret
 
 
@@ -20,6 +21,8 @@ class McpKeyOperations:
     def __init__(self, user_ops):
         """Initialize with reference to user operations for lookups."""
         self._user_ops = user_ops
+        # Usage counters are batched instead of written on every validation
+        self._usage = UsageBuffer(self._write_usage)
 
     @staticmethod
     def _generate_id() -> str:
@@ -162,6 +165,7 @@ class McpKeyOperations:
 
     def get_agent_mcp_api_key(self, agent_name: str) -> Optional[McpApiKey]:
         """Get the MCP API key for an agent (does not return the secret)."""
+        self.flush_usage()
         with get_db_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("""
@@ -185,11 +189,15 @@ class McpKeyOperations:
             """, (agent_name,))
             deleted = cursor.rowcount > 0
             conn.commit()
+            principal_cache.invalidate_agent(agent_name)
             return deleted
 
     def validate_mcp_api_key(self, api_key: str) -> Optional[Dict]:
         """Validate an MCP API key and return user/agent info if valid.
 
+        Valid keys are cached (see db/auth_cache.py) and usage statistics are
+        accumulated in memory, so repeat validations do not touch the database.
+
         Returns:
             Dict with key info including:
             - key_id, key_name: Key identifiers
@@ -198,8 +206,14 @@ class McpKeyOperations:
             - scope: 'user' or 'agent'
         """
         key_hash = self._hash_api_key(api_key)
+        cache_key = f"mcp:{key_hash}"
 
-        with get_db_connection() as conn:
+        cached = principal_cache.get(cache_key)
+        if cached is not None:
+            self.record_usage(cached["key_id"])
+            return dict(cached)
+
+        with get_db_connection(readonly=True) as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT k.id, k.name, k.user_id, k.is_active, k.agent_name, k.scope,
@@ -210,33 +224,49 @@ class McpKeyOperations:
             """, (key_hash,))
             row = cursor.fetchone()
 
-            if not row:
-                return None
+        if not row:
+            return None
 
-            if not row["is_active"]:
-                return None
+        if not row["is_active"]:
+            return None
 
-            # Update usage statistics
-            now = datetime.utcnow().isoformat()
-            cursor.execute("""
+        # Include agent collaboration fields
+        key_info = {
+            "key_id": row["id"],
+            "key_name": row["name"],
+            "user_id": row["username"],  # Return username for backward compat
+            "user_email": row["email"],
+            "agent_name": row["agent_name"],  # Agent name if scope is 'agent'
+            "scope": row["scope"] or "user"  # 'user' or 'agent'
+        }
+        principal_cache.put(
+            cache_key, key_info,
+            username=row["username"], key_id=row["id"], agent_name=row["agent_name"]
+        )
+        self.record_usage(row["id"])
+        return dict(key_info)
+
+    def record_usage(self, key_id: str):
+        """Count one use of a key; persisted by the next batch flush."""
+        self._usage.record(key_id, datetime.utcnow().isoformat())
+
+    def flush_usage(self) -> int:
+        """Write buffered usage statistics to mcp_api_keys."""
+        return self._usage.flush()
+
+    @staticmethod
+    def _write_usage(batch: Dict[str, tuple]):
+        """Apply a batch of {key_id: (count, last_used_at)} in one transaction."""
+        with get_db_connection() as conn:
+            conn.executemany("""
                 UPDATE mcp_api_keys
-                SET last_used_at = ?, usage_count = usage_count + 1
+                SET last_used_at = ?, usage_count = usage_count + ?
                 WHERE id = ?
-            """, (now, row["id"]))
-            conn.commit()
-
-            # Include agent collaboration fields
-            return {
-                "key_id": row["id"],
-                "key_name": row["name"],
-                "user_id": row["username"],  # Return username for backward compat
-                "user_email": row["email"],
-                "agent_name": row["agent_name"],  # Agent name if scope is 'agent'
-                "scope": row["scope"] or "user"  # 'user' or 'agent'
-            }
+            """, [(used_at, count, key_id) for key_id, (count, used_at) in batch.items()])
 
     def get_mcp_api_key(self, key_id: str, username: str) -> Optional[McpApiKey]:
         """Get MCP API key metadata."""
+        self.flush_usage()
         user = self._user_ops.get_user_by_username(username)
         if not user:
             return None
@@ -254,6 +284,7 @@ class McpKeyOperations:
 
     def list_mcp_api_keys(self, username: str) -> List[McpApiKey]:
         """List all MCP API keys for a user."""
+        self.flush_usage()
         user = self._user_ops.get_user_by_username(username)
         if not user:
             return []
@@ -271,6 +302,7 @@ class McpKeyOperations:
 
     def list_all_mcp_api_keys(self) -> List[McpApiKey]:
         """List all MCP API keys (admin only)."""
+        self.flush_usage()
         with get_db_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("""
@@ -299,6 +331,7 @@ class McpKeyOperations:
 
             cursor.execute("UPDATE mcp_api_keys SET is_active = 0 WHERE id = ?", (key_id,))
             conn.commit()
+            principal_cache.invalidate_key(key_id)
             return cursor.rowcount > 0
 
     def delete_mcp_api_key(self, key_id: str, username: str) -> bool:
@@ -319,4 +352,5 @@ class McpKeyOperations:
 
             cursor.execute("DELETE FROM mcp_api_keys WHERE id = ?", (key_id,))
             conn.commit()
+            principal_cache.invalidate_key(key_id)
             return cursor.rowcount > 0
@@ -34,6 +34,10 @@ Migration Order (as of 2026-02-28):
 27. agent_ownership_execution_timeout - TIMEOUT-001 per-agent execution timeout
 28. public_user_memory_table - MEM-001 per-user persistent memory for public link agents
 29. subscription_rate_limit_tracking - SUB-003 rate-limit event tracking for auto-switch
+30. agent_ownership_queue_depth - QUEUE-FAIR-001 per-agent execution queue depth
+
+The schedule change feed (SCHED-SYNC-001, ensure_schedule_change_feed) needs
+agent_schedules, so init_database() runs it after the schema instead.
 """
 
 
@@ -76,6 +80,7 @@ def run_all_migrations(cursor, conn):
         ("chat_messages_source_column", _migrate_chat_messages_source_column),
         ("agent_ownership_voice_prompt", _migrate_agent_ownership_voice_prompt),
         ("slack_channel_agents", _migrate_slack_channel_agents),
+        ("agent_ownership_queue_depth", _migrate_agent_ownership_queue_depth),
     ]
 
     for name, migration_fn in migrations:
@@ -888,3 +893,145 @@ def _migrate_slack_channel_agents(cursor, conn):
             print(f"Migrated {migrated} workspace(s) from slack_link_connections to slack_workspaces")
 
     conn.commit()
+
+
+def _migrate_agent_ownership_queue_depth(cursor, conn):
+    """Add max_queue_depth column to agent_ownership table (QUEUE-FAIR-001).
+
+    Per-agent depth of the execution queue (requests waiting for the agent
+    while another execution runs). Range: 1-50, Default: 3.
+    """
+    cursor.execute("PRAGMA table_info(agent_ownership)")
+    columns = {row[1] for row in cursor.fetchall()}
+
+    if "max_queue_depth" not in columns:
+        print("Adding max_queue_depth column to agent_ownership for execution queue depth...")
+        cursor.execute("ALTER TABLE agent_ownership ADD COLUMN max_queue_depth INTEGER DEFAULT 3")
+
+    conn.commit()
+
+
+# =========================================================================
+# Schedule Change Feed (SCHED-SYNC-001)
+# =========================================================================
+#
+# Triggers on agent_schedules and process_schedules append a row to
+# schedule_changes whenever a schedule is created, deleted, or changes a
+# field its APScheduler job depends on. The AUTOINCREMENT key is a
+# monotonically increasing revision, and deletes are kept as tombstones,
+# so the scheduler only reads rows changed since the last revision it
+# applied. Triggers fire for every writer (backend API, process publishing,
+# the scheduler itself), and run-time bookkeeping writes are not recorded.
+# The scheduler (src/scheduler/database.py) checks for these objects by name.
+
+SCHEDULE_CHANGE_FEED_DDL = [
+    # The scheduler and process publishing also create process_schedules on
+    # first use; the triggers need it now.
+    """
+    CREATE TABLE IF NOT EXISTS process_schedules (
+        id TEXT PRIMARY KEY,
+        process_id TEXT NOT NULL,
+        process_name TEXT NOT NULL,
+        trigger_id TEXT NOT NULL,
+        cron_expression TEXT NOT NULL,
+        enabled INTEGER DEFAULT 1,
+        timezone TEXT DEFAULT 'UTC',
+        description TEXT,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL,
+        last_run_at TEXT,
+        next_run_at TEXT,
+        UNIQUE(process_id, trigger_id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS schedule_changes (
+        revision INTEGER PRIMARY KEY AUTOINCREMENT,
+        schedule_type TEXT NOT NULL,
+        schedule_id TEXT NOT NULL,
+        operation TEXT NOT NULL,
+        changed_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%f', 'now'))
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_agent_schedules_insert
+    AFTER INSERT ON agent_schedules
+    BEGIN
+        INSERT INTO schedule_changes (schedule_type, schedule_id, operation)
+        VALUES ('agent', NEW.id, 'insert');
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_agent_schedules_update
+    AFTER UPDATE ON agent_schedules
+    WHEN OLD.enabled IS NOT NEW.enabled
+      OR OLD.cron_expression IS NOT NEW.cron_expression
+      OR OLD.timezone IS NOT NEW.timezone
+      OR OLD.name IS NOT NEW.name
+      OR OLD.agent_name IS NOT NEW.agent_name
+    BEGIN
+        INSERT INTO schedule_changes (schedule_type, schedule_id, operation)
+        VALUES ('agent', NEW.id, 'update');
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_agent_schedules_delete
+    AFTER DELETE ON agent_schedules
+    BEGIN
+        INSERT INTO schedule_changes (schedule_type, schedule_id, operation)
+        VALUES ('agent', OLD.id, 'delete');
+    END
+    """,
+    # Process publishing uses INSERT OR REPLACE with a fresh id; the
+    # implicit delete of the old row does not fire delete triggers, so
+    # record the tombstone before the insert.
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_process_schedules_replace
+    BEFORE INSERT ON process_schedules
+    BEGIN
+        INSERT INTO schedule_changes (schedule_type, schedule_id, operation)
+        SELECT 'process', id, 'delete' FROM process_schedules
+        WHERE process_id = NEW.process_id AND trigger_id = NEW.trigger_id AND id != NEW.id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_process_schedules_insert
+    AFTER INSERT ON process_schedules
+    BEGIN
+        INSERT INTO schedule_changes (schedule_type, schedule_id, operation)
+        VALUES ('process', NEW.id, 'insert');
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_process_schedules_update
+    AFTER UPDATE ON process_schedules
+    WHEN OLD.enabled IS NOT NEW.enabled
+      OR OLD.cron_expression IS NOT NEW.cron_expression
+      OR OLD.timezone IS NOT NEW.timezone
+      OR OLD.process_name IS NOT NEW.process_name
+      OR OLD.trigger_id IS NOT NEW.trigger_id
+    BEGIN
+        INSERT INTO schedule_changes (schedule_type, schedule_id, operation)
+        VALUES ('process', NEW.id, 'update');
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_process_schedules_delete
+    AFTER DELETE ON process_schedules
+    BEGIN
+        INSERT INTO schedule_changes (schedule_type, schedule_id, operation)
+        VALUES ('process', OLD.id, 'delete');
+    END
+    """,
+]
+
+
+def ensure_schedule_change_feed(cursor, conn):
+    """Create the schedule_changes table and its triggers (SCHED-SYNC-001).
+
+    Called from init_database() after the schema, since the triggers need
+    agent_schedules. Idempotent.
+    """
+    for statement in SCHEDULE_CHANGE_FEED_DDL:
+        cursor.execute(statement)
+    conn.commit()
@@ -7,11 +7,11 @@ and historical data for trend analysis.
 
 import json
 import secrets
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Optional, List, Dict, Any
 
 from .connection import get_db_connection
-from utils.helpers import utc_now_iso
+from utils.helpers import parse_iso_timestamp, utc_now_iso
 
 
 class MonitoringOperations:
@@ -46,17 +46,34 @@ class MonitoringOperations:
         Returns:
             ID of created record
         """
-        check_id = f"hc_{secrets.token_urlsafe(12)}"
-        now = utc_now_iso()
+        return self.create_health_checks([{
+            "agent_name": agent_name,
+            "check_type": check_type,
+            "status": status,
+            "docker_metrics": docker_metrics,
+            "network_metrics": network_metrics,
+            "business_metrics": business_metrics,
+            "error_message": error_message,
+        }])[0]
+
+    def create_health_checks(self, records: List[Dict[str, Any]]) -> List[str]:
+        """
+        Create several health check records in one transaction.
 
-        # Extract metrics from dicts
-        docker = docker_metrics or {}
-        network = network_metrics or {}
-        business = business_metrics or {}
+        Args:
+            records: Dicts with the keyword arguments of create_health_check
+
+        Returns:
+            IDs of created records, in order
+        """
+        now = utc_now_iso()
+        rows = [self._health_check_row(record, now) for record in records]
+        if not rows:
+            return []
 
         with get_db_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
+            cursor.executemany("""
                 INSERT INTO agent_health_checks (
                     id, agent_name, check_type, status,
                     container_status, cpu_percent, memory_percent, memory_mb,
@@ -66,35 +83,48 @@ class MonitoringOperations:
                     active_executions, error_rate,
                     error_message, checked_at, created_at
                 ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                check_id,
-                agent_name,
-                check_type,
-                status,
-                # Docker metrics
-                docker.get("container_status"),
-                docker.get("cpu_percent"),
-                docker.get("memory_percent"),
-                docker.get("memory_mb"),
-                docker.get("restart_count"),
-                1 if docker.get("oom_killed") else 0 if docker.get("oom_killed") is False else None,
-                # Network metrics
-                1 if network.get("reachable") else 0 if network.get("reachable") is False else None,
-                network.get("latency_ms"),
-                # Business metrics
-                1 if business.get("runtime_available") else 0 if business.get("runtime_available") is False else None,
-                1 if business.get("claude_available") else 0 if business.get("claude_available") is False else None,
-                business.get("context_percent"),
-                business.get("active_executions"),
-                business.get("error_rate"),
-                # Common fields
-                error_message,
-                now,
-                now,
-            ))
+            """, rows)
             conn.commit()
 
-        return check_id
+        return [row[0] for row in rows]
+
+    @staticmethod
+    def _health_check_row(record: Dict[str, Any], now: str) -> tuple:
+        """Convert a health check record dict to an agent_health_checks row."""
+        # Extract metrics from dicts
+        docker = record.get("docker_metrics") or {}
+        network = record.get("network_metrics") or {}
+        business = record.get("business_metrics") or {}
+
+        def flag(value):
+            return None if value is None else 1 if value else 0
+
+        return (
+            f"hc_{secrets.token_urlsafe(12)}",
+            record["agent_name"],
+            record["check_type"],
+            record["status"],
+            # Docker metrics
+            docker.get("container_status"),
+            docker.get("cpu_percent"),
+            docker.get("memory_percent"),
+            docker.get("memory_mb"),
+            docker.get("restart_count"),
+            flag(docker.get("oom_killed")),
+            # Network metrics
+            flag(network.get("reachable")),
+            network.get("latency_ms"),
+            # Business metrics
+            flag(business.get("runtime_available")),
+            flag(business.get("claude_available")),
+            business.get("context_percent"),
+            business.get("active_executions"),
+            business.get("error_rate"),
+            # Common fields
+            record.get("error_message"),
+            now,
+            now,
+        )
 
     def get_latest_health_check(
         self,
@@ -207,13 +237,31 @@ class MonitoringOperations:
         agent_name: str,
         hours: int = 24
     ) -> Optional[float]:
-        """Calculate uptime percentage for an agent over the specified period."""
+        """
+        Calculate uptime percentage for an agent over the specified period.
+
+        Time-weighted: each aggregate record's status holds until the next
+        record. The monitoring scheduler only persists status changes and
+        heartbeats, so counting records would overweight flapping periods.
+        """
         history = self.get_agent_health_history(agent_name, "aggregate", hours, limit=1000)
         if not history:
             return None
 
-        healthy_count = sum(1 for h in history if h["status"] in ["healthy", "degraded"])
-        return (healthy_count / len(history)) * 100 if history else None
+        up_states = ("healthy", "degraded")
+        end = datetime.now(timezone.utc)
+        up_seconds = total_seconds = 0.0
+        for record in history:  # newest first
+            start = parse_iso_timestamp(record["checked_at"])
+            span = max(0.0, (end - start).total_seconds())
+            total_seconds += span
+            if record["status"] in up_states:
+                up_seconds += span
+            end = min(end, start)
+
+        if total_seconds <= 0:
+            return 100.0 if history[0]["status"] in up_states else 0.0
+        return (up_seconds / total_seconds) * 100
 
     def calculate_avg_latency(
         self,
@@ -0,0 +1,117 @@
+"""
+Notifications from the backend to the dedicated scheduler.
+
+- `trinity:executions:completed` - a schedule execution reached a terminal
+  status, so the scheduler can stop waiting instead of re-reading
+  `schedule_executions` every POLL_INTERVAL seconds (SCHED-ASYNC-002).
+  Payload: {"execution_id": "...", "status": "success|failed|cancelled|..."}
+- `trinity:schedules:changed` - agent or process schedules were written, so
+  the scheduler runs its incremental sync now instead of at the next
+  SCHEDULE_RELOAD_INTERVAL tick (SCHED-SYNC-001).
+  Payload: {"schedule_id": "..." | null}
+
+Publishing is best-effort: if Redis is unavailable the event is dropped and
+the scheduler's periodic DB checks pick the change up. The Redis client is
+synchronous, so when called on an event loop thread the publish runs in the
+default executor instead of blocking the loop.
+"""
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from typing import Optional
+
+import redis
+
+from config import REDIS_URL
+
+logger = logging.getLogger(__name__)
+
+EXECUTION_EVENTS_CHANNEL = "trinity:executions:completed"
+SCHEDULE_EVENTS_CHANNEL = "trinity:schedules:changed"
+
+# After a publish failure, skip publishing for this long so DB writes are not
+# stalled by repeated Redis connect timeouts.
+_FAILURE_BACKOFF_SECONDS = 30.0
+
+
+class SchedulerEventPublisher:
+    """Publishes scheduler notifications to Redis pub/sub."""
+
+    def __init__(self, redis_url: str = REDIS_URL):
+        self.redis_url = redis_url
+        self._redis: Optional[redis.Redis] = None
+        self._lock = threading.Lock()
+        self._disabled_until = 0.0
+
+    @property
+    def redis(self) -> redis.Redis:
+        if self._redis is None:
+            with self._lock:
+                if self._redis is None:
+                    self._redis = redis.from_url(
+                        self.redis_url,
+                        decode_responses=True,
+                        socket_connect_timeout=1,
+                        socket_timeout=1,
+                    )
+        return self._redis
+
+    def publish(self, channel: str, payload: dict) -> bool:
+        """
+        Publish a notification.
+
+        Returns True if the event was handed to Redis. Never raises.
+        """
+        if time.monotonic() < self._disabled_until:
+            return False
+        try:
+            self.redis.publish(channel, json.dumps(payload))
+            return True
+        except Exception as e:
+            self._disabled_until = time.monotonic() + _FAILURE_BACKOFF_SECONDS
+            logger.warning(f"Failed to publish {channel} event: {e}")
+            return False
+
+    def publish_completed(self, execution_id: str, status: str) -> bool:
+        """Publish that an execution reached a terminal status."""
+        return self.publish(EXECUTION_EVENTS_CHANNEL, {"execution_id": execution_id, "status": status})
+
+    def publish_schedules_changed(self, schedule_id: Optional[str] = None) -> bool:
+        """Publish that schedules were created, updated or deleted."""
+        return self.publish(SCHEDULE_EVENTS_CHANNEL, {"schedule_id": schedule_id})
+
+
+# Global instance
+_publisher: Optional[SchedulerEventPublisher] = None
+
+
+def get_scheduler_event_publisher() -> SchedulerEventPublisher:
+    """Get the global scheduler event publisher."""
+    global _publisher
+    if _publisher is None:
+        _publisher = SchedulerEventPublisher()
+    return _publisher
+
+
+def _publish_off_loop(channel: str, payload: dict) -> bool:
+    publisher = get_scheduler_event_publisher()
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # Worker thread (e.g. asyncio.to_thread) or sync context: may block
+        return publisher.publish(channel, payload)
+    loop.run_in_executor(None, publisher.publish, channel, payload)
+    return True
+
+
+def publish_execution_completed(execution_id: str, status: str) -> bool:
+    """Publish an execution completion event (best-effort, never blocks the event loop)."""
+    return _publish_off_loop(EXECUTION_EVENTS_CHANNEL, {"execution_id": execution_id, "status": status})
+
+
+def publish_schedules_changed(schedule_id: Optional[str] = None) -> bool:
+    """Publish a schedule change notification (best-effort, never blocks the event loop)."""
+    return _publish_off_loop(SCHEDULE_EVENTS_CHANNEL, {"schedule_id": schedule_id})
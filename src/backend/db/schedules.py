@@ -15,12 +15,24 @@ import pytz
 from croniter import croniter
 
 from .connection import get_db_connection
+from .scheduler_events import publish_execution_completed
 from db_models import Schedule, ScheduleCreate, ScheduleExecution, AgentGitConfig
 from models import TaskExecutionStatus
 from utils.helpers import utc_now_iso, to_utc_iso, parse_iso_timestamp
 
 logger = logging.getLogger(__name__)
 
+# schedule_id of executions not started by a schedule (chat, API, MCP)
+MANUAL_SCHEDULE_ID = "__manual__"
+
+# Statuses the scheduler stops waiting on (SCHED-ASYNC-002)
+_TERMINAL_STATUSES = {
+    TaskExecutionStatus.SUCCESS.value,
+    TaskExecutionStatus.FAILED.value,
+    TaskExecutionStatus.CANCELLED.value,
+    TaskExecutionStatus.SKIPPED.value,
+}
+
 
 class ScheduleOperations:
     """Schedule and execution database operations."""
@@ -473,7 +485,7 @@ class ScheduleOperations:
                 ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, (
                 execution_id,
-                "__manual__",  # Special marker for manual/API-triggered tasks
+                MANUAL_SCHEDULE_ID,  # Special marker for manual/API-triggered tasks
                 agent_name,
                 TaskExecutionStatus.RUNNING,
                 now,
@@ -490,7 +502,7 @@ class ScheduleOperations:
 
             return ScheduleExecution(
                 id=execution_id,
-                schedule_id="__manual__",
+                schedule_id=MANUAL_SCHEDULE_ID,
                 agent_name=agent_name,
                 status=TaskExecutionStatus.RUNNING,
                 started_at=datetime.fromisoformat(now),
@@ -603,6 +615,9 @@ class ScheduleOperations:
     ) -> bool:
         """Update execution status when completed.
 
+        A terminal status of a schedule-triggered execution is published to
+        the dedicated scheduler, which waits on those executions (SCHED-ASYNC-002).
+
         Args:
             claude_session_id: Claude Code session ID for --resume support (EXEC-023)
         """
@@ -610,7 +625,7 @@ class ScheduleOperations:
             cursor = conn.cursor()
 
             # Get started_at for duration calculation
-            cursor.execute("SELECT started_at FROM schedule_executions WHERE id = ?", (execution_id,))
+            cursor.execute("SELECT started_at, schedule_id FROM schedule_executions WHERE id = ?", (execution_id,))
             row = cursor.fetchone()
             if not row:
                 return False
@@ -641,7 +656,12 @@ class ScheduleOperations:
                 execution_id
             ))
             conn.commit()
-            return cursor.rowcount > 0
+            updated = cursor.rowcount > 0
+
+        status_value = getattr(status, "value", status)
+        if updated and row["schedule_id"] != MANUAL_SCHEDULE_ID and status_value in _TERMINAL_STATUSES:
+            publish_execution_completed(execution_id, status_value)
+        return updated
 
     def get_schedule_executions(self, schedule_id: str, limit: int = 50) -> List[ScheduleExecution]:
         """Get execution history for a schedule."""
@@ -63,6 +63,7 @@ TABLES = {
             subscription_id TEXT,
             max_parallel_tasks INTEGER DEFAULT 3,
             execution_timeout_seconds INTEGER DEFAULT 900,
+            max_queue_depth INTEGER DEFAULT 3,
             avatar_identity_prompt TEXT,
             avatar_updated_at TEXT,
             is_default_avatar INTEGER DEFAULT 0,
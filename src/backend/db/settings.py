@@ -34,7 +34,7 @@ class SettingsOperations:
 
         Returns None if the setting doesn't exist.
         """
-        with get_db_connection() as conn:
+        with get_db_connection(readonly=True) as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT key, value, updated_at
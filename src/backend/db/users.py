@@ -8,6 +8,7 @@ from datetime import datetime
 from typing import Optional, Dict, List, Any
 
 from .connection import get_db_connection
+from .auth_cache import principal_cache
 from db_models import UserCreate
 
 
@@ -37,7 +38,7 @@ class UserOperations:
 
     def _get_user_by_field(self, field: str, value: Any) -> Optional[Dict]:
         """Generic user lookup by any field."""
-        with get_db_connection() as conn:
+        with get_db_connection(readonly=True) as conn:
             cursor = conn.cursor()
             cursor.execute(f"""
                 SELECT {self._USER_COLUMNS}
@@ -123,6 +124,7 @@ class UserOperations:
                 UPDATE users SET {", ".join(set_clauses)} WHERE username = ?
             """, params)
             conn.commit()
+            principal_cache.invalidate_user(username)
 
             return self.get_user_by_username(username)
 
@@ -197,6 +199,7 @@ class UserOperations:
                     WHERE username = ?
                 """, (auth0_sub, name, picture, datetime.utcnow().isoformat(), email))
                 conn.commit()
+            principal_cache.invalidate_user(email)
             return self.get_user_by_username(email)
 
         # Create new user
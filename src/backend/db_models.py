@@ -772,6 +772,18 @@ class MonitoringConfig(BaseModel):
     network_check_interval: int = 30
     business_check_interval: int = 60
 
+    # Scheduler (MON-SCHED-001): intervals above are scaled per agent by
+    # its last status and jittered; the scheduler wakes every tick to run
+    # the checks that are due
+    scheduler_tick_interval: int = 5
+    max_concurrent_checks: int = 10
+    healthy_interval_multiplier: float = 2.0
+    unhealthy_interval_multiplier: float = 0.5
+    interval_jitter: float = 0.1
+
+    # Unchanged check results are persisted at most this often (seconds)
+    heartbeat_interval: int = 300
+
     # Timeouts
     http_timeout: float = 10.0
     tcp_timeout: float = 5.0
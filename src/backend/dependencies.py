@@ -1,6 +1,7 @@
 """
 FastAPI dependencies for the Trinity backend.
 """
+import time
 from datetime import datetime, timedelta
 from typing import Optional, Annotated
 from fastapi import Depends, HTTPException, status, Request, Path
@@ -9,7 +10,8 @@ from jose import JWTError, jwt
 from passlib.context import CryptContext
 from models import User
 from config import SECRET_KEY, ALGORITHM
-from database import db
+from database import db, async_db
+from db.auth_cache import principal_cache, hash_token
 
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -103,6 +105,9 @@ async def get_current_user(request: Request, token: str = Depends(oauth2_scheme)
     FastAPI dependency to get the current authenticated user.
 
     Validates JWT token OR MCP API key and returns User object.
+
+    Resolved principals are cached by token hash (db/auth_cache.py) and
+    invalidated when the underlying user or MCP key changes.
     """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -110,6 +115,14 @@ async def get_current_user(request: Request, token: str = Depends(oauth2_scheme)
         headers={"WWW-Authenticate": "Bearer"},
     )
 
+    cache_key = f"principal:{hash_token(token)}"
+    cached = principal_cache.get(cache_key)
+    if cached is not None:
+        principal, key_id = cached
+        if key_id:
+            db.record_mcp_key_usage(key_id)
+        return principal.model_copy()
+
     # Try JWT token first
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
@@ -117,39 +130,52 @@ async def get_current_user(request: Request, token: str = Depends(oauth2_scheme)
         if username is None:
             raise credentials_exception
 
-        user = db.get_user_by_username(username)
+        user = await async_db.get_user_by_username(username)
         if user is None:
             raise credentials_exception
 
-        return User(
+        principal = User(
             id=user["id"],
             username=user["username"],
             email=user.get("email"),
             role=user["role"]
         )
+        # Never cache past the token's own expiry
+        ttl = payload["exp"] - time.time() if payload.get("exp") else None
+        principal_cache.put(cache_key, (principal, None), ttl=ttl, username=user["username"])
+        return principal.model_copy()
     except JWTError:
         # JWT failed, try MCP API key
         pass
 
     # Try MCP API key authentication
-    mcp_key_info = db.validate_mcp_api_key(token)
+    mcp_key_info = await async_db.validate_mcp_api_key(token)
     if mcp_key_info:  # validate_mcp_api_key returns dict if valid, None if invalid
         user_email = mcp_key_info.get("user_email")
         user_id = mcp_key_info.get("user_id")  # This is actually username, not DB id
 
         # Get full user record - try email first, then username
         # Note: user_id from MCP key is the username string, not the database id
-        user = db.get_user_by_email(user_email) if user_email else db.get_user_by_username(user_id)
+        user = (
+            await async_db.get_user_by_email(user_email) if user_email
+            else await async_db.get_user_by_username(user_id)
+        )
         if user:
             # For agent-scoped keys, include the agent_name
             agent_name = mcp_key_info.get("agent_name") if mcp_key_info.get("scope") == "agent" else None
-            return User(
+            principal = User(
                 id=user["id"],
                 username=user["username"],
                 email=user.get("email"),
                 role=user["role"],
                 agent_name=agent_name
             )
+            principal_cache.put(
+                cache_key, (principal, mcp_key_info["key_id"]),
+                username=user["username"], key_id=mcp_key_info["key_id"],
+                agent_name=mcp_key_info.get("agent_name")
+            )
+            return principal.model_copy()
 
     # Both JWT and MCP key failed
     raise credentials_exception
@@ -15,7 +15,6 @@ Refactored for better concern separation:
 import asyncio
 import json
 from datetime import datetime
-from typing import List
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Depends, Request, Query
 from fastapi.middleware.cors import CORSMiddleware
@@ -35,7 +34,7 @@ from routers.agent_rename import router as agent_rename_router, set_websocket_ma
 from routers.agent_ssh import router as agent_ssh_router
 from routers.credentials import router as credentials_router
 from routers.templates import router as templates_router
-from routers.sharing import router as sharing_router, set_websocket_manager as set_sharing_ws_manager
+from routers.sharing import router as sharing_router, set_websocket_manager as set_sharing_ws_manager, set_filtered_websocket_manager as set_sharing_filtered_ws_manager
 from routers.mcp_keys import router as mcp_keys_router
 from routers.chat import router as chat_router, set_websocket_manager as set_chat_ws_manager
 from routers.schedules import router as schedules_router
@@ -90,6 +89,15 @@ from services.operator_queue_service import operator_queue_service, set_websocke
 # Import cleanup service
 from services.cleanup_service import cleanup_service
 
+# Import WebSocket broadcast managers
+from services.websocket_manager import ConnectionManager, FilteredWebSocketManager, attach_relay, serialize_event
+
+# Import cross-worker event relay
+from services.event_relay import get_event_relay
+from db.auth_cache import principal_cache
+from services.agent_inventory import agent_inventory
+from services.container_stats import stats_collector
+
 
 # Import process engine WebSocket publisher
 from services.process_engine.events import set_websocket_publisher_broadcast
@@ -101,91 +109,6 @@ from routers.executions import run_execution_recovery
 from logging_config import setup_logging
 
 
-class ConnectionManager:
-    """WebSocket connection manager for broadcasting events."""
-
-    def __init__(self):
-        self.active_connections: List[WebSocket] = []
-
-    async def connect(self, websocket: WebSocket):
-        await websocket.accept()
-        self.active_connections.append(websocket)
-
-    def disconnect(self, websocket: WebSocket):
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
-
-    async def broadcast(self, message: str):
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(message)
-            except:
-                pass
-
-
-class FilteredWebSocketManager:
-    """
-    WebSocket manager that filters events based on user's accessible agents.
-
-    Used by /ws/events endpoint for external listeners (Trinity Connect).
-    Events are filtered server-side based on user's owned and shared agents.
-    """
-
-    def __init__(self):
-        from typing import Dict, Set
-        self.connections: Dict[WebSocket, Dict] = {}  # ws -> {email, is_admin, accessible_agents}
-
-    async def connect(self, websocket: WebSocket, email: str, is_admin: bool, accessible_agents: List[str]):
-        """Register a new connection with its accessible agents."""
-        self.connections[websocket] = {
-            "email": email,
-            "is_admin": is_admin,
-            "accessible_agents": set(accessible_agents)
-        }
-
-    def disconnect(self, websocket: WebSocket):
-        """Remove a connection."""
-        self.connections.pop(websocket, None)
-
-    def update_accessible_agents(self, websocket: WebSocket, accessible_agents: List[str]):
-        """Update the accessible agents list for a connection."""
-        if websocket in self.connections:
-            self.connections[websocket]["accessible_agents"] = set(accessible_agents)
-
-    async def broadcast_filtered(self, event: dict):
-        """
-        Broadcast event only to users who can access the event's agent.
-
-        Extracts agent name from various event fields and checks if
-        each connected user can access that agent.
-        """
-        # Extract agent name from event (different fields for different event types)
-        agent_name = (
-            event.get("agent_name") or
-            event.get("agent") or
-            event.get("name") or  # agent_started/agent_stopped events
-            event.get("source_agent") or
-            (event.get("details") or {}).get("source_agent") or
-            (event.get("details") or {}).get("target_agent")
-        )
-
-        if not agent_name:
-            return  # Can't filter without agent name
-
-        disconnected = []
-        for websocket, info in self.connections.items():
-            # Admin sees all, otherwise check accessible agents
-            if info["is_admin"] or agent_name in info["accessible_agents"]:
-                try:
-                    await websocket.send_json(event)
-                except Exception:
-                    disconnected.append(websocket)
-
-        # Clean up disconnected clients
-        for ws in disconnected:
-            self.disconnect(ws)
-
-
 manager = ConnectionManager()
 filtered_manager = FilteredWebSocketManager()
 
@@ -195,6 +118,7 @@ set_agents_filtered_ws_manager(filtered_manager)
 set_agent_rename_ws_manager(manager)
 set_agent_rename_filtered_ws_manager(filtered_manager)
 set_sharing_ws_manager(manager)
+set_sharing_filtered_ws_manager(filtered_manager)
 set_chat_ws_manager(manager)
 set_public_links_ws_manager(manager)
 set_notifications_ws_manager(manager)
@@ -211,6 +135,12 @@ set_opqueue_sync_ws_manager(manager)
 # NOTE: Scheduler broadcast callbacks removed - dedicated scheduler (trinity-scheduler)
 # publishes events to Redis which backend subscribes to, or via internal API calls
 
+# Share broadcasts with the other uvicorn workers and deliver scheduler events (EVENT-RELAY-001)
+event_relay = get_event_relay()
+attach_relay(event_relay, manager, filtered_manager)
+# Revoked keys and changed users drop out of every worker's auth cache
+principal_cache.attach_relay(event_relay)
+
 # Set up activity service WebSocket manager
 activity_service.set_websocket_manager(manager)
 activity_service.set_filtered_websocket_manager(filtered_manager)
@@ -227,7 +157,16 @@ async def lifespan(app: FastAPI):
     # Set up structured JSON logging (captured by Vector)
     setup_logging()
 
+    # Start cross-worker event relay (EVENT-RELAY-001)
+    event_relay.start()
+    print(f"Event relay started (worker {event_relay.worker_id[:8]})")
+
     if docker_client:
+        # Keep agent listings in memory from Docker events (INVENTORY-001)
+        agent_inventory.start()
+        # Stream container stats for running agents (STATS-001)
+        stats_collector.start()
+
         try:
             agents = list_all_agents_fast()  # Fast startup - no slow Docker API calls
             print(f"Found {len(agents)} existing Trinity agent containers")
@@ -381,6 +320,45 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         print(f"Error stopping operator queue sync service: {e}")
 
+    # Stop container stats streams
+    try:
+        stats_collector.stop()
+        print("Container stats collector stopped")
+    except Exception as e:
+        print(f"Error stopping container stats collector: {e}")
+
+    # Stop following Docker events
+    try:
+        agent_inventory.stop()
+        print("Agent inventory stopped")
+    except Exception as e:
+        print(f"Error stopping agent inventory: {e}")
+
+    # Stop cross-worker event relay
+    try:
+        await event_relay.stop()
+        print("Event relay stopped")
+    except Exception as e:
+        print(f"Error stopping event relay: {e}")
+
+    # Close pooled agent HTTP connections
+    try:
+        from services.agent_transport import get_agent_transport
+        await get_agent_transport().aclose()
+        print("Agent HTTP transport closed")
+    except Exception as e:
+        print(f"Error closing agent HTTP transport: {e}")
+
+    # Close pooled database connections
+    try:
+        from database import db, async_db, close_db_connections
+        db.flush_mcp_key_usage()
+        async_db.shutdown()
+        close_db_connections()
+        print("Database connections closed")
+    except Exception as e:
+        print(f"Error closing database connections: {e}")
+
 
 # Create FastAPI app
 app = FastAPI(
@@ -509,7 +487,7 @@ async def websocket_endpoint(websocket: WebSocket, token: str = None):
             return
 
         # First-message auth succeeded — add to manager
-        manager.active_connections.append(websocket)
+        await manager.connect(websocket, accept=False)
     else:
         # Token auth succeeded — connect normally
         await manager.connect(websocket)
@@ -522,11 +500,13 @@ async def websocket_endpoint(websocket: WebSocket, token: str = None):
             try:
                 msg = json.loads(data)
                 if msg.get("type") == "ping":
-                    await websocket.send_text(json.dumps({"type": "pong"}))
+                    manager.send(websocket, json.dumps({"type": "pong"}))
                     continue
             except (json.JSONDecodeError, TypeError):
                 pass
     except WebSocketDisconnect:
+        pass
+    finally:
         manager.disconnect(websocket)
 
 
@@ -534,7 +514,9 @@ async def websocket_endpoint(websocket: WebSocket, token: str = None):
 @app.websocket("/ws/events")
 async def websocket_events_endpoint(
     websocket: WebSocket,
-    token: str = Query(None, description="MCP API key for authentication")
+    token: str = Query(None, description="MCP API key for authentication"),
+    agents: str = Query(None, description="Comma-separated agents to subscribe to (default: all accessible)"),
+    event_types: str = Query(None, description="Comma-separated event types to subscribe to (default: all)"),
 ):
     """
     WebSocket endpoint for external event listeners (Trinity Connect).
@@ -545,6 +527,7 @@ async def websocket_events_endpoint(
     Usage:
         websocat "ws://localhost:8000/ws/events?token=trinity_mcp_xxx"
         wscat -c "ws://localhost:8000/ws/events?token=trinity_mcp_xxx"
+        wscat -c "ws://localhost:8000/ws/events?token=trinity_mcp_xxx&agents=a,b&event_types=agent_activity"
 
     Events received:
         - agent_activity (chat_start, schedule_start, tool_call completions)
@@ -555,6 +538,8 @@ async def websocket_events_endpoint(
     Commands (send as text):
         - "ping" -> receives "pong"
         - "refresh" -> refreshes accessible agents list
+        - {"type": "subscribe", "agents": [...], "event_types": [...]}
+          -> replaces the subscription (null or omitted = all), receives "subscribed"
     """
     from database import db
 
@@ -575,33 +560,60 @@ async def websocket_events_endpoint(
 
     # Get list of accessible agents for this user
     accessible_agents = db.get_accessible_agent_names(user_email, is_admin)
+    agent_filter = [a.strip() for a in agents.split(",") if a.strip()] if agents else None
+    type_filter = [t.strip() for t in event_types.split(",") if t.strip()] if event_types else None
 
     await websocket.accept()
     await websocket.send_json({
         "type": "connected",
         "user": user_email,
         "accessible_agents": accessible_agents,
+        "subscription": {"agents": agent_filter, "event_types": type_filter},
         "message": "Listening for events. Events filtered to your accessible agents."
     })
 
     # Add to filtered connections manager
-    await filtered_manager.connect(websocket, user_email, is_admin, accessible_agents)
+    await filtered_manager.connect(
+        websocket, user_email, is_admin, accessible_agents,
+        agents=agent_filter, event_types=type_filter,
+    )
 
     try:
         while True:
             # Keep connection alive, handle commands
             data = await websocket.receive_text()
             if data == "ping":
-                await websocket.send_text("pong")
+                filtered_manager.send(websocket, "pong")
             elif data == "refresh":
                 # Refresh accessible agents list (e.g., after sharing changes)
                 accessible_agents = db.get_accessible_agent_names(user_email, is_admin)
                 filtered_manager.update_accessible_agents(websocket, accessible_agents)
-                await websocket.send_json({
+                filtered_manager.send(websocket, serialize_event({
                     "type": "refreshed",
                     "accessible_agents": accessible_agents
-                })
+                }))
+            elif data.startswith("{"):
+                try:
+                    command = json.loads(data)
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(command, dict) and command.get("type") == "subscribe":
+                    # Lists of names narrow the subscription; anything else means all
+                    agent_filter, type_filter = (
+                        [str(v) for v in value] if isinstance(value, list) else None
+                        for value in (command.get("agents"), command.get("event_types"))
+                    )
+                    subscribed_agents = filtered_manager.subscribe(
+                        websocket, agents=agent_filter, event_types=type_filter
+                    )
+                    filtered_manager.send(websocket, serialize_event({
+                        "type": "subscribed",
+                        "agents": subscribed_agents,
+                        "event_types": type_filter,
+                    }))
     except WebSocketDisconnect:
+        pass
+    finally:
         filtered_manager.disconnect(websocket)
 
 
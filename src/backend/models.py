@@ -232,7 +232,8 @@ class QueueStatus(BaseModel):
     is_busy: bool
     current_execution: Optional[Execution] = None
     queue_length: int
-    queued_executions: List[Execution] = []
+    max_queue_depth: int = 3                   # Per-agent setting (agent_ownership.max_queue_depth)
+    queued_executions: List[Execution] = []    # In service (fair-share) order
 
 
 # ============================================================================
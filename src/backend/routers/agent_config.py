@@ -410,6 +410,79 @@ async def set_agent_capacity(
     }
 
 
+# ============================================================================
+# Execution Queue Depth Endpoints (QUEUE-FAIR-001)
+# ============================================================================
+
+@router.get("/{agent_name}/queue-depth")
+async def get_agent_queue_depth(
+    agent_name: str,
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get the execution queue depth setting for an agent.
+
+    Returns:
+    - max_queue_depth: Requests that may wait while the agent is busy (default 3)
+    """
+    if not db.can_user_access_agent(current_user.username, agent_name):
+        raise HTTPException(status_code=403, detail="Access denied")
+
+    container = get_agent_container(agent_name)
+    if not container:
+        raise HTTPException(status_code=404, detail="Agent not found")
+
+    return {
+        "agent_name": agent_name,
+        "max_queue_depth": db.get_max_queue_depth(agent_name),
+    }
+
+
+@router.put("/{agent_name}/queue-depth")
+async def set_agent_queue_depth(
+    agent_name: str,
+    body: dict,
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Set the execution queue depth for an agent.
+
+    Body:
+    - max_queue_depth: Maximum waiting requests (1-50)
+
+    Only agent owners can modify queue settings.
+    """
+    # Only owners can change queue depth
+    if not db.can_user_share_agent(current_user.username, agent_name):
+        raise HTTPException(status_code=403, detail="Only owners can change queue settings")
+
+    container = get_agent_container(agent_name)
+    if not container:
+        raise HTTPException(status_code=404, detail="Agent not found")
+
+    depth = body.get("max_queue_depth")
+    if depth is None:
+        raise HTTPException(status_code=400, detail="max_queue_depth is required")
+
+    # Validate range
+    if not isinstance(depth, int) or depth < 1 or depth > 50:
+        raise HTTPException(
+            status_code=400,
+            detail="max_queue_depth must be an integer between 1 and 50"
+        )
+
+    # Update database
+    success = db.set_max_queue_depth(agent_name, depth)
+    if not success:
+        raise HTTPException(status_code=500, detail="Failed to update queue depth")
+
+    return {
+        "message": "Queue depth updated",
+        "agent_name": agent_name,
+        "max_queue_depth": depth
+    }
+
+
 # ============================================================================
 # Execution Timeout Endpoints (TIMEOUT-001)
 # ============================================================================
@@ -1,7 +1,7 @@
 """Agent file management, info, and folder endpoints."""
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from pydantic import BaseModel
 
 from models import User
@@ -157,6 +157,10 @@ async def list_agent_files_endpoint(
     request: Request,
     path: str = "/home/developer",
     show_hidden: bool = False,
+    depth: Optional[int] = Query(None, ge=1),
+    offset: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1),
+    ignore: Optional[str] = None,
     current_user: User = Depends(get_current_user)
 ):
     """List files in the agent's workspace directory.
@@ -164,8 +168,17 @@ async def list_agent_files_endpoint(
     Args:
         path: Directory path to list (default: /home/developer)
         show_hidden: If True, include hidden files (starting with .)
+        depth: Directory levels to include (1 = only this directory); whole tree if omitted
+        offset: Entries of the requested directory to skip
+        limit: Maximum entries returned per directory; all if omitted
+        ignore: Comma-separated name patterns not to walk (e.g. node_modules,.git)
+
+    Supports If-None-Match; unchanged listings return 304.
     """
-    return await list_agent_files_logic(agent_name, path, current_user, request, show_hidden)
+    return await list_agent_files_logic(
+        agent_name, path, current_user, request, show_hidden,
+        depth=depth, offset=offset, limit=limit, ignore=ignore
+    )
 
 
 @router.get("/{agent_name}/files/download")
@@ -169,6 +169,8 @@ async def rename_agent_endpoint(
         if manager:
             await manager.broadcast(json.dumps(event))
         if filtered_manager:
+            # Listeners keep access under the new name, including this event
+            filtered_manager.rename_agent(agent_name, sanitized_name)
             await filtered_manager.broadcast_filtered(event)
 
         # Restart agent if it was running
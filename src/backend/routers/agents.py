@@ -19,7 +19,7 @@ from fastapi import APIRouter, Depends, HTTPException, Request, Query, WebSocket
 from pydantic import BaseModel
 
 from models import AgentConfig, AgentStatus, User, DeployLocalRequest
-from database import db
+from database import async_db
 from dependencies import get_current_user, decode_token, AuthorizedAgentByName, CurrentUser
 from services.docker_service import (
     docker_client,
@@ -31,6 +31,7 @@ from services.docker_utils import (
     volume_get, volume_remove
 )
 from services import git_service
+from services.agent_transport import get_agent_transport
 from services.image_generation_prompts import AVATAR_EMOTIONS
 
 # Import service layer functions
@@ -103,13 +104,17 @@ async def create_agent_internal(
 
     Facade that delegates to service layer with module-level dependencies.
     """
-    return await _create_agent_internal(
+    agent_status = await _create_agent_internal(
         config=config,
         current_user=current_user,
         request=request,
         skip_name_sanitization=skip_name_sanitization,
         ws_manager=manager
     )
+    # Owner's Trinity Connect listeners start receiving the new agent's events
+    if filtered_manager and current_user.email:
+        filtered_manager.grant_agent(current_user.email, agent_status.name)
+    return agent_status
 
 
 # ============================================================================
@@ -132,8 +137,6 @@ async def list_agents_endpoint(
     Returns:
         List of agents with their metadata including tags.
     """
-    from database import db
-
     agents = get_accessible_agents(current_user)
 
     # If tags filter specified, filter agents
@@ -141,12 +144,12 @@ async def list_agents_endpoint(
         tag_list = [t.strip().lower() for t in tags.split(",") if t.strip()]
         if tag_list:
             # Get agents that have any of the specified tags
-            matching_agents = set(db.get_agents_by_tags(tag_list))
+            matching_agents = set(await async_db.get_agents_by_tags(tag_list))
             agents = [a for a in agents if a.get("name") in matching_agents]
 
     # Add tags to each agent in response
     agent_names = [a.get("name") for a in agents]
-    all_tags = db.get_tags_for_agents(agent_names)
+    all_tags = await async_db.get_tags_for_agents(agent_names)
 
     for agent in agents:
         agent["tags"] = all_tags.get(agent.get("name"), [])
@@ -177,12 +180,12 @@ async def get_agents_execution_stats(
     """
     # Get all stats from database
     if include_7d:
-        all_stats = db.get_all_agents_execution_stats_dual()
+        all_stats = await async_db.get_all_agents_execution_stats_dual()
     else:
-        all_stats = db.get_all_agents_execution_stats(hours=hours)
+        all_stats = await async_db.get_all_agents_execution_stats(hours=hours)
 
     # Get schedule counts for all agents
-    schedule_counts = db.get_all_agents_schedule_counts()
+    schedule_counts = await async_db.get_all_agents_schedule_counts()
 
     # Filter to only agents the user can access
     accessible_agents = {a['name'] for a in get_accessible_agents(current_user)}
@@ -253,11 +256,11 @@ async def get_all_agent_slots(
     from datetime import datetime
 
     # Get all agents with their capacities
-    agent_capacities = db.get_all_agents_parallel_capacity()
+    agent_capacities = await async_db.get_all_agents_parallel_capacity()
 
     # Get slot states from Redis
     slot_service = get_slot_service()
-    slot_states = await slot_service.get_all_slot_states(agent_capacities)
+    slot_states = await slot_service.get_fleet_slot_state(agent_capacities)
 
     return BulkSlotState(
         agents=slot_states,
@@ -273,30 +276,30 @@ async def get_agent_endpoint(agent_name: AuthorizedAgentByName, request: Request
         raise HTTPException(status_code=404, detail="Agent not found")
 
     agent_dict = agent.dict() if hasattr(agent, 'dict') else dict(agent)
-    user_data = db.get_user_by_username(current_user.username)
+    user_data = await async_db.get_user_by_username(current_user.username)
     is_admin = user_data and user_data["role"] == "admin"
 
-    owner = db.get_agent_owner(agent_name)
+    owner = await async_db.get_agent_owner(agent_name)
     agent_dict["owner"] = owner["owner_username"] if owner else None
     agent_dict["is_owner"] = owner and owner["owner_username"] == current_user.username
     agent_dict["is_shared"] = not agent_dict["is_owner"] and not is_admin and \
-                               db.is_agent_shared_with_user(agent_name, current_user.username)
+                               await async_db.is_agent_shared_with_user(agent_name, current_user.username)
     agent_dict["is_system"] = owner.get("is_system", False) if owner else False
-    agent_dict["can_share"] = db.can_user_share_agent(current_user.username, agent_name)
-    agent_dict["can_delete"] = db.can_user_delete_agent(current_user.username, agent_name)
-    agent_dict["autonomy_enabled"] = db.get_autonomy_enabled(agent_name)
-    read_only_data = db.get_read_only_mode(agent_name)
+    agent_dict["can_share"] = await async_db.can_user_share_agent(current_user.username, agent_name)
+    agent_dict["can_delete"] = await async_db.can_user_delete_agent(current_user.username, agent_name)
+    agent_dict["autonomy_enabled"] = await async_db.get_autonomy_enabled(agent_name)
+    read_only_data = await async_db.get_read_only_mode(agent_name)
     agent_dict["read_only_enabled"] = read_only_data["enabled"]
 
     # Avatar URL (AVATAR-001)
-    identity = db.get_avatar_identity(agent_name)
+    identity = await async_db.get_avatar_identity(agent_name)
     if identity and identity.get("updated_at"):
         agent_dict["avatar_url"] = f"/api/agents/{agent_name}/avatar?v={identity['updated_at']}"
     else:
         agent_dict["avatar_url"] = None
 
     if agent_dict["can_share"]:
-        shares = db.get_agent_shares(agent_name)
+        shares = await async_db.get_agent_shares(agent_name)
         agent_dict["shares"] = [s.dict() for s in shares]
     else:
         agent_dict["shares"] = []
@@ -329,13 +332,13 @@ async def deploy_local_agent(
 async def delete_agent_endpoint(agent_name: str, request: Request, current_user: User = Depends(get_current_user)):
     """Delete an agent."""
     # Check for system agent first - no one can delete these
-    if db.is_system_agent(agent_name):
+    if await async_db.is_system_agent(agent_name):
         raise HTTPException(
             status_code=403,
             detail="System agents cannot be deleted. Use re-initialization to reset to clean state."
         )
 
-    if not db.can_user_delete_agent(current_user.username, agent_name):
+    if not await async_db.can_user_delete_agent(current_user.username, agent_name):
         raise HTTPException(status_code=403, detail="You don't have permission to delete this agent")
 
     container = get_agent_container(agent_name)
@@ -360,33 +363,33 @@ async def delete_agent_endpoint(agent_name: str, request: Request, current_user:
 
     # Delete all schedules for this agent
     # Dedicated scheduler syncs from database automatically
-    db.delete_agent_schedules(agent_name)
+    await async_db.delete_agent_schedules(agent_name)
 
     # Delete git config if exists
     git_service.delete_agent_git_config(agent_name)
 
     # Delete agent's MCP API key
     try:
-        db.delete_agent_mcp_api_key(agent_name)
+        await async_db.delete_agent_mcp_api_key(agent_name)
     except Exception as e:
         logger.warning(f"Failed to delete MCP API key for agent {agent_name}: {e}")
 
     # Delete agent permissions
     try:
-        db.delete_agent_permissions(agent_name)
+        await async_db.delete_agent_permissions(agent_name)
     except Exception as e:
         logger.warning(f"Failed to delete permissions for agent {agent_name}: {e}")
 
     # Delete agent skills
     try:
-        db.delete_agent_skills(agent_name)
+        await async_db.delete_agent_skills(agent_name)
     except Exception as e:
         logger.warning(f"Failed to delete skills for agent {agent_name}: {e}")
 
     # Delete shared folder config and shared volume
     try:
-        db.delete_shared_folder_config(agent_name)
-        shared_volume_name = db.get_shared_volume_name(agent_name)
+        await async_db.delete_shared_folder_config(agent_name)
+        shared_volume_name = await async_db.get_shared_volume_name(agent_name)
         try:
             shared_volume = await volume_get(shared_volume_name)
             await volume_remove(shared_volume)
@@ -397,7 +400,7 @@ async def delete_agent_endpoint(agent_name: str, request: Request, current_user:
 
     # Delete agent tags (ORG-001)
     try:
-        db.delete_agent_tags(agent_name)
+        await async_db.delete_agent_tags(agent_name)
     except Exception as e:
         logger.warning(f"Failed to delete tags for agent {agent_name}: {e}")
 
@@ -418,7 +421,12 @@ async def delete_agent_endpoint(agent_name: str, request: Request, current_user:
     except Exception as e:
         logger.warning(f"Failed to delete avatar for agent {agent_name}: {e}")
 
-    db.delete_agent_ownership(agent_name)
+    await async_db.delete_agent_ownership(agent_name)
+    if filtered_manager:
+        filtered_manager.remove_agent(agent_name)
+
+    # Drop pooled HTTP connections to the removed container
+    await get_agent_transport().close_agent(agent_name)
 
     if manager:
         await manager.broadcast(json.dumps({
@@ -518,10 +526,16 @@ async def get_agent_logs_endpoint(
 async def get_agent_stats_endpoint(
     agent_name: str,
     request: Request,
+    history: bool = False,
     current_user: User = Depends(get_current_user)
 ):
-    """Get live container stats (CPU, memory, network) for an agent."""
-    return await get_agent_stats_logic(agent_name, current_user)
+    """
+    Get live container stats (CPU, memory, network) for an agent.
+
+    With ?history=true, also returns recent samples (oldest first, up to
+    10 minutes at 5s resolution).
+    """
+    return await get_agent_stats_logic(agent_name, current_user, include_history=history)
 
 
 # ============================================================================
@@ -571,7 +585,7 @@ async def get_agent_activities(
     if not container:
         raise HTTPException(status_code=404, detail="Agent not found")
 
-    activities = db.get_agent_activities(
+    activities = await async_db.get_agent_activities(
         agent_name=agent_name,
         activity_type=activity_type,
         activity_state=activity_state,
@@ -596,7 +610,7 @@ async def get_activity_timeline(
     """Get cross-agent activity timeline."""
     types_list = activity_types.split(",") if activity_types else None
 
-    all_activities = db.get_activities_in_range(
+    all_activities = await async_db.get_activities_in_range(
         start_time=start_time,
         end_time=end_time,
         activity_types=types_list,
@@ -606,7 +620,7 @@ async def get_activity_timeline(
     filtered_activities = []
     for activity in all_activities:
         agent_name = activity.get("agent_name")
-        if db.can_user_access_agent(current_user.username, agent_name):
+        if await async_db.can_user_access_agent(current_user.username, agent_name):
             filtered_activities.append(activity)
             if len(filtered_activities) >= limit:
                 break
@@ -16,13 +16,15 @@ from models import User, ChatMessageRequest, ModelChangeRequest, ParallelTaskReq
 from dependencies import get_current_user, get_authorized_agent
 from services.docker_service import get_agent_container
 from services.activity_service import activity_service
-from services.execution_queue import get_execution_queue, QueueFullError, AgentBusyError
+from services.execution_queue import get_execution_queue, QueueFullError, AgentBusyError, QueueWaitError
 from services.slot_service import get_slot_service
+from services.agent_transport import get_agent_transport
+from services.execution_stream import get_execution_stream_mux
 from services.task_execution_service import (
     get_task_execution_service,
     agent_post_with_retry,
 )
-from database import db
+from database import async_db
 from utils.credential_sanitizer import sanitize_execution_log, sanitize_response
 from services.platform_prompt_service import get_platform_system_prompt
 
@@ -70,8 +72,10 @@ async def chat_with_agent(
     Proxy chat messages to agent's internal web server and persist to database.
 
     This endpoint enforces single-execution-at-a-time via the execution queue.
-    If the agent is busy, the request is queued (up to 3 waiting).
-    If the queue is full, returns 429 Too Many Requests.
+    If the agent is busy, the request waits its turn in the agent's weighted
+    fair-share queue (depth from agent settings, default 3; user requests are
+    weighted above agent-to-agent calls). If the queue is full, or the wait
+    exceeds 120s, returns 429 Too Many Requests.
 
     Issue #98: Chat executions now also acquire a capacity slot so that
     SlotService is the single source of truth for agent load. The queue
@@ -106,8 +110,11 @@ async def chat_with_agent(
         source_user_email=current_user.email or current_user.username
     )
 
+    max_queue_depth = await async_db.get_max_queue_depth(name)
     try:
-        queue_result, execution = await queue.submit(execution, wait_if_busy=True)
+        queue_result, execution = await queue.submit(
+            execution, wait_if_busy=True, max_queue_depth=max_queue_depth
+        )
         logger.info(f"[Chat] Agent '{name}' execution {execution.id}: {queue_result}")
     except QueueFullError as e:
         logger.warning(f"[Chat] Agent '{name}' queue full, rejecting request")
@@ -122,314 +129,342 @@ async def chat_with_agent(
             }
         )
 
-    # Track queue position for observability
-    is_queued = queue_result.startswith("queued:")
-
-    # Issue #98: Acquire a capacity slot so chat executions are visible in the
-    # capacity meter. The queue still enforces serial chat; the slot makes the
-    # resource usage visible to SlotService (single source of truth for load).
+    # From here on the request may hold the agent: the finally below hands it
+    # on even if the request is cancelled while queued or fails before the
+    # agent call, so the agent is never left marked running until its TTL.
     slot_service = get_slot_service()
     chat_slot_acquired = False
+    execution_success = False
     try:
-        chat_timeout = db.get_execution_timeout(name)
-        max_parallel_tasks = db.get_max_parallel_tasks(name)
-        chat_slot_acquired = await slot_service.acquire_slot(
+        # Track queue position for observability
+        is_queued = queue_result.startswith("queued:")
+
+        # Block (BLPOP, no polling) until the queue hands this request the agent
+        if is_queued:
+            try:
+                execution = await queue.wait_for_turn(execution)
+            except QueueWaitError as e:
+                if e.reason == "cleared":
+                    raise HTTPException(
+                        status_code=409,
+                        detail={
+                            "error": "Queued request was cancelled",
+                            "agent": name,
+                            "message": f"The queue for agent '{name}' was cleared before this request ran."
+                        }
+                    )
+                raise HTTPException(
+                    status_code=429,
+                    detail={
+                        "error": "Timed out waiting in agent queue",
+                        "agent": name,
+                        "retry_after": 30,
+                        "message": f"Agent '{name}' stayed busy for too long. Please try again later."
+                    }
+                )
+
+        # Issue #98: Acquire a capacity slot so chat executions are visible in the
+        # capacity meter. The queue still enforces serial chat; the slot makes the
+        # resource usage visible to SlotService (single source of truth for load).
+        try:
+            chat_timeout = await async_db.get_execution_timeout(name)
+            max_parallel_tasks = await async_db.get_max_parallel_tasks(name)
+            chat_slot_acquired = await slot_service.acquire_slot(
+                agent_name=name,
+                execution_id=execution.id,
+                max_parallel_tasks=max_parallel_tasks,
+                message_preview=request.message[:100] if request.message else "",
+                timeout_seconds=chat_timeout,
+            )
+            if not chat_slot_acquired:
+                logger.warning(f"[Chat] Agent '{name}' at capacity, could not acquire slot for chat {execution.id}")
+        except Exception as e:
+            logger.warning(f"[Chat] Failed to acquire slot for chat execution {execution.id}: {e}")
+
+        # Create execution record for ALL chat calls (user, MCP, and agent-to-agent)
+        # This ensures every execution appears in the Tasks tab for unified tracking (#96)
+        task_execution_id = None
+        # Determine triggered_by: "agent" for agent-to-agent, "mcp" for user MCP calls, "chat" for UI chat
+        if x_source_agent:
+            triggered_by = "agent"
+        elif x_via_mcp:
+            triggered_by = "mcp"
+        else:
+            triggered_by = "chat"
+        task_execution = await async_db.create_task_execution(
             agent_name=name,
-            execution_id=execution.id,
-            max_parallel_tasks=max_parallel_tasks,
-            message_preview=request.message[:100] if request.message else "",
-            timeout_seconds=chat_timeout,
+            message=request.message,
+            triggered_by=triggered_by,
+            source_user_id=current_user.id,
+            source_user_email=current_user.email or current_user.username,
+            source_agent_name=x_source_agent,
+            source_mcp_key_id=x_mcp_key_id,
+            source_mcp_key_name=x_mcp_key_name
         )
-        if not chat_slot_acquired:
-            logger.warning(f"[Chat] Agent '{name}' at capacity, could not acquire slot for chat {execution.id}")
-    except Exception as e:
-        logger.warning(f"[Chat] Failed to acquire slot for chat execution {execution.id}: {e}")
+        task_execution_id = task_execution.id if task_execution else None
+        logger.info(f"[Chat] Created task execution {task_execution_id} for {triggered_by} call on agent '{name}'")
+
+        # Broadcast collaboration event if this is agent-to-agent communication
+        collaboration_activity_id = None
+        if x_source_agent:
+            await broadcast_collaboration_event(
+                source_agent=x_source_agent,
+                target_agent=name,
+                action="chat"
+            )
 
-    # Create execution record for ALL chat calls (user, MCP, and agent-to-agent)
-    # This ensures every execution appears in the Tasks tab for unified tracking (#96)
-    task_execution_id = None
-    # Determine triggered_by: "agent" for agent-to-agent, "mcp" for user MCP calls, "chat" for UI chat
-    if x_source_agent:
-        triggered_by = "agent"
-    elif x_via_mcp:
-        triggered_by = "mcp"
-    else:
-        triggered_by = "chat"
-    task_execution = db.create_task_execution(
-        agent_name=name,
-        message=request.message,
-        triggered_by=triggered_by,
-        source_user_id=current_user.id,
-        source_user_email=current_user.email or current_user.username,
-        source_agent_name=x_source_agent,
-        source_mcp_key_id=x_mcp_key_id,
-        source_mcp_key_name=x_mcp_key_name
-    )
-    task_execution_id = task_execution.id if task_execution else None
-    logger.info(f"[Chat] Created task execution {task_execution_id} for {triggered_by} call on agent '{name}'")
+            # Track agent collaboration activity
+            collaboration_activity_id = await activity_service.track_activity(
+                agent_name=x_source_agent,  # Activity belongs to source agent
+                activity_type=ActivityType.AGENT_COLLABORATION,
+                user_id=current_user.id,
+                triggered_by="agent",
+                related_execution_id=task_execution_id,  # Database execution ID for structured queries
+                details={
+                    "source_agent": x_source_agent,
+                    "target_agent": name,
+                    "action": "chat",
+                    "message_preview": request.message[:100],
+                    "execution_id": task_execution_id,  # Also in details for WebSocket events
+                    "queue_status": queue_result
+                }
+            )
 
-    # Broadcast collaboration event if this is agent-to-agent communication
-    collaboration_activity_id = None
-    if x_source_agent:
-        await broadcast_collaboration_event(
-            source_agent=x_source_agent,
-            target_agent=name,
-            action="chat"
+        # Get or create chat session for this user+agent
+        session = await async_db.get_or_create_chat_session(
+            agent_name=name,
+            user_id=current_user.id,
+            user_email=current_user.email or current_user.username
         )
 
-        # Track agent collaboration activity
-        collaboration_activity_id = await activity_service.track_activity(
-            agent_name=x_source_agent,  # Activity belongs to source agent
-            activity_type=ActivityType.AGENT_COLLABORATION,
+        # Track chat start activity
+        # triggered_by: "agent" for agent-to-agent, "mcp" for user MCP calls, "user" for UI chat
+        activity_triggered_by = "agent" if x_source_agent else ("mcp" if x_via_mcp else "user")
+        chat_activity_id = await activity_service.track_activity(
+            agent_name=name,
+            activity_type=ActivityType.CHAT_START,
             user_id=current_user.id,
-            triggered_by="agent",
+            triggered_by=activity_triggered_by,
+            parent_activity_id=collaboration_activity_id,  # Link to collaboration if agent-initiated
             related_execution_id=task_execution_id,  # Database execution ID for structured queries
             details={
-                "source_agent": x_source_agent,
-                "target_agent": name,
-                "action": "chat",
                 "message_preview": request.message[:100],
+                "source_agent": x_source_agent,
                 "execution_id": task_execution_id,  # Also in details for WebSocket events
                 "queue_status": queue_result
             }
         )
 
-    # Get or create chat session for this user+agent
-    session = db.get_or_create_chat_session(
-        agent_name=name,
-        user_id=current_user.id,
-        user_email=current_user.email or current_user.username
-    )
-
-    # Track chat start activity
-    # triggered_by: "agent" for agent-to-agent, "mcp" for user MCP calls, "user" for UI chat
-    activity_triggered_by = "agent" if x_source_agent else ("mcp" if x_via_mcp else "user")
-    chat_activity_id = await activity_service.track_activity(
-        agent_name=name,
-        activity_type=ActivityType.CHAT_START,
-        user_id=current_user.id,
-        triggered_by=activity_triggered_by,
-        parent_activity_id=collaboration_activity_id,  # Link to collaboration if agent-initiated
-        related_execution_id=task_execution_id,  # Database execution ID for structured queries
-        details={
-            "message_preview": request.message[:100],
-            "source_agent": x_source_agent,
-            "execution_id": task_execution_id,  # Also in details for WebSocket events
-            "queue_status": queue_result
-        }
-    )
-
-    # Log user message to database
-    user_message = db.add_chat_message(
-        session_id=session.id,
-        agent_name=name,
-        user_id=current_user.id,
-        user_email=current_user.email or current_user.username,
-        role="user",
-        content=request.message
-    )
-
-    execution_success = False
-    try:
-        # chat_timeout already fetched above for slot acquisition (Issue #98)
-
-        payload = {"message": request.message, "stream": False}
-        if request.model:
-            payload["model"] = request.model
-        # Inject platform instructions into every chat request
-        payload["system_prompt"] = get_platform_system_prompt()
-        # Pass execution ID so agent registers process under the same ID (enables termination)
-        if task_execution_id:
-            payload["execution_id"] = task_execution_id
-
-        start_time = datetime.utcnow()
-
-        # Use retry helper to handle agent server startup delays
-        response = await agent_post_with_retry(
-            name,
-            "/api/chat",
-            payload,
-            max_retries=3,
-            retry_delay=1.0,
-            timeout=chat_timeout + 10  # Add buffer for HTTP overhead
-        )
-        response.raise_for_status()
-
-        response_data = response.json()
-
-        # Extract metadata for persistence
-        execution_time_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
-        metadata = response_data.get("metadata", {})
-        session_data = response_data.get("session", {})
-
-        # Serialize tool calls if present
-        # Note: Check is not None, not truthiness - empty list [] is valid log
-        # execution_log is now raw Claude Code format for UI
-        # execution_log_simplified is the old format for activity tracking
-        execution_log = response_data.get("execution_log", [])
-        execution_log_simplified = response_data.get("execution_log_simplified", execution_log)
-        execution_log_json = json.dumps(execution_log) if execution_log is not None else None
-        tool_calls_json = json.dumps(execution_log_simplified) if execution_log_simplified is not None else None
-
-        # SECURITY: Sanitize credentials from execution logs and response before persistence
-        execution_log_json = sanitize_execution_log(execution_log_json)
-        tool_calls_json = sanitize_execution_log(tool_calls_json)
-        sanitized_response = sanitize_response(response_data.get("response", ""))
-
-        # Log assistant response to database with observability data
-        # SECURITY: Use sanitized response
-        assistant_message = db.add_chat_message(
+        # Log user message to database
+        user_message = await async_db.add_chat_message(
             session_id=session.id,
             agent_name=name,
             user_id=current_user.id,
             user_email=current_user.email or current_user.username,
-            role="assistant",
-            content=sanitized_response,
-            cost=metadata.get("cost_usd"),
-            context_used=session_data.get("context_tokens"),
-            context_max=session_data.get("context_window"),
-            tool_calls=tool_calls_json,
-            execution_time_ms=execution_time_ms
+            role="user",
+            content=request.message
         )
 
-        # Note: Tool calls are stored in chat_messages.tool_calls JSON column
-        # Individual tool_call activities were removed (Issue #45) - they were
-        # duplicate data that accumulated as orphans (never completed)
+        try:
+            # chat_timeout already fetched above for slot acquisition (Issue #98)
+
+            payload = {"message": request.message, "stream": False}
+            if request.model:
+                payload["model"] = request.model
+            # Inject platform instructions into every chat request
+            payload["system_prompt"] = get_platform_system_prompt()
+            # Pass execution ID so agent registers process under the same ID (enables termination)
+            if task_execution_id:
+                payload["execution_id"] = task_execution_id
+
+            start_time = datetime.utcnow()
+
+            # Use retry helper to handle agent server startup delays
+            response = await agent_post_with_retry(
+                name,
+                "/api/chat",
+                payload,
+                max_retries=3,
+                retry_delay=1.0,
+                timeout=chat_timeout + 10  # Add buffer for HTTP overhead
+            )
+            response.raise_for_status()
 
-        # Track chat completion
-        await activity_service.complete_activity(
-            activity_id=chat_activity_id,
-            status=ActivityState.COMPLETED,
-            details={
-                "related_chat_message_id": assistant_message.id,
-                "context_used": session_data.get("context_tokens"),
-                "context_max": session_data.get("context_window"),
-                "cost_usd": metadata.get("cost_usd"),
-                "execution_time_ms": execution_time_ms,
-                "tool_count": len(execution_log_simplified),
-                "execution_id": task_execution_id  # Use database execution ID, not queue ID
-            }
-        )
+            response_data = response.json()
 
-        # Complete collaboration activity if this was agent-to-agent
-        if collaboration_activity_id:
+            # Extract metadata for persistence
+            execution_time_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
+            metadata = response_data.get("metadata", {})
+            session_data = response_data.get("session", {})
+
+            # Serialize tool calls if present
+            # Note: Check is not None, not truthiness - empty list [] is valid log
+            # execution_log is now raw Claude Code format for UI
+            # execution_log_simplified is the old format for activity tracking
+            execution_log = response_data.get("execution_log", [])
+            execution_log_simplified = response_data.get("execution_log_simplified", execution_log)
+            execution_log_json = json.dumps(execution_log) if execution_log is not None else None
+            tool_calls_json = json.dumps(execution_log_simplified) if execution_log_simplified is not None else None
+
+            # SECURITY: Sanitize credentials from execution logs and response before persistence
+            execution_log_json = sanitize_execution_log(execution_log_json)
+            tool_calls_json = sanitize_execution_log(tool_calls_json)
+            sanitized_response = sanitize_response(response_data.get("response", ""))
+
+            # Log assistant response to database with observability data
+            # SECURITY: Use sanitized response
+            assistant_message = await async_db.add_chat_message(
+                session_id=session.id,
+                agent_name=name,
+                user_id=current_user.id,
+                user_email=current_user.email or current_user.username,
+                role="assistant",
+                content=sanitized_response,
+                cost=metadata.get("cost_usd"),
+                context_used=session_data.get("context_tokens"),
+                context_max=session_data.get("context_window"),
+                tool_calls=tool_calls_json,
+                execution_time_ms=execution_time_ms
+            )
+
+            # Note: Tool calls are stored in chat_messages.tool_calls JSON column
+            # Individual tool_call activities were removed (Issue #45) - they were
+            # duplicate data that accumulated as orphans (never completed)
+
+            # Track chat completion
             await activity_service.complete_activity(
-                activity_id=collaboration_activity_id,
+                activity_id=chat_activity_id,
                 status=ActivityState.COMPLETED,
                 details={
                     "related_chat_message_id": assistant_message.id,
-                    "response_length": len(response_data.get("response", "")),
+                    "context_used": session_data.get("context_tokens"),
+                    "context_max": session_data.get("context_window"),
+                    "cost_usd": metadata.get("cost_usd"),
                     "execution_time_ms": execution_time_ms,
+                    "tool_count": len(execution_log_simplified),
                     "execution_id": task_execution_id  # Use database execution ID, not queue ID
                 }
             )
 
-        # Update task execution record with results (#96: all chat types now have execution records)
-        # SECURITY: Use sanitized response and execution logs
-        if task_execution_id:
-            context_used = session_data.get("context_tokens", 0)
-            db.update_execution_status(
-                execution_id=task_execution_id,
-                status=TaskExecutionStatus.SUCCESS,
-                response=sanitized_response,
-                context_used=context_used if context_used > 0 else None,
-                context_max=session_data.get("context_window") or 200000,
-                cost=metadata.get("cost_usd"),
-                tool_calls=tool_calls_json,  # Simplified format for activity tracking
-                execution_log=execution_log_json  # Raw Claude Code format for UI
-            )
-
-        execution_success = True
-
-        # Add execution metadata to response
-        # Include both IDs for clarity:
-        # - id: Queue execution ID (transient, for queue status tracking)
-        # - task_execution_id: Database execution ID (permanent, for API queries and navigation)
-        response_data["execution"] = {
-            "id": execution.id,  # Queue ID (transient)
-            "task_execution_id": task_execution_id,  # Database ID (permanent) - use this for navigation
-            "queue_status": queue_result,
-            "was_queued": is_queued
-        }
-
-        return response_data
-    except httpx.HTTPError as e:
-        import logging
-        # Extract detailed error message from agent response if available
-        error_msg = f"HTTP error: {type(e).__name__}"
-        agent_status_code = None
-        if hasattr(e, 'response') and e.response is not None:
-            agent_status_code = e.response.status_code
-            try:
-                error_data = e.response.json()
-                if "detail" in error_data:
-                    error_msg = error_data["detail"]
-            except Exception:
-                # Try raw text if JSON parsing fails
-                if e.response.text:
-                    error_msg = e.response.text[:500]
-        logging.getLogger("trinity.errors").error(f"Failed to communicate with agent {name}: {error_msg}")
+            # Complete collaboration activity if this was agent-to-agent
+            if collaboration_activity_id:
+                await activity_service.complete_activity(
+                    activity_id=collaboration_activity_id,
+                    status=ActivityState.COMPLETED,
+                    details={
+                        "related_chat_message_id": assistant_message.id,
+                        "response_length": len(response_data.get("response", "")),
+                        "execution_time_ms": execution_time_ms,
+                        "execution_id": task_execution_id  # Use database execution ID, not queue ID
+                    }
+                )
 
-        # Track chat failure
-        await activity_service.complete_activity(
-            activity_id=chat_activity_id,
-            status=ActivityState.FAILED,
-            error=error_msg
-        )
+            # Update task execution record with results (#96: all chat types now have execution records)
+            # SECURITY: Use sanitized response and execution logs
+            if task_execution_id:
+                context_used = session_data.get("context_tokens", 0)
+                await async_db.update_execution_status(
+                    execution_id=task_execution_id,
+                    status=TaskExecutionStatus.SUCCESS,
+                    response=sanitized_response,
+                    context_used=context_used if context_used > 0 else None,
+                    context_max=session_data.get("context_window") or 200000,
+                    cost=metadata.get("cost_usd"),
+                    tool_calls=tool_calls_json,  # Simplified format for activity tracking
+                    execution_log=execution_log_json  # Raw Claude Code format for UI
+                )
 
-        # Update task execution record on failure (#96: all chat types now have execution records)
-        if task_execution_id:
-            db.update_execution_status(
-                execution_id=task_execution_id,
-                status=TaskExecutionStatus.FAILED,
-                error=error_msg
-            )
+            execution_success = True
+
+            # Add execution metadata to response
+            # Include both IDs for clarity:
+            # - id: Queue execution ID (transient, for queue status tracking)
+            # - task_execution_id: Database execution ID (permanent, for API queries and navigation)
+            response_data["execution"] = {
+                "id": execution.id,  # Queue ID (transient)
+                "task_execution_id": task_execution_id,  # Database ID (permanent) - use this for navigation
+                "queue_status": queue_result,
+                "was_queued": is_queued
+            }
 
-        # Complete collaboration activity on failure (was missing - caused activities to stay in "started" state)
-        if collaboration_activity_id:
+            return response_data
+        except httpx.HTTPError as e:
+            import logging
+            # Extract detailed error message from agent response if available
+            error_msg = f"HTTP error: {type(e).__name__}"
+            agent_status_code = None
+            if hasattr(e, 'response') and e.response is not None:
+                agent_status_code = e.response.status_code
+                try:
+                    error_data = e.response.json()
+                    if "detail" in error_data:
+                        error_msg = error_data["detail"]
+                except Exception:
+                    # Try raw text if JSON parsing fails
+                    if e.response.text:
+                        error_msg = e.response.text[:500]
+            logging.getLogger("trinity.errors").error(f"Failed to communicate with agent {name}: {error_msg}")
+
+            # Track chat failure
             await activity_service.complete_activity(
-                activity_id=collaboration_activity_id,
+                activity_id=chat_activity_id,
                 status=ActivityState.FAILED,
                 error=error_msg
             )
 
-        # SUB-003: Auto-switch subscription on rate-limit errors from agent
-        if agent_status_code == 429:
-            try:
-                from services.subscription_auto_switch import handle_rate_limit_error
-                switch_result = await handle_rate_limit_error(
-                    agent_name=name,
-                    error_message=error_msg,
+            # Update task execution record on failure (#96: all chat types now have execution records)
+            if task_execution_id:
+                await async_db.update_execution_status(
+                    execution_id=task_execution_id,
+                    status=TaskExecutionStatus.FAILED,
+                    error=error_msg
                 )
-                if switch_result:
-                    # Auto-switch happened — inform the caller
-                    raise HTTPException(
-                        status_code=429,
-                        detail={
-                            "error": error_msg,
-                            "auto_switch": switch_result,
-                            "message": (
-                                f"Rate limit hit. Subscription auto-switched to "
-                                f"'{switch_result['new_subscription']}'. Please retry."
-                            ),
-                            "retry_after": 15,
-                        }
+
+            # Complete collaboration activity on failure (was missing - caused activities to stay in "started" state)
+            if collaboration_activity_id:
+                await activity_service.complete_activity(
+                    activity_id=collaboration_activity_id,
+                    status=ActivityState.FAILED,
+                    error=error_msg
+                )
+
+            # SUB-003: Auto-switch subscription on rate-limit errors from agent
+            if agent_status_code == 429:
+                try:
+                    from services.subscription_auto_switch import handle_rate_limit_error
+                    switch_result = await handle_rate_limit_error(
+                        agent_name=name,
+                        error_message=error_msg,
                     )
-            except HTTPException:
-                raise
-            except Exception as e:
-                logger.error(f"[SUB-003] Auto-switch check failed for '{name}': {e}")
+                    if switch_result:
+                        # Auto-switch happened — inform the caller
+                        raise HTTPException(
+                            status_code=429,
+                            detail={
+                                "error": error_msg,
+                                "auto_switch": switch_result,
+                                "message": (
+                                    f"Rate limit hit. Subscription auto-switched to "
+                                    f"'{switch_result['new_subscription']}'. Please retry."
+                                ),
+                                "retry_after": 15,
+                            }
+                        )
+                except HTTPException:
+                    raise
+                except Exception as e:
+                    logger.error(f"[SUB-003] Auto-switch check failed for '{name}': {e}")
 
-            # Preserve 429 from agent so frontend can show clear message
-            raise HTTPException(status_code=429, detail=error_msg)
+                # Preserve 429 from agent so frontend can show clear message
+                raise HTTPException(status_code=429, detail=error_msg)
 
-        raise HTTPException(
-            status_code=503,
-            detail=f"Failed to communicate with agent: {error_msg}"
-        )
+            raise HTTPException(
+                status_code=503,
+                detail=f"Failed to communicate with agent: {error_msg}"
+            )
     finally:
         # Always release the queue slot when done
-        await queue.complete(name, success=execution_success)
+        await queue.complete(name, success=execution_success, execution_id=execution.id)
         # Issue #98: Release the capacity slot acquired for this chat execution
         if chat_slot_acquired:
             await slot_service.release_slot(name, execution.id)
@@ -460,7 +495,7 @@ async def _execute_task_background(
         # TIMEOUT-001: Use agent's configured timeout if not explicitly provided
         effective_timeout = request.timeout_seconds
         if effective_timeout is None:
-            effective_timeout = db.get_execution_timeout(agent_name)
+            effective_timeout = await async_db.get_execution_timeout(agent_name)
 
         payload = {
             "message": request.message,
@@ -498,7 +533,7 @@ async def _execute_task_background(
             execution_log_json = json.dumps(execution_log) if execution_log else None
             execution_log_json = sanitize_execution_log(execution_log_json)
 
-            db.update_execution_status(
+            await async_db.update_execution_status(
                 execution_id=execution_id,
                 status=TaskExecutionStatus.SUCCESS,
                 response=sanitized_resp,
@@ -513,30 +548,30 @@ async def _execute_task_background(
         if request.save_to_session and user_id and user_email:
             try:
                 if request.create_new_session:
-                    session = db.create_new_chat_session(
+                    session = await async_db.create_new_chat_session(
                         agent_name=agent_name,
                         user_id=user_id,
                         user_email=user_email
                     )
                 elif request.chat_session_id:
                     # Use the explicit session ID from the frontend
-                    session = db.get_chat_session(request.chat_session_id)
+                    session = await async_db.get_chat_session(request.chat_session_id)
                     if not session:
                         # Session not found, fall back to get_or_create
-                        session = db.get_or_create_chat_session(
+                        session = await async_db.get_or_create_chat_session(
                             agent_name=agent_name,
                             user_id=user_id,
                             user_email=user_email
                         )
                 else:
-                    session = db.get_or_create_chat_session(
+                    session = await async_db.get_or_create_chat_session(
                         agent_name=agent_name,
                         user_id=user_id,
                         user_email=user_email
                     )
 
                 original_user_message = request.user_message or request.message
-                db.add_chat_message(
+                await async_db.add_chat_message(
                     session_id=session.id,
                     agent_name=agent_name,
                     user_id=user_id,
@@ -545,7 +580,7 @@ async def _execute_task_background(
                     content=original_user_message
                 )
 
-                db.add_chat_message(
+                await async_db.add_chat_message(
                     session_id=session.id,
                     agent_name=agent_name,
                     user_id=user_id,
@@ -621,9 +656,9 @@ async def _execute_task_background(
 
         # Update execution record with failure
         if execution_id:
-            existing = db.get_execution(execution_id)
+            existing = await async_db.get_execution(execution_id)
             if not existing or existing.status != TaskExecutionStatus.CANCELLED:
-                db.update_execution_status(
+                await async_db.update_execution_status(
                     execution_id=execution_id,
                     status=TaskExecutionStatus.FAILED,
                     error=error_msg
@@ -691,7 +726,7 @@ async def execute_parallel_task(
         triggered_by = "manual"
 
     # Create execution record in database (persisted task history)
-    execution = db.create_task_execution(
+    execution = await async_db.create_task_execution(
         agent_name=name,
         message=request.message,
         triggered_by=triggered_by,
@@ -734,11 +769,11 @@ async def execute_parallel_task(
     # Async mode: acquire slot here, spawn background task which releases it
     if request.async_mode:
         slot_service = get_slot_service()
-        max_parallel_tasks = db.get_max_parallel_tasks(name)
+        max_parallel_tasks = await async_db.get_max_parallel_tasks(name)
         # TIMEOUT-001: Use agent's configured timeout for slot TTL
         effective_timeout = request.timeout_seconds
         if effective_timeout is None:
-            effective_timeout = db.get_execution_timeout(name)
+            effective_timeout = await async_db.get_execution_timeout(name)
         slot_acquired = await slot_service.acquire_slot(
             agent_name=name,
             execution_id=execution_id or f"temp-{datetime.utcnow().timestamp()}",
@@ -749,7 +784,7 @@ async def execute_parallel_task(
 
         if not slot_acquired:
             if execution_id:
-                db.update_execution_status(
+                await async_db.update_execution_status(
                     execution_id=execution_id,
                     status=TaskExecutionStatus.FAILED,
                     error=f"Agent at capacity ({max_parallel_tasks}/{max_parallel_tasks} parallel tasks running)"
@@ -780,7 +815,7 @@ async def execute_parallel_task(
 
         # Update execution status to running
         if execution_id:
-            db.update_execution_status(execution_id=execution_id, status=TaskExecutionStatus.RUNNING)
+            await async_db.update_execution_status(execution_id=execution_id, status=TaskExecutionStatus.RUNNING)
 
         # Spawn background task (slot will be released when task completes)
         asyncio.create_task(
@@ -863,21 +898,21 @@ async def execute_parallel_task(
     if request.save_to_session:
         try:
             if request.create_new_session:
-                session = db.create_new_chat_session(
+                session = await async_db.create_new_chat_session(
                     agent_name=name,
                     user_id=current_user.id,
                     user_email=current_user.email or current_user.username
                 )
             elif request.chat_session_id:
-                session = db.get_chat_session(request.chat_session_id)
+                session = await async_db.get_chat_session(request.chat_session_id)
                 if not session:
-                    session = db.get_or_create_chat_session(
+                    session = await async_db.get_or_create_chat_session(
                         agent_name=name,
                         user_id=current_user.id,
                         user_email=current_user.email or current_user.username
                     )
             else:
-                session = db.get_or_create_chat_session(
+                session = await async_db.get_or_create_chat_session(
                     agent_name=name,
                     user_id=current_user.id,
                     user_email=current_user.email or current_user.username
@@ -885,7 +920,7 @@ async def execute_parallel_task(
 
             original_user_message = request.user_message or request.message
 
-            db.add_chat_message(
+            await async_db.add_chat_message(
                 session_id=session.id,
                 agent_name=name,
                 user_id=current_user.id,
@@ -894,7 +929,7 @@ async def execute_parallel_task(
                 content=original_user_message
             )
 
-            db.add_chat_message(
+            await async_db.add_chat_message(
                 session_id=session.id,
                 agent_name=name,
                 user_id=current_user.id,
@@ -934,13 +969,13 @@ async def get_agent_chat_history(
         )
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"http://agent-{name}:8000/api/chat/history",
-                timeout=10.0
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_agent_transport().client(name)
+        response = await client.get(
+            f"http://agent-{name}:8000/api/chat/history",
+            timeout=10.0
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPError as e:
         import logging
         logging.getLogger("trinity.errors").error(f"Failed to get chat history for {name}: {e}")
@@ -967,21 +1002,21 @@ async def reset_agent_chat_history(
         )
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.delete(
-                f"http://agent-{name}:8000/api/chat/history",
+        client = get_agent_transport().client(name)
+        response = await client.delete(
+            f"http://agent-{name}:8000/api/chat/history",
+            timeout=10.0
+        )
+        # Agent may not implement this endpoint yet
+        if response.status_code == 405:
+            # Clear activity instead as a fallback
+            await client.delete(
+                f"http://agent-{name}:8000/api/activity",
                 timeout=10.0
             )
-            # Agent may not implement this endpoint yet
-            if response.status_code == 405:
-                # Clear activity instead as a fallback
-                await client.delete(
-                    f"http://agent-{name}:8000/api/activity",
-                    timeout=10.0
-                )
-                return {"status": "reset", "message": "Session activity cleared"}
-            response.raise_for_status()
-            return response.json()
+            return {"status": "reset", "message": "Session activity cleared"}
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPError as e:
         import logging
         logging.getLogger("trinity.errors").error(f"Failed to reset chat history for {name}: {e}")
@@ -1008,13 +1043,13 @@ async def get_agent_chat_session(
         )
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"http://agent-{name}:8000/api/chat/session",
-                timeout=10.0
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_agent_transport().client(name)
+        response = await client.get(
+            f"http://agent-{name}:8000/api/chat/session",
+            timeout=10.0
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPError as e:
         import logging
         logging.getLogger("trinity.errors").error(f"Failed to get session info for {name}: {e}")
@@ -1028,10 +1063,17 @@ async def get_agent_chat_session(
 
 @router.get("/{name}/activity")
 async def get_agent_activity(
+    since: Optional[str] = None,
     name: str = Depends(get_authorized_agent),
     current_user: User = Depends(get_current_user)
 ):
-    """Get session activity for real-time monitoring."""
+    """
+    Get session activity for real-time monitoring.
+
+    Pass the `cursor` of a previous response as `since` to get only the
+    tool calls started or completed after it (`reset: true` means the
+    agent returned its full timeline instead).
+    """
     container = get_agent_container(name)
     if not container:
         raise HTTPException(status_code=404, detail="Agent not found")
@@ -1050,13 +1092,14 @@ async def get_agent_activity(
         }
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"http://agent-{name}:8000/api/activity",
-                timeout=10.0
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_agent_transport().client(name)
+        response = await client.get(
+            f"http://agent-{name}:8000/api/activity",
+            params={"since": since} if since else None,
+            timeout=10.0
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPError:
         return {
             "status": "idle",
@@ -1089,13 +1132,13 @@ async def get_agent_activity_detail(
         )
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"http://agent-{name}:8000/api/activity/{tool_id}",
-                timeout=10.0
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_agent_transport().client(name)
+        response = await client.get(
+            f"http://agent-{name}:8000/api/activity/{tool_id}",
+            timeout=10.0
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPError as e:
         import logging
         logging.getLogger("trinity.errors").error(f"Failed to get activity detail for {name}: {e}")
@@ -1122,13 +1165,13 @@ async def clear_agent_activity(
         }
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.delete(
-                f"http://agent-{name}:8000/api/activity",
-                timeout=10.0
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_agent_transport().client(name)
+        response = await client.delete(
+            f"http://agent-{name}:8000/api/activity",
+            timeout=10.0
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPError as e:
         import logging
         logging.getLogger("trinity.errors").error(f"Failed to clear activity for {name}: {e}")
@@ -1157,13 +1200,13 @@ async def get_agent_model(
         )
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"http://agent-{name}:8000/api/model",
-                timeout=10.0
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_agent_transport().client(name)
+        response = await client.get(
+            f"http://agent-{name}:8000/api/model",
+            timeout=10.0
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPError as e:
         import logging
         logging.getLogger("trinity.errors").error(f"Failed to get model info for {name}: {e}")
@@ -1191,15 +1234,15 @@ async def set_agent_model(
         )
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.put(
-                f"http://agent-{name}:8000/api/model",
-                json={"model": request.model},
-                timeout=10.0
-            )
-            response.raise_for_status()
+        client = get_agent_transport().client(name)
+        response = await client.put(
+            f"http://agent-{name}:8000/api/model",
+            json={"model": request.model},
+            timeout=10.0
+        )
+        response.raise_for_status()
 
-            return response.json()
+        return response.json()
     except httpx.HTTPError as e:
         import logging
         logging.getLogger("trinity.errors").error(f"Failed to set model for {name}: {e}")
@@ -1240,7 +1283,7 @@ async def get_persistent_chat_history(
         # (Owner check would require checking agent_ownership table)
         user_id_filter = current_user.id
 
-    messages = db.get_agent_chat_history(
+    messages = await async_db.get_agent_chat_history(
         agent_name=name,
         user_id=user_id_filter,
         limit=limit
@@ -1275,7 +1318,7 @@ async def get_agent_chat_sessions(
     # Non-admins only see their own sessions
     user_id_filter = None if current_user.role == "admin" else current_user.id
 
-    sessions = db.get_agent_chat_sessions(
+    sessions = await async_db.get_agent_chat_sessions(
         agent_name=name,
         user_id=user_id_filter,
         status=status
@@ -1305,7 +1348,7 @@ async def get_chat_session_detail(
     if not container:
         raise HTTPException(status_code=404, detail="Agent not found")
 
-    session = db.get_chat_session(session_id)
+    session = await async_db.get_chat_session(session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Chat session not found")
 
@@ -1317,7 +1360,7 @@ async def get_chat_session_detail(
     if current_user.role != "admin" and session.user_id != current_user.id:
         raise HTTPException(status_code=403, detail="You don't have access to this session")
 
-    messages = db.get_chat_messages(session_id, limit=limit)
+    messages = await async_db.get_chat_messages(session_id, limit=limit)
 
     return {
         "session": session.model_dump(),
@@ -1337,7 +1380,7 @@ async def close_chat_session(
     if not container:
         raise HTTPException(status_code=404, detail="Agent not found")
 
-    session = db.get_chat_session(session_id)
+    session = await async_db.get_chat_session(session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Chat session not found")
 
@@ -1348,7 +1391,7 @@ async def close_chat_session(
     if current_user.role != "admin" and session.user_id != current_user.id:
         raise HTTPException(status_code=403, detail="You don't have access to this session")
 
-    success = db.close_chat_session(session_id)
+    success = await async_db.close_chat_session(session_id)
 
     if success:
         return {"status": "closed", "session_id": session_id}
@@ -1392,10 +1435,11 @@ async def terminate_agent_execution(
 
     try:
         # Proxy termination request to agent container
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            response = await client.post(
-                f"http://agent-{name}:8000/api/executions/{execution_id}/terminate"
-            )
+        client = get_agent_transport().client(name)
+        response = await client.post(
+            f"http://agent-{name}:8000/api/executions/{execution_id}/terminate",
+            timeout=15.0
+        )
 
         result = response.json()
 
@@ -1425,7 +1469,7 @@ async def terminate_agent_execution(
 
             # Update database execution record if provided
             if task_execution_id:
-                db.update_execution_status(
+                await async_db.update_execution_status(
                     execution_id=task_execution_id,
                     status=TaskExecutionStatus.CANCELLED,
                     error="Execution terminated by user"
@@ -1479,12 +1523,13 @@ async def get_agent_running_executions(
         return {"executions": []}
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(
-                f"http://agent-{name}:8000/api/executions/running"
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_agent_transport().client(name)
+        response = await client.get(
+            f"http://agent-{name}:8000/api/executions/running",
+            timeout=10.0
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPError:
         return {"executions": []}
 
@@ -1497,18 +1542,23 @@ async def get_agent_running_executions(
 async def stream_execution_log(
     execution_id: str,
     name: str = Depends(get_authorized_agent),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    last_event_id: Optional[str] = Header(None)
 ):
     """
     Stream execution log entries via Server-Sent Events (SSE).
 
     Proxies the SSE stream from the agent container to the frontend.
-    Validates user access before starting the stream.
+    Validates user access before starting the stream. All viewers of an
+    execution share one upstream stream (see services/execution_stream.py).
 
     SSE Event format:
+    - id: sequence id of the log entry
     - data: JSON-encoded log entry from Claude Code
     - Final message: {"type": "stream_end"}
 
+    Reconnect with a Last-Event-ID header to resume after that entry.
+
     Use this endpoint for live monitoring of running executions.
     """
     container = get_agent_container(name)
@@ -1518,42 +1568,8 @@ async def stream_execution_log(
     if container.status != "running":
         raise HTTPException(status_code=503, detail="Agent is not running")
 
-    async def proxy_stream():
-        """Proxy SSE stream from agent container with connect timeout and keepalive."""
-        agent_url = f"http://agent-{name}:8000/api/executions/{execution_id}/stream"
-        try:
-            # Connect timeout prevents hanging if agent is unresponsive,
-            # but read timeout is None since SSE streams are long-lived
-            timeout = httpx.Timeout(connect=10.0, read=None, write=None, pool=None)
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                async with client.stream("GET", agent_url) as response:
-                    if response.status_code == 404:
-                        # Execution not found on agent (race condition: task not started yet)
-                        yield f"data: {json.dumps({'type': 'error', 'message': 'Execution not yet available on agent', 'retryable': True})}\n\n"
-                        yield f"data: {json.dumps({'type': 'stream_end'})}\n\n"
-                        return
-
-                    if response.status_code != 200:
-                        yield f"data: {json.dumps({'type': 'error', 'message': f'Agent returned {response.status_code}'})}\n\n"
-                        yield f"data: {json.dumps({'type': 'stream_end'})}\n\n"
-                        return
-
-                    # Stream through data from agent, adding proxy-level keepalive
-                    async for chunk in response.aiter_text():
-                        yield chunk
-        except httpx.ConnectError:
-            yield f"data: {json.dumps({'type': 'error', 'message': 'Failed to connect to agent', 'retryable': True})}\n\n"
-            yield f"data: {json.dumps({'type': 'stream_end'})}\n\n"
-        except httpx.ConnectTimeout:
-            yield f"data: {json.dumps({'type': 'error', 'message': 'Agent connection timed out', 'retryable': True})}\n\n"
-            yield f"data: {json.dumps({'type': 'stream_end'})}\n\n"
-        except Exception as e:
-            logger.error(f"[Stream] Error streaming from agent {name}: {e}")
-            yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
-            yield f"data: {json.dumps({'type': 'stream_end'})}\n\n"
-
     return StreamingResponse(
-        proxy_stream(),
+        get_execution_stream_mux().subscribe(name, execution_id, last_event_id),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
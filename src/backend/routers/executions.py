@@ -31,7 +31,8 @@ from services.process_engine.repositories import (
     SqliteEventRepository,
 )
 from services.process_engine.services import OutputStorage, EventLogger
-from services.process_engine.events import InMemoryEventBus, get_websocket_publisher, get_webhook_publisher
+from services.process_engine.events import InMemoryEventBus, RedisEventBus, get_websocket_publisher, get_webhook_publisher
+from services.event_relay import get_event_relay
 from services.process_engine.engine import (
     ExecutionEngine,
     StepHandlerRegistry,
@@ -174,10 +175,10 @@ def get_event_repo() -> SqliteEventRepository:
 
 
 def get_event_bus() -> InMemoryEventBus:
-    """Get the event bus."""
+    """Get the event bus (shared by all backend workers through the event relay)."""
     global _event_bus
     if _event_bus is None:
-        _event_bus = InMemoryEventBus()
+        _event_bus = RedisEventBus(get_event_relay(), topic="process_events")
         # Register WebSocket publisher to broadcast events
         websocket_publisher = get_websocket_publisher()
         websocket_publisher.register_with_event_bus(_event_bus)
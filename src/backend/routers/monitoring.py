@@ -72,12 +72,14 @@ async def _broadcast_health_change(
         "timestamp": utc_now_iso()
     }
     event_json = json.dumps(event)
+    # A lagging client only needs the agent's latest health
+    coalesce_key = f"agent_health_changed:{agent_name}"
 
     if _websocket_manager:
-        await _websocket_manager.broadcast(event_json)
+        await _websocket_manager.broadcast(event_json, coalesce_key=coalesce_key)
 
     if _filtered_websocket_manager:
-        await _filtered_websocket_manager.broadcast_filtered(event)
+        await _filtered_websocket_manager.broadcast_filtered(event, coalesce_key=coalesce_key)
 
 
 # ============================================================================
@@ -452,6 +454,20 @@ async def trigger_fleet_health_check(
     }
 
 
+@router.get("/scheduler-status")
+async def get_scheduler_status(
+    current_user: User = Depends(require_admin)
+):
+    """
+    Get health check scheduler metrics.
+
+    Admin only. Returns cycle durations (last, average, max), overruns of
+    the tick interval, schedule lag, checks run per layer and records
+    written or skipped as unchanged.
+    """
+    return get_monitoring_service().metrics()
+
+
 @router.get("/cleanup-status")
 async def get_cleanup_status(
     current_user: User = Depends(require_admin)
@@ -10,19 +10,21 @@ Provides endpoints for platform-wide operations:
 These endpoints are admin-only and intended for platform operations.
 """
 import os
+import asyncio
 import logging
-import concurrent.futures
 from datetime import datetime, timedelta
 from typing import Optional, List
 from fastapi import APIRouter, Depends, HTTPException, Request, Query
 import httpx
 
 from models import User
-from database import db
+from database import db, async_db
 from dependencies import get_current_user
 from services.docker_service import get_agent_container, docker_client, list_all_agents_fast
 from services.docker_utils import container_stop, container_start
 from services.agent_client import get_agent_client
+from services.agent_transport import get_agent_transport
+from services import git_service
 from db.agents import SYSTEM_AGENT_NAME
 
 router = APIRouter(prefix="/api/ops", tags=["operations"])
@@ -220,6 +222,48 @@ async def get_fleet_health(
     }
 
 
+@router.get("/fleet/git-status")
+async def get_fleet_git_status(
+    request: Request,
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get git status of all git-enabled agents the user can access.
+
+    Running agents are queried concurrently; each agent serves its status
+    from a short-lived cache, so polling this is cheap.
+
+    Returns per agent:
+    - github_repo / working_branch / last_sync_at: Git config from the database
+    - agent_running: Whether the container is running
+    - status: Live git status from the agent (None if not running or unreachable)
+    """
+    configs = await async_db.list_git_enabled_agents()
+    if current_user.role != "admin":
+        # Owned (by username) and shared (by email), as can_user_access_agent()
+        accessible = set(await async_db.get_agents_by_owner(current_user.username))
+        if current_user.email:
+            accessible.update(await async_db.get_accessible_agent_names(current_user.email))
+        configs = [config for config in configs if config.agent_name in accessible]
+
+    agents = await git_service.get_fleet_git_status(configs)
+
+    pending_sync = sum(
+        1 for agent in agents
+        if agent["status"] and agent["status"].get("sync_status") == "pending_sync"
+    )
+
+    return {
+        "timestamp": datetime.utcnow().isoformat(),
+        "summary": {
+            "total": len(agents),
+            "running": sum(1 for agent in agents if agent["agent_running"]),
+            "pending_sync": pending_sync
+        },
+        "agents": agents
+    }
+
+
 # ============================================================================
 # Fleet Operations
 # ============================================================================
@@ -580,6 +624,40 @@ async def resume_all_schedules(
     }
 
 
+# Containers stopped at once during an emergency stop
+EMERGENCY_STOP_CONCURRENCY = 10
+# Seconds an emergency stop waits for agents to terminate their executions
+# before stopping containers anyway (hung agents must not delay the stop)
+EMERGENCY_STOP_GRACE_SECONDS = 3.0
+
+
+async def _terminate_fleet_executions(
+    agent_names: List[str],
+    deadline: float = EMERGENCY_STOP_GRACE_SECONDS
+) -> dict:
+    """
+    Ask every agent to terminate its running executions, all at once.
+
+    Each agent answers as soon as SIGINT is sent. Waits at most deadline
+    seconds in total; agents that have not answered by then are left to the
+    container stop. Returns terminate_all_executions() results by agent
+    name, with {"success": False, "error": "timed out"} for those agents.
+    """
+    tasks = {
+        asyncio.create_task(get_agent_client(name).terminate_all_executions(timeout=deadline)): name
+        for name in agent_names
+    }
+    done, pending = await asyncio.wait(tasks, timeout=deadline)
+    for task in pending:
+        task.cancel()
+
+    results = {tasks[task]: {"success": False, "error": "timed out"} for task in pending}
+    for task in done:
+        error = task.exception()
+        results[tasks[task]] = {"success": False, "error": str(error)} if error else task.result()
+    return results
+
+
 def _stop_agent_container(agent_name: str, timeout: int = 10) -> dict:
     """
     Stop a single agent container. Used for parallel stopping.
@@ -610,7 +688,11 @@ async def emergency_stop(
 
     Admin-only. Use for runaway costs or critical issues.
 
-    Agents are stopped in parallel using a thread pool for faster response time.
+    Running executions on those agents are terminated first, concurrently
+    across the fleet (SIGINT to each execution's process group, SIGKILL
+    after 5s on the agent), waiting at most EMERGENCY_STOP_GRACE_SECONDS.
+    Agents are then stopped in parallel in worker threads, without blocking
+    the event loop.
 
     Args:
         system_prefix: Optional filter to only stop agents with names starting with this prefix
@@ -619,6 +701,7 @@ async def emergency_stop(
 
     results = {
         "schedules_paused": 0,
+        "executions_terminated": 0,
         "agents_stopped": 0,
         "errors": []
     }
@@ -658,35 +741,65 @@ async def emergency_stop(
         if status == "running":
             agents_to_stop.append(agent_name)
 
-    # Stop agents in parallel using thread pool (Docker SDK is synchronous)
+    # Terminate running executions gracefully before their containers go down
     if agents_to_stop:
-        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-            futures = {
-                executor.submit(_stop_agent_container, agent_name, 10): agent_name
-                for agent_name in agents_to_stop
-            }
+        terminations = await _terminate_fleet_executions(agents_to_stop)
+        for agent_name, result in terminations.items():
+            if result["success"]:
+                results["executions_terminated"] += len(result["terminated"])
+            else:
+                # Container stop below still ends the executions
+                logger.warning(f"[EmergencyStop] Could not terminate executions on {agent_name}: {result.get('error')}")
+
+    # Stop agents in parallel in worker threads (Docker SDK is synchronous)
+    if agents_to_stop:
+        semaphore = asyncio.Semaphore(EMERGENCY_STOP_CONCURRENCY)
+
+        async def stop(agent_name: str) -> dict:
+            async with semaphore:
+                return await asyncio.to_thread(_stop_agent_container, agent_name, 10)
 
-            # Wait for all with a timeout (60 seconds should be plenty for parallel stops)
-            for future in concurrent.futures.as_completed(futures, timeout=60):
-                agent_name = futures[future]
-                try:
-                    result = future.result()
-                    if result["result"] == "stopped":
-                        results["agents_stopped"] += 1
-                    elif result["result"] == "error":
-                        results["errors"].append(f"Agent {agent_name}: {result.get('error', 'unknown error')}")
-                except Exception as e:
-                    results["errors"].append(f"Agent {agent_name}: {e}")
+        tasks = {asyncio.create_task(stop(agent_name)): agent_name for agent_name in agents_to_stop}
+
+        # Wait for all with a timeout (60 seconds should be plenty for parallel stops)
+        done, pending = await asyncio.wait(tasks, timeout=60)
+        for task in done:
+            agent_name = tasks[task]
+            try:
+                result = task.result()
+                if result["result"] == "stopped":
+                    results["agents_stopped"] += 1
+                elif result["result"] == "error":
+                    results["errors"].append(f"Agent {agent_name}: {result.get('error', 'unknown error')}")
+            except Exception as e:
+                results["errors"].append(f"Agent {agent_name}: {e}")
+        for task in pending:
+            results["errors"].append(f"Agent {tasks[task]}: stop timed out")
 
     return {
         "success": True,
         "message": "Emergency stop completed",
         "schedules_paused": results["schedules_paused"],
+        "executions_terminated": results["executions_terminated"],
         "agents_stopped": results["agents_stopped"],
         "errors": results["errors"] if results["errors"] else None
     }
 
 
+@router.get("/agent-transport")
+async def get_agent_transport_metrics(
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Connection pool metrics for backend-to-agent HTTP traffic.
+
+    Admin-only. Reports per-agent request counts, new connections opened
+    and keep-alive hit rate.
+    """
+    require_admin(current_user)
+    return get_agent_transport().get_metrics()
+
+
 # ============================================================================
 # Alerts
 # ============================================================================
@@ -14,6 +14,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, Body
 from pydantic import BaseModel, Field
 
 from dependencies import get_current_user, CurrentUser
+from db.scheduler_events import publish_schedules_changed
 from services.process_engine.domain import (
     ProcessDefinition,
     ProcessId,
@@ -28,7 +29,8 @@ from services.process_engine.domain import (
 )
 from services.process_engine.repositories import SqliteProcessDefinitionRepository
 from services.process_engine.services import ProcessValidator, ValidationResult, ProcessAuthorizationService
-from services.process_engine.events import InMemoryEventBus, get_websocket_publisher
+from services.process_engine.events import InMemoryEventBus, RedisEventBus, get_websocket_publisher
+from services.event_relay import get_event_relay
 
 # For process schedule management
 import sqlite3
@@ -182,10 +184,10 @@ _event_bus: Optional[InMemoryEventBus] = None
 
 
 def get_event_bus() -> InMemoryEventBus:
-    """Get or create the event bus for definition events."""
+    """Get or create the event bus for definition events (shared by all workers)."""
     global _event_bus
     if _event_bus is None:
-        _event_bus = InMemoryEventBus()
+        _event_bus = RedisEventBus(get_event_relay(), topic="process_definitions")
         # Register WebSocket publisher
         websocket_publisher = get_websocket_publisher()
         websocket_publisher.register_with_event_bus(_event_bus)
@@ -823,6 +825,9 @@ def _register_process_schedules(definition: ProcessDefinition) -> int:
     except Exception as e:
         logger.error(f"Failed to register process schedules: {e}")
 
+    if count > 0:
+        # Wake the scheduler's incremental sync (SCHED-SYNC-001)
+        publish_schedules_changed()
     return count
 
 
@@ -851,6 +856,7 @@ def _unregister_process_schedules(process_id: ProcessId) -> int:
 
         if count > 0:
             logger.info(f"Unregistered {count} schedule(s) for process {process_id}")
+            publish_schedules_changed()
 
     except Exception as e:
         logger.error(f"Failed to unregister process schedules: {e}")
@@ -5,7 +5,6 @@ These endpoints do NOT require authentication and are used by public users
 to access agents via shareable links.
 """
 import asyncio
-import json
 import secrets
 import httpx
 import logging
@@ -25,6 +24,7 @@ from database import (
     PublicChatMessage
 )
 from services.docker_service import get_agent_container
+from services.execution_stream import get_execution_stream_mux
 from services.email_service import email_service
 from services.task_execution_service import get_task_execution_service
 from services.platform_prompt_service import format_user_memory_block
@@ -835,7 +835,8 @@ async def public_stream_execution(
     Stream execution log entries via SSE for a public chat execution.
 
     Validates the public link token instead of JWT authentication.
-    Proxies the SSE stream from the agent container to the frontend.
+    Proxies the SSE stream from the agent container to the frontend through
+    the shared per-execution stream; honours Last-Event-ID on reconnect.
     """
     # Validate link token
     is_valid, reason, link = db.is_public_link_valid(token)
@@ -852,29 +853,10 @@ async def public_stream_execution(
     if not execution or execution.agent_name != agent_name:
         raise HTTPException(status_code=404, detail="Execution not found")
 
-    async def proxy_stream():
-        """Proxy SSE stream from agent container."""
-        agent_url = f"http://agent-{agent_name}:8000/api/executions/{execution_id}/stream"
-        try:
-            async with httpx.AsyncClient(timeout=None) as client:
-                async with client.stream("GET", agent_url) as response:
-                    if response.status_code != 200:
-                        yield f"data: {json.dumps({'type': 'error', 'message': f'Agent returned {response.status_code}'})}\n\n"
-                        yield f"data: {json.dumps({'type': 'stream_end'})}\n\n"
-                        return
-
-                    async for chunk in response.aiter_text():
-                        yield chunk
-        except httpx.ConnectError:
-            yield f"data: {json.dumps({'type': 'error', 'message': 'Failed to connect to agent'})}\n\n"
-            yield f"data: {json.dumps({'type': 'stream_end'})}\n\n"
-        except Exception as e:
-            logger.error(f"[PublicStream] Error streaming from agent {agent_name}: {e}")
-            yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
-            yield f"data: {json.dumps({'type': 'stream_end'})}\n\n"
-
     return StreamingResponse(
-        proxy_stream(),
+        get_execution_stream_mux().subscribe(
+            agent_name, execution_id, request.headers.get("last-event-id")
+        ),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
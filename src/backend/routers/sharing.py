@@ -13,6 +13,7 @@ router = APIRouter(prefix="/api/agents", tags=["sharing"])
 
 # WebSocket manager will be injected from main.py
 manager = None
+filtered_manager = None  # For Trinity Connect /ws/events
 
 def set_websocket_manager(ws_manager):
     """Set the WebSocket manager for broadcasting events."""
@@ -20,6 +21,12 @@ def set_websocket_manager(ws_manager):
     manager = ws_manager
 
 
+def set_filtered_websocket_manager(ws_manager):
+    """Set the filtered WebSocket manager for /ws/events (Trinity Connect)."""
+    global filtered_manager
+    filtered_manager = ws_manager
+
+
 @router.post("/{agent_name}/share", response_model=AgentShare)
 async def share_agent_endpoint(
     agent_name: OwnedAgentByName,
@@ -60,6 +67,8 @@ async def share_agent_endpoint(
             "event": "agent_shared",
             "data": {"name": agent_name, "shared_with": share_request.email}
         }))
+    if filtered_manager:
+        filtered_manager.grant_agent(share_request.email, agent_name)
 
     return share
 
@@ -85,6 +94,8 @@ async def unshare_agent_endpoint(
             "event": "agent_unshared",
             "data": {"name": agent_name, "removed_user": email}
         }))
+    if filtered_manager:
+        filtered_manager.revoke_agent(email, agent_name)
 
     return {"message": f"Sharing removed for {email}"}
 
@@ -4,6 +4,10 @@ Host and Container Telemetry Endpoints
 Provides real-time system metrics for the Dashboard:
 - Host system stats (CPU, memory, disk)
 - Aggregate container stats across all running agents
+
+Container stats come from the streaming stats collector
+(services/container_stats.py); one-shot Docker stats calls are only made
+for agents the collector has no recent sample for yet.
 """
 
 import asyncio
@@ -14,6 +18,7 @@ from typing import List, Dict, Any, Optional
 from fastapi import APIRouter, HTTPException
 
 from services.docker_service import docker_client, list_all_agents_fast
+from services.container_stats import StatsSample, parse_stats, stats_collector
 
 # Module-level executor for Docker operations (blocking calls)
 # Limited to 4 workers to avoid overwhelming Docker daemon
@@ -66,39 +71,29 @@ async def get_host_stats():
         raise HTTPException(status_code=500, detail=f"Error getting host stats: {str(e)}")
 
 
+def _container_stats_entry(agent_name: str, sample: StatsSample) -> Dict[str, Any]:
+    return {
+        "name": agent_name,
+        "cpu": round(sample.cpu_percent, 1),
+        "memory_mb": round(sample.memory_used_bytes / (1024 * 1024), 1)
+    }
+
+
 def _get_single_container_stats_sync(agent_name: str) -> Dict[str, Any]:
     """
     Synchronous helper to get stats for a single container.
     Runs in thread pool to avoid blocking the event loop.
+
+    Only used when the stats collector has no recent sample for the agent.
     """
     try:
         container = docker_client.containers.get(f"agent-{agent_name}")
 
         # Get stats (one-shot) - this is the blocking call (~1-2s per container)
-        stats = container.stats(stream=False)
-
-        # Calculate CPU percentage
-        cpu_percent = 0.0
-        cpu_delta = stats['cpu_stats']['cpu_usage']['total_usage'] - \
-                   stats['precpu_stats']['cpu_usage']['total_usage']
-        system_delta = stats['cpu_stats']['system_cpu_usage'] - \
-                      stats['precpu_stats']['system_cpu_usage']
-
-        if system_delta > 0 and cpu_delta > 0:
-            num_cpus = len(stats['cpu_stats']['cpu_usage'].get('percpu_usage', [])) or 1
-            cpu_percent = (cpu_delta / system_delta) * num_cpus * 100.0
-
-        # Get memory usage (subtract cache for accuracy)
-        memory_usage = stats['memory_stats'].get('usage', 0)
-        memory_cache = stats['memory_stats'].get('stats', {}).get('cache', 0)
-        memory_used = memory_usage - memory_cache
-        memory_mb = round(memory_used / (1024 * 1024), 1)
-
-        return {
-            "name": agent_name,
-            "cpu": round(cpu_percent, 1),
-            "memory_mb": memory_mb
-        }
+        sample = parse_stats(container.stats(stream=False))
+        if sample is None:
+            raise RuntimeError("No stats available")
+        return _container_stats_entry(agent_name, sample)
 
     except Exception as e:
         return {
@@ -115,7 +110,8 @@ async def get_container_stats():
     Get aggregate statistics across all running agent containers.
 
     Returns total CPU usage, memory consumption, and per-container breakdown.
-    Uses parallel execution for better performance with multiple containers.
+    Served from the streaming stats collector; agents without a recent
+    sample are fetched with one-shot stats calls in parallel.
     No authentication required (follows OTel pattern).
     """
     if not docker_client:
@@ -135,16 +131,24 @@ async def get_container_stats():
                 "timestamp": datetime.utcnow().isoformat() + "Z"
             }
 
-        # Fetch all container stats in PARALLEL using thread pool
-        # This reduces time from O(n * 1-2s) to O(1-2s) for n containers
-        loop = asyncio.get_event_loop()
-        tasks = [
-            loop.run_in_executor(_docker_executor, _get_single_container_stats_sync, agent.name)
-            for agent in running_agents
-        ]
-
-        # Wait for all stats to complete concurrently
-        containers_stats = await asyncio.gather(*tasks, return_exceptions=True)
+        containers_stats: List[Any] = []
+        missing = []
+        for agent in running_agents:
+            sample = stats_collector.get_latest(agent.name)
+            if sample is not None:
+                containers_stats.append(_container_stats_entry(agent.name, sample))
+            else:
+                missing.append(agent.name)
+
+        if missing:
+            # Fetch the rest in PARALLEL using thread pool
+            # This reduces time from O(n * 1-2s) to O(1-2s) for n containers
+            loop = asyncio.get_event_loop()
+            tasks = [
+                loop.run_in_executor(_docker_executor, _get_single_container_stats_sync, name)
+                for name in missing
+            ]
+            containers_stats.extend(await asyncio.gather(*tasks, return_exceptions=True))
 
         # Process results, handling any exceptions
         processed_stats: List[Dict[str, Any]] = []
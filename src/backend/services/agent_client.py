@@ -12,6 +12,8 @@ from typing import Optional, Any, Dict
 
 import httpx
 
+from services.agent_transport import get_agent_transport
+
 logger = logging.getLogger(__name__)
 
 
@@ -129,9 +131,8 @@ class AgentClient:
         timeout = timeout or self.DEFAULT_TIMEOUT
 
         try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.request(method, url, **kwargs)
-                return response
+            client = get_agent_transport().client(self.agent_name)
+            return await client.request(method, url, timeout=timeout, **kwargs)
         except httpx.ConnectError as e:
             raise AgentNotReachableError(
                 f"Cannot connect to agent {self.agent_name}: {e}"
@@ -480,6 +481,47 @@ class AgentClient:
         except AgentClientError as e:
             return {"success": False, "error": str(e)}
 
+    # ========================================================================
+    # Execution Control
+    # ========================================================================
+
+    async def terminate_all_executions(
+        self,
+        graceful_timeout: float = 5.0,
+        timeout: float = 10.0
+    ) -> dict:
+        """
+        Terminate every running execution on the agent.
+
+        The agent answers once SIGINT is sent and escalates to SIGKILL
+        itself after graceful_timeout, so this does not wait for exits.
+
+        Returns:
+            dict with success status, terminated execution IDs and per-execution errors
+        """
+        try:
+            response = await self.post(
+                "/api/executions/terminate-all",
+                timeout=timeout,
+                params={"graceful_timeout": graceful_timeout}
+            )
+
+            if response.status_code == 200:
+                result = response.json()
+                return {
+                    "success": True,
+                    "terminated": result.get("terminated", []),
+                    "errors": result.get("errors") or {}
+                }
+            return {
+                "success": False,
+                "error": self._extract_error_detail(response),
+                "status_code": response.status_code
+            }
+
+        except AgentClientError as e:
+            return {"success": False, "error": str(e)}
+
     # ========================================================================
     # Health Check
     # ========================================================================
@@ -0,0 +1,229 @@
+"""
+Docker-events-driven agent container inventory (INVENTORY-001).
+
+list_all_agents_fast() used to call Docker `containers.list` on every
+dashboard request, monitoring pass, telemetry poll and port allocation.
+The inventory keeps the same label-only AgentStatus records in memory:
+
+- A background thread lists all agent containers, then follows the Docker
+  events stream (create/start/restart/stop/die/pause/unpause/rename/
+  destroy). Every RECONCILE_INTERVAL seconds the stream ends and the
+  thread reloads and reopens it, correcting anything events cannot
+  express (e.g. `restarting`).
+- The stream is opened with `since` set to just before the list call, so
+  no event in between is lost. Events set absolute state, so replaying one
+  the list already reflects is harmless.
+- docker_utils lifecycle wrappers report the container they changed
+  (observe()), so a request sees its own change without waiting for the
+  event. Every record carries the time it was observed; an older event or
+  observation never overwrites a newer one, and removed containers keep a
+  tombstone until the next reload.
+
+Reads are served from memory only while the event stream is live. Before
+start(), without Docker, or while reconnecting, list_all_agents_fast()
+lists containers directly.
+"""
+
+import logging
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+import docker
+
+from models import AgentStatus
+from services.docker_service import AGENT_LABEL, agent_status_from_labels, docker_client
+
+logger = logging.getLogger(__name__)
+
+# Seconds between full reloads (the events stream is reopened after each)
+RECONCILE_INTERVAL = 60
+# Seconds to wait before reconnecting after a Docker error
+RECONNECT_DELAY = 5
+
+_RUNNING_ACTIONS = {"start", "restart", "unpause"}
+_STOPPED_ACTIONS = {"create", "stop", "die"}
+
+
+class AgentInventory:
+    """In-memory map of agent containers kept current from Docker events."""
+
+    def __init__(
+        self,
+        client=None,
+        reconcile_interval: float = RECONCILE_INTERVAL,
+        reconnect_delay: float = RECONNECT_DELAY,
+    ):
+        self.client = client
+        self.reconcile_interval = reconcile_interval
+        self.reconnect_delay = reconnect_delay
+        self._lock = threading.Lock()
+        # container id -> (observed at, ns since epoch; status)
+        self._agents: Dict[str, Tuple[int, AgentStatus]] = {}
+        self._removed: Dict[str, int] = {}  # container id -> removed at (ns)
+        self._live = False
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stream = None
+        self.events_applied = 0
+        self.reloads = 0
+
+    @property
+    def is_live(self) -> bool:
+        """True while reads are served from memory."""
+        return self._live
+
+    def start(self):
+        """Start following Docker events in a background thread."""
+        if self.client is None or (self._thread is not None and self._thread.is_alive()):
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="agent-inventory", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background thread; reads fall back to Docker."""
+        self._stop.set()
+        self._live = False
+        stream = self._stream
+        if stream is not None:
+            try:
+                stream.close()
+            except Exception:
+                pass
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def list_agents(self) -> Optional[List[AgentStatus]]:
+        """Copies of all agent records, or None while the inventory is not live."""
+        if not self._live:
+            return None
+        with self._lock:
+            records = list(self._agents.values())
+        return [status.model_copy() for _, status in records]
+
+    def observe(self, container):
+        """
+        Record a container's state right after this worker changed it.
+
+        Blocking (inspects the container): call from an executor thread.
+        """
+        if not self._live:
+            return
+        observed_at = time.time_ns()
+        try:
+            container.reload()
+        except docker.errors.NotFound:
+            self._remove(container.id, observed_at)
+            return
+        except Exception as e:
+            logger.debug(f"Could not inspect container for inventory: {e}")
+            return
+        labels = container.labels or {}
+        if labels.get("trinity.platform") == "agent":
+            self._upsert(container.id, observed_at, agent_status_from_labels(
+                container.name, labels, container.status, container.id
+            ))
+
+    # -------------------------------------------------------------------------
+    # Event stream
+    # -------------------------------------------------------------------------
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                since = int(time.time())
+                self._reload(since)
+                self._stream = self.client.events(
+                    decode=True,
+                    since=since,
+                    until=since + int(self.reconcile_interval),
+                    filters={"type": "container", "label": AGENT_LABEL},
+                )
+                self._live = True
+                for event in self._stream:
+                    self._apply_event(event)
+            except Exception as e:
+                if self._stop.is_set():
+                    break
+                self._live = False
+                logger.warning(
+                    f"Agent inventory lost Docker events ({e}); "
+                    f"listing containers directly, retrying in {self.reconnect_delay}s"
+                )
+                self._stop.wait(self.reconnect_delay)
+            finally:
+                self._stream = None
+        self._live = False
+
+    def _reload(self, since: int):
+        """Replace the inventory with a full listing taken at or after `since`."""
+        containers = self.client.containers.list(all=True, filters={"label": AGENT_LABEL})
+        version = since * 1_000_000_000
+        agents = {
+            c.id: (version, agent_status_from_labels(c.name, c.labels, c.status, c.id))
+            for c in containers
+        }
+        with self._lock:
+            # Observations newer than the listing stay (events replayed from `since` agree)
+            for container_id, record in self._agents.items():
+                if record[0] > version:
+                    agents[container_id] = record
+            self._removed = {cid: at for cid, at in self._removed.items() if at > version}
+            for container_id in self._removed:
+                agents.pop(container_id, None)
+            self._agents = agents
+        self.reloads += 1
+
+    def _apply_event(self, event: dict):
+        action = event.get("Action") or event.get("status") or ""
+        actor = event.get("Actor") or {}
+        container_id = actor.get("ID") or event.get("id")
+        attributes = actor.get("Attributes") or {}
+        if not container_id:
+            return
+        observed_at = event.get("timeNano") or int(event.get("time", 0)) * 1_000_000_000
+
+        if action == "destroy":
+            self._remove(container_id, observed_at)
+            return
+        if action in _RUNNING_ACTIONS:
+            docker_status = "running"
+        elif action in _STOPPED_ACTIONS:
+            docker_status = "exited"
+        elif action == "pause":
+            docker_status = "paused"
+        elif action == "rename":
+            with self._lock:
+                record = self._agents.get(container_id)
+            docker_status = record[1].status if record else "exited"
+        else:
+            return  # exec_*, health_status, kill (followed by die), ...
+
+        # Event attributes carry the container's labels plus name/image
+        self._upsert(container_id, observed_at, agent_status_from_labels(
+            attributes.get("name", ""), attributes, docker_status, container_id
+        ))
+        self.events_applied += 1
+
+    def _upsert(self, container_id: str, observed_at: int, status: AgentStatus):
+        with self._lock:
+            if self._removed.get(container_id, -1) >= observed_at:
+                return
+            current = self._agents.get(container_id)
+            if current is not None and current[0] > observed_at:
+                return
+            self._agents[container_id] = (observed_at, status)
+
+    def _remove(self, container_id: str, observed_at: int):
+        with self._lock:
+            current = self._agents.get(container_id)
+            if current is not None and current[0] > observed_at:
+                return
+            self._agents.pop(container_id, None)
+            self._removed[container_id] = max(observed_at, self._removed.get(container_id, 0))
+
+
+# Global instance
+agent_inventory = AgentInventory(docker_client)
@@ -4,10 +4,11 @@ Agent Service Files - File browser operations.
 Handles file listing, download, preview, and delete for agent workspaces.
 """
 import logging
+from typing import Optional
 
 import httpx
 from fastapi import HTTPException, Request
-from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.responses import JSONResponse, PlainTextResponse, Response, StreamingResponse
 
 from models import User
 from database import db
@@ -23,11 +24,18 @@ async def list_agent_files_logic(
     path: str,
     current_user: User,
     request: Request,
-    show_hidden: bool = False
-) -> dict:
+    show_hidden: bool = False,
+    depth: Optional[int] = None,
+    offset: int = 0,
+    limit: Optional[int] = None,
+    ignore: Optional[str] = None
+) -> Response:
     """
     List files in the agent's workspace directory.
-    Returns a flat list of files with metadata (name, size, modified date).
+    Returns a tree of files with metadata (name, size, modified date).
+
+    The agent's ETag is passed through and the request's If-None-Match is
+    forwarded, so an unchanged listing is answered with 304 and no body.
 
     Args:
         agent_name: Name of the agent
@@ -35,6 +43,10 @@ async def list_agent_files_logic(
         current_user: Current authenticated user
         request: HTTP request object
         show_hidden: If True, include hidden files (starting with .)
+        depth: Directory levels to include (whole tree if None)
+        offset: Entries of the requested directory to skip
+        limit: Maximum entries per directory (all if None)
+        ignore: Comma-separated name patterns not to walk (none if None)
     """
     if not db.can_user_access_agent(current_user.username, agent_name):
         raise HTTPException(status_code=403, detail="You don't have permission to access this agent")
@@ -47,19 +59,37 @@ async def list_agent_files_logic(
     if container.status != "running":
         raise HTTPException(status_code=400, detail="Agent must be running to browse files")
 
+    params = {"path": path, "show_hidden": str(show_hidden).lower(), "offset": offset}
+    if depth is not None:
+        params["depth"] = depth
+    if limit is not None:
+        params["limit"] = limit
+    if ignore is not None:
+        params["ignore"] = ignore
+
+    headers = {}
+    if request.headers.get("if-none-match"):
+        headers["If-None-Match"] = request.headers["if-none-match"]
+
     try:
         # Call agent's internal file listing API with retry
         response = await agent_http_request(
             agent_name,
             "GET",
             "/api/files",
-            params={"path": path, "show_hidden": str(show_hidden).lower()},
+            params=params,
+            headers=headers,
             max_retries=3,
             retry_delay=1.0,
             timeout=30.0
         )
+        cache_headers = {"Cache-Control": "no-cache"}
+        if response.headers.get("etag"):
+            cache_headers["ETag"] = response.headers["etag"]
+        if response.status_code == 304:
+            return Response(status_code=304, headers=cache_headers)
         if response.status_code == 200:
-            return response.json()
+            return JSONResponse(response.json(), headers=cache_headers)
         else:
             raise HTTPException(
                 status_code=response.status_code,
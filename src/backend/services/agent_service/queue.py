@@ -7,6 +7,7 @@ import logging
 
 from fastapi import HTTPException
 
+from database import async_db
 from models import User
 from services.docker_service import get_agent_container
 from services.execution_queue import get_execution_queue
@@ -26,7 +27,8 @@ async def get_agent_queue_status_logic(
     - is_busy: Whether the agent is currently executing a request
     - current_execution: Details of the currently running execution (if any)
     - queue_length: Number of requests waiting in the queue
-    - queued_executions: Details of queued requests
+    - max_queue_depth: Configured queue depth for the agent
+    - queued_executions: Details of queued requests, in the order they will run
 
     This is useful for checking if an agent is available before
     sending a chat request, or for monitoring agent workload.
@@ -37,7 +39,8 @@ async def get_agent_queue_status_logic(
 
     try:
         queue = get_execution_queue()
-        status = await queue.get_status(agent_name)
+        max_queue_depth = await async_db.get_max_queue_depth(agent_name)
+        status = await queue.get_status(agent_name, max_queue_depth)
         return status.model_dump()
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get queue status: {str(e)}")
@@ -53,7 +56,7 @@ async def clear_agent_queue_logic(
     This does NOT stop the currently running execution - only clears pending requests.
     Use this if you want to cancel all waiting requests for an agent.
 
-    Returns the number of cleared executions.
+    Waiting callers are woken and receive 409. Returns the number of cleared executions.
     """
     container = get_agent_container(agent_name)
     if not container:
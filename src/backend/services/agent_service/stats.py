@@ -7,19 +7,20 @@ import asyncio
 import logging
 from datetime import datetime, timedelta
 
-import httpx
 from fastapi import HTTPException
 
 from models import User
 from database import db
 from services.docker_service import get_agent_container
 from services.docker_utils import container_reload, container_stats
+from services.container_stats import parse_stats, stats_collector
+from services.agent_transport import get_agent_transport
 from .helpers import get_accessible_agents
 
 logger = logging.getLogger(__name__)
 
 
-async def _fetch_single_agent_context(agent: dict, client: httpx.AsyncClient) -> dict:
+async def _fetch_single_agent_context(agent: dict) -> dict:
     """Fetch context stats for a single agent (used for concurrent fetching)."""
     agent_name = agent["name"]
     status = agent["status"]
@@ -44,7 +45,8 @@ async def _fetch_single_agent_context(agent: dict, client: httpx.AsyncClient) ->
         container = get_agent_container(agent_name)
         if container:
             agent_url = f"http://{container.name}:8000/api/chat/session"
-            response = await client.get(agent_url)
+            client = get_agent_transport().client(agent_name)
+            response = await client.get(agent_url, timeout=2.0)
             if response.status_code == 200:
                 session_data = response.json()
                 stats["contextPercent"] = session_data.get("context_percent", 0)
@@ -94,10 +96,9 @@ async def get_agents_context_stats_logic(
     """
     accessible_agents = get_accessible_agents(current_user)
 
-    # Fetch all agent stats concurrently using a shared client
-    async with httpx.AsyncClient(timeout=2.0) as client:
-        tasks = [_fetch_single_agent_context(agent, client) for agent in accessible_agents]
-        agent_stats = await asyncio.gather(*tasks, return_exceptions=True)
+    # Fetch all agent stats concurrently over pooled per-agent connections
+    tasks = [_fetch_single_agent_context(agent) for agent in accessible_agents]
+    agent_stats = await asyncio.gather(*tasks, return_exceptions=True)
 
     # Filter out any exceptions and keep successful results
     valid_stats = []
@@ -123,10 +124,15 @@ async def get_agents_context_stats_logic(
 
 async def get_agent_stats_logic(
     agent_name: str,
-    current_user: User
+    current_user: User,
+    include_history: bool = False
 ) -> dict:
     """
     Get live container stats (CPU, memory, network) for an agent.
+
+    Served from the streaming stats collector when it has a recent sample;
+    otherwise a one-shot Docker stats call (~1-2s) is made. With
+    include_history, also returns the collector's recent samples.
     """
     container = get_agent_container(agent_name)
     if not container:
@@ -137,30 +143,11 @@ async def get_agent_stats_logic(
         raise HTTPException(status_code=400, detail="Agent is not running")
 
     try:
-        stats = await container_stats(container, stream=False)
-
-        cpu_percent = 0.0
-        cpu_stats = stats.get("cpu_stats", {})
-        precpu_stats = stats.get("precpu_stats", {})
-
-        cpu_delta = cpu_stats.get("cpu_usage", {}).get("total_usage", 0) - \
-                    precpu_stats.get("cpu_usage", {}).get("total_usage", 0)
-        system_delta = cpu_stats.get("system_cpu_usage", 0) - \
-                       precpu_stats.get("system_cpu_usage", 0)
-
-        if system_delta > 0 and cpu_delta > 0:
-            num_cpus = len(cpu_stats.get("cpu_usage", {}).get("percpu_usage", [])) or 1
-            cpu_percent = (cpu_delta / system_delta) * num_cpus * 100.0
-
-        memory_stats = stats.get("memory_stats", {})
-        memory_used = memory_stats.get("usage", 0)
-        memory_limit = memory_stats.get("limit", 0)
-        cache = memory_stats.get("stats", {}).get("cache", 0)
-        memory_used_actual = max(0, memory_used - cache)
-
-        networks = stats.get("networks", {})
-        network_rx = sum(net.get("rx_bytes", 0) for net in networks.values())
-        network_tx = sum(net.get("tx_bytes", 0) for net in networks.values())
+        sample = stats_collector.get_latest(agent_name)
+        if sample is None:
+            sample = parse_stats(await container_stats(container, stream=False))
+        if sample is None:
+            raise RuntimeError("No stats available")
 
         started_at = container.attrs.get("State", {}).get("StartedAt", "")
         uptime_seconds = 0
@@ -171,15 +158,20 @@ async def get_agent_stats_logic(
             except Exception:
                 pass
 
-        return {
-            "cpu_percent": round(cpu_percent, 1),
-            "memory_used_bytes": memory_used_actual,
-            "memory_limit_bytes": memory_limit,
-            "memory_percent": round((memory_used_actual / memory_limit * 100) if memory_limit > 0 else 0, 1),
-            "network_rx_bytes": network_rx,
-            "network_tx_bytes": network_tx,
+        result = {
+            "cpu_percent": round(sample.cpu_percent, 1),
+            "memory_used_bytes": sample.memory_used_bytes,
+            "memory_limit_bytes": sample.memory_limit_bytes,
+            "memory_percent": round(sample.memory_percent, 1),
+            "network_rx_bytes": sample.network_rx_bytes,
+            "network_tx_bytes": sample.network_tx_bytes,
+            "block_read_bytes": sample.block_read_bytes,
+            "block_write_bytes": sample.block_write_bytes,
             "uptime_seconds": uptime_seconds,
             "status": container.status
         }
+        if include_history:
+            result["history"] = [s.to_dict() for s in stats_collector.get_history(agent_name)]
+        return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get stats: {str(e)}")
@@ -0,0 +1,200 @@
+"""
+Shared HTTP transport for backend-to-agent traffic.
+
+Every proxy call to an agent container (`http://agent-{name}:8000`) used to
+create and tear down its own `httpx.AsyncClient`, paying TCP setup on each
+request. This module keeps one long-lived client per agent, so requests reuse
+keep-alive connections from that agent's pool.
+
+Usage:
+    client = get_agent_transport().client(agent_name)
+    response = await client.get(f"http://agent-{agent_name}:8000/api/activity", timeout=10.0)
+
+Clients carry no default timeout semantics beyond DEFAULT_TIMEOUT; callers
+pass per-request timeouts as before.
+
+Configuration (environment):
+    AGENT_HTTP_MAX_CONNECTIONS    Max open connections per agent (default 32)
+    AGENT_HTTP_MAX_KEEPALIVE      Idle keep-alive connections per agent (default 8)
+    AGENT_HTTP_KEEPALIVE_EXPIRY   Seconds an idle connection is kept (default 60)
+    AGENT_HTTP2                   "true" to negotiate HTTP/2 (requires the `h2` package)
+"""
+import asyncio
+import logging
+import os
+import weakref
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 30.0
+
+
+@dataclass
+class AgentPoolStats:
+    """Request/connection counters for one agent's pool."""
+    requests: int = 0
+    new_connections: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of requests served by an already-open connection."""
+        if self.requests == 0:
+            return 0.0
+        return max(0.0, 1.0 - self.new_connections / self.requests)
+
+
+class AgentTransport:
+    """
+    Process-wide pool of per-agent `httpx.AsyncClient`s.
+
+    Clients are bound to the event loop that created them, so they are
+    tracked per loop; the backend runs a single loop, tests may run several.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 32,
+        max_keepalive_connections: int = 8,
+        keepalive_expiry: float = 60.0,
+        http2: bool = False,
+    ):
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2 and self._h2_available()
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, httpx.AsyncClient]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._stats: Dict[str, AgentPoolStats] = {}
+
+    @staticmethod
+    def _h2_available() -> bool:
+        try:
+            import h2  # noqa: F401
+            return True
+        except ImportError:
+            logger.warning("AGENT_HTTP2 requested but 'h2' is not installed - using HTTP/1.1")
+            return False
+
+    def _stats_for(self, agent_name: str) -> AgentPoolStats:
+        stats = self._stats.get(agent_name)
+        if stats is None:
+            stats = self._stats[agent_name] = AgentPoolStats()
+        return stats
+
+    def _make_client(self, agent_name: str) -> httpx.AsyncClient:
+        stats = self._stats_for(agent_name)
+
+        async def trace(event_name: str, info: dict):
+            # httpcore emits connect_tcp only when it has to open a new connection
+            if event_name == "connection.connect_tcp.started":
+                stats.new_connections += 1
+
+        async def on_request(request: httpx.Request):
+            stats.requests += 1
+            request.extensions["trace"] = trace
+
+        return httpx.AsyncClient(
+            base_url=f"http://agent-{agent_name}:8000",
+            timeout=DEFAULT_TIMEOUT,
+            limits=self.limits,
+            http2=self.http2,
+            event_hooks={"request": [on_request]},
+        )
+
+    def client(self, agent_name: str) -> httpx.AsyncClient:
+        """
+        Get the shared client for an agent.
+
+        The client must not be closed or used as a context manager by callers.
+        Both relative paths ("/api/activity") and absolute agent URLs work.
+        """
+        loop = asyncio.get_running_loop()
+        clients = self._clients.get(loop)
+        if clients is None:
+            clients = self._clients[loop] = {}
+        client = clients.get(agent_name)
+        if client is None or client.is_closed:
+            client = clients[agent_name] = self._make_client(agent_name)
+        return client
+
+    async def request(
+        self,
+        agent_name: str,
+        method: str,
+        path: str,
+        timeout: Optional[float] = None,
+        **kwargs,
+    ) -> httpx.Response:
+        """Send a request to an agent over its pooled client."""
+        return await self.client(agent_name).request(
+            method, path, timeout=timeout or DEFAULT_TIMEOUT, **kwargs
+        )
+
+    async def close_agent(self, agent_name: str) -> None:
+        """Close pooled connections for an agent (e.g. after it is deleted or renamed)."""
+        try:
+            clients = self._clients.get(asyncio.get_running_loop()) or {}
+        except RuntimeError:
+            return
+        client = clients.pop(agent_name, None)
+        self._stats.pop(agent_name, None)
+        if client is not None:
+            await client.aclose()
+
+    async def aclose(self) -> None:
+        """Close all clients owned by the running loop (called on shutdown)."""
+        clients = self._clients.pop(asyncio.get_running_loop(), {})
+        for client in clients.values():
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.debug(f"Error closing agent client: {e}")
+
+    def get_metrics(self) -> dict:
+        """Pool usage metrics, overall and per agent."""
+        agents = {
+            name: {
+                "requests": s.requests,
+                "new_connections": s.new_connections,
+                "hit_rate": round(s.hit_rate, 4),
+            }
+            for name, s in sorted(self._stats.items())
+        }
+        total_requests = sum(s.requests for s in self._stats.values())
+        total_new = sum(s.new_connections for s in self._stats.values())
+        return {
+            "http2": self.http2,
+            "limits": {
+                "max_connections": self.limits.max_connections,
+                "max_keepalive_connections": self.limits.max_keepalive_connections,
+                "keepalive_expiry": self.limits.keepalive_expiry,
+            },
+            "requests": total_requests,
+            "new_connections": total_new,
+            "hit_rate": round(AgentPoolStats(total_requests, total_new).hit_rate, 4),
+            "agents": agents,
+        }
+
+
+# Global instance
+_agent_transport: Optional[AgentTransport] = None
+
+
+def get_agent_transport() -> AgentTransport:
+    """Get the global agent transport instance."""
+    global _agent_transport
+    if _agent_transport is None:
+        _agent_transport = AgentTransport(
+            max_connections=int(os.getenv("AGENT_HTTP_MAX_CONNECTIONS", "32")),
+            max_keepalive_connections=int(os.getenv("AGENT_HTTP_MAX_KEEPALIVE", "8")),
+            keepalive_expiry=float(os.getenv("AGENT_HTTP_KEEPALIVE_EXPIRY", "60")),
+            http2=os.getenv("AGENT_HTTP2", "false").lower() == "true",
+        )
+    return _agent_transport
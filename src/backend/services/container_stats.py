@@ -0,0 +1,257 @@
+"""
+Streaming container stats collector (STATS-001).
+
+`container.stats(stream=False)` makes Docker sample a container twice,
+about a second apart. Telemetry, the agent stats endpoint and the Docker
+health check each paid that 1-2s on every request.
+
+The collector holds one streaming stats connection per running agent. A
+sync thread starts and stops streams as agents come and go, using the
+in-memory agent inventory. Each stream thread keeps:
+
+- the latest sample (Docker streams one per second), and
+- a fixed-size ring buffer of samples at least SAMPLE_INTERVAL apart
+  (HISTORY_SIZE x SAMPLE_INTERVAL = 10 minutes by default).
+
+Each agent therefore costs one thread and at most HISTORY_SIZE small
+samples. Readers get copies and never wait on Docker. A sample older than
+STALE_AFTER seconds (stream reconnecting, agent just started) is not
+served; callers then fall back to a one-shot stats call.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional
+
+from services.docker_service import docker_client, list_all_agents_fast
+
+logger = logging.getLogger(__name__)
+
+# Samples kept per agent
+HISTORY_SIZE = 120
+# Minimum seconds between samples kept in history
+SAMPLE_INTERVAL = 5.0
+# Latest samples older than this are not served
+STALE_AFTER = 10.0
+# Seconds between syncs of the stream set with the running agents
+SYNC_INTERVAL = 5.0
+# Seconds before reopening a stream that ended or failed
+RECONNECT_DELAY = 2.0
+
+
+@dataclass(frozen=True, slots=True)
+class StatsSample:
+    """Resource usage of one container at one point in time."""
+    timestamp: float
+    cpu_percent: float
+    memory_used_bytes: int
+    memory_limit_bytes: int
+    memory_usage_bytes: int  # Raw cgroup usage, page cache included
+    network_rx_bytes: int
+    network_tx_bytes: int
+    block_read_bytes: int
+    block_write_bytes: int
+
+    @property
+    def memory_percent(self) -> float:
+        if self.memory_limit_bytes <= 0:
+            return 0.0
+        return self.memory_used_bytes / self.memory_limit_bytes * 100
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def parse_stats(stats: dict, timestamp: Optional[float] = None) -> Optional[StatsSample]:
+    """
+    Convert a Docker stats document to a StatsSample.
+
+    Returns None when the document has no previous CPU reading to compare
+    with (first streamed document) or no data (stopped container).
+    """
+    cpu_stats = stats.get("cpu_stats") or {}
+    precpu_stats = stats.get("precpu_stats") or {}
+    memory_stats = stats.get("memory_stats") or {}
+    if not precpu_stats.get("system_cpu_usage") or not memory_stats:
+        return None
+
+    cpu_percent = 0.0
+    cpu_delta = cpu_stats.get("cpu_usage", {}).get("total_usage", 0) - \
+        precpu_stats.get("cpu_usage", {}).get("total_usage", 0)
+    system_delta = cpu_stats.get("system_cpu_usage", 0) - precpu_stats.get("system_cpu_usage", 0)
+    if system_delta > 0 and cpu_delta > 0:
+        num_cpus = cpu_stats.get("online_cpus") or \
+            len(cpu_stats.get("cpu_usage", {}).get("percpu_usage") or []) or 1
+        cpu_percent = (cpu_delta / system_delta) * num_cpus * 100.0
+
+    # Page cache is reclaimable: report usage without it (cgroup v1 "cache",
+    # cgroup v2 "inactive_file")
+    memory_detail = memory_stats.get("stats") or {}
+    cache = memory_detail.get("cache", memory_detail.get("inactive_file", 0))
+    memory_used = max(0, memory_stats.get("usage", 0) - cache)
+
+    networks = stats.get("networks") or {}
+    block_read = block_write = 0
+    for entry in (stats.get("blkio_stats") or {}).get("io_service_bytes_recursive") or []:
+        op = entry.get("op", "").lower()
+        if op == "read":
+            block_read += entry.get("value", 0)
+        elif op == "write":
+            block_write += entry.get("value", 0)
+
+    return StatsSample(
+        timestamp=time.time() if timestamp is None else timestamp,
+        cpu_percent=cpu_percent,
+        memory_used_bytes=memory_used,
+        memory_limit_bytes=memory_stats.get("limit", 0),
+        memory_usage_bytes=memory_stats.get("usage", 0),
+        network_rx_bytes=sum(net.get("rx_bytes", 0) for net in networks.values()),
+        network_tx_bytes=sum(net.get("tx_bytes", 0) for net in networks.values()),
+        block_read_bytes=block_read,
+        block_write_bytes=block_write,
+    )
+
+
+class _StatsStream:
+    """One agent's stats stream thread and its samples."""
+
+    def __init__(self, collector: "ContainerStatsCollector", agent_name: str, container_id: str):
+        self.collector = collector
+        self.agent_name = agent_name
+        self.container_id = container_id
+        self.latest: Optional[StatsSample] = None
+        self.history: deque = deque(maxlen=collector.history_size)
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(
+            target=self._run, name=f"stats-{agent_name}", daemon=True
+        )
+
+    def record(self, sample: StatsSample):
+        with self.collector._lock:
+            self.latest = sample
+            if not self.history or \
+                    sample.timestamp - self.history[-1].timestamp >= self.collector.sample_interval:
+                self.history.append(sample)
+
+    def _run(self):
+        client = self.collector.client
+        while not self.stopped.is_set():
+            try:
+                for stats in client.api.stats(self.container_id, stream=True, decode=True):
+                    if self.stopped.is_set():
+                        return
+                    sample = parse_stats(stats)
+                    if sample is not None:
+                        self.record(sample)
+            except Exception as e:
+                logger.debug(f"Stats stream for {self.agent_name} failed: {e}")
+            # Stream ended (container stopped) or failed: the sync thread
+            # stops this stream if the agent is no longer running
+            self.stopped.wait(self.collector.reconnect_delay)
+
+
+class ContainerStatsCollector:
+    """Streams stats for every running agent container into ring buffers."""
+
+    def __init__(
+        self,
+        client=None,
+        history_size: int = HISTORY_SIZE,
+        sample_interval: float = SAMPLE_INTERVAL,
+        stale_after: float = STALE_AFTER,
+        sync_interval: float = SYNC_INTERVAL,
+        reconnect_delay: float = RECONNECT_DELAY,
+    ):
+        self.client = client
+        self.history_size = history_size
+        self.sample_interval = sample_interval
+        self.stale_after = stale_after
+        self.sync_interval = sync_interval
+        self.reconnect_delay = reconnect_delay
+        self._lock = threading.Lock()
+        self._streams: Dict[str, _StatsStream] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Start the sync thread (streams open within one SYNC_INTERVAL)."""
+        if self.client is None or self.is_running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="stats-sync", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the sync thread and signal every stream to end."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        with self._lock:
+            streams = list(self._streams.values())
+            self._streams.clear()
+        for stream in streams:
+            stream.stopped.set()
+
+    def get_latest(self, agent_name: str) -> Optional[StatsSample]:
+        """Latest sample for an agent, or None if there is no recent one."""
+        stream = self._streams.get(agent_name)
+        sample = stream.latest if stream is not None else None
+        if sample is None or time.time() - sample.timestamp > self.stale_after:
+            return None
+        return sample
+
+    def get_history(self, agent_name: str, seconds: Optional[float] = None) -> List[StatsSample]:
+        """Samples kept for an agent, oldest first, optionally only the last `seconds`."""
+        stream = self._streams.get(agent_name)
+        if stream is None:
+            return []
+        with self._lock:
+            samples = list(stream.history)
+        if seconds is not None:
+            cutoff = time.time() - seconds
+            samples = [s for s in samples if s.timestamp >= cutoff]
+        return samples
+
+    def sync(self, running: Dict[str, str]):
+        """Make the open streams match `running` (agent name -> container id)."""
+        with self._lock:
+            stale = [
+                name for name, stream in self._streams.items()
+                if running.get(name) != stream.container_id
+            ]
+            removed = [self._streams.pop(name) for name in stale]
+            added = [
+                _StatsStream(self, name, container_id)
+                for name, container_id in running.items()
+                if name not in self._streams and container_id
+            ]
+            for stream in added:
+                self._streams[stream.agent_name] = stream
+        for stream in removed:
+            stream.stopped.set()
+        for stream in added:
+            stream.thread.start()
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.sync({
+                    agent.name: agent.container_id
+                    for agent in list_all_agents_fast()
+                    if agent.status == "running"
+                })
+            except Exception as e:
+                logger.warning(f"Stats collector could not list agents: {e}")
+            self._stop.wait(self.sync_interval)
+
+
+# Global instance
+stats_collector = ContainerStatsCollector(docker_client)
@@ -6,6 +6,9 @@ from datetime import datetime
 import docker
 from models import AgentStatus
 
+# Label filter selecting Trinity agent containers
+AGENT_LABEL = "trinity.platform=agent"
+
 
 # Initialize Docker client
 try:
@@ -28,6 +31,43 @@ def get_agent_container(name: str):
         return None
 
 
+def normalize_container_status(docker_status: str) -> str:
+    """
+    Normalize Docker status to simpler values for frontend.
+
+    Docker statuses: created, running, paused, restarting, removing, exited, dead
+    """
+    if docker_status in ("exited", "dead", "created"):
+        return "stopped"
+    if docker_status == "running":
+        return "running"
+    return docker_status  # paused, restarting, etc.
+
+
+def agent_status_from_labels(container_name: str, labels: dict, docker_status: str, container_id: str) -> AgentStatus:
+    """
+    Build an AgentStatus from container labels and basic status only.
+
+    No container.attrs or container.image lookups (see list_all_agents_fast).
+    """
+    return AgentStatus(
+        # Use container name as authoritative source (handles rename correctly)
+        name=container_name.lstrip("/").removeprefix("agent-"),
+        type=labels.get("trinity.agent-type", "unknown"),
+        status=normalize_container_status(docker_status),
+        port=int(labels.get("trinity.ssh-port", "0")),
+        created=datetime.fromisoformat(labels.get("trinity.created", datetime.now().isoformat())),
+        resources={
+            "cpu": labels.get("trinity.cpu", "2"),
+            "memory": labels.get("trinity.memory", "4g")
+        },
+        container_id=container_id,
+        template=labels.get("trinity.template", None) or None,
+        runtime=labels.get("trinity.runtime", "claude-code"),  # From label instead of env vars
+        base_image_version=labels.get("trinity.base-image-version"),  # Label only, no image lookup
+    )
+
+
 def get_agent_status_from_container(container) -> AgentStatus:
     """Convert a Docker container to AgentStatus using container labels."""
     labels = container.labels
@@ -35,15 +75,7 @@ def get_agent_status_from_container(container) -> AgentStatus:
     # Container name is "agent-{name}", so strip the prefix
     agent_name = container.name.removeprefix("agent-")
 
-    # Normalize Docker status to simpler values for frontend
-    # Docker statuses: created, running, paused, restarting, removing, exited, dead
-    docker_status = container.status
-    if docker_status in ("exited", "dead", "created"):
-        normalized_status = "stopped"
-    elif docker_status == "running":
-        normalized_status = "running"
-    else:
-        normalized_status = docker_status  # paused, restarting, etc.
+    normalized_status = normalize_container_status(container.status)
 
     # Extract runtime from container environment variables
     runtime = "claude-code"  # Default
@@ -92,7 +124,7 @@ def list_all_agents() -> List[AgentStatus]:
     try:
         containers = docker_client.containers.list(
             all=True,
-            filters={"label": "trinity.platform=agent"}
+            filters={"label": AGENT_LABEL}
         )
         return [get_agent_status_from_container(c) for c in containers]
     except Exception as e:
@@ -104,14 +136,31 @@ def list_all_agents_fast() -> List[AgentStatus]:
     """
     List all Trinity agent containers WITHOUT expensive Docker operations.
 
-    This function extracts data ONLY from container labels and basic status,
-    avoiding potentially slow operations like:
+    Served from the in-memory agent inventory, which follows the Docker
+    events stream (services/agent_inventory.py, INVENTORY-001), so the
+    request path does not touch the Docker socket. Falls back to listing
+    containers while the inventory is not live.
+
+    Data comes ONLY from container labels and basic status, avoiding
+    potentially slow operations like:
     - container.attrs (full inspect API call)
     - container.image (image metadata lookup)
     - container.stats() (CPU sampling - 2+ seconds per container)
 
     Use this for agent list endpoints where you need quick response times.
     Use list_all_agents() when you need full agent metadata.
+    """
+    from services.agent_inventory import agent_inventory
+
+    agents = agent_inventory.list_agents()
+    if agents is not None:
+        return agents
+    return list_agent_containers_fast()
+
+
+def list_agent_containers_fast() -> List[AgentStatus]:
+    """
+    List agent containers from Docker using labels only.
 
     Performance: ~50ms for 10 agents vs ~2-3s with full metadata.
     """
@@ -120,43 +169,12 @@ def list_all_agents_fast() -> List[AgentStatus]:
     try:
         containers = docker_client.containers.list(
             all=True,
-            filters={"label": "trinity.platform=agent"}
+            filters={"label": AGENT_LABEL}
         )
-
-        agents = []
-        for container in containers:
-            labels = container.labels
-            # Use container name as authoritative source (handles rename correctly)
-            agent_name = container.name.removeprefix("agent-")
-
-            # Normalize Docker status to simpler values for frontend
-            docker_status = container.status
-            if docker_status in ("exited", "dead", "created"):
-                normalized_status = "stopped"
-            elif docker_status == "running":
-                normalized_status = "running"
-            else:
-                normalized_status = docker_status
-
-            # Extract only data available in labels - no container.attrs or container.image
-            agent = AgentStatus(
-                name=agent_name,
-                type=labels.get("trinity.agent-type", "unknown"),
-                status=normalized_status,
-                port=int(labels.get("trinity.ssh-port", "0")),
-                created=datetime.fromisoformat(labels.get("trinity.created", datetime.now().isoformat())),
-                resources={
-                    "cpu": labels.get("trinity.cpu", "2"),
-                    "memory": labels.get("trinity.memory", "4g")
-                },
-                container_id=container.id,
-                template=labels.get("trinity.template", None) or None,
-                runtime=labels.get("trinity.runtime", "claude-code"),  # From label instead of env vars
-                base_image_version=labels.get("trinity.base-image-version"),  # Label only, no image lookup
-            )
-            agents.append(agent)
-
-        return agents
+        return [
+            agent_status_from_labels(c.name, c.labels, c.status, c.id)
+            for c in containers
+        ]
     except Exception as e:
         print(f"Error listing agents (fast) from Docker: {e}")
         return []
@@ -13,12 +13,22 @@ from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, Optional
 
 from services.docker_service import docker_client
+from services.agent_inventory import agent_inventory
 
 # Shared executor - limited to 4 workers to avoid overwhelming Docker daemon
 # This matches the pattern in telemetry.py
 _docker_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="docker-")
 
 
+def _observed(operation, container):
+    """Run a lifecycle operation, then report the container to the agent inventory."""
+    def run():
+        result = operation()
+        agent_inventory.observe(container)
+        return result
+    return run
+
+
 # =============================================================================
 # Container Operations
 # =============================================================================
@@ -31,7 +41,9 @@ async def container_stop(container, timeout: int = 10) -> None:
         timeout: Seconds to wait before killing (default 10)
     """
     loop = asyncio.get_event_loop()
-    await loop.run_in_executor(_docker_executor, lambda: container.stop(timeout=timeout))
+    await loop.run_in_executor(
+        _docker_executor, _observed(lambda: container.stop(timeout=timeout), container)
+    )
 
 
 async def container_remove(container, force: bool = False) -> None:
@@ -42,7 +54,9 @@ async def container_remove(container, force: bool = False) -> None:
         force: Force removal even if running
     """
     loop = asyncio.get_event_loop()
-    await loop.run_in_executor(_docker_executor, lambda: container.remove(force=force))
+    await loop.run_in_executor(
+        _docker_executor, _observed(lambda: container.remove(force=force), container)
+    )
 
 
 async def container_start(container) -> None:
@@ -52,7 +66,7 @@ async def container_start(container) -> None:
         container: Docker container object
     """
     loop = asyncio.get_event_loop()
-    await loop.run_in_executor(_docker_executor, container.start)
+    await loop.run_in_executor(_docker_executor, _observed(container.start, container))
 
 
 async def container_reload(container) -> None:
@@ -87,7 +101,9 @@ async def container_rename(container, new_name: str) -> None:
         new_name: New name for the container
     """
     loop = asyncio.get_event_loop()
-    await loop.run_in_executor(_docker_executor, lambda: container.rename(new_name))
+    await loop.run_in_executor(
+        _docker_executor, _observed(lambda: container.rename(new_name), container)
+    )
 
 
 async def container_get(container_id: str) -> Any:
@@ -182,7 +198,10 @@ async def containers_run(
     loop = asyncio.get_event_loop()
 
     def _run():
-        return docker_client.containers.run(image, command=command, **kwargs)
+        container = docker_client.containers.run(image, command=command, **kwargs)
+        if kwargs.get("detach"):
+            agent_inventory.observe(container)
+        return container
 
     return await loop.run_in_executor(_docker_executor, _run)
 
@@ -292,6 +311,7 @@ async def api_exec_start(exec_id: str, socket: bool = False, tty: bool = True) -
 # =============================================================================
 # Container Listing (Already optimized in docker_service.py)
 # =============================================================================
-# Note: list_all_agents() and list_all_agents_fast() are already efficient
-# and don't require async wrappers as they complete quickly (<50ms).
-# Only wrap if profiling shows they become a bottleneck.
+# Note: list_all_agents_fast() is served from the in-memory agent inventory
+# (services/agent_inventory.py) and doesn't need an async wrapper. The
+# lifecycle wrappers above report the containers they change to the
+# inventory so callers read their own writes.
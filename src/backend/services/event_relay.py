@@ -0,0 +1,230 @@
+"""
+Cross-worker event relay over Redis pub/sub (EVENT-RELAY-001).
+
+WebSocket managers and the process engine event bus live inside one uvicorn
+worker, so with several workers a client only saw events raised in the
+worker it happened to be connected to. Each worker publishes its events
+through the relay and receives the other workers' events from one pub/sub
+subscription.
+
+- publish() never blocks: payloads are queued and a publisher task sends
+  them to Redis in pipelined batches. While Redis is unreachable relayed
+  events are dropped; local delivery is unaffected.
+- All relayed topics share RELAY_CHANNEL. Messages carry the publishing
+  worker's id, and a worker skips its own (already delivered locally).
+- External channels (e.g. the dedicated scheduler's `scheduler:events`)
+  are dispatched to their handlers as-is.
+"""
+
+import asyncio
+import inspect
+import json
+import logging
+import uuid
+from collections import deque
+from typing import Any, Callable, Dict, Optional
+
+import redis.asyncio as aioredis
+
+from config import REDIS_URL
+
+logger = logging.getLogger(__name__)
+
+RELAY_CHANNEL = "trinity:relay"
+
+# Queued payloads before the oldest are dropped
+PUBLISH_QUEUE_SIZE = 10000
+
+# After a publish failure, drop relayed events for this long instead of
+# retrying Redis on every broadcast.
+_FAILURE_BACKOFF_SECONDS = 5.0
+
+RelayHandler = Callable[[dict], Any]
+
+
+class EventRelay:
+    """Publishes this worker's events to Redis and dispatches other workers' events."""
+
+    def __init__(
+        self,
+        redis_url: str = REDIS_URL,
+        redis_client: Optional[aioredis.Redis] = None,
+        reconnect_delay: float = 5.0,
+        queue_size: int = PUBLISH_QUEUE_SIZE,
+    ):
+        self.redis = redis_client or aioredis.from_url(redis_url, decode_responses=True)
+        self.worker_id = uuid.uuid4().hex
+        self.reconnect_delay = reconnect_delay
+        self.queue_size = queue_size
+        self._topics: Dict[str, RelayHandler] = {}
+        self._channels: Dict[str, RelayHandler] = {}
+        self._outbox: deque = deque()  # serialized relay messages
+        self._wakeup: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._publisher_task: Optional[asyncio.Task] = None
+        self._subscriber_task: Optional[asyncio.Task] = None
+        self._connected = False
+        self.published = 0
+        self.dropped = 0
+        self.received = 0
+
+    @property
+    def is_running(self) -> bool:
+        return self._publisher_task is not None
+
+    @property
+    def is_connected(self) -> bool:
+        """True while the pub/sub subscription is live."""
+        return self._connected
+
+    def add_handler(self, topic: str, handler: RelayHandler):
+        """Dispatch payloads other workers publish on topic to handler (sync or async)."""
+        self._topics[topic] = handler
+
+    def add_channel(self, channel: str, handler: RelayHandler):
+        """Dispatch JSON messages from an external Redis channel to handler. Call before start()."""
+        self._channels[channel] = handler
+
+    def start(self):
+        """Start the publisher and subscriber tasks on the running event loop."""
+        if self.is_running:
+            return
+        loop = asyncio.get_running_loop()
+        self._loop = loop
+        self._wakeup = asyncio.Event()
+        self._publisher_task = loop.create_task(self._publisher())
+        self._subscriber_task = loop.create_task(self._subscriber())
+
+    async def stop(self):
+        """Cancel both tasks; queued payloads are discarded."""
+        tasks = [t for t in (self._publisher_task, self._subscriber_task) if t is not None]
+        self._publisher_task = self._subscriber_task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._outbox.clear()
+        self._connected = False
+
+    def publish(self, topic: str, payload: dict):
+        """
+        Queue a JSON-serializable payload for the other workers.
+
+        Never blocks or raises. Safe to call from other threads (e.g. DB code
+        run with asyncio.to_thread). Before start() (scripts, tests) nothing
+        is relayed.
+        """
+        if not self.is_running:
+            return
+        try:
+            on_loop = asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            on_loop = False
+        if not on_loop:
+            try:
+                self._loop.call_soon_threadsafe(self.publish, topic, payload)
+            except RuntimeError:
+                pass  # loop closed during shutdown
+            return
+        try:
+            message = json.dumps(
+                {"origin": self.worker_id, "topic": topic, "payload": payload},
+                separators=(",", ":"),
+            )
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Not relaying unserializable {topic} payload: {e}")
+            return
+        if len(self._outbox) >= self.queue_size:
+            self._outbox.popleft()
+            self.dropped += 1
+        self._outbox.append(message)
+        self._wakeup.set()
+
+    async def _publisher(self):
+        while True:
+            while not self._outbox:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+            batch = list(self._outbox)
+            self._outbox.clear()
+            try:
+                async with self.redis.pipeline(transaction=False) as pipe:
+                    for message in batch:
+                        pipe.publish(RELAY_CHANNEL, message)
+                    await pipe.execute()
+                self.published += len(batch)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(
+                    f"Event relay publish failed ({e}); dropping relayed events "
+                    f"for {_FAILURE_BACKOFF_SECONDS}s"
+                )
+                self.dropped += len(batch)
+                await asyncio.sleep(_FAILURE_BACKOFF_SECONDS)
+                self.dropped += len(self._outbox)
+                self._outbox.clear()
+
+    async def _subscriber(self):
+        while True:
+            pubsub = self.redis.pubsub()
+            try:
+                await pubsub.subscribe(RELAY_CHANNEL, *self._channels)
+                self._connected = True
+                logger.info(f"Event relay subscribed to {', '.join([RELAY_CHANNEL, *self._channels])}")
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        await self._dispatch(message["channel"], message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(
+                    f"Event relay disconnected ({e}), only local events are delivered; "
+                    f"retrying in {self.reconnect_delay}s"
+                )
+            finally:
+                self._connected = False
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+            await asyncio.sleep(self.reconnect_delay)
+
+    async def _dispatch(self, channel: str, data: str):
+        try:
+            message = json.loads(data)
+        except ValueError:
+            logger.warning(f"Ignoring malformed message on {channel}: {data!r}")
+            return
+        if not isinstance(message, dict):
+            return
+
+        if channel == RELAY_CHANNEL:
+            if message.get("origin") == self.worker_id:
+                return
+            handler = self._topics.get(message.get("topic"))
+            payload = message.get("payload")
+        else:
+            handler = self._channels.get(channel)
+            payload = message
+        if handler is None or not isinstance(payload, dict):
+            return
+
+        self.received += 1
+        try:
+            result = handler(payload)
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            logger.error(f"Relay handler for {channel} failed: {e}", exc_info=True)
+
+
+# Global instance
+_relay: Optional[EventRelay] = None
+
+
+def get_event_relay() -> EventRelay:
+    """Get the global event relay (one per worker)."""
+    global _relay
+    if _relay is None:
+        _relay = EventRelay()
+    return _relay
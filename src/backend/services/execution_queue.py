@@ -11,27 +11,165 @@ Redis-backed for:
 
 Queue Rules:
 - One execution at a time per agent (enforced at platform level)
-- Queue max 3 waiting requests per agent
-- Reject (429) if queue full
-- Timeout queued requests after 120s of waiting
-- Track source (user/schedule/agent) for observability
+- Queue depth per agent from agent settings (max_queue_depth, default 3)
+- Reject (429) only if the queue is full
+- Waiters block on a Redis list (BLPOP) until handed the agent, up to 120s
+- Weighted fair-share order: source classes weigh user 4 : agent 2 : schedule 1,
+  and callers within the queue share by weight instead of arrival order
+
+Key Pattern:
+- agent:running:{name} (STRING) - Currently running execution (JSON, TTL)
+- agent:queue:pending:{name} (ZSET) - "{seq}:{execution_id}" scored by virtual finish time
+- agent:queue:items:{name} (HASH) - execution_id -> queued execution JSON
+- agent:queue:share:{name} (HASH) - virtual clock, sequence and per-caller finish times
+- agent:queue:ready:{execution_id} (LIST) - wake-up token for a waiting request
 """
 
-import json
+import asyncio
 import logging
 from datetime import datetime
 from typing import Optional, List
-import redis
+import redis.asyncio as aioredis
 import uuid
 
 from models import Execution, ExecutionSource, QueueItemStatus, QueueStatus
+from utils.helpers import to_utc_iso
 
 logger = logging.getLogger(__name__)
 
 # Configuration
-MAX_QUEUE_SIZE = 3           # Max queued requests per agent
+MAX_QUEUE_SIZE = 3           # Default queued requests per agent (agent_ownership.max_queue_depth)
 EXECUTION_TTL = 600          # 10 minutes max execution time (Redis TTL)
 QUEUE_WAIT_TIMEOUT = 120     # 120 seconds max wait in queue
+READY_TOKEN_TTL = QUEUE_WAIT_TIMEOUT + 60  # Unclaimed wake-up tokens expire
+
+# Fair-share weights per source class. Each queued request advances its
+# caller's virtual finish time by 1/weight, so a user request is served four
+# times as often as a schedule request when both are backlogged, and no
+# class starves.
+SOURCE_WEIGHTS = {
+    ExecutionSource.USER: 4,
+    ExecutionSource.AGENT: 2,
+    ExecutionSource.SCHEDULE: 1,
+}
+
+# Wake-up tokens pushed to agent:queue:ready:{execution_id}
+_TOKEN_RUN = "run"
+_TOKEN_CLEARED = "cleared"
+
+# Lua scripts: submit, complete, withdraw and clear are each one atomic
+# round-trip, so a request can never be queued behind an idle agent or be
+# handed the agent twice.
+#
+# Scripts only touch the agent's keys, passed in KEYS (Redis Cluster routes
+# scripts by their declared keys). The ready list of a promoted or cleared
+# request is only known inside the script, so the scripts return it and the
+# caller pushes the wake-up token right after (_wake()).
+#
+# Shared promotion: pop the lowest virtual finish time and make it the running
+# execution. Resets the share state once the queue drains.
+# ARGV: ttl, started_at
+_PROMOTE_LUA = """
+local function promote(running_key, pending_key, items_key, share_key, ttl, started_at)
+    while true do
+        local popped = redis.call('ZPOPMIN', pending_key)
+        if #popped == 0 then
+            redis.call('DEL', share_key)
+            return false
+        end
+        local execution_id = string.match(popped[1], ':(.*)$')
+        local payload = redis.call('HGET', items_key, execution_id)
+        if payload then
+            redis.call('HDEL', items_key, execution_id)
+            redis.call('HSET', share_key, '_clock', popped[2])
+            local execution = cjson.decode(payload)
+            execution['status'] = 'running'
+            execution['started_at'] = started_at
+            payload = cjson.encode(execution)
+            redis.call('SET', running_key, payload, 'EX', ttl)
+            return payload
+        end
+    end
+end
+"""
+
+# KEYS[1] = running, KEYS[2] = pending, KEYS[3] = items, KEYS[4] = share
+# ARGV[1] = ttl, ARGV[2] = started_at, ARGV[3] = running payload,
+# ARGV[4] = wait_if_busy ('1'/'0'), ARGV[5] = max depth, ARGV[6] = execution_id,
+# ARGV[7] = queued payload, ARGV[8] = caller, ARGV[9] = cost
+# Returns {1, 0} running, {2, position} queued, {0, depth} full, {3, current} busy,
+# each followed by the payload of a request promoted on the way ('' if none)
+_SUBMIT_LUA = _PROMOTE_LUA + """
+local promoted = ''
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    if redis.call('ZCARD', KEYS[2]) == 0 then
+        redis.call('SET', KEYS[1], ARGV[3], 'EX', ARGV[1])
+        return {1, 0, promoted}
+    end
+    -- Running state lapsed (TTL or force release) with requests waiting:
+    -- the head of the queue goes first.
+    promoted = promote(KEYS[1], KEYS[2], KEYS[3], KEYS[4], ARGV[1], ARGV[2]) or ''
+    if redis.call('EXISTS', KEYS[1]) == 0 then
+        redis.call('SET', KEYS[1], ARGV[3], 'EX', ARGV[1])
+        return {1, 0, promoted}
+    end
+end
+if ARGV[4] ~= '1' then
+    return {3, redis.call('GET', KEYS[1]) or '', promoted}
+end
+local depth = redis.call('ZCARD', KEYS[2])
+if depth >= tonumber(ARGV[5]) then
+    return {0, depth, promoted}
+end
+local seq = redis.call('HINCRBY', KEYS[4], '_seq', 1)
+local clock = tonumber(redis.call('HGET', KEYS[4], '_clock') or '0')
+local caller_field = 'caller:' .. ARGV[8]
+local last = tonumber(redis.call('HGET', KEYS[4], caller_field) or '0')
+local finish = math.max(clock, last) + tonumber(ARGV[9])
+redis.call('HSET', KEYS[4], caller_field, tostring(finish))
+local member = string.format('%012d:%s', seq, ARGV[6])
+redis.call('ZADD', KEYS[2], tostring(finish), member)
+redis.call('HSET', KEYS[3], ARGV[6], ARGV[7])
+return {2, redis.call('ZRANK', KEYS[2], member) + 1, promoted}
+"""
+
+# KEYS as submit. ARGV[1..2] as promote, ARGV[3] = completing execution_id ('' = any)
+# Only the execution holding the agent (or nobody, if it lapsed) may hand it on.
+_COMPLETE_LUA = _PROMOTE_LUA + """
+local current = redis.call('GET', KEYS[1])
+if current and ARGV[3] ~= '' and cjson.decode(current)['id'] ~= ARGV[3] then
+    return false
+end
+local next_payload = promote(KEYS[1], KEYS[2], KEYS[3], KEYS[4], ARGV[1], ARGV[2])
+if not next_payload then
+    redis.call('DEL', KEYS[1])
+end
+return next_payload
+"""
+
+# KEYS[1] = pending, KEYS[2] = items, ARGV[1] = execution_id
+# Returns 1 if the request was still waiting and is now removed, 0 if it was
+# already promoted or cleared. The ZSET scan is bounded by the queue depth.
+_WITHDRAW_LUA = """
+if redis.call('HDEL', KEYS[2], ARGV[1]) == 0 then
+    return 0
+end
+for _, member in ipairs(redis.call('ZRANGE', KEYS[1], 0, -1)) do
+    if string.match(member, ':(.*)$') == ARGV[1] then
+        redis.call('ZREM', KEYS[1], member)
+        break
+    end
+end
+return 1
+"""
+
+# KEYS[1] = pending, KEYS[2] = items, KEYS[3] = share
+# Returns the cleared execution IDs (their waiters get a cleared token).
+_CLEAR_LUA = """
+local execution_ids = redis.call('HKEYS', KEYS[2])
+redis.call('DEL', KEYS[1], KEYS[2], KEYS[3])
+return execution_ids
+"""
 
 
 class QueueFullError(Exception):
@@ -50,53 +188,92 @@ class AgentBusyError(Exception):
         super().__init__(f"Agent '{agent_name}' is currently executing")
 
 
+class QueueWaitError(Exception):
+    """Raised when a queued request leaves the queue without running."""
+    def __init__(self, agent_name: str, execution_id: str, reason: str):
+        self.agent_name = agent_name
+        self.execution_id = execution_id
+        self.reason = reason  # "timeout" or "cleared"
+        super().__init__(f"Queued execution {execution_id} on agent '{agent_name}' {reason}")
+
+
 class ExecutionQueue:
     """
     Redis-backed execution queue for agents.
 
     Ensures only one execution runs per agent at a time.
-    Additional requests are queued (up to MAX_QUEUE_SIZE) or rejected.
-
-    Thread-safety: Uses atomic Redis operations to prevent race conditions:
-    - submit(): Uses SET NX EX for atomic slot acquisition
-    - complete(): Uses Lua script for atomic pop-and-set
+    Additional requests wait in a weighted fair-share queue (up to the agent's
+    max_queue_depth) and are woken through a blocking pop when their turn comes.
+
+    Thread-safety: every state change is a single Lua script:
+    - submit(): acquire the agent or enqueue, with the depth check
+    - complete(): pop next by virtual finish time and set it running, then
+      wake its waiter
+    - wait_for_turn(): BLPOP on the request's ready key, atomic withdraw on timeout
+      or cancellation
     """
 
-    # Lua script for atomic complete operation
-    # Atomically pops next from queue and sets as running, or clears if empty
-    COMPLETE_SCRIPT = """
-local running_key = KEYS[1]
-local queue_key = KEYS[2]
-local ttl = tonumber(ARGV[1])
-
--- Pop next from queue (RPOP for FIFO)
-local next_item = redis.call('RPOP', queue_key)
-
-if next_item then
-    -- Atomically set as running with TTL
-    redis.call('SET', running_key, next_item, 'EX', ttl)
-    return next_item
-else
-    -- No more items, clear running state
-    redis.call('DEL', running_key)
-    return nil
-end
-"""
-
-    def __init__(self, redis_url: str = "redis://redis:6379"):
-        self.redis = redis.from_url(redis_url, decode_responses=True)
+    def __init__(
+        self,
+        redis_url: str = "redis://redis:6379",
+        redis_client: Optional[aioredis.Redis] = None,
+    ):
+        self.redis = redis_client or aioredis.from_url(redis_url, decode_responses=True)
         self.running_prefix = "agent:running:"
         self.queue_prefix = "agent:queue:"
-        # Register Lua script for atomic complete operation
-        self._complete_script = self.redis.register_script(self.COMPLETE_SCRIPT)
+        self._submit_script = self.redis.register_script(_SUBMIT_LUA)
+        self._complete_script = self.redis.register_script(_COMPLETE_LUA)
+        self._withdraw_script = self.redis.register_script(_WITHDRAW_LUA)
+        self._clear_script = self.redis.register_script(_CLEAR_LUA)
 
     def _running_key(self, agent_name: str) -> str:
         """Redis key for currently running execution."""
         return f"{self.running_prefix}{agent_name}"
 
-    def _queue_key(self, agent_name: str) -> str:
-        """Redis key for waiting queue (list)."""
-        return f"{self.queue_prefix}{agent_name}"
+    def _pending_key(self, agent_name: str) -> str:
+        """Redis key for waiting requests (ZSET by virtual finish time)."""
+        return f"{self.queue_prefix}pending:{agent_name}"
+
+    def _items_key(self, agent_name: str) -> str:
+        """Redis key for waiting request payloads (HASH by execution ID)."""
+        return f"{self.queue_prefix}items:{agent_name}"
+
+    def _share_key(self, agent_name: str) -> str:
+        """Redis key for fair-share bookkeeping (virtual clock, per-caller finish)."""
+        return f"{self.queue_prefix}share:{agent_name}"
+
+    def _ready_key(self, execution_id: str) -> str:
+        """Redis key a waiting request blocks on."""
+        return f"{self.queue_prefix}ready:{execution_id}"
+
+    def _queue_keys(self, agent_name: str) -> list:
+        return [
+            self._running_key(agent_name),
+            self._pending_key(agent_name),
+            self._items_key(agent_name),
+            self._share_key(agent_name),
+        ]
+
+    def _promote_args(self) -> list:
+        return [EXECUTION_TTL, to_utc_iso(datetime.utcnow())]
+
+    async def _wake(self, execution_ids: List[str], token: str):
+        """Push a wake-up token to the ready list of each waiting request."""
+        if not execution_ids:
+            return
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for execution_id in execution_ids:
+                ready_key = self._ready_key(execution_id)
+                pipe.rpush(ready_key, token)
+                pipe.expire(ready_key, READY_TOKEN_TTL)
+            await pipe.execute()
+
+    @staticmethod
+    def _caller_key(execution: Execution) -> str:
+        """Identity that fair-share is computed over."""
+        if execution.source == ExecutionSource.AGENT and execution.source_agent:
+            return f"agent:{execution.source_agent}"
+        return f"{execution.source.value}:{execution.source_user_id or '-'}"
 
     def _serialize_execution(self, execution: Execution) -> str:
         """Serialize execution to JSON for Redis storage."""
@@ -131,150 +308,242 @@ end
     async def submit(
         self,
         execution: Execution,
-        wait_if_busy: bool = True
+        wait_if_busy: bool = True,
+        max_queue_depth: int = MAX_QUEUE_SIZE
     ) -> tuple[str, Execution]:
         """
         Submit execution request for an agent.
 
-        Uses atomic SET NX EX to prevent race conditions where two concurrent
-        requests could both acquire the execution slot.
+        Acquiring the agent and enqueueing happen in one Lua script, so a
+        request can never be queued behind an agent that just went idle.
+        A queued request should then await wait_for_turn().
 
         Args:
             execution: The execution request to submit
             wait_if_busy: If True, queue the request if busy. If False, raise AgentBusyError.
+            max_queue_depth: Maximum waiting requests for this agent
 
         Returns:
             Tuple of (status, execution):
             - ("running", execution) - Started immediately
-            - ("queued:N", execution) - Queued at position N
+            - ("queued:N", execution) - Queued at position N (fair-share order)
 
         Raises:
-            QueueFullError: If queue is at MAX_QUEUE_SIZE
+            QueueFullError: If max_queue_depth requests are already waiting
             AgentBusyError: If wait_if_busy=False and agent is busy
         """
-        running_key = self._running_key(execution.agent_name)
-        queue_key = self._queue_key(execution.agent_name)
+        agent_name = execution.agent_name
 
-        # Prepare execution for running state
+        # Prepare both forms: running if the agent is free, queued otherwise
         execution.status = QueueItemStatus.RUNNING
         execution.started_at = datetime.utcnow()
-        serialized = self._serialize_execution(execution)
-
-        # Atomic acquire: SET key value NX EX ttl
-        # Returns True if key was set (we acquired), False/None if key exists (busy)
-        acquired = self.redis.set(
-            running_key,
-            serialized,
-            nx=True,  # Only set if Not eXists
-            ex=EXECUTION_TTL
+        running_payload = self._serialize_execution(execution)
+        execution.status = QueueItemStatus.QUEUED
+        execution.started_at = None
+        queued_payload = self._serialize_execution(execution)
+
+        weight = SOURCE_WEIGHTS.get(execution.source, 1)
+        outcome, value, promoted = await self._submit_script(
+            keys=self._queue_keys(agent_name),
+            args=[
+                *self._promote_args(),
+                running_payload,
+                "1" if wait_if_busy else "0",
+                max_queue_depth,
+                execution.id,
+                queued_payload,
+                self._caller_key(execution),
+                repr(1.0 / weight),
+            ],
         )
 
-        if acquired:
-            logger.info(f"[Queue] Agent '{execution.agent_name}' execution started: {execution.id}")
+        if promoted:
+            await self._wake([self._deserialize_execution(promoted).id], _TOKEN_RUN)
+
+        if outcome == 1:
+            execution = self._deserialize_execution(running_payload)
+            logger.info(f"[Queue] Agent '{agent_name}' execution started: {execution.id}")
             return ("running", execution)
 
-        # Agent is busy - atomic acquire failed
-        if not wait_if_busy:
-            current = self.redis.get(running_key)
-            current_exec = self._deserialize_execution(current) if current else None
-            raise AgentBusyError(execution.agent_name, current_exec)
+        if outcome == 3:
+            current_exec = self._deserialize_execution(value) if value else None
+            raise AgentBusyError(agent_name, current_exec)
 
-        # Reset execution state for queuing
-        execution.status = QueueItemStatus.QUEUED
-        execution.started_at = None
+        if outcome == 0:
+            logger.warning(f"[Queue] Agent '{agent_name}' queue full ({value} waiting)")
+            raise QueueFullError(agent_name, value)
 
-        # Check queue length and add (queue operations are a separate concern)
-        queue_len = self.redis.llen(queue_key)
-        if queue_len >= MAX_QUEUE_SIZE:
-            logger.warning(f"[Queue] Agent '{execution.agent_name}' queue full ({queue_len} waiting)")
-            raise QueueFullError(execution.agent_name, queue_len)
+        logger.info(
+            f"[Queue] Agent '{agent_name}' execution queued at position {value} "
+            f"({execution.source.value}): {execution.id}"
+        )
+        return (f"queued:{value}", execution)
 
-        # Add to queue (left push for FIFO - rpop will get oldest)
-        self.redis.lpush(queue_key, self._serialize_execution(execution))
-        position = queue_len + 1
-        logger.info(f"[Queue] Agent '{execution.agent_name}' execution queued at position {position}: {execution.id}")
-        return (f"queued:{position}", execution)
+    async def wait_for_turn(
+        self,
+        execution: Execution,
+        timeout: float = QUEUE_WAIT_TIMEOUT
+    ) -> Execution:
+        """
+        Block until a queued execution is handed the agent.
+
+        Waits on the request's ready list with BLPOP (no polling). On timeout
+        the request is withdrawn atomically; if it was promoted in the same
+        instant, the promotion wins and the execution runs (also when the
+        wake-up token never arrived). If the waiting
+        task is cancelled (client disconnect, shutdown), the request is
+        withdrawn, or the agent handed on if it was already promoted.
+
+        Returns:
+            The execution, now running
+
+        Raises:
+            QueueWaitError: If the wait timed out or the queue was cleared
+        """
+        agent_name = execution.agent_name
+        ready_key = self._ready_key(execution.id)
+
+        try:
+            popped = await self.redis.blpop(ready_key, timeout=timeout)
+            if popped is None:
+                withdrawn = await self._withdraw(execution)
+                token = None if withdrawn else await self._claim_token(execution)
+            else:
+                token = popped[1]
+        except asyncio.CancelledError:
+            await asyncio.shield(self._abandon(execution))
+            raise
+
+        if token != _TOKEN_RUN:
+            reason = "cleared" if token == _TOKEN_CLEARED else "timeout"
+            logger.warning(f"[Queue] Agent '{agent_name}' queued execution {execution.id} {reason}")
+            raise QueueWaitError(agent_name, execution.id, reason)
 
-    async def complete(self, agent_name: str, success: bool = True) -> Optional[Execution]:
+        execution.status = QueueItemStatus.RUNNING
+        execution.started_at = datetime.utcnow()
+        logger.info(f"[Queue] Agent '{agent_name}' queued execution now running: {execution.id}")
+        return execution
+
+    async def _withdraw(self, execution: Execution) -> bool:
+        """Remove a waiting request; False if it was already promoted or cleared."""
+        agent_name = execution.agent_name
+        return bool(await self._withdraw_script(
+            keys=[self._pending_key(agent_name), self._items_key(agent_name)],
+            args=[execution.id],
+        ))
+
+    async def _claim_token(self, execution: Execution) -> Optional[str]:
+        """Token of a request that is no longer waiting, or None if it was lost."""
+        token = await self.redis.lpop(self._ready_key(execution.id))
+        if token is None:
+            # Promoted, but the wake-up push did not happen (e.g. the
+            # completing worker died in between): the agent is still ours
+            running = await self.redis.get(self._running_key(execution.agent_name))
+            if running and self._deserialize_execution(running).id == execution.id:
+                token = _TOKEN_RUN
+        return token
+
+    async def _abandon(self, execution: Execution):
+        """Clean up after a waiter that went away (cancelled mid-wait)."""
+        try:
+            if not await self._withdraw(execution):
+                # Promoted (the run token may already have been popped) or
+                # cleared: hand the agent on if this request holds it
+                await self.complete(execution.agent_name, success=False, execution_id=execution.id)
+            await self.redis.delete(self._ready_key(execution.id))
+        except Exception as e:
+            logger.error(f"[Queue] Failed to clean up abandoned execution {execution.id}: {e}")
+
+    async def complete(
+        self,
+        agent_name: str,
+        success: bool = True,
+        execution_id: Optional[str] = None
+    ) -> Optional[Execution]:
         """
         Mark current execution done and start next if queued.
 
-        Uses a Lua script for atomic pop-and-set to prevent race conditions
-        where queue entries could be lost or processed twice.
+        Uses a Lua script that pops the waiting request with the lowest
+        virtual finish time and sets it running; its waiter is then woken.
 
         Args:
             agent_name: The agent that completed execution
             success: Whether execution succeeded
+            execution_id: The completing execution. If given and another
+                execution holds the agent (e.g. after a force release),
+                the queue is left untouched.
 
         Returns:
             Next execution that was started (if any), or None
         """
-        running_key = self._running_key(agent_name)
-        queue_key = self._queue_key(agent_name)
-
-        # Log completed execution (before atomic operation)
-        completed = self.redis.get(running_key)
-        if completed:
-            completed_exec = self._deserialize_execution(completed)
-            status_str = "completed" if success else "failed"
-            logger.info(f"[Queue] Agent '{agent_name}' execution {status_str}: {completed_exec.id}")
-
-        # Atomic: pop next and set as running (or clear if empty)
-        # The Lua script handles both operations atomically
-        next_item = self._complete_script(
-            keys=[running_key, queue_key],
-            args=[EXECUTION_TTL]
+        status_str = "completed" if success else "failed"
+        logger.info(f"[Queue] Agent '{agent_name}' execution {status_str}: {execution_id or '(current)'}")
+
+        next_item = await self._complete_script(
+            keys=self._queue_keys(agent_name),
+            args=[*self._promote_args(), execution_id or ""],
         )
 
         if next_item:
             next_exec = self._deserialize_execution(next_item)
-            # Update status in Python object (Redis already has the data)
-            next_exec.status = QueueItemStatus.RUNNING
-            next_exec.started_at = datetime.utcnow()
+            await self._wake([next_exec.id], _TOKEN_RUN)
             logger.info(f"[Queue] Agent '{agent_name}' starting next execution: {next_exec.id}")
             return next_exec
         else:
             logger.info(f"[Queue] Agent '{agent_name}' queue empty, now idle")
             return None
 
-    async def get_status(self, agent_name: str) -> QueueStatus:
-        """Get current queue status for an agent."""
-        running_key = self._running_key(agent_name)
-        queue_key = self._queue_key(agent_name)
+    async def get_status(
+        self,
+        agent_name: str,
+        max_queue_depth: int = MAX_QUEUE_SIZE
+    ) -> QueueStatus:
+        """Get current queue status for an agent (queued in service order)."""
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.get(self._running_key(agent_name))
+        pipe.zrange(self._pending_key(agent_name), 0, -1)
+        pipe.hgetall(self._items_key(agent_name))
+        running, members, items = await pipe.execute()
 
-        # Get current execution
-        running = self.redis.get(running_key)
         current_execution = self._deserialize_execution(running) if running else None
-
-        # Get queued executions
-        queue_items = self.redis.lrange(queue_key, 0, -1)
-        queued_executions = [self._deserialize_execution(item) for item in queue_items]
-        # Reverse to show oldest first (FIFO order)
-        queued_executions.reverse()
+        queued_executions = []
+        for member in members:
+            payload = items.get(member.split(":", 1)[1])
+            if payload:
+                queued_executions.append(self._deserialize_execution(payload))
 
         return QueueStatus(
             agent_name=agent_name,
             is_busy=current_execution is not None,
             current_execution=current_execution,
             queue_length=len(queued_executions),
+            max_queue_depth=max_queue_depth,
             queued_executions=queued_executions
         )
 
     async def is_busy(self, agent_name: str) -> bool:
         """Check if agent is currently executing."""
         running_key = self._running_key(agent_name)
-        return self.redis.exists(running_key) > 0
+        return await self.redis.exists(running_key) > 0
 
     async def clear_queue(self, agent_name: str) -> int:
         """
         Clear all queued executions for an agent (not current execution).
 
+        Waiting requests are woken and fail with QueueWaitError("cleared").
         Returns the number of cleared items.
         """
-        queue_key = self._queue_key(agent_name)
-        count = self.redis.llen(queue_key)
+        cleared = await self._clear_script(
+            keys=[
+                self._pending_key(agent_name),
+                self._items_key(agent_name),
+                self._share_key(agent_name),
+            ],
+        )
+        await self._wake(cleared, _TOKEN_CLEARED)
+
+        count = len(cleared)
         if count > 0:
-            self.redis.delete(queue_key)
             logger.info(f"[Queue] Cleared {count} queued executions for agent '{agent_name}'")
         return count
 
@@ -283,12 +552,12 @@ end
         Force release an agent (emergency use - clears running state).
 
         Use this if an execution is stuck or the agent died without completing.
+        Waiting requests are handed the agent by the next complete() or submit().
         Returns True if there was a running execution.
         """
         running_key = self._running_key(agent_name)
-        existed = self.redis.exists(running_key) > 0
+        existed = await self.redis.delete(running_key) > 0
         if existed:
-            self.redis.delete(running_key)
             logger.warning(f"[Queue] Force released agent '{agent_name}' from running state")
         return existed
 
@@ -298,14 +567,10 @@ end
         Uses SCAN instead of KEYS to avoid blocking Redis on large datasets.
         """
         pattern = f"{self.running_prefix}*"
-        agents = []
-        cursor = 0
-        while True:
-            cursor, keys = self.redis.scan(cursor, match=pattern, count=100)
-            agents.extend(key.replace(self.running_prefix, "") for key in keys)
-            if cursor == 0:
-                break
-        return agents
+        return [
+            key.replace(self.running_prefix, "")
+            async for key in self.redis.scan_iter(match=pattern, count=100)
+        ]
 
 
 # Global instance (initialized on import if Redis is available)
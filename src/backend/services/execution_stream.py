@@ -0,0 +1,300 @@
+"""
+Shared upstream streams for live execution logs (LOG-STREAM-001).
+
+Every browser watching an execution used to open its own SSE connection to
+the agent, so N viewers meant N agent subscribers each replaying the whole
+buffered log. The multiplexer keeps one upstream stream per
+(agent, execution) in this worker and fans it out:
+
+- Upstream events go into a fixed-size ring buffer (REPLAY_SIZE). Each
+  viewer reads it with its own cursor, so late joiners get the buffered
+  events and a slow viewer never holds up the upstream or other viewers. A
+  viewer that falls more than REPLAY_SIZE events behind gets a stream_gap
+  event instead of the events it missed.
+- Events keep the agent's sequence ids as SSE `id:` lines. A viewer that
+  reconnects with Last-Event-ID only gets the events after that id.
+- If the upstream connection drops before stream_end it is reopened with
+  Last-Event-ID (up to UPSTREAM_RETRIES times), so the agent only resends
+  what the multiplexer has not seen.
+- The upstream is closed when its last viewer leaves.
+
+Viewers get the same SSE format as the agent endpoint: `id:` + `data:`
+log entries, error events, and a final {"type": "stream_end"}.
+"""
+
+import asyncio
+import json
+import logging
+from collections import deque
+from itertools import islice
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+import httpx
+
+from services.agent_transport import get_agent_transport
+
+logger = logging.getLogger(__name__)
+
+# Upstream events kept per execution for late joiners and resume
+REPLAY_SIZE = 1000
+# Seconds without events before a viewer is sent a keepalive comment
+KEEPALIVE_INTERVAL = 30.0
+# Times a dropped upstream stream is reopened before viewers get an error
+UPSTREAM_RETRIES = 3
+# Seconds before reopening a dropped upstream stream
+RECONNECT_DELAY = 1.0
+
+# Connect timeout prevents hanging if agent is unresponsive,
+# but read timeout is None since SSE streams are long-lived
+UPSTREAM_TIMEOUT = httpx.Timeout(connect=10.0, read=None, write=None, pool=None)
+
+STREAM_END = json.dumps({"type": "stream_end"})
+
+# (ring position, sequence id or None, JSON data)
+_Event = Tuple[int, Optional[int], str]
+
+
+def format_event(data: str, seq: Optional[int] = None) -> str:
+    """Format JSON data as an SSE event, with the sequence id as event id."""
+    event_id = f"id: {seq}\n" if seq is not None else ""
+    return f"{event_id}data: {data}\n\n"
+
+
+def parse_event_id(last_event_id: Optional[str]) -> int:
+    """Sequence id from a Last-Event-ID header (0 when missing or invalid)."""
+    try:
+        return max(int(last_event_id), 0) if last_event_id else 0
+    except ValueError:
+        return 0
+
+
+def _parse_event(block: str) -> Tuple[Optional[int], Optional[str]]:
+    """(sequence id, data) of one SSE event block; data is None for comments."""
+    seq = None
+    data: List[str] = []
+    for line in block.split("\n"):
+        if line.startswith("id:"):
+            try:
+                seq = int(line[3:].strip())
+            except ValueError:
+                pass
+        elif line.startswith("data:"):
+            data.append(line[6:] if line.startswith("data: ") else line[5:])
+    return seq, "\n".join(data) if data else None
+
+
+def _is_stream_end(data: str) -> bool:
+    if "stream_end" not in data:
+        return False
+    try:
+        return json.loads(data).get("type") == "stream_end"
+    except (ValueError, AttributeError):
+        return False
+
+
+class _ExecutionStream:
+    """One upstream stream and the ring buffer its viewers read from."""
+
+    def __init__(self, agent_name: str, execution_id: str, replay_size: int):
+        self.agent_name = agent_name
+        self.execution_id = execution_id
+        self.events: deque = deque(maxlen=replay_size)
+        self.next_position = 0
+        self.last_seq = 0
+        self.finished = False
+        self.viewers = 0
+        self.task: Optional[asyncio.Task] = None
+        # Replaced on every change; viewers wait on the current one
+        self.changed = asyncio.Event()
+
+    def append(self, data: str, seq: Optional[int] = None):
+        self.events.append((self.next_position, seq, data))
+        self.next_position += 1
+        if seq is not None:
+            self.last_seq = seq
+        self._notify()
+
+    def finish(self):
+        self.finished = True
+        self._notify()
+
+    def _notify(self):
+        changed, self.changed = self.changed, asyncio.Event()
+        changed.set()
+
+    def start_position(self, after_seq: int) -> int:
+        """Ring position of the first event after sequence id after_seq (if buffered)."""
+        if after_seq:
+            for position, seq, _ in reversed(self.events):
+                if seq is not None and seq <= after_seq:
+                    return position + 1
+        return self.events[0][0] if self.events else self.next_position
+
+    def read(self, position: int) -> Tuple[List[_Event], int, int]:
+        """Events from position on: (events, next position, events lost to the ring)."""
+        oldest = self.events[0][0] if self.events else self.next_position
+        start = max(position, oldest)
+        return list(islice(self.events, start - oldest, None)), self.next_position, start - position
+
+
+class ExecutionStreamMux:
+    """Shares one upstream log stream per (agent, execution) among its viewers."""
+
+    def __init__(
+        self,
+        replay_size: int = REPLAY_SIZE,
+        keepalive_interval: float = KEEPALIVE_INTERVAL,
+        upstream_retries: int = UPSTREAM_RETRIES,
+        reconnect_delay: float = RECONNECT_DELAY,
+    ):
+        self.replay_size = replay_size
+        self.keepalive_interval = keepalive_interval
+        self.upstream_retries = upstream_retries
+        self.reconnect_delay = reconnect_delay
+        self._streams: Dict[Tuple[str, str], _ExecutionStream] = {}
+        self.upstreams_opened = 0
+
+    def viewer_count(self, agent_name: str, execution_id: str) -> int:
+        stream = self._streams.get((agent_name, execution_id))
+        return stream.viewers if stream else 0
+
+    async def subscribe(
+        self, agent_name: str, execution_id: str, last_event_id: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        SSE text for one viewer of an execution's log, ending after stream_end.
+
+        Joins the execution's upstream stream, opening it for the first
+        viewer. last_event_id is the viewer's Last-Event-ID header.
+        """
+        after_seq = parse_event_id(last_event_id)
+        key = (agent_name, execution_id)
+        stream = self._streams.get(key)
+        if stream is None or stream.finished:
+            stream = _ExecutionStream(agent_name, execution_id, self.replay_size)
+            self._streams[key] = stream
+            stream.task = asyncio.create_task(self._pump(stream))
+        stream.viewers += 1
+
+        try:
+            position = stream.start_position(after_seq)
+            while True:
+                changed = stream.changed
+                events, position, lost = stream.read(position)
+                if lost:
+                    yield format_event(json.dumps({"type": "stream_gap", "missed": lost}))
+                for _, seq, data in events:
+                    # The upstream starts from the beginning; skip what the viewer has
+                    if seq is not None and seq <= after_seq:
+                        continue
+                    yield format_event(data, seq)
+                if events or lost:
+                    continue
+                if stream.finished:
+                    return
+                try:
+                    await asyncio.wait_for(changed.wait(), timeout=self.keepalive_interval)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+        finally:
+            stream.viewers -= 1
+            if stream.viewers == 0:
+                self._release(key, stream)
+
+    def _release(self, key: Tuple[str, str], stream: _ExecutionStream):
+        """Forget a stream and close its upstream connection."""
+        if self._streams.get(key) is stream:
+            del self._streams[key]
+        if stream.task and not stream.task.done():
+            stream.task.cancel()
+
+    def _fail(self, stream: _ExecutionStream, message: str, retryable: bool = False):
+        error = {"type": "error", "message": message}
+        if retryable:
+            error["retryable"] = True
+        stream.append(json.dumps(error))
+        stream.append(STREAM_END)
+
+    async def _pump(self, stream: _ExecutionStream):
+        """Read the agent's SSE stream into the ring buffer, reconnecting with Last-Event-ID."""
+        agent_url = f"http://agent-{stream.agent_name}:8000/api/executions/{stream.execution_id}/stream"
+        connected = False
+        retries = 0
+        try:
+            while True:
+                headers = {"Last-Event-ID": str(stream.last_seq)} if stream.last_seq else {}
+                try:
+                    client = get_agent_transport().client(stream.agent_name)
+                    async with client.stream("GET", agent_url, headers=headers, timeout=UPSTREAM_TIMEOUT) as response:
+                        if response.status_code == 404:
+                            if connected:
+                                self._fail(stream, "Execution log no longer available on agent")
+                            else:
+                                # Execution not found on agent (race condition: task not started yet)
+                                self._fail(stream, "Execution not yet available on agent", retryable=True)
+                            return
+                        if response.status_code != 200:
+                            self._fail(stream, f"Agent returned {response.status_code}")
+                            return
+
+                        connected = True
+                        self.upstreams_opened += 1
+                        seen = stream.last_seq
+                        if await self._read_events(stream, response):
+                            return
+                        if stream.last_seq > seen:
+                            retries = 0
+                except httpx.ConnectTimeout:
+                    if not connected:
+                        self._fail(stream, "Agent connection timed out", retryable=True)
+                        return
+                except httpx.ConnectError:
+                    if not connected:
+                        self._fail(stream, "Failed to connect to agent", retryable=True)
+                        return
+                except httpx.HTTPError as e:
+                    logger.warning(f"[Stream] Upstream for {stream.agent_name}/{stream.execution_id} dropped: {e}")
+
+                retries += 1
+                if retries > self.upstream_retries:
+                    self._fail(stream, "Lost connection to agent", retryable=True)
+                    return
+                await asyncio.sleep(self.reconnect_delay)
+        except Exception as e:
+            logger.error(f"[Stream] Error streaming from agent {stream.agent_name}: {e}")
+            self._fail(stream, str(e))
+        finally:
+            stream.finish()
+            key = (stream.agent_name, stream.execution_id)
+            if self._streams.get(key) is stream:
+                del self._streams[key]
+
+    async def _read_events(self, stream: _ExecutionStream, response: httpx.Response) -> bool:
+        """Append the response's events to the stream. True once stream_end was read."""
+        buffer = ""
+        async for chunk in response.aiter_text():
+            buffer += chunk
+            while "\n\n" in buffer:
+                block, buffer = buffer.split("\n\n", 1)
+                seq, data = _parse_event(block)
+                if data is None:
+                    # Keepalive comment; viewers get their own
+                    continue
+                if seq is not None and seq <= stream.last_seq:
+                    continue
+                stream.append(data, seq)
+                if _is_stream_end(data):
+                    return True
+        return False
+
+
+# Global instance
+_execution_stream_mux: Optional[ExecutionStreamMux] = None
+
+
+def get_execution_stream_mux() -> ExecutionStreamMux:
+    """Get the global execution stream multiplexer."""
+    global _execution_stream_mux
+    if _execution_stream_mux is None:
+        _execution_stream_mux = ExecutionStreamMux()
+    return _execution_stream_mux
@@ -7,17 +7,22 @@ Handles:
 - Managing git configuration in the database
 - Initializing git in agent containers
 """
+import asyncio
 import httpx
 import uuid
 import logging
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Iterable
 from database import db, AgentGitConfig, GitSyncResult
-from services.docker_service import get_agent_container, execute_command_in_container
+from services.docker_service import get_agent_container, execute_command_in_container, list_all_agents_fast
+from services.agent_transport import get_agent_transport
 
 logger = logging.getLogger(__name__)
 
+# Agents whose git status is fetched at once by get_fleet_git_status()
+FLEET_GIT_STATUS_CONCURRENCY = 10
+
 
 def generate_instance_id() -> str:
     """Generate a unique instance ID for an agent."""
@@ -71,20 +76,54 @@ async def get_git_status(agent_name: str) -> Optional[Dict[str, Any]]:
     if not container or container.status != "running":
         return None
 
+    return await _fetch_git_status(agent_name)
+
+
+async def _fetch_git_status(agent_name: str) -> Optional[Dict[str, Any]]:
+    """Call the agent's internal git status endpoint over the shared agent transport."""
     try:
-        # Call the agent's internal git status endpoint
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                f"http://agent-{agent_name}:8000/api/git/status"
-            )
-            if response.status_code == 200:
-                return response.json()
-            return None
+        client = get_agent_transport().client(agent_name)
+        response = await client.get(
+            f"http://agent-{agent_name}:8000/api/git/status",
+            timeout=30.0
+        )
+        if response.status_code == 200:
+            return response.json()
+        return None
     except Exception as e:
-        print(f"Error getting git status for {agent_name}: {e}")
+        logger.warning(f"[Git] Error getting git status for {agent_name}: {e}")
         return None
 
 
+async def get_fleet_git_status(configs: Iterable[AgentGitConfig]) -> List[Dict[str, Any]]:
+    """
+    Get git status for the given git-enabled agents.
+
+    The caller lists (and access-filters) the git configs. Running agents
+    are queried concurrently, at most FLEET_GIT_STATUS_CONCURRENCY at a
+    time. Each entry has the agent's git config and its live status (None
+    if the agent is not running or did not answer).
+    """
+    running = {agent.name for agent in list_all_agents_fast() if agent.status == "running"}
+    semaphore = asyncio.Semaphore(FLEET_GIT_STATUS_CONCURRENCY)
+
+    async def fetch(config: AgentGitConfig) -> Dict[str, Any]:
+        status = None
+        if config.agent_name in running:
+            async with semaphore:
+                status = await _fetch_git_status(config.agent_name)
+        return {
+            "agent_name": config.agent_name,
+            "github_repo": config.github_repo,
+            "working_branch": config.working_branch,
+            "last_sync_at": config.last_sync_at.isoformat() if config.last_sync_at else None,
+            "agent_running": config.agent_name in running,
+            "status": status
+        }
+
+    return list(await asyncio.gather(*(fetch(config) for config in configs)))
+
+
 async def sync_to_github(
     agent_name: str,
     message: Optional[str] = None,
@@ -8,13 +8,19 @@ Performs multi-layer health checks on agent infrastructure:
 
 Health checks run as background tasks and store results in the database.
 Alerts are sent via the notification system when status changes.
+
+The background service schedules each agent and check layer separately
+(MON-SCHED-001): intervals adapt to the agent's status, and unchanged
+results are only persisted as periodic heartbeats.
 """
 
 import asyncio
+import random
+import re
 import time
+from collections import deque
 from datetime import datetime, timedelta
 from typing import Optional, Dict, List, Any, Tuple
-from concurrent.futures import ThreadPoolExecutor
 
 import docker
 import httpx
@@ -41,6 +47,20 @@ from utils.helpers import utc_now_iso
 
 DEFAULT_CONFIG = MonitoringConfig()
 
+# Scheduled check tiers and the config field holding each one's base interval
+CHECK_TIERS = ("docker", "network", "business")
+_TIER_INTERVALS = {
+    "docker": "docker_check_interval",
+    "network": "network_check_interval",
+    "business": "business_check_interval",
+}
+# Cycle durations kept for the average in MonitoringService.metrics()
+CYCLE_HISTORY = 100
+# Seconds between deletions of health records older than 7 days
+CLEANUP_INTERVAL = 3600
+
+_NUMBER_PATTERN = re.compile(r"\d+(?:\.\d+)?")
+
 # Initialize Docker client
 try:
     docker_client = docker.from_env()
@@ -91,30 +111,24 @@ def check_docker_health(agent_name: str) -> DockerHealthCheck:
     # Get container state from attrs
     state = container.attrs.get("State", {})
 
-    # Get resource stats (this can be slow, ~1-2s)
+    # Get resource stats (streamed; the one-shot fallback can be slow, ~1-2s)
     cpu_percent = None
     memory_percent = None
     memory_mb = None
 
     try:
-        # Use stream=False for one-shot stats
-        stats = container.stats(stream=False)
-
-        # Calculate CPU percentage
-        cpu_delta = stats["cpu_stats"]["cpu_usage"]["total_usage"] - \
-                    stats["precpu_stats"]["cpu_usage"]["total_usage"]
-        system_delta = stats["cpu_stats"]["system_cpu_usage"] - \
-                       stats["precpu_stats"]["system_cpu_usage"]
-        num_cpus = stats["cpu_stats"].get("online_cpus", 1)
-
-        if system_delta > 0 and cpu_delta > 0:
-            cpu_percent = (cpu_delta / system_delta) * num_cpus * 100
-
-        # Calculate memory percentage
-        mem_usage = stats["memory_stats"].get("usage", 0)
-        mem_limit = stats["memory_stats"].get("limit", 1)
-        memory_percent = (mem_usage / mem_limit) * 100 if mem_limit > 0 else 0
-        memory_mb = mem_usage / (1024 * 1024)
+        # Latest streamed sample; one-shot stats only if there is none
+        from services.container_stats import parse_stats, stats_collector
+        sample = stats_collector.get_latest(agent_name)
+        if sample is None and container.status == "running":
+            sample = parse_stats(container.stats(stream=False))
+
+        if sample is not None:
+            cpu_percent = sample.cpu_percent
+            # Raw usage including page cache, as the alert thresholds expect
+            mem_limit = sample.memory_limit_bytes
+            memory_percent = (sample.memory_usage_bytes / mem_limit) * 100 if mem_limit > 0 else 0
+            memory_mb = sample.memory_usage_bytes / (1024 * 1024)
     except Exception:
         pass  # Stats unavailable for stopped containers
 
@@ -359,6 +373,159 @@ def aggregate_health(
 # Composite Health Check
 # =========================================================================
 
+def _health_check_records(
+    agent_name: str,
+    status: AgentHealthStatus,
+    issues: List[str],
+    docker_check: Optional[DockerHealthCheck] = None,
+    network_check: Optional[NetworkHealthCheck] = None,
+    business_check: Optional[BusinessHealthCheck] = None,
+    aggregate_checks: Optional[Tuple[DockerHealthCheck, NetworkHealthCheck, BusinessHealthCheck]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Build agent_health_checks records for db.create_health_checks().
+
+    One record per layer check given, plus the aggregate record built from
+    `aggregate_checks` (defaults to the three layer checks).
+    """
+    records = []
+
+    if docker_check is not None:
+        records.append({
+            "agent_name": agent_name,
+            "check_type": "docker",
+            "status": "healthy" if docker_check.container_status == "running" else "unhealthy",
+            "docker_metrics": {
+                "container_status": docker_check.container_status,
+                "exit_code": docker_check.exit_code,
+                "restart_count": docker_check.restart_count,
+                "oom_killed": docker_check.oom_killed,
+                "cpu_percent": docker_check.cpu_percent,
+                "memory_percent": docker_check.memory_percent,
+                "memory_mb": docker_check.memory_mb,
+            },
+        })
+
+    if network_check is not None:
+        records.append({
+            "agent_name": agent_name,
+            "check_type": "network",
+            "status": "healthy" if network_check.reachable else "unhealthy",
+            "network_metrics": {
+                "reachable": network_check.reachable,
+                "latency_ms": network_check.latency_ms,
+            },
+            "error_message": network_check.error,
+        })
+
+    if business_check is not None:
+        records.append({
+            "agent_name": agent_name,
+            "check_type": "business",
+            "status": business_check.status,
+            "business_metrics": {
+                "runtime_available": business_check.runtime_available,
+                "claude_available": business_check.claude_available,
+                "context_percent": business_check.context_percent,
+                "active_executions": business_check.active_execution_count,
+                "error_rate": business_check.recent_error_rate,
+                "credential_status": business_check.credential_status,
+            },
+        })
+
+    docker, network, business = aggregate_checks or (docker_check, network_check, business_check)
+    records.append({
+        "agent_name": agent_name,
+        "check_type": "aggregate",
+        "status": status.value,
+        "docker_metrics": {
+            "container_status": docker.container_status,
+            "cpu_percent": docker.cpu_percent,
+            "memory_percent": docker.memory_percent,
+        },
+        "network_metrics": {
+            "reachable": network.reachable,
+            "latency_ms": network.latency_ms,
+        },
+        "business_metrics": {
+            "runtime_available": business.runtime_available,
+            "context_percent": business.context_percent,
+        },
+        "error_message": "; ".join(issues) if issues else None,
+    })
+
+    return records
+
+
+async def _send_health_alerts(
+    agent_name: str,
+    previous_status: Optional[str],
+    status: AgentHealthStatus,
+    issues: List[str],
+    docker_check: DockerHealthCheck,
+    network_check: NetworkHealthCheck,
+    config: MonitoringConfig,
+    check_conditions: bool = True
+):
+    """
+    Alert on a status change and on specific Docker conditions.
+
+    Args:
+        previous_status: Last known aggregate status (None: no status change alert)
+        check_conditions: Whether docker_check is fresh and its OOM, stopped,
+            restart and resource conditions should be evaluated
+    """
+    try:
+        from services.monitoring_alerts import get_alert_service
+        alert_service = get_alert_service()
+
+        if previous_status is not None and previous_status != status.value:
+            await alert_service.evaluate_and_alert(
+                agent_name=agent_name,
+                previous_status=previous_status,
+                current_status=status.value,
+                issues=issues,
+                details={
+                    "docker_status": docker_check.container_status,
+                    "cpu_percent": docker_check.cpu_percent,
+                    "memory_percent": docker_check.memory_percent,
+                    "network_reachable": network_check.reachable,
+                    "latency_ms": network_check.latency_ms,
+                }
+            )
+
+        if not check_conditions:
+            return
+
+        # Check for specific alert conditions
+        if docker_check.oom_killed:
+            await alert_service.alert_container_stopped(
+                agent_name, docker_check.exit_code, oom_killed=True
+            )
+        elif docker_check.container_status not in ("running", "unknown", "not_found"):
+            await alert_service.alert_container_stopped(
+                agent_name, docker_check.exit_code
+            )
+
+        if docker_check.restart_count and docker_check.restart_count > 3:
+            await alert_service.alert_high_restart_count(
+                agent_name, docker_check.restart_count
+            )
+
+        if docker_check.cpu_percent and docker_check.cpu_percent > config.cpu_critical_percent:
+            await alert_service.alert_resource_critical(
+                agent_name, "cpu", docker_check.cpu_percent
+            )
+
+        if docker_check.memory_percent and docker_check.memory_percent > config.memory_critical_percent:
+            await alert_service.alert_resource_critical(
+                agent_name, "memory", docker_check.memory_percent
+            )
+
+    except Exception as e:
+        print(f"Failed to send monitoring alert: {e}")
+
+
 async def perform_health_check(
     agent_name: str,
     config: MonitoringConfig = DEFAULT_CONFIG,
@@ -373,17 +540,13 @@ async def perform_health_check(
     Returns:
         AgentHealthDetail with all check results
     """
-    # Run Docker check in thread pool (blocking)
-    loop = asyncio.get_event_loop()
-    with ThreadPoolExecutor(max_workers=1) as executor:
-        docker_check = await loop.run_in_executor(
-            executor,
-            check_docker_health,
-            agent_name
-        )
+    # Run Docker check in the default thread pool (blocking)
+    loop = asyncio.get_running_loop()
+    docker_task = loop.run_in_executor(None, check_docker_health, agent_name)
 
     # Run network and business checks concurrently
-    network_check, business_check = await asyncio.gather(
+    docker_check, network_check, business_check = await asyncio.gather(
+        docker_task,
         check_network_health(agent_name, config.http_timeout),
         check_business_health(agent_name, config.http_timeout)
     )
@@ -394,119 +557,27 @@ async def perform_health_check(
 
     # Store results if requested
     if store_results:
-        # Store individual layer checks
-        db.create_health_check(
-            agent_name=agent_name,
-            check_type="docker",
-            status="healthy" if docker_check.container_status == "running" else "unhealthy",
-            docker_metrics={
-                "container_status": docker_check.container_status,
-                "exit_code": docker_check.exit_code,
-                "restart_count": docker_check.restart_count,
-                "oom_killed": docker_check.oom_killed,
-                "cpu_percent": docker_check.cpu_percent,
-                "memory_percent": docker_check.memory_percent,
-                "memory_mb": docker_check.memory_mb,
-            }
-        )
-
-        db.create_health_check(
-            agent_name=agent_name,
-            check_type="network",
-            status="healthy" if network_check.reachable else "unhealthy",
-            network_metrics={
-                "reachable": network_check.reachable,
-                "latency_ms": network_check.latency_ms,
-            },
-            error_message=network_check.error
-        )
-
-        db.create_health_check(
-            agent_name=agent_name,
-            check_type="business",
-            status=business_check.status,
-            business_metrics={
-                "runtime_available": business_check.runtime_available,
-                "claude_available": business_check.claude_available,
-                "context_percent": business_check.context_percent,
-                "active_executions": business_check.active_execution_count,
-                "error_rate": business_check.recent_error_rate,
-                "credential_status": business_check.credential_status,
-            }
-        )
+        db.create_health_checks(_health_check_records(
+            agent_name, status, issues, docker_check, network_check, business_check
+        ))
 
-        # Store aggregate result
-        db.create_health_check(
-            agent_name=agent_name,
-            check_type="aggregate",
-            status=status.value,
-            docker_metrics={
-                "container_status": docker_check.container_status,
-                "cpu_percent": docker_check.cpu_percent,
-                "memory_percent": docker_check.memory_percent,
-            },
-            network_metrics={
-                "reachable": network_check.reachable,
-                "latency_ms": network_check.latency_ms,
-            },
-            business_metrics={
-                "runtime_available": business_check.runtime_available,
-                "context_percent": business_check.context_percent,
-            },
-            error_message="; ".join(issues) if issues else None
-        )
-
-        # Check for status change and send alerts
+        # Get previous status from recent history
+        previous_status = None
         try:
-            from services.monitoring_alerts import get_alert_service
-            alert_service = get_alert_service()
-
-            # Get previous status from recent history
             history = db.get_agent_health_history(agent_name, "aggregate", hours=1, limit=2)
             if len(history) > 1:
                 previous_status = history[1].get("status", "unknown")
-                if previous_status != status.value:
-                    await alert_service.evaluate_and_alert(
-                        agent_name=agent_name,
-                        previous_status=previous_status,
-                        current_status=status.value,
-                        issues=issues,
-                        details={
-                            "docker_status": docker_check.container_status,
-                            "cpu_percent": docker_check.cpu_percent,
-                            "memory_percent": docker_check.memory_percent,
-                            "network_reachable": network_check.reachable,
-                            "latency_ms": network_check.latency_ms,
-                        }
-                    )
-
-            # Check for specific alert conditions
-            if docker_check.oom_killed:
-                await alert_service.alert_container_stopped(
-                    agent_name, docker_check.exit_code, oom_killed=True
-                )
-            elif docker_check.container_status not in ("running", "unknown", "not_found"):
-                await alert_service.alert_container_stopped(
-                    agent_name, docker_check.exit_code
-                )
-
-            if docker_check.restart_count and docker_check.restart_count > 3:
-                await alert_service.alert_high_restart_count(
-                    agent_name, docker_check.restart_count
-                )
-
-            if docker_check.cpu_percent and docker_check.cpu_percent > config.cpu_critical_percent:
-                await alert_service.alert_resource_critical(
-                    agent_name, "cpu", docker_check.cpu_percent
-                )
-
-            if docker_check.memory_percent and docker_check.memory_percent > config.memory_critical_percent:
-                await alert_service.alert_resource_critical(
-                    agent_name, "memory", docker_check.memory_percent
-                )
-
         except Exception as e:
-            print(f"Failed to send monitoring alert: {e}")
+            print(f"Failed to read health history for {agent_name}: {e}")
+
+        await _send_health_alerts(
+            agent_name, previous_status, status, issues,
+            docker_check, network_check, config
+        )
+
+        # The scheduler must not skip its next write as "unchanged"
+        if _monitoring_service is not None:
+            _monitoring_service.invalidate(agent_name)
 
     # Get historical metrics
     uptime = db.calculate_uptime_percent(agent_name, hours=24)
@@ -540,7 +611,7 @@ async def perform_fleet_health_check(
     now = utc_now_iso()
 
     # Run health checks in parallel with concurrency limit
-    semaphore = asyncio.Semaphore(10)  # Max 10 concurrent checks
+    semaphore = asyncio.Semaphore(config.max_concurrent_checks)
 
     async def check_with_limit(name: str) -> AgentHealthDetail:
         async with semaphore:
@@ -603,9 +674,71 @@ async def perform_fleet_health_check(
 # Background Task Management
 # =========================================================================
 
+def interval_multiplier(status: Optional[str], config: MonitoringConfig = DEFAULT_CONFIG) -> float:
+    """Scale of an agent's check intervals given its last aggregate status."""
+    if status == AgentHealthStatus.HEALTHY.value:
+        return config.healthy_interval_multiplier
+    if status == AgentHealthStatus.DEGRADED.value:
+        return 1.0
+    # Unhealthy, critical, or not checked yet
+    return config.unhealthy_interval_multiplier
+
+
+def _record_fingerprint(record: Dict[str, Any]) -> tuple:
+    """
+    What must change for a health check record to be persisted before the
+    next heartbeat: status and discrete state, not CPU/memory/latency
+    readings (numbers in messages are masked for the same reason).
+    """
+    docker = record.get("docker_metrics") or {}
+    network = record.get("network_metrics") or {}
+    business = record.get("business_metrics") or {}
+    message = record.get("error_message")
+    return (
+        record["status"],
+        docker.get("container_status"),
+        docker.get("restart_count"),
+        docker.get("oom_killed"),
+        network.get("reachable"),
+        business.get("runtime_available"),
+        business.get("claude_available"),
+        business.get("credential_status"),
+        _NUMBER_PATTERN.sub("#", message) if message else None,
+    )
+
+
+class _AgentSchedule:
+    """Scheduler state for one agent."""
+
+    __slots__ = ("due", "checks", "status", "persisted")
+
+    def __init__(self, status: Optional[str], now: float):
+        # Check tier -> monotonic time the tier is next due
+        self.due: Dict[str, float] = dict.fromkeys(CHECK_TIERS, now)
+        # Check tier -> latest result
+        self.checks: Dict[str, Any] = {}
+        # Last aggregate status (seeded from the database)
+        self.status = status
+        # Check type -> (fingerprint, monotonic time) of the last persisted record
+        self.persisted: Dict[str, Tuple[tuple, float]] = {}
+
+
 class MonitoringService:
     """
-    Background service for periodic health checks.
+    Background service for periodic health checks (MON-SCHED-001).
+
+    Every agent has its own schedule per check tier (docker, network,
+    business). The base intervals come from the config and are scaled by
+    the agent's last status (healthy agents less often, unhealthy and
+    critical ones more often) with random jitter, so checks spread out
+    instead of running for the whole fleet at once. The service wakes
+    every `scheduler_tick_interval` seconds and runs only the tiers that
+    are due, at most `max_concurrent_checks` agents at a time; the other
+    tiers' latest results are reused for the aggregate status.
+
+    Records of a cycle are written in one batch. A record is only written
+    when its status or discrete state changed, or once per
+    `heartbeat_interval` otherwise.
 
     Usage:
         service = MonitoringService(config)
@@ -618,6 +751,17 @@ class MonitoringService:
         self.config = config
         self._running = False
         self._task: Optional[asyncio.Task] = None
+        self._schedules: Dict[str, _AgentSchedule] = {}
+        self._last_cleanup = time.monotonic()
+        self._cycle_durations: deque = deque(maxlen=CYCLE_HISTORY)
+        # Metrics
+        self.cycles = 0
+        self.overruns = 0
+        self.max_cycle_duration = 0.0
+        self.last_lag = 0.0
+        self.checks_run: Dict[str, int] = dict.fromkeys(CHECK_TIERS, 0)
+        self.records_written = 0
+        self.records_skipped = 0
 
     @property
     def is_running(self) -> bool:
@@ -643,41 +787,201 @@ class MonitoringService:
                 pass
         print("Monitoring service stopped")
 
+    def invalidate(self, agent_name: str):
+        """Forget what was persisted for an agent (written by another path)."""
+        schedule = self._schedules.get(agent_name)
+        if schedule is not None:
+            schedule.persisted.clear()
+
+    def metrics(self) -> Dict[str, Any]:
+        """Scheduler metrics: cycle durations, lag, checks run and records written."""
+        durations = list(self._cycle_durations)
+        return {
+            "running": self._running,
+            "agents_scheduled": len(self._schedules),
+            "tick_interval_seconds": self.config.scheduler_tick_interval,
+            "cycles": self.cycles,
+            "overruns": self.overruns,
+            "last_cycle_seconds": round(durations[-1], 3) if durations else None,
+            "avg_cycle_seconds": round(sum(durations) / len(durations), 3) if durations else None,
+            "max_cycle_seconds": round(self.max_cycle_duration, 3),
+            "last_lag_seconds": round(self.last_lag, 3),
+            "checks_run": dict(self.checks_run),
+            "records_written": self.records_written,
+            "records_skipped": self.records_skipped,
+        }
+
     async def _run_loop(self):
         """Main monitoring loop."""
         while self._running:
+            started = time.monotonic()
             try:
                 await self._run_check_cycle()
             except Exception as e:
                 print(f"Monitoring check cycle failed: {e}")
 
-            # Wait for next cycle
-            await asyncio.sleep(self.config.docker_check_interval)
+            duration = time.monotonic() - started
+            self._record_cycle(duration)
+
+            # Wait for next tick
+            await asyncio.sleep(max(0.0, self.config.scheduler_tick_interval - duration))
+
+    def _record_cycle(self, duration: float):
+        self.cycles += 1
+        self._cycle_durations.append(duration)
+        self.max_cycle_duration = max(self.max_cycle_duration, duration)
+        if duration > self.config.scheduler_tick_interval:
+            self.overruns += 1
 
     async def _run_check_cycle(self):
-        """Run one cycle of health checks for all agents."""
+        """Run the checks that are due and persist what changed."""
         from services.docker_service import list_all_agents_fast
 
         # Get list of running agents
         agents = list_all_agents_fast()
         running_agents = [a.name for a in agents if a.status == "running"]
 
-        if not running_agents:
-            return
-
-        # Perform health checks
-        await perform_fleet_health_check(
-            running_agents,
-            self.config,
-            store_results=True
+        for name in set(self._schedules) - set(running_agents):
+            del self._schedules[name]
+
+        now = time.monotonic()
+        due = []
+        for name in running_agents:
+            schedule = self._schedules.get(name)
+            if schedule is None:
+                schedule = self._schedules[name] = _AgentSchedule(self._last_status(name), now)
+            tiers = [tier for tier in CHECK_TIERS if schedule.due[tier] <= now]
+            if tiers:
+                due.append((name, schedule, tiers))
+
+        self.last_lag = max(
+            (now - min(schedule.due[tier] for tier in tiers) for _, schedule, tiers in due),
+            default=0.0
         )
 
-        # Cleanup old records periodically (every hour)
-        # This is a simple implementation; could be more sophisticated
-        import random
-        if random.random() < 0.03:  # ~1 in 33 cycles (every ~15 min at 30s interval)
+        if due:
+            semaphore = asyncio.Semaphore(self.config.max_concurrent_checks)
+
+            async def check_with_limit(name, schedule, tiers):
+                async with semaphore:
+                    return await self._check_agent(name, schedule, tiers)
+
+            results = await asyncio.gather(
+                *[check_with_limit(*entry) for entry in due],
+                return_exceptions=True
+            )
+
+            records = []
+            for (name, schedule, tiers), result in zip(due, results):
+                if isinstance(result, Exception):
+                    print(f"Health check failed for {name}: {result}")
+                    self._reschedule(schedule, tiers, time.monotonic())
+                else:
+                    records.extend(result)
+            self._persist(records)
+
+        # Cleanup old records periodically
+        if time.monotonic() - self._last_cleanup >= CLEANUP_INTERVAL:
+            self._last_cleanup = time.monotonic()
             db.cleanup_old_health_records(days=7)
 
+    async def _check_agent(
+        self,
+        agent_name: str,
+        schedule: _AgentSchedule,
+        tiers: List[str]
+    ) -> List[Dict[str, Any]]:
+        """Run an agent's due check tiers; returns the records to persist."""
+        config = self.config
+        # A tier without a result yet (earlier failure) runs regardless
+        tiers = [tier for tier in CHECK_TIERS if tier in tiers or tier not in schedule.checks]
+
+        loop = asyncio.get_running_loop()
+        jobs = {}
+        if "docker" in tiers:
+            jobs["docker"] = loop.run_in_executor(None, check_docker_health, agent_name)
+        if "network" in tiers:
+            jobs["network"] = check_network_health(agent_name, config.http_timeout)
+        if "business" in tiers:
+            jobs["business"] = check_business_health(agent_name, config.http_timeout)
+        results = await asyncio.gather(*jobs.values())
+        schedule.checks.update(zip(jobs, results))
+        for tier in tiers:
+            self.checks_run[tier] += 1
+
+        docker_check, network_check, business_check = (schedule.checks[t] for t in CHECK_TIERS)
+        status, issues = aggregate_health(docker_check, network_check, business_check, config)
+
+        previous_status = schedule.status
+        schedule.status = status.value
+        now = time.monotonic()
+        self._reschedule(schedule, tiers, now, all_tiers=previous_status != status.value)
+
+        await _send_health_alerts(
+            agent_name, previous_status, status, issues,
+            docker_check, network_check, config,
+            check_conditions="docker" in tiers
+        )
+
+        records = _health_check_records(
+            agent_name, status, issues,
+            *(schedule.checks[t] if t in tiers else None for t in CHECK_TIERS),
+            aggregate_checks=(docker_check, network_check, business_check)
+        )
+        changed = []
+        for record in records:
+            fingerprint = _record_fingerprint(record)
+            last = schedule.persisted.get(record["check_type"])
+            if last is not None and last[0] == fingerprint and now - last[1] < config.heartbeat_interval:
+                self.records_skipped += 1
+                continue
+            schedule.persisted[record["check_type"]] = (fingerprint, now)
+            changed.append(record)
+        return changed
+
+    def _reschedule(
+        self,
+        schedule: _AgentSchedule,
+        tiers: List[str],
+        now: float,
+        all_tiers: bool = False
+    ):
+        """
+        Set the next due time of the tiers just run. With `all_tiers` (the
+        status changed) the other tiers are brought forward if the new
+        status makes them due sooner.
+        """
+        config = self.config
+        multiplier = interval_multiplier(schedule.status, config)
+        for tier in CHECK_TIERS:
+            if tier not in tiers and not all_tiers:
+                continue
+            interval = getattr(config, _TIER_INTERVALS[tier]) * multiplier
+            interval *= random.uniform(1 - config.interval_jitter, 1 + config.interval_jitter)
+            due = now + max(interval, 1.0)
+            schedule.due[tier] = due if tier in tiers else min(schedule.due[tier], due)
+
+    def _persist(self, records: List[Dict[str, Any]]):
+        """Write a cycle's records in one batch."""
+        if not records:
+            return
+        try:
+            db.create_health_checks(records)
+            self.records_written += len(records)
+        except Exception as e:
+            print(f"Failed to store health checks: {e}")
+            # Nothing was written: the next check of these agents writes again
+            for name in {record["agent_name"] for record in records}:
+                self.invalidate(name)
+
+    def _last_status(self, agent_name: str) -> Optional[str]:
+        """Last persisted aggregate status, to alert on changes across restarts."""
+        try:
+            latest = db.get_latest_health_check(agent_name, "aggregate")
+        except Exception:
+            return None
+        return latest.get("status") if latest else None
+
 
 # Global service instance
 _monitoring_service: Optional[MonitoringService] = None
@@ -20,7 +20,7 @@ def _utcnow() -> datetime:
 
 from .enums import DefinitionStatus, ExecutionStatus, StepStatus
 from .value_objects import ProcessId, ExecutionId, StepId, Version, Money, Duration
-from .entities import StepDefinition, StepExecution, OutputConfig
+from .entities import ChangeTracked, StepDefinition, StepExecution, OutputConfig
 from .step_configs import TriggerConfig, parse_trigger_config
 from .exceptions import (
     CircularDependencyError,
@@ -362,11 +362,13 @@ class ProcessDefinition:
 
 
 @dataclass
-class ProcessExecution:
+class ProcessExecution(ChangeTracked):
     """
     Aggregate root for process execution state.
 
     Tracks all runtime state for a single execution of a process.
+    The root and each StepExecution are change-tracked separately, so a
+    save after one step transition writes only that step.
     """
     id: ExecutionId
     process_id: ProcessId
@@ -564,6 +566,14 @@ class ProcessExecution:
             if step_exec.status == StepStatus.SKIPPED
         ]
 
+    def get_step_executions_changed_since(self, revision: int) -> list[StepExecution]:
+        """Get step executions modified after the given revision."""
+        return [
+            step_exec
+            for step_exec in self.step_executions.values()
+            if step_exec.revision > revision
+        ]
+
     def all_steps_completed(self) -> bool:
         """Check if all steps are completed or skipped."""
         for step_exec in self.step_executions.values():
@@ -575,6 +585,7 @@ class ProcessExecution:
         """Add a child execution ID to track sub-process calls."""
         if child_id not in self.child_execution_ids:
             self.child_execution_ids.append(child_id)
+            self.touch()
 
     def is_sub_process(self) -> bool:
         """Check if this execution is a sub-process (has a parent)."""
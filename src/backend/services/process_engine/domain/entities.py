@@ -8,6 +8,7 @@ Reference: IT3 Section 4.2 (Entities)
 
 from __future__ import annotations
 
+import itertools
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Optional
@@ -31,6 +32,39 @@ from .step_configs import (
 )
 
 
+_revisions = itertools.count(1)
+
+
+class ChangeTracked:
+    """
+    Mixin for dirty tracking: every attribute write stamps the object
+    with a new, globally increasing revision.
+
+    Repositories remember the revision they last persisted and write only
+    objects with a newer one. In-place mutation of a mutable attribute
+    (e.g. appending to a list) is not seen; call touch() after it.
+    """
+    _revision: int = 0
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        object.__setattr__(self, "_revision", next(_revisions))
+
+    @property
+    def revision(self) -> int:
+        """Revision of the last change to this object."""
+        return self._revision
+
+    def touch(self) -> None:
+        """Mark the object as changed."""
+        object.__setattr__(self, "_revision", next(_revisions))
+
+    @staticmethod
+    def current_revision() -> int:
+        """A revision newer than every change made so far."""
+        return next(_revisions)
+
+
 @dataclass
 class StepRoles:
     """
@@ -267,11 +301,12 @@ class StepDefinition:
 
 
 @dataclass
-class StepExecution:
+class StepExecution(ChangeTracked):
     """
     Entity within ProcessExecution aggregate.
 
     Tracks the runtime state of a single step execution.
+    Change-tracked so repositories can persist only modified steps.
     """
     step_id: StepId
     status: StepStatus = StepStatus.PENDING
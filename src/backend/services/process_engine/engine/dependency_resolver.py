@@ -73,6 +73,7 @@ class DependencyResolver:
         """
         self.definition = definition
         self._step_map = {str(step.id): step for step in definition.steps}
+        self._dependents: Optional[dict[str, list[StepId]]] = None
     
     def get_ready_steps(self, execution: ProcessExecution) -> list[StepId]:
         """
@@ -165,6 +166,52 @@ class DependencyResolver:
         
         return result
     
+    def get_dependents(self) -> dict[str, list[StepId]]:
+        """
+        Get the reverse dependency edges of the process.
+        
+        Dependents are listed in definition order. A step that lists the
+        same dependency twice appears twice, matching the in-degree
+        counts from get_unsatisfied_dependency_counts().
+        
+        Returns:
+            Dict mapping step_id -> list of step IDs that depend on it
+        """
+        if self._dependents is None:
+            dependents: dict[str, list[StepId]] = {
+                str(step.id): [] for step in self.definition.steps
+            }
+            for step in self.definition.steps:
+                for dep in step.dependencies:
+                    dependents.setdefault(str(dep), []).append(step.id)
+            self._dependents = dependents
+        return self._dependents
+    
+    def get_unsatisfied_dependency_counts(self, execution: ProcessExecution) -> dict[str, int]:
+        """
+        Count the dependencies of each step that are not yet satisfied.
+        
+        A dependency is satisfied when it is COMPLETED or SKIPPED, the same
+        rule get_ready_steps() applies. A PENDING step with a count of zero
+        is ready; the engine decrements the counts as steps finish instead
+        of rescanning the whole process.
+        
+        Args:
+            execution: Current execution state
+            
+        Returns:
+            Dict mapping step_id -> number of unsatisfied dependencies
+        """
+        satisfied_steps = set(execution.get_completed_step_ids())
+        satisfied_steps.update(execution.get_skipped_step_ids())
+        
+        return {
+            str(step.id): sum(
+                1 for dep in step.dependencies if str(dep) not in satisfied_steps
+            )
+            for step in self.definition.steps
+        }
+    
     def get_step_definition(self, step_id: StepId) -> Optional[StepDefinition]:
         """
         Get step definition by ID.
@@ -9,6 +9,8 @@ Reference: BACKLOG_MVP.md - E2-03
 
 import asyncio
 import logging
+from collections import deque
+from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Optional
@@ -266,7 +268,10 @@ class ExecutionEngine:
         Main execution loop.
 
         Executes steps in dependency order until complete or failed.
-        Supports parallel execution of independent steps.
+        Scheduling is completion-driven: each step is started as soon as
+        its own dependencies finish, rather than waiting for the slowest
+        step of its level. max_concurrent_steps bounds the number of
+        steps in flight for the whole execution.
         """
         resolver = DependencyResolver(definition)
 
@@ -282,106 +287,86 @@ class ExecutionEngine:
                 triggered_by=execution.triggered_by,
             ))
 
-        # Execute steps until done
-        while True:
-            # Check if cancelled or paused
-            if execution.status == ExecutionStatus.CANCELLED:
-                break
-
-            if execution.status == ExecutionStatus.PAUSED:
-                logger.info(f"Execution {execution.id} paused (waiting for approval)")
-                break
-
-            # Check for failures (if stop_on_failure is enabled)
-            if resolver.has_failed_steps(execution) and self.config.stop_on_failure:
-                await self._fail_execution(execution, "Step execution failed", definition)
-                break
-
-            # Get all ready steps
-            ready_step_ids = resolver.get_ready_steps(execution)
-
-            if not ready_step_ids:
-                # No more steps ready
-                if resolver.is_complete(execution):
-                    # All done - complete execution
-                    await self._complete_execution(execution, definition)
-                    break
-                elif resolver.has_failed_steps(execution):
-                    # Failed steps blocking progress
-                    await self._fail_execution(execution, "Step execution failed", definition)
-                    break
-                else:
-                    # Check if steps are still running (parallel execution)
-                    running_steps = resolver.get_running_steps(execution)
-                    if running_steps:
-                        # Wait a bit and continue - steps are still running
-                        await asyncio.sleep(0.1)
-                        continue
-                    # Shouldn't happen - deadlock
-                    logger.error("No steps ready but execution not complete")
-                    await self._fail_execution(execution, "Execution deadlock", definition)
-                    break
+        # Remaining in-degree per step; a finished step releases its dependents
+        remaining = resolver.get_unsatisfied_dependency_counts(execution)
+        dependents = resolver.get_dependents()
+        ready: deque[StepId] = deque(resolver.get_ready_steps(execution))
+        running: dict[asyncio.Task, StepId] = {}
+        step_failed = resolver.has_failed_steps(execution)
 
-            # Get step definitions
-            step_defs = []
-            for step_id in ready_step_ids:
-                step_def = resolver.get_step_definition(step_id)
-                if step_def is None:
-                    await self._fail_execution(execution, f"Step definition not found: {step_id}", definition)
-                    return execution
-                step_defs.append(step_def)
-
-            # Execute steps (parallel or sequential)
-            if self.config.parallel_execution and len(step_defs) > 1:
-                # Parallel execution
-                await self._execute_steps_parallel(execution, step_defs, definition)
-            else:
-                # Sequential execution (one step at a time)
-                for step_def in step_defs:
-                    await self._execute_step(execution, step_def, definition)
-                    # Check if execution was failed/cancelled during step execution
-                    if execution.status in (ExecutionStatus.FAILED, ExecutionStatus.CANCELLED):
-                        break
+        # Global concurrency limit across the whole execution (0 = unlimited)
+        limit = self.config.max_concurrent_steps if self.config.parallel_execution else 1
 
-            # Check if execution was failed/cancelled during step execution
-            if execution.status in (ExecutionStatus.FAILED, ExecutionStatus.CANCELLED):
-                break
-
-        return execution
-
-    async def _execute_steps_parallel(
-        self,
-        execution: ProcessExecution,
-        step_defs: list[StepDefinition],
-        definition: ProcessDefinition,
-    ) -> None:
-        """
-        Execute multiple steps in parallel.
+        try:
+            while True:
+                halted = execution.status in (
+                    ExecutionStatus.CANCELLED,
+                    ExecutionStatus.PAUSED,
+                    ExecutionStatus.FAILED,
+                ) or (step_failed and self.config.stop_on_failure)
+
+                # Launch ready steps up to the concurrency limit
+                while ready and not halted and (limit <= 0 or len(running) < limit):
+                    step_id = ready.popleft()
+                    step_def = resolver.get_step_definition(step_id)
+                    if step_def is None:
+                        await self._fail_execution(execution, f"Step definition not found: {step_id}", definition)
+                        halted = True
+                        break
+                    task = asyncio.create_task(self._execute_step(execution, step_def, definition))
+                    running[task] = step_id
 
-        Uses asyncio.gather to run steps concurrently.
-        Respects max_concurrent_steps configuration.
-        """
-        step_names = [s.name for s in step_defs]
-        logger.info(f"Executing {len(step_defs)} steps in parallel: {step_names}")
+                # Nothing in flight: either done, halted, or blocked
+                if not running:
+                    break
 
-        # Apply concurrency limit if configured
-        if self.config.max_concurrent_steps > 0:
-            semaphore = asyncio.Semaphore(self.config.max_concurrent_steps)
+                # Wait for the next step to finish; once halted, in-flight
+                # steps are drained but nothing new is started
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    step_id = running.pop(task)
+                    if task.exception() is not None:
+                        logger.error(f"Step '{step_id}' raised: {task.exception()!r}")
+
+                    status = execution.step_executions[str(step_id)].status
+                    if status == StepStatus.FAILED:
+                        step_failed = True
+                    elif status in (StepStatus.COMPLETED, StepStatus.SKIPPED):
+                        for dependent in dependents.get(str(step_id), ()):
+                            remaining[str(dependent)] -= 1
+                            step_exec = execution.step_executions.get(str(dependent))
+                            if (
+                                remaining[str(dependent)] == 0
+                                and step_exec is not None
+                                and step_exec.status == StepStatus.PENDING
+                            ):
+                                ready.append(dependent)
+        finally:
+            # Only reached with tasks in flight if _run itself was cancelled
+            for task in running:
+                task.cancel()
+
+        if execution.status in (ExecutionStatus.CANCELLED, ExecutionStatus.FAILED):
+            return execution
 
-            async def limited_execute(step_def: StepDefinition):
-                async with semaphore:
-                    await self._execute_step(execution, step_def, definition)
+        if execution.status == ExecutionStatus.PAUSED:
+            logger.info(f"Execution {execution.id} paused (waiting for approval)")
+            return execution
 
-            tasks = [limited_execute(step_def) for step_def in step_defs]
+        if step_failed and self.config.stop_on_failure:
+            await self._fail_execution(execution, "Step execution failed", definition)
+        elif resolver.is_complete(execution):
+            # All done - complete execution
+            await self._complete_execution(execution, definition)
+        elif resolver.has_failed_steps(execution):
+            # Failed steps blocking progress
+            await self._fail_execution(execution, "Step execution failed", definition)
         else:
-            tasks = [
-                self._execute_step(execution, step_def, definition)
-                for step_def in step_defs
-            ]
+            # Shouldn't happen - deadlock
+            logger.error("No steps ready but execution not complete")
+            await self._fail_execution(execution, "Execution deadlock", definition)
 
-        # Run all steps concurrently
-        # Using return_exceptions=True to continue even if some fail
-        await asyncio.gather(*tasks, return_exceptions=True)
+        return execution
 
     async def _execute_step(
         self,
@@ -460,9 +445,7 @@ class ExecutionEngine:
             attempt += 1
 
             # Build context
-            step_outputs = {}
-            if self.output_storage:
-                step_outputs = self.output_storage.get_all_outputs(execution.id)
+            step_outputs = self._build_step_outputs(execution)
 
             context = StepContext(
                 execution=execution,
@@ -703,14 +686,17 @@ class ExecutionEngine:
         if action == OnErrorAction.FAIL_PROCESS:
             await self._fail_execution(execution, f"Step '{step_def.name}' failed: {result.error}", definition)
 
-    def _build_step_outputs(self, execution: ProcessExecution) -> dict[str, Any]:
+    def _build_step_outputs(self, execution: ProcessExecution) -> Mapping[str, Any]:
         """
-        Build step outputs dictionary for condition evaluation.
+        Build step outputs mapping for condition evaluation and handlers.
 
-        Returns a dict mapping step_id -> output data.
+        Returns a mapping of step_id -> output data, loaded from output
+        storage only when a step output is first looked up.
         """
         if self.output_storage:
-            return self.output_storage.get_all_outputs(execution.id)
+            from ..services import LazyStepOutputs
+            output_storage = self.output_storage
+            return LazyStepOutputs(lambda: output_storage.get_all_outputs(execution.id))
         return {}
 
     async def _complete_execution(
@@ -8,6 +8,7 @@ Reference: IT3 Section 8 (Anti-Corruption Layers)
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import Any, Callable, Optional, Type
 
@@ -63,7 +64,7 @@ class StepContext:
     """
     execution: ProcessExecution
     step_definition: StepDefinition
-    step_outputs: dict[str, Any]  # step_id → output
+    step_outputs: Mapping[str, Any]  # step_id → output (may load lazily)
     input_data: dict[str, Any]  # Process input data
     
     def get_step_output(self, step_id: str) -> Optional[Any]:
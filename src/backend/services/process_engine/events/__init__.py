@@ -5,6 +5,7 @@ Event bus and publishers for the process engine.
 """
 
 from .bus import EventBus, EventHandler, InMemoryEventBus
+from .redis_bus import RedisEventBus, decode_event, encode_event
 from .websocket_publisher import (
     WebSocketEventPublisher,
     get_websocket_publisher,
@@ -20,6 +21,9 @@ __all__ = [
     "EventBus",
     "EventHandler",
     "InMemoryEventBus",
+    "RedisEventBus",
+    "encode_event",
+    "decode_event",
     # WebSocket Publisher
     "WebSocketEventPublisher",
     "get_websocket_publisher",
@@ -2,7 +2,8 @@
 Event Bus Implementation
 
 Provides publish/subscribe infrastructure for domain events.
-MVP uses in-memory implementation; can be extended for Redis/Kafka later.
+InMemoryEventBus serves a single worker; RedisEventBus (redis_bus.py)
+shares events between backend workers.
 
 Reference: IT3 Section 5 (Domain Events)
 """
@@ -35,6 +36,11 @@ class EventBus(ABC):
     - Publishing events (async, non-blocking)
     - Subscribing handlers to specific event types
     - Subscribing handlers to all events
+
+    By default a handler runs once per event, in the worker that published
+    it - right for side effects such as persistence and webhooks. Handlers
+    subscribed with broadcast=True run in every worker (e.g. to notify
+    state held in each worker's memory).
     """
 
     @abstractmethod
@@ -52,20 +58,23 @@ class EventBus(ABC):
         self,
         event_type: Type[T],
         handler: EventHandler,
+        broadcast: bool = False,
     ) -> None:
         """
         Subscribe a handler to a specific event type.
         
-        The handler will be called for all events of this type.
+        The handler will be called for all events of this type; with
+        broadcast=True also for those published by other workers.
         """
         ...
 
     @abstractmethod
-    def subscribe_all(self, handler: EventHandler) -> None:
+    def subscribe_all(self, handler: EventHandler, broadcast: bool = False) -> None:
         """
         Subscribe a handler to all events.
         
-        The handler will be called for every event published.
+        The handler will be called for every event published; with
+        broadcast=True also for those published by other workers.
         """
         ...
 
@@ -102,7 +111,8 @@ class InMemoryEventBus(EventBus):
     Suitable for:
     - MVP/development
     - Testing
-    - Single-instance deployments
+    - Single-instance deployments (every handler sees every event, so
+      `broadcast` makes no difference)
     
     Events are dispatched asynchronously using asyncio.create_task().
     Handlers run concurrently for a single event.
@@ -147,9 +157,13 @@ class InMemoryEventBus(EventBus):
         
         # Dispatch to all handlers concurrently
         for handler in handlers:
-            task = asyncio.create_task(self._safe_dispatch(handler, event))
-            self._pending_tasks.add(task)
-            task.add_done_callback(self._pending_tasks.discard)
+            self._dispatch(handler, event)
+
+    def _dispatch(self, handler: EventHandler, event: DomainEvent) -> None:
+        """Run a handler in its own task, tracked until it finishes."""
+        task = asyncio.create_task(self._safe_dispatch(handler, event))
+        self._pending_tasks.add(task)
+        task.add_done_callback(self._pending_tasks.discard)
 
     async def _safe_dispatch(
         self,
@@ -174,6 +188,7 @@ class InMemoryEventBus(EventBus):
         self,
         event_type: Type[T],
         handler: EventHandler,
+        broadcast: bool = False,
     ) -> None:
         """Subscribe handler to specific event type."""
         if handler not in self._handlers[event_type]:
@@ -182,7 +197,7 @@ class InMemoryEventBus(EventBus):
                 f"Subscribed {handler.__name__} to {event_type.__name__}"
             )
 
-    def subscribe_all(self, handler: EventHandler) -> None:
+    def subscribe_all(self, handler: EventHandler, broadcast: bool = False) -> None:
         """Subscribe handler to all events."""
         if handler not in self._global_handlers:
             self._global_handlers.append(handler)
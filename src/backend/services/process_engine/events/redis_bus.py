@@ -0,0 +1,208 @@
+"""
+Redis-backed Event Bus
+
+Shares domain events between backend workers (EVENT-RELAY-001). Events are
+dispatched locally exactly like InMemoryEventBus. Handlers subscribed
+with broadcast=True receive the events of other workers too, through the
+worker's event relay (services/event_relay.py); all other handlers only
+run in the publishing worker, so persistence and webhooks still happen
+once per event. An event is only relayed when a broadcast handler is
+subscribed to it. Every worker registers the same subscriptions at
+startup, so the local subscriptions tell whether any worker needs it.
+
+Events cross workers as JSON. encode_event/decode_event round-trip the
+domain dataclasses, value objects and enums exactly; only classes from
+the domain package can be decoded.
+"""
+
+from __future__ import annotations
+
+import inspect
+import logging
+from collections import defaultdict
+from dataclasses import fields, is_dataclass
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Protocol, Type
+
+from ..domain import enums as domain_enums
+from ..domain import events as domain_events
+from ..domain import value_objects as domain_value_objects
+from ..domain.events import DomainEvent
+from .bus import EventHandler, InMemoryEventBus, T
+
+
+logger = logging.getLogger(__name__)
+
+PROCESS_EVENTS_TOPIC = "process_events"
+
+
+class EventTransport(Protocol):
+    """The part of services.event_relay.EventRelay the bus needs."""
+
+    def publish(self, topic: str, payload: dict) -> None: ...
+
+    def add_handler(self, topic: str, handler) -> None: ...
+
+
+# =============================================================================
+# Event Serialization
+# =============================================================================
+
+
+def _domain_classes() -> dict[str, type]:
+    classes = {}
+    for module in (domain_events, domain_value_objects, domain_enums):
+        for name, obj in inspect.getmembers(module, inspect.isclass):
+            if obj.__module__ == module.__name__ and (is_dataclass(obj) or issubclass(obj, Enum)):
+                classes[name] = obj
+    return classes
+
+
+_DOMAIN_CLASSES = _domain_classes()
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return {"__enum__": type(value).__name__, "value": value.value}
+    if is_dataclass(value) and not isinstance(value, type):
+        return {
+            "__dataclass__": type(value).__name__,
+            "fields": {f.name: _encode(getattr(value, f.name)) for f in fields(value) if f.init},
+        }
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"__decimal__": str(value)}
+    if isinstance(value, tuple):
+        return {"__tuple__": [_encode(v) for v in value]}
+    if isinstance(value, list):
+        return [_encode(v) for v in value]
+    if isinstance(value, dict):
+        return {key: _encode(v) for key, v in value.items()}
+    return value
+
+
+def _decode(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_decode(v) for v in value]
+    if not isinstance(value, dict):
+        return value
+    if "__dataclass__" in value:
+        cls = _DOMAIN_CLASSES[value["__dataclass__"]]
+        return cls(**{name: _decode(v) for name, v in value["fields"].items()})
+    if "__enum__" in value:
+        return _DOMAIN_CLASSES[value["__enum__"]](value["value"])
+    if "__datetime__" in value:
+        return datetime.fromisoformat(value["__datetime__"])
+    if "__decimal__" in value:
+        return Decimal(value["__decimal__"])
+    if "__tuple__" in value:
+        return tuple(_decode(v) for v in value["__tuple__"])
+    return {key: _decode(v) for key, v in value.items()}
+
+
+def encode_event(event: DomainEvent) -> dict:
+    """Encode a domain event as JSON-serializable data."""
+    return _encode(event)
+
+
+def decode_event(data: dict) -> DomainEvent:
+    """
+    Rebuild a domain event from encode_event() output.
+
+    Raises ValueError for unknown classes or malformed data.
+    """
+    try:
+        event = _decode(data)
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"Cannot decode event: {e}") from e
+    if not isinstance(event, DomainEvent):
+        raise ValueError(f"Not a domain event: {type(event).__name__}")
+    return event
+
+
+# =============================================================================
+# Redis Event Bus
+# =============================================================================
+
+
+class RedisEventBus(InMemoryEventBus):
+    """
+    Event bus shared by all backend workers through the event relay.
+
+    Local dispatch is unchanged from InMemoryEventBus. Events with a
+    broadcast subscriber are also relayed; events from other workers are
+    dispatched to broadcast handlers only. If Redis is unavailable, events still reach every local
+    handler.
+    """
+
+    def __init__(self, transport: EventTransport, topic: str = PROCESS_EVENTS_TOPIC):
+        super().__init__()
+        self._transport = transport
+        self._topic = topic
+        self._broadcast_handlers: dict[Type[DomainEvent], list[EventHandler]] = defaultdict(list)
+        self._global_broadcast_handlers: list[EventHandler] = []
+        transport.add_handler(topic, self._handle_remote)
+
+    async def publish(self, event: DomainEvent) -> None:
+        """Dispatch to local handlers and relay to the other workers."""
+        await super().publish(event)
+        if not self._has_broadcast_handlers(type(event)):
+            return
+        try:
+            self._transport.publish(self._topic, {"event": encode_event(event)})
+        except Exception as e:
+            logger.warning(f"Failed to relay {type(event).__name__}: {e}")
+
+    def _has_broadcast_handlers(self, event_type: Type[DomainEvent]) -> bool:
+        return bool(self._global_broadcast_handlers or self._broadcast_handlers.get(event_type))
+
+    async def _handle_remote(self, payload: dict) -> None:
+        """Dispatch an event published by another worker to broadcast handlers."""
+        try:
+            event = decode_event(payload["event"])
+        except (KeyError, ValueError) as e:
+            logger.warning(f"Ignoring relayed process event: {e}")
+            return
+
+        handlers = list(self._broadcast_handlers.get(type(event), []))
+        handlers.extend(self._global_broadcast_handlers)
+        for handler in handlers:
+            self._dispatch(handler, event)
+
+    def subscribe(
+        self,
+        event_type: Type[T],
+        handler: EventHandler,
+        broadcast: bool = False,
+    ) -> None:
+        """Subscribe handler to specific event type."""
+        super().subscribe(event_type, handler)
+        if broadcast and handler not in self._broadcast_handlers[event_type]:
+            self._broadcast_handlers[event_type].append(handler)
+
+    def subscribe_all(self, handler: EventHandler, broadcast: bool = False) -> None:
+        """Subscribe handler to all events."""
+        super().subscribe_all(handler)
+        if broadcast and handler not in self._global_broadcast_handlers:
+            self._global_broadcast_handlers.append(handler)
+
+    def unsubscribe(self, event_type: Type[T], handler: EventHandler) -> None:
+        """Unsubscribe handler from specific event type."""
+        super().unsubscribe(event_type, handler)
+        if handler in self._broadcast_handlers[event_type]:
+            self._broadcast_handlers[event_type].remove(handler)
+
+    def unsubscribe_all(self, handler: EventHandler) -> None:
+        """Unsubscribe handler from all events."""
+        super().unsubscribe_all(handler)
+        if handler in self._global_broadcast_handlers:
+            self._global_broadcast_handlers.remove(handler)
+
+    def clear(self) -> None:
+        """Clear all subscriptions."""
+        super().clear()
+        self._broadcast_handlers.clear()
+        self._global_broadcast_handlers.clear()
@@ -4,7 +4,12 @@ Process Engine Repositories
 Repository interfaces and implementations for process definitions and executions.
 """
 
-from .interfaces import ProcessDefinitionRepository, ProcessExecutionRepository, EventRepository
+from .interfaces import (
+    ProcessDefinitionRepository,
+    ProcessExecutionRepository,
+    ProcessAnalyticsRepository,
+    EventRepository,
+)
 from .sqlite_definitions import SqliteProcessDefinitionRepository
 from .sqlite_executions import SqliteProcessExecutionRepository
 from .sqlite_events import SqliteEventRepository
@@ -13,6 +18,7 @@ from .audit import SqliteAuditRepository
 __all__ = [
     "ProcessDefinitionRepository",
     "ProcessExecutionRepository",
+    "ProcessAnalyticsRepository",
     "EventRepository",
     "SqliteProcessDefinitionRepository",
     "SqliteProcessExecutionRepository",
@@ -7,6 +7,7 @@ Reference: IT3 Section 7 (Repositories)
 """
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Optional
 
 from ..domain import (
@@ -210,6 +211,55 @@ class ProcessExecutionRepository(ABC):
         ...
 
 
+class ProcessAnalyticsRepository(ABC):
+    """
+    Repository interface for aggregated execution statistics.
+    
+    Implemented by execution repositories that can aggregate in storage
+    instead of returning full executions. Every method covers executions
+    that started at or after `since`; costs are in cents and durations
+    in seconds.
+    """
+
+    @abstractmethod
+    def aggregate_process_stats(
+        self,
+        since: datetime,
+        process_id: Optional[ProcessId] = None,
+    ) -> dict[str, dict]:
+        """
+        Aggregate executions per process.
+        
+        Returns process_id -> {execution_count, completed_count, failed_count,
+        running_count, duration_count, duration_total, duration_min,
+        duration_max, cost_count, cost_total, cost_min, cost_max}.
+        """
+        ...
+
+    @abstractmethod
+    def aggregate_daily_stats(
+        self,
+        since: datetime,
+        process_id: Optional[ProcessId] = None,
+    ) -> dict[str, dict]:
+        """
+        Aggregate executions per start day (YYYY-MM-DD).
+        
+        Returns day -> {execution_count, completed_count, failed_count, cost_total}.
+        """
+        ...
+
+    @abstractmethod
+    def aggregate_step_stats(self, since: datetime) -> list[dict]:
+        """
+        Aggregate step executions per process name and step ID.
+        
+        Returns [{process_name, step_id, execution_count, failed_count,
+        duration_count, duration_total, cost_count, cost_total}].
+        """
+        ...
+
+
 class EventRepository(ABC):
     """
     Repository interface for domain events.
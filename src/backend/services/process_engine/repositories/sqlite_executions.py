@@ -10,7 +10,9 @@ Reference: BACKLOG_MVP.md - E2-02
 
 import json
 import sqlite3
-from datetime import datetime, timezone
+import threading
+import weakref
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Optional
 
@@ -25,7 +27,101 @@ from ..domain import (
     Version,
     Money,
 )
-from .interfaces import ProcessExecutionRepository
+from .interfaces import ProcessAnalyticsRepository, ProcessExecutionRepository
+
+
+# Executions in these states no longer change and are kept in the daily rollups
+_ROLLUP_STATUSES = (
+    ExecutionStatus.COMPLETED.value,
+    ExecutionStatus.FAILED.value,
+    ExecutionStatus.CANCELLED.value,
+)
+
+# Whole seconds, matching ProcessExecution.duration (rounded to the millisecond
+# first so float error in julianday() does not truncate 5.0s to 4s)
+_EXECUTION_DURATION = (
+    "CAST(ROUND((julianday(e.completed_at) - julianday(e.started_at)) * 86400.0, 3) AS INTEGER)"
+)
+_STEP_DURATION = (
+    "ROUND((julianday(s.completed_at) - julianday(s.started_at)) * 86400.0, 3)"
+)
+
+# Aggregates over process_executions e, in process_execution_daily column order
+_EXECUTION_AGGREGATES = f"""
+    COUNT(*),
+    SUM(e.status = 'completed'),
+    SUM(e.status = 'failed'),
+    SUM(e.completed_at IS NOT NULL),
+    COALESCE(SUM({_EXECUTION_DURATION}), 0),
+    MIN({_EXECUTION_DURATION}),
+    MAX({_EXECUTION_DURATION}),
+    SUM(e.total_cost_amount > 0),
+    COALESCE(SUM(CASE WHEN e.total_cost_amount > 0 THEN e.total_cost_amount END), 0),
+    MIN(CASE WHEN e.total_cost_amount > 0 THEN e.total_cost_amount END),
+    MAX(CASE WHEN e.total_cost_amount > 0 THEN e.total_cost_amount END)
+"""
+
+# Aggregates over step_executions s, in step_execution_daily column order
+_STEP_AGGREGATES = f"""
+    COUNT(*),
+    SUM(s.status = 'failed'),
+    SUM(s.started_at IS NOT NULL AND s.completed_at IS NOT NULL),
+    COALESCE(SUM({_STEP_DURATION}), 0),
+    SUM(s.cost_amount > 0),
+    COALESCE(SUM(CASE WHEN s.cost_amount > 0 THEN s.cost_amount END), 0)
+"""
+
+# Adds the matching executions to the rollups; {where} filters process_executions e
+_EXECUTION_ROLLUP_UPSERT = f"""
+    INSERT INTO process_execution_daily (
+        day, process_id,
+        execution_count, completed_count, failed_count,
+        duration_count, duration_total, duration_min, duration_max,
+        cost_count, cost_total, cost_min, cost_max
+    )
+    SELECT substr(e.started_at, 1, 10), e.process_id, {_EXECUTION_AGGREGATES}
+    FROM process_executions e
+    WHERE {{where}}
+    GROUP BY 1, 2
+    ON CONFLICT (day, process_id) DO UPDATE SET
+        execution_count = execution_count + excluded.execution_count,
+        completed_count = completed_count + excluded.completed_count,
+        failed_count = failed_count + excluded.failed_count,
+        duration_count = duration_count + excluded.duration_count,
+        duration_total = duration_total + excluded.duration_total,
+        duration_min = MIN(COALESCE(duration_min, excluded.duration_min),
+                           COALESCE(excluded.duration_min, duration_min)),
+        duration_max = MAX(COALESCE(duration_max, excluded.duration_max),
+                           COALESCE(excluded.duration_max, duration_max)),
+        cost_count = cost_count + excluded.cost_count,
+        cost_total = cost_total + excluded.cost_total,
+        cost_min = MIN(COALESCE(cost_min, excluded.cost_min),
+                       COALESCE(excluded.cost_min, cost_min)),
+        cost_max = MAX(COALESCE(cost_max, excluded.cost_max),
+                       COALESCE(excluded.cost_max, cost_max))
+"""
+
+_STEP_ROLLUP_UPSERT = f"""
+    INSERT INTO step_execution_daily (
+        day, process_id, process_name, step_id,
+        execution_count, failed_count,
+        duration_count, duration_total,
+        cost_count, cost_total
+    )
+    SELECT substr(e.started_at, 1, 10), e.process_id, e.process_name, s.step_id,
+        {_STEP_AGGREGATES}
+    FROM process_executions e
+    JOIN step_executions s ON s.execution_id = e.id
+    WHERE {{where}}
+    GROUP BY 1, 2, 3, 4
+    ON CONFLICT (day, process_id, process_name, step_id) DO UPDATE SET
+        execution_count = execution_count + excluded.execution_count,
+        failed_count = failed_count + excluded.failed_count,
+        duration_count = duration_count + excluded.duration_count,
+        duration_total = duration_total + excluded.duration_total,
+        cost_count = cost_count + excluded.cost_count,
+        cost_total = cost_total + excluded.cost_total
+"""
 
 
 def _utcnow() -> datetime:
@@ -33,7 +129,24 @@ def _utcnow() -> datetime:
     return datetime.now(timezone.utc)
 
 
-class SqliteProcessExecutionRepository(ProcessExecutionRepository):
+def _window(since: datetime) -> tuple[str, str]:
+    """
+    Split an analytics window at the first day boundary after `since`.
+    
+    Returns the ISO cutoff and the following day (YYYY-MM-DD). Whole days
+    from the boundary on are read from the rollups; the partial first day
+    is aggregated from the execution rows.
+    """
+    since = since.astimezone(timezone.utc)
+    return since.isoformat(), (since.date() + timedelta(days=1)).isoformat()
+
+
+def _next_day(day: str) -> str:
+    """The day after a YYYY-MM-DD day."""
+    return (datetime.strptime(day, "%Y-%m-%d").date() + timedelta(days=1)).isoformat()
+
+
+class SqliteProcessExecutionRepository(ProcessExecutionRepository, ProcessAnalyticsRepository):
     """
     SQLite implementation of ProcessExecutionRepository.
     
@@ -41,6 +154,16 @@ class SqliteProcessExecutionRepository(ProcessExecutionRepository):
     - process_executions: Main execution record
     - step_executions: Per-step state (could be denormalized in main record,
                        but keeping separate for query flexibility)
+    
+    Saves are deltas: the repository remembers the revision at which it last
+    wrote (or loaded) each execution object and only writes the root row and
+    the step rows that changed since, in one transaction. Connections are
+    reused (one per thread) instead of opened per call.
+    
+    Finished executions are also counted into per-day rollup tables
+    (process_execution_daily, step_execution_daily) in the same transaction,
+    so analytics read one row per process and day instead of every execution.
+    The rolled_up flag marks the executions already counted there.
     """
     
     def __init__(self, db_path: str | Path):
@@ -53,142 +176,316 @@ class SqliteProcessExecutionRepository(ProcessExecutionRepository):
         self.db_path = str(db_path)
         self._is_memory = self.db_path == ":memory:"
         self._memory_conn: Optional[sqlite3.Connection] = None
+        self._local = threading.local()
+        # execution_id -> (weakref to the in-memory execution, persisted revision)
+        self._persisted: dict[str, tuple[weakref.ref, int]] = {}
         self._init_schema()
     
     def _get_connection(self) -> sqlite3.Connection:
-        """Get database connection."""
+        """Get the reused database connection for the current thread."""
         if self._is_memory:
             if self._memory_conn is None:
                 self._memory_conn = sqlite3.connect(":memory:", check_same_thread=False)
                 self._memory_conn.row_factory = sqlite3.Row
             return self._memory_conn
-        else:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
             conn = sqlite3.connect(self.db_path)
             conn.row_factory = sqlite3.Row
-            return conn
+            self._local.conn = conn
+        return conn
+    
+    def _persisted_revision(self, execution: ProcessExecution) -> Optional[int]:
+        """Revision this repository last persisted for this execution object."""
+        entry = self._persisted.get(str(execution.id))
+        if entry is None or entry[0]() is not execution:
+            return None
+        return entry[1]
+    
+    def _mark_persisted(self, execution: ProcessExecution, revision: int) -> None:
+        """Remember that the execution is persisted up to the given revision."""
+        execution_id = str(execution.id)
+        
+        def forget(ref: weakref.ref) -> None:
+            entry = self._persisted.get(execution_id)
+            if entry is not None and entry[0] is ref:
+                del self._persisted[execution_id]
+        
+        self._persisted[execution_id] = (weakref.ref(execution, forget), revision)
     
     def _init_schema(self) -> None:
         """Initialize database schema."""
         conn = self._get_connection()
-        try:
-            conn.executescript("""
-                CREATE TABLE IF NOT EXISTS process_executions (
-                    id TEXT PRIMARY KEY,
-                    process_id TEXT NOT NULL,
-                    process_version TEXT NOT NULL,
-                    process_name TEXT NOT NULL,
-                    status TEXT NOT NULL,
-                    triggered_by TEXT DEFAULT 'manual',
-                    input_data TEXT DEFAULT '{}',
-                    output_data TEXT DEFAULT '{}',
-                    total_cost_amount INTEGER DEFAULT 0,
-                    total_cost_currency TEXT DEFAULT 'USD',
-                    started_at TEXT,
-                    completed_at TEXT,
-                    created_at TEXT NOT NULL,
-                    updated_at TEXT NOT NULL
-                );
-                
-                CREATE INDEX IF NOT EXISTS idx_exec_process_id 
-                    ON process_executions(process_id);
-                CREATE INDEX IF NOT EXISTS idx_exec_status 
-                    ON process_executions(status);
-                CREATE INDEX IF NOT EXISTS idx_exec_started_at 
-                    ON process_executions(started_at);
-                    
-                CREATE TABLE IF NOT EXISTS step_executions (
-                    execution_id TEXT NOT NULL,
-                    step_id TEXT NOT NULL,
-                    status TEXT NOT NULL,
-                    input_data TEXT DEFAULT '{}',
-                    output_data TEXT DEFAULT '{}',
-                    error_data TEXT DEFAULT '{}',
-                    cost_amount INTEGER DEFAULT 0,
-                    cost_currency TEXT DEFAULT 'USD',
-                    started_at TEXT,
-                    completed_at TEXT,
-                    retry_count INTEGER DEFAULT 0,
-                    PRIMARY KEY (execution_id, step_id),
-                    FOREIGN KEY (execution_id) REFERENCES process_executions(id)
-                        ON DELETE CASCADE
-                );
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS process_executions (
+                id TEXT PRIMARY KEY,
+                process_id TEXT NOT NULL,
+                process_version TEXT NOT NULL,
+                process_name TEXT NOT NULL,
+                status TEXT NOT NULL,
+                triggered_by TEXT DEFAULT 'manual',
+                input_data TEXT DEFAULT '{}',
+                output_data TEXT DEFAULT '{}',
+                total_cost_amount INTEGER DEFAULT 0,
+                total_cost_currency TEXT DEFAULT 'USD',
+                started_at TEXT,
+                completed_at TEXT,
+                created_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL,
+                rolled_up INTEGER NOT NULL DEFAULT 0
+            );
+            
+            CREATE INDEX IF NOT EXISTS idx_exec_process_id 
+                ON process_executions(process_id);
+            CREATE INDEX IF NOT EXISTS idx_exec_status 
+                ON process_executions(status);
+            CREATE INDEX IF NOT EXISTS idx_exec_started_at 
+                ON process_executions(started_at);
                 
-                CREATE INDEX IF NOT EXISTS idx_step_exec_status 
-                    ON step_executions(status);
+            CREATE TABLE IF NOT EXISTS step_executions (
+                execution_id TEXT NOT NULL,
+                step_id TEXT NOT NULL,
+                status TEXT NOT NULL,
+                input_data TEXT DEFAULT '{}',
+                output_data TEXT DEFAULT '{}',
+                error_data TEXT DEFAULT '{}',
+                cost_amount INTEGER DEFAULT 0,
+                cost_currency TEXT DEFAULT 'USD',
+                started_at TEXT,
+                completed_at TEXT,
+                retry_count INTEGER DEFAULT 0,
+                PRIMARY KEY (execution_id, step_id),
+                FOREIGN KEY (execution_id) REFERENCES process_executions(id)
+                    ON DELETE CASCADE
+            );
+            
+            CREATE INDEX IF NOT EXISTS idx_step_exec_status 
+                ON step_executions(status);
+            
+            CREATE TABLE IF NOT EXISTS process_execution_daily (
+                day TEXT NOT NULL,
+                process_id TEXT NOT NULL,
+                execution_count INTEGER NOT NULL DEFAULT 0,
+                completed_count INTEGER NOT NULL DEFAULT 0,
+                failed_count INTEGER NOT NULL DEFAULT 0,
+                duration_count INTEGER NOT NULL DEFAULT 0,
+                duration_total INTEGER NOT NULL DEFAULT 0,
+                duration_min INTEGER,
+                duration_max INTEGER,
+                cost_count INTEGER NOT NULL DEFAULT 0,
+                cost_total INTEGER NOT NULL DEFAULT 0,
+                cost_min INTEGER,
+                cost_max INTEGER,
+                PRIMARY KEY (day, process_id)
+            );
+            
+            CREATE TABLE IF NOT EXISTS step_execution_daily (
+                day TEXT NOT NULL,
+                process_id TEXT NOT NULL,
+                process_name TEXT NOT NULL,
+                step_id TEXT NOT NULL,
+                execution_count INTEGER NOT NULL DEFAULT 0,
+                failed_count INTEGER NOT NULL DEFAULT 0,
+                duration_count INTEGER NOT NULL DEFAULT 0,
+                duration_total REAL NOT NULL DEFAULT 0,
+                cost_count INTEGER NOT NULL DEFAULT 0,
+                cost_total INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (day, process_id, process_name, step_id)
+            );
+        """)
+        conn.commit()
+        
+        columns = {row["name"] for row in conn.execute("PRAGMA table_info(process_executions)")}
+        with conn:
+            if "rolled_up" not in columns:
+                # Database from before the rollups: count its finished executions
+                conn.execute(
+                    "ALTER TABLE process_executions ADD COLUMN rolled_up INTEGER NOT NULL DEFAULT 0"
+                )
+                conn.execute(f"""
+                    UPDATE process_executions SET rolled_up = 1
+                    WHERE status IN ({", ".join("?" * len(_ROLLUP_STATUSES))})
+                      AND started_at IS NOT NULL
+                """, _ROLLUP_STATUSES)
+                conn.execute(_EXECUTION_ROLLUP_UPSERT.format(where="e.rolled_up = 1"))
+                conn.execute(_STEP_ROLLUP_UPSERT.format(where="e.rolled_up = 1"))
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_exec_process_started
+                    ON process_executions(process_id, started_at)
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_exec_not_rolled_up
+                    ON process_executions(started_at) WHERE rolled_up = 0
             """)
-            conn.commit()
-        finally:
-            if not self._is_memory:
-                conn.close()
     
     # =========================================================================
     # Repository Interface Implementation
     # =========================================================================
     
     def save(self, execution: ProcessExecution) -> None:
-        """Save or update an execution."""
+        """
+        Save or update an execution.
+        
+        Writes the main row if it changed and only the step executions
+        modified since this object was last saved or loaded. Objects this
+        repository has not seen before are written in full.
+        """
+        # Taken before collecting changes: anything modified concurrently
+        # gets a newer revision and is written by the next save
+        revision = ProcessExecution.current_revision()
+        since = self._persisted_revision(execution)
+        
+        if since is None:
+            write_root = True
+            step_execs = list(execution.step_executions.values())
+        else:
+            write_root = execution.revision > since
+            step_execs = execution.get_step_executions_changed_since(since)
+        
+        if not write_root and not step_execs:
+            return
+        
+        execution_id = str(execution.id)
+        now = _utcnow().isoformat()
         conn = self._get_connection()
-        try:
-            now = _utcnow().isoformat()
-            
-            # Upsert main execution record
-            # Store amount as cents (multiply by 100)
-            cost_cents = int(execution.total_cost.amount * 100)
+        with conn:
+            previous = conn.execute("""
+                SELECT process_id, process_name, status, started_at, completed_at,
+                       total_cost_amount, rolled_up
+                FROM process_executions WHERE id = ?
+            """, (execution_id,)).fetchone()
+            was_rolled_up = bool(previous and previous["rolled_up"])
             
-            conn.execute("""
-                INSERT OR REPLACE INTO process_executions (
-                    id, process_id, process_version, process_name,
-                    status, triggered_by, input_data, output_data,
-                    total_cost_amount, total_cost_currency,
-                    started_at, completed_at, created_at, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 
-                    COALESCE((SELECT created_at FROM process_executions WHERE id = ?), ?),
-                    ?)
-            """, (
-                str(execution.id),
-                str(execution.process_id),
-                str(execution.process_version),
-                execution.process_name,
-                execution.status.value,
-                execution.triggered_by,
-                json.dumps(execution.input_data),
-                json.dumps(execution.output_data),
-                cost_cents,  # Store as cents
-                execution.total_cost.currency,
-                execution.started_at.isoformat() if execution.started_at else None,
-                execution.completed_at.isoformat() if execution.completed_at else None,
-                str(execution.id),  # For COALESCE
-                now,  # created_at if new
-                now,  # updated_at
-            ))
-            
-            # Save step executions
-            for step_id, step_exec in execution.step_executions.items():
-                self._save_step_execution(conn, str(execution.id), step_exec)
+            if write_root:
+                rolled_up = (
+                    execution.status.value in _ROLLUP_STATUSES
+                    and execution.started_at is not None
+                )
+                self._save_execution_row(conn, execution, now, rolled_up)
+            else:
+                conn.execute(
+                    "UPDATE process_executions SET updated_at = ? WHERE id = ?",
+                    (now, execution_id),
+                )
+            conn.executemany("""
+                INSERT OR REPLACE INTO step_executions (
+                    execution_id, step_id, status,
+                    input_data, output_data, error_data,
+                    cost_amount, cost_currency,
+                    started_at, completed_at, retry_count
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, [self._step_execution_row(execution_id, step_exec) for step_exec in step_execs])
             
-            conn.commit()
-        finally:
-            if not self._is_memory:
-                conn.close()
+            if write_root:
+                self._maintain_rollups(conn, execution, previous, was_rolled_up, rolled_up, bool(step_execs))
+            elif was_rolled_up and step_execs:
+                self._rebuild_rollups(conn, previous["process_id"], previous["started_at"])
+        
+        self._mark_persisted(execution, revision)
     
-    def _save_step_execution(
+    def _save_execution_row(
         self,
         conn: sqlite3.Connection,
-        execution_id: str,
-        step_exec: StepExecution,
+        execution: ProcessExecution,
+        now: str,
+        rolled_up: bool,
     ) -> None:
-        """Save a single step execution."""
-        # Store cost as cents
-        cost_cents = int(step_exec.cost.amount * 100) if step_exec.cost else 0
+        """Upsert the main execution record."""
+        # Store amount as cents (multiply by 100)
+        cost_cents = int(execution.total_cost.amount * 100)
         
         conn.execute("""
-            INSERT OR REPLACE INTO step_executions (
-                execution_id, step_id, status,
-                input_data, output_data, error_data,
-                cost_amount, cost_currency,
-                started_at, completed_at, retry_count
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            INSERT OR REPLACE INTO process_executions (
+                id, process_id, process_version, process_name,
+                status, triggered_by, input_data, output_data,
+                total_cost_amount, total_cost_currency,
+                started_at, completed_at, created_at, updated_at, rolled_up
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 
+                COALESCE((SELECT created_at FROM process_executions WHERE id = ?), ?),
+                ?, ?)
         """, (
+            str(execution.id),
+            str(execution.process_id),
+            str(execution.process_version),
+            execution.process_name,
+            execution.status.value,
+            execution.triggered_by,
+            json.dumps(execution.input_data),
+            json.dumps(execution.output_data),
+            cost_cents,  # Store as cents
+            execution.total_cost.currency,
+            execution.started_at.isoformat() if execution.started_at else None,
+            execution.completed_at.isoformat() if execution.completed_at else None,
+            str(execution.id),  # For COALESCE
+            now,  # created_at if new
+            now,  # updated_at
+            int(rolled_up),
+        ))
+    
+    def _maintain_rollups(
+        self,
+        conn: sqlite3.Connection,
+        execution: ProcessExecution,
+        previous: Optional[sqlite3.Row],
+        was_rolled_up: bool,
+        rolled_up: bool,
+        steps_changed: bool,
+    ) -> None:
+        """
+        Keep the daily rollups in line with a rewritten execution row.
+        
+        A newly finished execution is added to its day's rollups. Changing
+        an execution that is already counted (a reopened or corrected one)
+        recounts the affected days from the execution rows.
+        """
+        execution_id = str(execution.id)
+        if rolled_up and not was_rolled_up:
+            conn.execute(_EXECUTION_ROLLUP_UPSERT.format(where="e.id = ?"), (execution_id,))
+            conn.execute(_STEP_ROLLUP_UPSERT.format(where="e.id = ?"), (execution_id,))
+            return
+        if not was_rolled_up:
+            return
+        
+        started_at = execution.started_at.isoformat() if execution.started_at else None
+        current = (
+            str(execution.process_id),
+            execution.process_name,
+            execution.status.value,
+            started_at,
+            execution.completed_at.isoformat() if execution.completed_at else None,
+            int(execution.total_cost.amount * 100),
+        )
+        if rolled_up and not steps_changed and current == tuple(previous)[:6]:
+            return
+        
+        self._rebuild_rollups(conn, previous["process_id"], previous["started_at"])
+        if rolled_up and (current[0], started_at[:10]) != (
+            previous["process_id"], previous["started_at"][:10]
+        ):
+            self._rebuild_rollups(conn, current[0], started_at)
+    
+    def _rebuild_rollups(self, conn: sqlite3.Connection, process_id: str, started_at: str) -> None:
+        """Recount one process's rollups for the day `started_at` falls on."""
+        day = started_at[:10]
+        params = (process_id, day, _next_day(day))
+        where = "e.process_id = ? AND e.started_at >= ? AND e.started_at < ? AND e.rolled_up = 1"
+        conn.execute(
+            "DELETE FROM process_execution_daily WHERE process_id = ? AND day = ?",
+            (process_id, day),
+        )
+        conn.execute(
+            "DELETE FROM step_execution_daily WHERE process_id = ? AND day = ?",
+            (process_id, day),
+        )
+        conn.execute(_EXECUTION_ROLLUP_UPSERT.format(where=where), params)
+        conn.execute(_STEP_ROLLUP_UPSERT.format(where=where), params)
+    
+    def _step_execution_row(self, execution_id: str, step_exec: StepExecution) -> tuple:
+        """Build the step_executions row for a single step execution."""
+        # Store cost as cents
+        cost_cents = int(step_exec.cost.amount * 100) if step_exec.cost else 0
+        
+        return (
             execution_id,
             str(step_exec.step_id),
             step_exec.status.value,
@@ -200,31 +497,27 @@ class SqliteProcessExecutionRepository(ProcessExecutionRepository):
             step_exec.started_at.isoformat() if step_exec.started_at else None,
             step_exec.completed_at.isoformat() if step_exec.completed_at else None,
             step_exec.retry_count,
-        ))
+        )
     
     def get_by_id(self, id: ExecutionId) -> Optional[ProcessExecution]:
         """Get execution by ID."""
         conn = self._get_connection()
-        try:
-            cursor = conn.execute(
-                "SELECT * FROM process_executions WHERE id = ?",
-                (str(id),)
-            )
-            row = cursor.fetchone()
-            if row is None:
-                return None
-            
-            # Get step executions
-            step_cursor = conn.execute(
-                "SELECT * FROM step_executions WHERE execution_id = ?",
-                (str(id),)
-            )
-            step_rows = step_cursor.fetchall()
-            
-            return self._deserialize(row, step_rows)
-        finally:
-            if not self._is_memory:
-                conn.close()
+        cursor = conn.execute(
+            "SELECT * FROM process_executions WHERE id = ?",
+            (str(id),)
+        )
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        
+        # Get step executions
+        step_cursor = conn.execute(
+            "SELECT * FROM step_executions WHERE execution_id = ?",
+            (str(id),)
+        )
+        step_rows = step_cursor.fetchall()
+        
+        return self._deserialize(row, step_rows)
     
     def update(self, execution: ProcessExecution) -> None:
         """Update an existing execution."""
@@ -234,7 +527,11 @@ class SqliteProcessExecutionRepository(ProcessExecutionRepository):
     def delete(self, id: ExecutionId) -> bool:
         """Delete an execution."""
         conn = self._get_connection()
-        try:
+        with conn:
+            previous = conn.execute(
+                "SELECT process_id, started_at, rolled_up FROM process_executions WHERE id = ?",
+                (str(id),)
+            ).fetchone()
             # Delete step executions first (cascade should handle this, but be explicit)
             conn.execute(
                 "DELETE FROM step_executions WHERE execution_id = ?",
@@ -244,11 +541,10 @@ class SqliteProcessExecutionRepository(ProcessExecutionRepository):
                 "DELETE FROM process_executions WHERE id = ?",
                 (str(id),)
             )
-            conn.commit()
-            return cursor.rowcount > 0
-        finally:
-            if not self._is_memory:
-                conn.close()
+            if previous is not None and previous["rolled_up"]:
+                self._rebuild_rollups(conn, previous["process_id"], previous["started_at"])
+        self._persisted.pop(str(id), None)
+        return cursor.rowcount > 0
     
     def list_by_process(
         self,
@@ -258,54 +554,46 @@ class SqliteProcessExecutionRepository(ProcessExecutionRepository):
     ) -> list[ProcessExecution]:
         """List executions for a specific process."""
         conn = self._get_connection()
-        try:
-            cursor = conn.execute("""
-                SELECT * FROM process_executions 
-                WHERE process_id = ?
-                ORDER BY created_at DESC
-                LIMIT ? OFFSET ?
-            """, (str(process_id), limit, offset))
-            
-            results = []
-            for row in cursor.fetchall():
-                step_cursor = conn.execute(
-                    "SELECT * FROM step_executions WHERE execution_id = ?",
-                    (row["id"],)
-                )
-                results.append(self._deserialize(row, step_cursor.fetchall()))
-            
-            return results
-        finally:
-            if not self._is_memory:
-                conn.close()
+        cursor = conn.execute("""
+            SELECT * FROM process_executions 
+            WHERE process_id = ?
+            ORDER BY created_at DESC
+            LIMIT ? OFFSET ?
+        """, (str(process_id), limit, offset))
+        
+        results = []
+        for row in cursor.fetchall():
+            step_cursor = conn.execute(
+                "SELECT * FROM step_executions WHERE execution_id = ?",
+                (row["id"],)
+            )
+            results.append(self._deserialize(row, step_cursor.fetchall()))
+        
+        return results
     
     def list_active(self) -> list[ProcessExecution]:
         """List all active (running/pending/paused) executions."""
         conn = self._get_connection()
-        try:
-            active_statuses = (
-                ExecutionStatus.PENDING.value,
-                ExecutionStatus.RUNNING.value,
-                ExecutionStatus.PAUSED.value,
+        active_statuses = (
+            ExecutionStatus.PENDING.value,
+            ExecutionStatus.RUNNING.value,
+            ExecutionStatus.PAUSED.value,
+        )
+        cursor = conn.execute("""
+            SELECT * FROM process_executions 
+            WHERE status IN (?, ?, ?)
+            ORDER BY started_at ASC
+        """, active_statuses)
+        
+        results = []
+        for row in cursor.fetchall():
+            step_cursor = conn.execute(
+                "SELECT * FROM step_executions WHERE execution_id = ?",
+                (row["id"],)
             )
-            cursor = conn.execute("""
-                SELECT * FROM process_executions 
-                WHERE status IN (?, ?, ?)
-                ORDER BY started_at ASC
-            """, active_statuses)
-            
-            results = []
-            for row in cursor.fetchall():
-                step_cursor = conn.execute(
-                    "SELECT * FROM step_executions WHERE execution_id = ?",
-                    (row["id"],)
-                )
-                results.append(self._deserialize(row, step_cursor.fetchall()))
-            
-            return results
-        finally:
-            if not self._is_memory:
-                conn.close()
+            results.append(self._deserialize(row, step_cursor.fetchall()))
+        
+        return results
     
     def list_all(
         self,
@@ -315,62 +603,203 @@ class SqliteProcessExecutionRepository(ProcessExecutionRepository):
     ) -> list[ProcessExecution]:
         """List all executions with optional filtering."""
         conn = self._get_connection()
-        try:
-            if status:
-                cursor = conn.execute("""
-                    SELECT * FROM process_executions 
-                    WHERE status = ?
-                    ORDER BY created_at DESC
-                    LIMIT ? OFFSET ?
-                """, (status.value, limit, offset))
-            else:
-                cursor = conn.execute("""
-                    SELECT * FROM process_executions 
-                    ORDER BY created_at DESC
-                    LIMIT ? OFFSET ?
-                """, (limit, offset))
-            
-            results = []
-            for row in cursor.fetchall():
-                step_cursor = conn.execute(
-                    "SELECT * FROM step_executions WHERE execution_id = ?",
-                    (row["id"],)
-                )
-                results.append(self._deserialize(row, step_cursor.fetchall()))
-            
-            return results
-        finally:
-            if not self._is_memory:
-                conn.close()
+        if status:
+            cursor = conn.execute("""
+                SELECT * FROM process_executions 
+                WHERE status = ?
+                ORDER BY created_at DESC
+                LIMIT ? OFFSET ?
+            """, (status.value, limit, offset))
+        else:
+            cursor = conn.execute("""
+                SELECT * FROM process_executions 
+                ORDER BY created_at DESC
+                LIMIT ? OFFSET ?
+            """, (limit, offset))
+        
+        results = []
+        for row in cursor.fetchall():
+            step_cursor = conn.execute(
+                "SELECT * FROM step_executions WHERE execution_id = ?",
+                (row["id"],)
+            )
+            results.append(self._deserialize(row, step_cursor.fetchall()))
+        
+        return results
     
     def count(self, status: Optional[ExecutionStatus] = None) -> int:
         """Count executions with optional status filter."""
         conn = self._get_connection()
-        try:
-            if status:
-                cursor = conn.execute(
-                    "SELECT COUNT(*) FROM process_executions WHERE status = ?",
-                    (status.value,)
-                )
-            else:
-                cursor = conn.execute("SELECT COUNT(*) FROM process_executions")
-            return cursor.fetchone()[0]
-        finally:
-            if not self._is_memory:
-                conn.close()
+        if status:
+            cursor = conn.execute(
+                "SELECT COUNT(*) FROM process_executions WHERE status = ?",
+                (status.value,)
+            )
+        else:
+            cursor = conn.execute("SELECT COUNT(*) FROM process_executions")
+        return cursor.fetchone()[0]
     
     def exists(self, id: ExecutionId) -> bool:
         """Check if an execution exists."""
         conn = self._get_connection()
-        try:
-            cursor = conn.execute(
-                "SELECT 1 FROM process_executions WHERE id = ?",
-                (str(id),)
-            )
-            return cursor.fetchone() is not None
-        finally:
-            if not self._is_memory:
-                conn.close()
+        cursor = conn.execute(
+            "SELECT 1 FROM process_executions WHERE id = ?",
+            (str(id),)
+        )
+        return cursor.fetchone() is not None
+    
+    # =========================================================================
+    # Analytics Aggregation
+    # =========================================================================
+    
+    def _aggregate_sources(
+        self,
+        since: datetime,
+        rollup_select: str,
+        execution_select: str,
+        group_by: str,
+        process_id: Optional[ProcessId] = None,
+    ) -> tuple[str, list]:
+        """
+        Build the three disjoint parts of an analytics window.
+        
+        - rollup rows (alias r) for the whole days after the cutoff day
+        - execution rows (alias e) started on the cutoff day after the cutoff
+        - execution rows not yet rolled up (unfinished) after the cutoff day
+        
+        Returns the UNION ALL of the parts and its parameters.
+        """
+        cutoff, next_day = _window(since)
+        rollup_filter = execution_filter = ""
+        filter_params = []
+        if process_id is not None:
+            rollup_filter = " AND r.process_id = ?"
+            execution_filter = " AND e.process_id = ?"
+            filter_params = [str(process_id)]
+        sql = f"""
+            {rollup_select} WHERE r.day >= ?{rollup_filter}
+            UNION ALL
+            {execution_select} WHERE e.started_at >= ? AND e.started_at < ?{execution_filter}
+                GROUP BY {group_by}
+            UNION ALL
+            {execution_select} WHERE e.rolled_up = 0 AND e.started_at >= ?{execution_filter}
+                GROUP BY {group_by}
+        """
+        params = (
+            [next_day, *filter_params]
+            + [cutoff, next_day, *filter_params]
+            + [next_day, *filter_params]
+        )
+        return sql, params
+    
+    def aggregate_process_stats(
+        self,
+        since: datetime,
+        process_id: Optional[ProcessId] = None,
+    ) -> dict[str, dict]:
+        """Aggregate executions started since `since` per process."""
+        sources, params = self._aggregate_sources(
+            since,
+            rollup_select="""
+                SELECT r.process_id, r.execution_count, r.completed_count, r.failed_count,
+                       r.duration_count, r.duration_total, r.duration_min, r.duration_max,
+                       r.cost_count, r.cost_total, r.cost_min, r.cost_max,
+                       0 AS running_count
+                FROM process_execution_daily r
+            """,
+            execution_select=f"""
+                SELECT e.process_id, {_EXECUTION_AGGREGATES},
+                       SUM(e.status = 'running')
+                FROM process_executions e
+            """,
+            group_by="e.process_id",
+            process_id=process_id,
+        )
+        conn = self._get_connection()
+        cursor = conn.execute(f"""
+            SELECT process_id,
+                   SUM(execution_count) AS execution_count,
+                   SUM(completed_count) AS completed_count,
+                   SUM(failed_count) AS failed_count,
+                   SUM(running_count) AS running_count,
+                   SUM(duration_count) AS duration_count,
+                   SUM(duration_total) AS duration_total,
+                   MIN(duration_min) AS duration_min,
+                   MAX(duration_max) AS duration_max,
+                   SUM(cost_count) AS cost_count,
+                   SUM(cost_total) AS cost_total,
+                   MIN(cost_min) AS cost_min,
+                   MAX(cost_max) AS cost_max
+            FROM ({sources})
+            GROUP BY process_id
+        """, params)
+        return {row["process_id"]: dict(row) for row in cursor.fetchall()}
+    
+    def aggregate_daily_stats(
+        self,
+        since: datetime,
+        process_id: Optional[ProcessId] = None,
+    ) -> dict[str, dict]:
+        """Aggregate executions started since `since` per start day."""
+        sources, params = self._aggregate_sources(
+            since,
+            rollup_select="""
+                SELECT r.day, r.execution_count, r.completed_count, r.failed_count, r.cost_total
+                FROM process_execution_daily r
+            """,
+            execution_select="""
+                SELECT substr(e.started_at, 1, 10) AS day,
+                       COUNT(*),
+                       SUM(e.status = 'completed'),
+                       SUM(e.status = 'failed'),
+                       COALESCE(SUM(CASE WHEN e.total_cost_amount > 0 THEN e.total_cost_amount END), 0)
+                FROM process_executions e
+            """,
+            group_by="day",
+            process_id=process_id,
+        )
+        conn = self._get_connection()
+        cursor = conn.execute(f"""
+            SELECT day,
+                   SUM(execution_count) AS execution_count,
+                   SUM(completed_count) AS completed_count,
+                   SUM(failed_count) AS failed_count,
+                   SUM(cost_total) AS cost_total
+            FROM ({sources})
+            GROUP BY day
+        """, params)
+        return {row["day"]: dict(row) for row in cursor.fetchall()}
+    
+    def aggregate_step_stats(self, since: datetime) -> list[dict]:
+        """Aggregate step executions of executions started since `since`."""
+        sources, params = self._aggregate_sources(
+            since,
+            rollup_select="""
+                SELECT r.process_name, r.step_id, r.execution_count, r.failed_count,
+                       r.duration_count, r.duration_total, r.cost_count, r.cost_total
+                FROM step_execution_daily r
+            """,
+            execution_select=f"""
+                SELECT e.process_name, s.step_id, {_STEP_AGGREGATES}
+                FROM process_executions e
+                JOIN step_executions s ON s.execution_id = e.id
+            """,
+            group_by="e.process_name, s.step_id",
+        )
+        conn = self._get_connection()
+        cursor = conn.execute(f"""
+            SELECT process_name, step_id,
+                   SUM(execution_count) AS execution_count,
+                   SUM(failed_count) AS failed_count,
+                   SUM(duration_count) AS duration_count,
+                   SUM(duration_total) AS duration_total,
+                   SUM(cost_count) AS cost_count,
+                   SUM(cost_total) AS cost_total
+            FROM ({sources})
+            GROUP BY process_name, step_id
+            ORDER BY process_name, step_id
+        """, params)
+        return [dict(row) for row in cursor.fetchall()]
     
     # =========================================================================
     # Serialization / Deserialization
@@ -429,4 +858,7 @@ class SqliteProcessExecutionRepository(ProcessExecutionRepository):
             completed_at=datetime.fromisoformat(row["completed_at"]) if row["completed_at"] else None,
         )
         
+        # Freshly loaded: nothing to write until it is modified
+        self._mark_persisted(execution, ProcessExecution.current_revision())
+        
         return execution
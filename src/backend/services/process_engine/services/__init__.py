@@ -6,7 +6,15 @@ Business logic that doesn't naturally fit within aggregates.
 
 from .validator import ProcessValidator, ValidationResult, ValidationError, ErrorLevel
 from .output_storage import OutputStorage, OutputPath
-from .expression_evaluator import ExpressionEvaluator, EvaluationContext, ExpressionError, ConditionEvaluator
+from .expression_evaluator import (
+    ExpressionEvaluator,
+    EvaluationContext,
+    ExpressionError,
+    ConditionEvaluator,
+    LazyStepOutputs,
+    compile_condition,
+    compile_template,
+)
 from .event_logger import EventLogger
 from .analytics import ProcessAnalytics, ProcessMetrics, TrendData, StepPerformance
 from .alerts import CostAlertService, CostThreshold, CostAlert, ThresholdType, AlertStatus
@@ -28,6 +36,9 @@ __all__ = [
     "EvaluationContext",
     "ExpressionError",
     "ConditionEvaluator",
+    "LazyStepOutputs",
+    "compile_condition",
+    "compile_template",
     "EventLogger",
     "ProcessAnalytics",
     "ProcessMetrics",
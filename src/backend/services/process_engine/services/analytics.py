@@ -24,6 +24,7 @@ from ..domain import (
 from ..repositories import (
     ProcessDefinitionRepository,
     ProcessExecutionRepository,
+    ProcessAnalyticsRepository,
 )
 
 logger = logging.getLogger(__name__)
@@ -157,6 +158,9 @@ class ProcessAnalytics:
     - Per-process metrics (success rate, duration, cost)
     - Trend data over time
     - Step-level performance analysis
+
+    Execution repositories that implement ProcessAnalyticsRepository
+    aggregate in storage; others are loaded and aggregated here.
     """
 
     def __init__(
@@ -166,6 +170,9 @@ class ProcessAnalytics:
     ):
         self._definition_repo = definition_repo
         self._execution_repo = execution_repo
+        self._aggregates: Optional[ProcessAnalyticsRepository] = (
+            execution_repo if isinstance(execution_repo, ProcessAnalyticsRepository) else None
+        )
 
     def get_process_metrics(
         self,
@@ -189,6 +196,15 @@ class ProcessAnalytics:
                 process_name="Unknown",
             )
 
+        cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+        if self._aggregates:
+            stats = self._aggregates.aggregate_process_stats(cutoff, process_id)
+            return self._metrics_from_stats(
+                process_id=str(process_id),
+                process_name=definition.name,
+                stats=stats.get(str(process_id)),
+            )
+
         # Get executions for this process
         executions = self._execution_repo.list_by_process(
             process_id,
@@ -197,7 +213,6 @@ class ProcessAnalytics:
         )
 
         # Filter by time window
-        cutoff = datetime.now(timezone.utc) - timedelta(days=days)
         recent_executions = [
             e for e in executions
             if e.started_at and e.started_at >= cutoff
@@ -233,6 +248,17 @@ class ProcessAnalytics:
         cutoff = datetime.now(timezone.utc) - timedelta(days=days)
         results = []
 
+        if self._aggregates:
+            stats = self._aggregates.aggregate_process_stats(cutoff)
+            return [
+                self._metrics_from_stats(
+                    process_id=str(definition.id),
+                    process_name=definition.name,
+                    stats=stats.get(str(definition.id)),
+                )
+                for definition in definitions
+            ]
+
         for definition in definitions:
             executions = self._execution_repo.list_by_process(
                 definition.id,
@@ -271,6 +297,34 @@ class ProcessAnalytics:
         """
         cutoff = datetime.now(timezone.utc) - timedelta(days=days)
 
+        # Group by date
+        daily_data: Dict[str, DailyTrend] = {}
+        for i in range(days):
+            date = (datetime.now(timezone.utc) - timedelta(days=i)).strftime("%Y-%m-%d")
+            daily_data[date] = DailyTrend(date=date)
+
+        if self._aggregates:
+            daily_stats = self._aggregates.aggregate_daily_stats(cutoff, process_id)
+            for date_key, stats in daily_stats.items():
+                daily_data[date_key] = DailyTrend(
+                    date=date_key,
+                    execution_count=stats["execution_count"],
+                    completed_count=stats["completed_count"],
+                    failed_count=stats["failed_count"],
+                    total_cost=Decimal(stats["cost_total"]) / 100,
+                )
+        else:
+            self._add_daily_trends(daily_data, cutoff, process_id)
+
+        return self._summarize_trends(days, daily_data)
+
+    def _add_daily_trends(
+        self,
+        daily_data: Dict[str, DailyTrend],
+        cutoff: datetime,
+        process_id: Optional[ProcessId],
+    ) -> None:
+        """Count loaded executions into the daily trends."""
         # Get executions
         if process_id:
             executions = self._execution_repo.list_by_process(
@@ -290,12 +344,6 @@ class ProcessAnalytics:
             if e.started_at and e.started_at >= cutoff
         ]
 
-        # Group by date
-        daily_data: Dict[str, DailyTrend] = {}
-        for i in range(days):
-            date = (datetime.now(timezone.utc) - timedelta(days=i)).strftime("%Y-%m-%d")
-            daily_data[date] = DailyTrend(date=date)
-
         for execution in recent_executions:
             if not execution.started_at:
                 continue
@@ -315,6 +363,8 @@ class ProcessAnalytics:
             if execution.total_cost:
                 trend.total_cost += execution.total_cost.amount
 
+    def _summarize_trends(self, days: int, daily_data: Dict[str, DailyTrend]) -> TrendData:
+        """Calculate success rates and totals over the daily trends."""
         # Calculate success rates and sort by date
         for trend in daily_data.values():
             finished = trend.completed_count + trend.failed_count
@@ -362,6 +412,35 @@ class ProcessAnalytics:
         """
         cutoff = datetime.now(timezone.utc) - timedelta(days=days)
 
+        if self._aggregates:
+            entries = [
+                self._step_entry_from_stats(stats)
+                for stats in self._aggregates.aggregate_step_stats(cutoff)
+            ]
+        else:
+            entries = self._calculate_step_entries(cutoff)
+
+        # Sort for slowest (by average duration)
+        slowest = sorted(
+            [e for e in entries if e.average_duration_seconds],
+            key=lambda e: e.average_duration_seconds or 0,
+            reverse=True,
+        )[:limit]
+
+        # Sort for most expensive (by total cost)
+        most_expensive = sorted(
+            [e for e in entries if e.total_cost > 0],
+            key=lambda e: e.total_cost,
+            reverse=True,
+        )[:limit]
+
+        return StepPerformance(
+            slowest_steps=slowest,
+            most_expensive_steps=most_expensive,
+        )
+
+    def _calculate_step_entries(self, cutoff: datetime) -> List[StepPerformanceEntry]:
+        """Build step performance entries from loaded executions."""
         # Get all recent executions
         executions = self._execution_repo.list_all(
             limit=10000,
@@ -426,25 +505,66 @@ class ProcessAnalytics:
 
             entries.append(entry)
 
-        # Sort for slowest (by average duration)
-        slowest = sorted(
-            [e for e in entries if e.average_duration_seconds],
-            key=lambda e: e.average_duration_seconds or 0,
-            reverse=True,
-        )[:limit]
+        return entries
 
-        # Sort for most expensive (by total cost)
-        most_expensive = sorted(
-            [e for e in entries if e.total_cost > 0],
-            key=lambda e: e.total_cost,
-            reverse=True,
-        )[:limit]
+    def _step_entry_from_stats(self, stats: Dict[str, Any]) -> StepPerformanceEntry:
+        """Build a step performance entry from repository aggregates."""
+        entry = StepPerformanceEntry(
+            step_id=stats["step_id"],
+            step_name=stats["step_id"],  # We don't have step name easily, use ID
+            process_name=stats["process_name"],
+            execution_count=stats["execution_count"],
+        )
 
-        return StepPerformance(
-            slowest_steps=slowest,
-            most_expensive_steps=most_expensive,
+        if stats["duration_count"]:
+            entry.average_duration_seconds = stats["duration_total"] / stats["duration_count"]
+
+        if stats["cost_count"]:
+            entry.total_cost = Decimal(stats["cost_total"]) / 100
+            entry.average_cost = entry.total_cost / stats["cost_count"]
+
+        if stats["execution_count"] > 0:
+            entry.failure_rate = (stats["failed_count"] / stats["execution_count"]) * 100
+
+        return entry
+
+    def _metrics_from_stats(
+        self,
+        process_id: str,
+        process_name: str,
+        stats: Optional[Dict[str, Any]],
+    ) -> ProcessMetrics:
+        """Build metrics from repository aggregates (costs in cents)."""
+        metrics = ProcessMetrics(
+            process_id=process_id,
+            process_name=process_name,
         )
 
+        if not stats:
+            return metrics
+
+        metrics.execution_count = stats["execution_count"]
+        metrics.completed_count = stats["completed_count"]
+        metrics.failed_count = stats["failed_count"]
+        metrics.running_count = stats["running_count"]
+
+        finished = metrics.completed_count + metrics.failed_count
+        if finished > 0:
+            metrics.success_rate = (metrics.completed_count / finished) * 100
+
+        if stats["duration_count"]:
+            metrics.average_duration_seconds = stats["duration_total"] / stats["duration_count"]
+            metrics.min_duration_seconds = stats["duration_min"]
+            metrics.max_duration_seconds = stats["duration_max"]
+
+        if stats["cost_count"]:
+            metrics.total_cost = Decimal(stats["cost_total"]) / 100
+            metrics.average_cost = metrics.total_cost / stats["cost_count"]
+            metrics.min_cost = Decimal(stats["cost_min"]) / 100
+            metrics.max_cost = Decimal(stats["cost_max"]) / 100
+
+        return metrics
+
     def _calculate_metrics(
         self,
         process_id: str,
@@ -4,14 +4,20 @@ Expression Evaluator Service
 Evaluates template expressions in process messages and configurations.
 Uses Jinja2-style syntax for familiarity.
 
+Templates and conditions are compiled once into closures and cached by
+string (LRU-bounded), so evaluating a process with hundreds of gateway
+conditions does not re-parse anything.
+
 Reference: BACKLOG_MVP.md - E2-07
 Reference: IT2 Section 6 (Expression Language choice)
 """
 
 import re
 import logging
+from collections.abc import Mapping
 from dataclasses import dataclass
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, Callable, Optional, Sequence
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +31,7 @@ class EvaluationContext:
     in expressions.
     """
     input_data: dict[str, Any]
-    step_outputs: dict[str, Any]
+    step_outputs: Mapping[str, Any]
     execution_id: Optional[str] = None
     process_name: Optional[str] = None
     
@@ -39,8 +45,10 @@ class EvaluationContext:
             get("steps.research.output.summary") -> step_outputs["research"]["summary"]
             get("execution.id") -> execution_id
         """
-        parts = path.split(".")
-        
+        return self.resolve(path.split("."))
+    
+    def resolve(self, parts: Sequence[str]) -> Any:
+        """Get value by an already split path (see get())."""
         if not parts:
             return None
         
@@ -96,6 +104,37 @@ class EvaluationContext:
         return None
 
 
+class LazyStepOutputs(Mapping):
+    """
+    Step outputs loaded on first access.
+    
+    Building the outputs dict reads the execution from storage; conditions
+    and templates that only reference inputs never trigger the load.
+    """
+    
+    def __init__(self, loader: Callable[[], Mapping[str, Any]]):
+        self._loader = loader
+        self._outputs: Optional[Mapping[str, Any]] = None
+    
+    @property
+    def loaded(self) -> bool:
+        return self._outputs is not None
+    
+    def _load(self) -> Mapping[str, Any]:
+        if self._outputs is None:
+            self._outputs = self._loader() or {}
+        return self._outputs
+    
+    def __getitem__(self, step_id: str) -> Any:
+        return self._load()[step_id]
+    
+    def __iter__(self):
+        return iter(self._load())
+    
+    def __len__(self) -> int:
+        return len(self._load())
+
+
 class ExpressionEvaluator:
     """
     Evaluates template expressions in strings.
@@ -146,20 +185,27 @@ class ExpressionEvaluator:
         Raises:
             ExpressionError: If strict=True and an expression cannot be resolved
         """
-        def replace_expression(match):
-            expression = match.group(1).strip()
-            value = context.get(expression)
+        segments = compile_template(template)
+        if len(segments) == 1 and isinstance(segments[0], str):
+            return segments[0]
+        
+        parts = []
+        for segment in segments:
+            if isinstance(segment, str):
+                parts.append(segment)
+                continue
+            value = context.resolve(segment.path)
             
             if value is None:
                 if strict:
-                    raise ExpressionError(f"Undefined expression: {expression}")
+                    raise ExpressionError(f"Undefined expression: {segment.expression}")
                 # Leave as-is
-                return match.group(0)
-            
-            # Convert value to string
-            return self._value_to_string(value)
+                parts.append(segment.text)
+            else:
+                # Convert value to string
+                parts.append(self._value_to_string(value))
         
-        return self.EXPRESSION_PATTERN.sub(replace_expression, template)
+        return "".join(parts)
     
     def extract_expressions(self, template: str) -> list[str]:
         """
@@ -171,7 +217,7 @@ class ExpressionEvaluator:
         Returns:
             List of expression strings (without braces)
         """
-        return [match.group(1).strip() for match in self.EXPRESSION_PATTERN.finditer(template)]
+        return [s.expression for s in compile_template(template) if not isinstance(s, str)]
     
     def validate_expressions(
         self,
@@ -259,10 +305,13 @@ class ConditionEvaluator:
     Evaluates boolean conditions for gateway routing.
     
     Supports:
-    - Comparison operators: ==, !=, >, <, >=, <=
-    - Boolean operators: and, or, not
-    - Accessing step outputs: steps.analyze.output.score
+    - Comparison operators: ==, !=, >, <, >=, <=, in, not in
+    - Boolean operators: and, or, not (precedence not > and > or)
+    - Parentheses for grouping
+    - Accessing step outputs: steps.analyze.output.score,
+      steps['step-id'].output, {{steps.analyze.output.score}}
     - Accessing inputs: input.priority
+    - Literals: 'text', "text", 42, 4.2, true, false, null
     
     Example:
     ```python
@@ -287,6 +336,8 @@ class ConditionEvaluator:
         "<": lambda a, b: float(a) < float(b) if _is_numeric(a, b) else str(a) < str(b),
         ">=": lambda a, b: float(a) >= float(b) if _is_numeric(a, b) else str(a) >= str(b),
         "<=": lambda a, b: float(a) <= float(b) if _is_numeric(a, b) else str(a) <= str(b),
+        "in": lambda a, b: _contains(b, a),
+        "not in": lambda a, b: not _contains(b, a),
     }
     
     def evaluate(self, condition: str, context: EvaluationContext) -> bool:
@@ -301,85 +352,27 @@ class ConditionEvaluator:
             Boolean result of the condition
             
         Raises:
-            ExpressionError: If condition cannot be evaluated
+            ExpressionError: If condition cannot be parsed or evaluated
         """
         if not condition or not condition.strip():
             return True  # Empty condition is always true
         
-        condition = condition.strip()
-        
+        compiled = compile_condition(condition.strip())
         try:
-            # Handle 'and' operator (split and evaluate both sides)
-            if " and " in condition:
-                parts = condition.split(" and ", 1)
-                return self.evaluate(parts[0], context) and self.evaluate(parts[1], context)
-            
-            # Handle 'or' operator
-            if " or " in condition:
-                parts = condition.split(" or ", 1)
-                return self.evaluate(parts[0], context) or self.evaluate(parts[1], context)
-            
-            # Handle 'not' operator
-            if condition.startswith("not "):
-                return not self.evaluate(condition[4:], context)
-            
-            # Handle comparison operators
-            for op in ["==", "!=", ">=", "<=", ">", "<"]:
-                if op in condition:
-                    parts = condition.split(op, 1)
-                    if len(parts) == 2:
-                        left = self._resolve_value(parts[0].strip(), context)
-                        right = self._resolve_value(parts[1].strip(), context)
-                        return self.COMPARISON_OPS[op](left, right)
-            
-            # If no operator, treat as truthy check
-            value = self._resolve_value(condition, context)
-            return bool(value)
-            
+            return bool(compiled(context))
         except Exception as e:
             logger.error(f"Failed to evaluate condition '{condition}': {e}")
             raise ExpressionError(f"Failed to evaluate condition: {condition}") from e
     
-    def _resolve_value(self, expr: str, context: EvaluationContext) -> Any:
-        """
-        Resolve an expression to its value.
-        
-        Handles:
-        - String literals: 'value' or "value"
-        - Numeric literals: 123, 45.67
-        - Boolean literals: true, false
-        - Path expressions: steps.analyze.output.score
-        """
-        expr = expr.strip()
-        
-        # String literal (single or double quotes)
-        if (expr.startswith("'") and expr.endswith("'")) or \
-           (expr.startswith('"') and expr.endswith('"')):
-            return expr[1:-1]
-        
-        # Boolean literals
-        if expr.lower() == "true":
-            return True
-        if expr.lower() == "false":
-            return False
-        
-        # Null literal
-        if expr.lower() in ("null", "none"):
+    def validate(self, condition: str) -> Optional[str]:
+        """Return a syntax error message for the condition, or None if it parses."""
+        if not condition or not condition.strip():
             return None
-        
-        # Numeric literal
         try:
-            if "." in expr:
-                return float(expr)
-            return int(expr)
-        except ValueError:
-            pass
-        
-        # Path expression - use context to resolve
-        value = context.get(expr)
-        if value is None:
-            logger.warning(f"Expression '{expr}' resolved to None")
-        return value
+            compile_condition(condition.strip())
+        except ExpressionError as e:
+            return str(e)
+        return None
 
 
 def _is_numeric(a: Any, b: Any) -> bool:
@@ -390,3 +383,237 @@ def _is_numeric(a: Any, b: Any) -> bool:
         return True
     except (ValueError, TypeError):
         return False
+
+
+def _contains(container: Any, item: Any) -> bool:
+    """Membership test for `in`; a missing container contains nothing."""
+    if container is None:
+        return False
+    if isinstance(container, str):
+        return str(item) in container
+    try:
+        return item in container
+    except TypeError:
+        return False
+
+
+# =============================================================================
+# Compilation
+# =============================================================================
+
+# Distinct templates/conditions kept compiled
+COMPILE_CACHE_SIZE = 2048
+
+# A compiled condition: context -> value (truthiness decides the route)
+CompiledCondition = Callable[[EvaluationContext], Any]
+
+
+@dataclass(frozen=True)
+class _Placeholder:
+    """A {{expression}} in a compiled template."""
+    text: str  # as written, kept when the value is undefined
+    expression: str
+    path: tuple[str, ...]
+
+
+@lru_cache(maxsize=COMPILE_CACHE_SIZE)
+def compile_template(template: str) -> tuple:
+    """
+    Split a template into literal strings and placeholders, once per template.
+    
+    Returns a tuple of str and _Placeholder items in template order.
+    """
+    segments: list = []
+    position = 0
+    for match in ExpressionEvaluator.EXPRESSION_PATTERN.finditer(template):
+        if match.start() > position:
+            segments.append(template[position:match.start()])
+        expression = match.group(1).strip()
+        segments.append(_Placeholder(match.group(0), expression, tuple(expression.split("."))))
+        position = match.end()
+    if position < len(template) or not segments:
+        segments.append(template[position:])
+    return tuple(segments)
+
+
+@lru_cache(maxsize=COMPILE_CACHE_SIZE)
+def compile_condition(condition: str) -> CompiledCondition:
+    """
+    Parse a condition once into a closure over the evaluation context.
+    
+    Raises:
+        ExpressionError: If the condition is not valid syntax
+    """
+    return _ConditionParser(condition).parse()
+
+
+_TOKEN_PATTERN = re.compile(r"""
+    \s*(?:
+        (?P<placeholder>\{\{(?P<placeholder_path>[^}]+)\}\})
+      | (?P<string>'[^']*'|"[^"]*")
+      | (?P<number>-?\d+(?:\.\d+)?)(?![\w-])
+      | (?P<op>==|!=|>=|<=|>|<|[().\[\]])
+      | (?P<name>[A-Za-z_][\w-]*)
+    )""", re.VERBOSE)
+
+_KEYWORDS = {"and", "or", "not", "in"}
+_LITERALS = {"true": True, "false": False, "null": None, "none": None}
+
+
+def _tokenize(condition: str) -> list[tuple[str, str]]:
+    tokens = []
+    position = 0
+    end = len(condition.rstrip())
+    while position < end:
+        match = _TOKEN_PATTERN.match(condition, position)
+        if match is None:
+            raise ExpressionError(
+                f"Invalid syntax at position {position} in condition: {condition}"
+            )
+        kind = match.lastgroup if match.lastgroup != "placeholder_path" else "placeholder"
+        value = match.group(kind)
+        if kind == "name" and value in _KEYWORDS:
+            kind = "keyword"
+        tokens.append((kind, value))
+        position = match.end()
+    return tokens
+
+
+def _path_getter(path: tuple[str, ...]) -> CompiledCondition:
+    def get(context: EvaluationContext) -> Any:
+        value = context.resolve(path)
+        if value is None:
+            logger.debug(f"Expression '{'.'.join(path)}' resolved to None")
+        return value
+    return get
+
+
+class _ConditionParser:
+    """
+    Recursive-descent parser producing closures.
+    
+    condition  := or_expr
+    or_expr    := and_expr ("or" and_expr)*
+    and_expr   := not_expr ("and" not_expr)*
+    not_expr   := "not" not_expr | comparison
+    comparison := operand (("==" | "!=" | ">=" | "<=" | ">" | "<" | "in" | "not" "in") operand)?
+    operand    := literal | path | "{{" path "}}" | "(" or_expr ")"
+    path       := name ("." (name | number) | "[" (string | number) "]")*
+    """
+    
+    def __init__(self, condition: str):
+        self.condition = condition
+        self.tokens = _tokenize(condition)
+        self.position = 0
+    
+    def parse(self) -> CompiledCondition:
+        if not self.tokens:
+            raise ExpressionError(f"Empty condition: {self.condition!r}")
+        compiled = self._or_expr()
+        if self.position < len(self.tokens):
+            self._error(f"unexpected '{self.tokens[self.position][1]}'")
+        return compiled
+    
+    def _error(self, message: str):
+        raise ExpressionError(f"Invalid condition ({message}): {self.condition}")
+    
+    def _peek(self) -> tuple[str, str]:
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+        return ("end", "")
+    
+    def _accept(self, kind: str, value: Optional[str] = None) -> bool:
+        token_kind, token_value = self._peek()
+        if token_kind == kind and (value is None or token_value == value):
+            self.position += 1
+            return True
+        return False
+    
+    def _expect(self, kind: str, value: Optional[str] = None) -> str:
+        token_kind, token_value = self._peek()
+        if not self._accept(kind, value):
+            self._error(f"expected {value or kind}, found '{token_value or 'end'}'")
+        return token_value
+    
+    def _or_expr(self) -> CompiledCondition:
+        left = self._and_expr()
+        while self._accept("keyword", "or"):
+            right = self._and_expr()
+            left = (lambda l, r: lambda context: l(context) or r(context))(left, right)
+        return left
+    
+    def _and_expr(self) -> CompiledCondition:
+        left = self._not_expr()
+        while self._accept("keyword", "and"):
+            right = self._not_expr()
+            left = (lambda l, r: lambda context: l(context) and r(context))(left, right)
+        return left
+    
+    def _not_expr(self) -> CompiledCondition:
+        if self._accept("keyword", "not"):
+            operand = self._not_expr()
+            return lambda context: not operand(context)
+        return self._comparison()
+    
+    def _comparison(self) -> CompiledCondition:
+        left = self._operand()
+        kind, value = self._peek()
+        if kind == "op" and value in ConditionEvaluator.COMPARISON_OPS:
+            self.position += 1
+            op = value
+        elif kind == "keyword" and value == "in":
+            self.position += 1
+            op = "in"
+        elif kind == "keyword" and value == "not" and \
+                self.tokens[self.position + 1:self.position + 2] == [("keyword", "in")]:
+            self.position += 2
+            op = "not in"
+        else:
+            return left
+        right = self._operand()
+        compare = ConditionEvaluator.COMPARISON_OPS[op]
+        return lambda context: compare(left(context), right(context))
+    
+    def _operand(self) -> CompiledCondition:
+        kind, value = self._peek()
+        if self._accept("op", "("):
+            inner = self._or_expr()
+            self._expect("op", ")")
+            return inner
+        if self._accept("string"):
+            literal = value[1:-1]
+            return lambda context: literal
+        if self._accept("number"):
+            number = float(value) if "." in value else int(value)
+            return lambda context: number
+        if self._accept("placeholder"):
+            expression = value[2:-2].strip()
+            return _path_getter(tuple(expression.split(".")))
+        if self._accept("name"):
+            if value.lower() in _LITERALS:
+                constant = _LITERALS[value.lower()]
+                return lambda context: constant
+            return _path_getter(self._path_rest(value))
+        self._error(f"expected a value, found '{value or 'end'}'")
+    
+    def _path_rest(self, root: str) -> tuple[str, ...]:
+        path = [root]
+        while True:
+            if self._accept("op", "."):
+                kind, value = self._peek()
+                if kind not in ("name", "keyword", "number"):
+                    self._error(f"expected a field name after '.', found '{value or 'end'}'")
+                self.position += 1
+                path.append(value)
+            elif self._accept("op", "["):
+                kind, value = self._peek()
+                if kind == "string":
+                    path.append(value[1:-1])
+                elif kind == "number":
+                    path.append(value)
+                else:
+                    self._error(f"expected a quoted key in [], found '{value or 'end'}'")
+                self.position += 1
+                self._expect("op", "]")
+            else:
+                return tuple(path)
@@ -13,13 +13,13 @@ Slot Rules:
 - Parallel /task endpoint respects capacity limits
 - Return 429 when at capacity
 - Slots auto-expire after 30 minutes (safety net)
+- Acquire/release/cleanup are atomic Lua scripts on the asyncio client
 """
 
-import json
 import logging
 from datetime import datetime
 from typing import Optional, Dict, List, Any
-import redis
+import redis.asyncio as aioredis
 import time
 
 from dataclasses import dataclass
@@ -30,6 +30,65 @@ logger = logging.getLogger(__name__)
 SLOT_TTL_BUFFER = 300  # 5 minute buffer added to agent timeout for slot TTL
 DEFAULT_SLOT_TTL_SECONDS = 1200  # 20 minutes - fallback if no agent timeout known
 
+# Lua scripts: each slot operation is one atomic round-trip, so concurrent
+# acquires cannot both pass the capacity check.
+#
+# Every key a script touches is passed in KEYS (Redis Cluster routes scripts
+# by their declared keys). The metadata keys of stale or force-cleared slots
+# are only known inside the script, so the scripts return those execution
+# IDs and the caller deletes the metadata (_delete_metadata()); it also
+# expires on its own.
+#
+# Stale cleanup shared by acquire and cleanup.
+# KEYS[1] = slots ZSET, ARGV[1] = cutoff timestamp
+_CLEANUP_LUA = """
+local stale = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1])
+if #stale > 0 then
+    redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', ARGV[1])
+end
+"""
+
+# KEYS[2] = metadata HASH of the new slot
+# ARGV[2] = now, ARGV[3] = max_parallel_tasks, ARGV[4] = execution_id,
+# ARGV[5] = started_at, ARGV[6] = message_preview, ARGV[7] = timeout_seconds,
+# ARGV[8] = metadata TTL
+# Returns {acquired (0/1), slot_number or current count, stale execution IDs}
+_ACQUIRE_LUA = _CLEANUP_LUA + """
+local count = redis.call('ZCARD', KEYS[1])
+if count >= tonumber(ARGV[3]) then
+    return {0, count, stale}
+end
+redis.call('ZADD', KEYS[1], ARGV[2], ARGV[4])
+redis.call('HSET', KEYS[2],
+    'started_at', ARGV[5],
+    'message_preview', ARGV[6],
+    'slot_number', tostring(count + 1),
+    'timeout_seconds', ARGV[7])
+redis.call('EXPIRE', KEYS[2], ARGV[8])
+return {1, count + 1, stale}
+"""
+
+# Returns stale execution IDs
+_CLEANUP_ONLY_LUA = _CLEANUP_LUA + """
+return stale
+"""
+
+# KEYS[1] = slots ZSET, KEYS[2] = metadata HASH, ARGV[1] = execution_id
+# Returns {removed (0/1), remaining}
+_RELEASE_LUA = """
+local removed = redis.call('ZREM', KEYS[1], ARGV[1])
+redis.call('DEL', KEYS[2])
+return {removed, redis.call('ZCARD', KEYS[1])}
+"""
+
+# KEYS[1] = slots ZSET
+# Returns cleared execution IDs
+_FORCE_CLEAR_LUA = """
+local entries = redis.call('ZRANGE', KEYS[1], 0, -1)
+redis.call('DEL', KEYS[1])
+return entries
+"""
+
 
 @dataclass
 class SlotInfo:
@@ -59,12 +118,24 @@ class SlotService:
     - ZADD agent:slots:{name} {timestamp} {execution_id}
     - ZCARD for counting active slots
     - ZREMRANGEBYSCORE for cleanup
+
+    Uses the asyncio Redis client; acquire, release, cleanup and force-clear
+    each run as a single Lua script (atomic, one round-trip; removed slots
+    then have their metadata deleted in one more).
     """
 
-    def __init__(self, redis_url: str = "redis://redis:6379"):
-        self.redis = redis.from_url(redis_url, decode_responses=True)
+    def __init__(
+        self,
+        redis_url: str = "redis://redis:6379",
+        redis_client: Optional[aioredis.Redis] = None,
+    ):
+        self.redis = redis_client or aioredis.from_url(redis_url, decode_responses=True)
         self.slots_prefix = "agent:slots:"
         self.metadata_prefix = "agent:slot:"
+        self._acquire_script = self.redis.register_script(_ACQUIRE_LUA)
+        self._cleanup_script = self.redis.register_script(_CLEANUP_ONLY_LUA)
+        self._release_script = self.redis.register_script(_RELEASE_LUA)
+        self._force_clear_script = self.redis.register_script(_FORCE_CLEAR_LUA)
 
     def _slots_key(self, agent_name: str) -> str:
         """Redis key for agent's slot set."""
@@ -74,6 +145,13 @@ class SlotService:
         """Redis key for slot metadata."""
         return f"{self.metadata_prefix}{agent_name}:{execution_id}"
 
+    async def _delete_metadata(self, agent_name: str, execution_ids: List[str]) -> None:
+        """Delete the metadata of slots a script removed."""
+        if execution_ids:
+            await self.redis.delete(
+                *(self._metadata_key(agent_name, execution_id) for execution_id in execution_ids)
+            )
+
     async def acquire_slot(
         self,
         agent_name: str,
@@ -85,6 +163,9 @@ class SlotService:
         """
         Try to acquire a slot for an execution.
 
+        Stale cleanup, the capacity check and slot registration run in one
+        Lua script, so concurrent acquires never exceed max_parallel_tasks.
+
         Args:
             agent_name: Name of the agent
             execution_id: Unique execution ID
@@ -95,38 +176,42 @@ class SlotService:
         Returns:
             True if slot acquired, False if at capacity
         """
-        slots_key = self._slots_key(agent_name)
         now = time.time()
 
         # TIMEOUT-001: Dynamic slot TTL based on agent timeout + buffer
         slot_ttl = timeout_seconds + SLOT_TTL_BUFFER
 
-        # Clean up expired slots first (uses dynamic TTL for this agent)
-        await self._cleanup_stale_slots_for_agent(agent_name, slot_ttl)
+        acquired, slot_number, stale = await self._acquire_script(
+            keys=[
+                self._slots_key(agent_name),
+                self._metadata_key(agent_name, execution_id),
+            ],
+            args=[
+                now - slot_ttl,
+                now,
+                max_parallel_tasks,
+                execution_id,
+                datetime.utcnow().isoformat(),
+                message_preview[:100] if message_preview else "",
+                timeout_seconds,
+                slot_ttl,
+            ],
+        )
 
-        # Check current count
-        current_count = self.redis.zcard(slots_key)
-        if current_count >= max_parallel_tasks:
+        if stale:
+            # A reused execution ID keeps the metadata just written for it
+            await self._delete_metadata(agent_name, [s for s in stale if s != execution_id])
+            logger.warning(
+                f"[Slots] Cleaned up {len(stale)} stale slots for agent '{agent_name}'"
+            )
+
+        if not acquired:
             logger.info(
-                f"[Slots] Agent '{agent_name}' at capacity ({current_count}/{max_parallel_tasks}), "
+                f"[Slots] Agent '{agent_name}' at capacity ({slot_number}/{max_parallel_tasks}), "
                 f"rejecting execution {execution_id}"
             )
             return False
 
-        # Add slot (ZADD with timestamp score)
-        self.redis.zadd(slots_key, {execution_id: now})
-
-        # Store metadata with dynamic TTL
-        metadata_key = self._metadata_key(agent_name, execution_id)
-        slot_number = current_count + 1  # Assign next available slot number
-        self.redis.hset(metadata_key, mapping={
-            "started_at": datetime.utcnow().isoformat(),
-            "message_preview": message_preview[:100] if message_preview else "",
-            "slot_number": str(slot_number),
-            "timeout_seconds": str(timeout_seconds)
-        })
-        self.redis.expire(metadata_key, slot_ttl)
-
         logger.info(
             f"[Slots] Agent '{agent_name}' acquired slot {slot_number}/{max_parallel_tasks} "
             f"for execution {execution_id} (TTL={slot_ttl}s)"
@@ -141,17 +226,15 @@ class SlotService:
             agent_name: Name of the agent
             execution_id: Execution ID to release
         """
-        slots_key = self._slots_key(agent_name)
-        metadata_key = self._metadata_key(agent_name, execution_id)
-
-        # Remove from ZSET
-        removed = self.redis.zrem(slots_key, execution_id)
-
-        # Delete metadata
-        self.redis.delete(metadata_key)
+        removed, remaining = await self._release_script(
+            keys=[
+                self._slots_key(agent_name),
+                self._metadata_key(agent_name, execution_id),
+            ],
+            args=[execution_id],
+        )
 
         if removed:
-            remaining = self.redis.zcard(slots_key)
             logger.info(
                 f"[Slots] Agent '{agent_name}' released slot for execution {execution_id}, "
                 f"{remaining} slots still active"
@@ -172,15 +255,18 @@ class SlotService:
         now = time.time()
 
         # Get all active execution IDs with scores (timestamps)
-        slot_entries = self.redis.zrangebyscore(
+        slot_entries = await self.redis.zrangebyscore(
             slots_key, "-inf", "+inf", withscores=True
         )
 
-        slots = []
-        for execution_id, start_timestamp in slot_entries:
-            metadata_key = self._metadata_key(agent_name, execution_id)
-            metadata = self.redis.hgetall(metadata_key)
+        # Fetch all slot metadata in one pipelined round-trip
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for execution_id, _ in slot_entries:
+                pipe.hgetall(self._metadata_key(agent_name, execution_id))
+            metadata_list = await pipe.execute() if slot_entries else []
 
+        slots = []
+        for (execution_id, start_timestamp), metadata in zip(slot_entries, metadata_list):
             duration_seconds = int(now - start_timestamp)
             slot_number = int(metadata.get("slot_number", 0))
 
@@ -204,9 +290,9 @@ class SlotService:
             slots=slots
         )
 
-    async def get_all_slot_states(self, agent_capacities: Dict[str, int]) -> Dict[str, Dict[str, Any]]:
+    async def get_fleet_slot_state(self, agent_capacities: Dict[str, int]) -> Dict[str, Dict[str, Any]]:
         """
-        Get slot states for multiple agents efficiently.
+        Get slot states for many agents in one pipelined round-trip.
 
         Args:
             agent_capacities: Dict mapping agent_name to max_parallel_tasks
@@ -214,17 +300,22 @@ class SlotService:
         Returns:
             Dict mapping agent_name to {"max": N, "active": M}
         """
-        result = {}
-
-        for agent_name, max_tasks in agent_capacities.items():
-            slots_key = self._slots_key(agent_name)
-            active_count = self.redis.zcard(slots_key)
-            result[agent_name] = {
-                "max": max_tasks,
-                "active": active_count
+        if not agent_capacities:
+            return {}
+
+        agent_names = list(agent_capacities)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for agent_name in agent_names:
+                pipe.zcard(self._slots_key(agent_name))
+            counts = await pipe.execute()
+
+        return {
+            agent_name: {
+                "max": agent_capacities[agent_name],
+                "active": active_count,
             }
-
-        return result
+            for agent_name, active_count in zip(agent_names, counts)
+        }
 
     async def _cleanup_stale_slots_for_agent(self, agent_name: str, slot_ttl: int = None) -> int:
         """Remove slots older than TTL for a single agent.
@@ -233,28 +324,20 @@ class SlotService:
             agent_name: Name of the agent
             slot_ttl: Slot TTL in seconds. If None, uses DEFAULT_SLOT_TTL_SECONDS.
         """
-        slots_key = self._slots_key(agent_name)
         ttl = slot_ttl if slot_ttl is not None else DEFAULT_SLOT_TTL_SECONDS
         cutoff = time.time() - ttl
 
-        # Get stale entries before removing
-        stale = self.redis.zrangebyscore(slots_key, "-inf", cutoff)
+        stale = await self._cleanup_script(
+            keys=[self._slots_key(agent_name)],
+            args=[cutoff],
+        )
 
         if stale:
-            # Remove stale slots
-            removed = self.redis.zremrangebyscore(slots_key, "-inf", cutoff)
-
-            # Clean up metadata
-            for execution_id in stale:
-                metadata_key = self._metadata_key(agent_name, execution_id)
-                self.redis.delete(metadata_key)
-
+            await self._delete_metadata(agent_name, stale)
             logger.warning(
-                f"[Slots] Cleaned up {removed} stale slots for agent '{agent_name}'"
+                f"[Slots] Cleaned up {len(stale)} stale slots for agent '{agent_name}'"
             )
-            return removed
-
-        return 0
+        return len(stale)
 
     async def cleanup_stale_slots(self) -> int:
         """
@@ -267,15 +350,10 @@ class SlotService:
 
         # Find all agent slot keys
         pattern = f"{self.slots_prefix}*"
-        cursor = 0
-        while True:
-            cursor, keys = self.redis.scan(cursor, match=pattern, count=100)
-            for key in keys:
-                agent_name = key.replace(self.slots_prefix, "")
-                removed = await self._cleanup_stale_slots_for_agent(agent_name)
-                total_removed += removed
-            if cursor == 0:
-                break
+        async for key in self.redis.scan_iter(match=pattern, count=100):
+            agent_name = key.replace(self.slots_prefix, "")
+            removed = await self._cleanup_stale_slots_for_agent(agent_name)
+            total_removed += removed
 
         if total_removed > 0:
             logger.info(f"[Slots] Cleanup removed {total_removed} stale slots total")
@@ -285,7 +363,7 @@ class SlotService:
     async def get_active_count(self, agent_name: str) -> int:
         """Get count of active slots for an agent."""
         slots_key = self._slots_key(agent_name)
-        return self.redis.zcard(slots_key)
+        return await self.redis.zcard(slots_key)
 
     async def is_at_capacity(self, agent_name: str, max_parallel_tasks: int) -> bool:
         """Check if agent is at capacity."""
@@ -299,21 +377,11 @@ class SlotService:
         Returns:
             Number of slots cleared
         """
-        slots_key = self._slots_key(agent_name)
-
-        # Get all execution IDs first
-        entries = self.redis.zrange(slots_key, 0, -1)
-        count = len(entries)
+        cleared = await self._force_clear_script(keys=[self._slots_key(agent_name)])
+        await self._delete_metadata(agent_name, cleared)
 
+        count = len(cleared)
         if count > 0:
-            # Delete slot set
-            self.redis.delete(slots_key)
-
-            # Delete all metadata
-            for execution_id in entries:
-                metadata_key = self._metadata_key(agent_name, execution_id)
-                self.redis.delete(metadata_key)
-
             logger.warning(f"[Slots] Force cleared {count} slots for agent '{agent_name}'")
 
         return count
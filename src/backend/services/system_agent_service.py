@@ -267,6 +267,7 @@ class SystemAgentService:
     def _set_system_scope(self, key_id: str):
         """Update MCP key to have system scope (bypasses permissions)."""
         from db.connection import get_db_connection
+        from db.auth_cache import principal_cache
 
         with get_db_connection() as conn:
             cursor = conn.cursor()
@@ -275,6 +276,7 @@ class SystemAgentService:
                 ("system", key_id)
             )
             conn.commit()
+        principal_cache.invalidate_key(key_id)
 
 
 # Global service instance
@@ -28,6 +28,7 @@ import httpx
 from database import db
 from models import ActivityState, ActivityType, TaskExecutionStatus
 from services.activity_service import activity_service
+from services.agent_transport import get_agent_transport
 from services.slot_service import get_slot_service
 from utils.credential_sanitizer import sanitize_execution_log, sanitize_response
 from services.platform_prompt_service import get_platform_system_prompt
@@ -77,9 +78,8 @@ async def agent_post_with_retry(
     last_error = None
     for attempt in range(max_retries):
         try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.post(agent_url, json=payload)
-                return response
+            client = get_agent_transport().client(agent_name)
+            return await client.post(agent_url, json=payload, timeout=timeout)
         except httpx.ConnectError as e:
             last_error = e
             if attempt < max_retries - 1:
@@ -0,0 +1,452 @@
+"""
+WebSocket broadcast managers.
+
+Each connection gets a bounded outbound queue drained by its own writer
+task, so a broadcast only enqueues and never waits on a client. A slow
+client loses its oldest queued events (or has them coalesced) instead of
+delaying everyone else; a client that stops accepting frames, or whose
+socket errors, is closed and removed.
+
+- ConnectionManager: /ws (authenticated UI clients, every event)
+- FilteredWebSocketManager: /ws/events (Trinity Connect, events filtered
+  to the agents each user can access)
+
+With several backend workers, attach_relay() makes broadcasts and access
+changes reach the connections of every worker (EVENT-RELAY-001), and
+delivers the dedicated scheduler's events.
+"""
+
+import asyncio
+import json
+import logging
+from collections import deque
+from typing import Callable, Dict, List, Optional, Set, TYPE_CHECKING
+
+from fastapi import WebSocket
+
+if TYPE_CHECKING:
+    from services.event_relay import EventRelay
+
+logger = logging.getLogger(__name__)
+
+# Queued events per connection before the oldest are dropped
+SEND_QUEUE_SIZE = 256
+# Seconds a single send may take before the client is considered stalled
+SEND_TIMEOUT = 10.0
+# Close code for evicted clients (RFC 6455 1013: try again later)
+EVICT_CLOSE_CODE = 1013
+
+# Relay topic for broadcasts and access changes between workers
+WS_RELAY_TOPIC = "websocket"
+# Published by the dedicated scheduler (must match src/scheduler/service.py)
+SCHEDULER_EVENTS_CHANNEL = "scheduler:events"
+
+
+def serialize_event(event: dict) -> str:
+    """Serialize an event once for every recipient (same format as send_json)."""
+    return json.dumps(event, separators=(",", ":"), ensure_ascii=False)
+
+
+class ClientConnection:
+    """
+    One WebSocket with its outbound queue and writer task.
+
+    enqueue() never blocks. When the queue is full the oldest event is
+    dropped; an event with a coalesce key replaces a still-queued event
+    with the same key, since only the latest matters to the client.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        on_evict: Callable[[WebSocket], None],
+        queue_size: int = SEND_QUEUE_SIZE,
+        send_timeout: float = SEND_TIMEOUT,
+    ):
+        self.websocket = websocket
+        self.queue_size = queue_size
+        self.send_timeout = send_timeout
+        self.dropped = 0
+        self.sent = 0
+        self._on_evict = on_evict
+        self._queue: deque = deque()  # (coalesce_key, message)
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._writer())
+
+    @property
+    def pending(self) -> int:
+        """Number of queued events not yet sent."""
+        return len(self._queue)
+
+    def enqueue(self, message: str, coalesce_key: Optional[str] = None) -> None:
+        """Queue a serialized event for this client."""
+        if coalesce_key is not None:
+            for index, (key, _) in enumerate(self._queue):
+                if key == coalesce_key:
+                    self._queue[index] = (coalesce_key, message)
+                    self.dropped += 1
+                    return
+        if len(self._queue) >= self.queue_size:
+            self._queue.popleft()
+            self.dropped += 1
+        self._queue.append((coalesce_key, message))
+        self._wakeup.set()
+
+    async def _writer(self) -> None:
+        """Send queued events in order until the client fails or is closed."""
+        try:
+            while True:
+                while not self._queue:
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                _, message = self._queue.popleft()
+                async with asyncio.timeout(self.send_timeout):
+                    await self.websocket.send_text(message)
+                self.sent += 1
+        except asyncio.CancelledError:
+            raise
+        except asyncio.TimeoutError:
+            logger.warning(f"Evicting WebSocket client: send stalled for {self.send_timeout}s")
+            await self._evict()
+        except Exception as e:
+            logger.debug(f"Evicting WebSocket client after send error: {e}")
+            await self._evict()
+
+    async def _evict(self) -> None:
+        self._queue.clear()
+        self._on_evict(self.websocket)
+        try:
+            await asyncio.wait_for(
+                self.websocket.close(code=EVICT_CLOSE_CODE),
+                self.send_timeout,
+            )
+        except Exception:
+            pass
+
+    def close(self) -> None:
+        """Stop the writer task; queued events are discarded."""
+        self._queue.clear()
+        if not self._task.done() and self._task is not asyncio.current_task():
+            self._task.cancel()
+
+
+class ConnectionManager:
+    """WebSocket connection manager for broadcasting events."""
+
+    def __init__(self, queue_size: int = SEND_QUEUE_SIZE, send_timeout: float = SEND_TIMEOUT):
+        self.queue_size = queue_size
+        self.send_timeout = send_timeout
+        self.clients: Dict[WebSocket, ClientConnection] = {}
+        self.relay: Optional["EventRelay"] = None
+
+    async def connect(self, websocket: WebSocket, accept: bool = True):
+        """Register a connection; accept it first unless already accepted."""
+        if accept:
+            await websocket.accept()
+        self.clients[websocket] = ClientConnection(
+            websocket, self.disconnect, self.queue_size, self.send_timeout
+        )
+
+    def disconnect(self, websocket: WebSocket):
+        client = self.clients.pop(websocket, None)
+        if client is not None:
+            client.close()
+
+    def send(self, websocket: WebSocket, message: str) -> None:
+        """Queue a message for one connection (keeps it ordered with broadcasts)."""
+        client = self.clients.get(websocket)
+        if client is not None:
+            client.enqueue(message)
+
+    async def broadcast(self, message: str, coalesce_key: Optional[str] = None):
+        """Queue a serialized event for every connection of every worker; does not wait for sends."""
+        self.deliver(message, coalesce_key)
+        if self.relay is not None:
+            self.relay.publish(WS_RELAY_TOPIC, {
+                "kind": "broadcast", "message": message, "coalesce_key": coalesce_key,
+            })
+
+    def deliver(self, message: str, coalesce_key: Optional[str] = None):
+        """Queue a serialized event for this worker's connections."""
+        for client in list(self.clients.values()):
+            client.enqueue(message, coalesce_key)
+
+
+class FilteredWebSocketManager:
+    """
+    WebSocket manager that filters events based on user's accessible agents.
+
+    Used by /ws/events endpoint for external listeners (Trinity Connect).
+    Events are filtered server-side based on user's owned and shared agents.
+
+    Connections are indexed by agent (plus a set of admins who see every
+    agent), so an event is only looked at by the connections that can
+    receive it. A connection may narrow its subscription to specific agents
+    and/or event types; the agent index holds the intersection of the
+    subscription with what the user can access.
+    """
+
+    def __init__(self, queue_size: int = SEND_QUEUE_SIZE, send_timeout: float = SEND_TIMEOUT):
+        self.queue_size = queue_size
+        self.send_timeout = send_timeout
+        # ws -> {email, is_admin, accessible_agents, agents, event_types, client}
+        self.connections: Dict[WebSocket, Dict] = {}
+        self._by_agent: Dict[str, Set[WebSocket]] = {}
+        self._all_agents: Set[WebSocket] = set()  # Admins without an agent subscription
+        self._by_email: Dict[str, Set[WebSocket]] = {}
+        self.relay: Optional["EventRelay"] = None
+
+    async def connect(
+        self,
+        websocket: WebSocket,
+        email: str,
+        is_admin: bool,
+        accessible_agents: List[str],
+        agents: Optional[List[str]] = None,
+        event_types: Optional[List[str]] = None,
+    ):
+        """
+        Register a new (already accepted) connection with its accessible agents.
+
+        `agents` and `event_types` narrow the subscription; None means all.
+        """
+        self.connections[websocket] = {
+            "email": email,
+            "is_admin": is_admin,
+            "accessible_agents": set(accessible_agents),
+            "agents": set(agents) if agents is not None else None,
+            "event_types": set(event_types) if event_types is not None else None,
+            "client": ClientConnection(websocket, self.disconnect, self.queue_size, self.send_timeout),
+        }
+        self._by_email.setdefault((email or "").lower(), set()).add(websocket)
+        self._index(websocket)
+
+    def disconnect(self, websocket: WebSocket):
+        """Remove a connection."""
+        if websocket not in self.connections:
+            return
+        self._unindex(websocket)
+        info = self.connections.pop(websocket)
+        email = (info["email"] or "").lower()
+        sockets = self._by_email.get(email)
+        if sockets is not None:
+            sockets.discard(websocket)
+            if not sockets:
+                del self._by_email[email]
+        info["client"].close()
+
+    def update_accessible_agents(self, websocket: WebSocket, accessible_agents: List[str]):
+        """Update the accessible agents list for a connection."""
+        if websocket in self.connections:
+            self._unindex(websocket)
+            self.connections[websocket]["accessible_agents"] = set(accessible_agents)
+            self._index(websocket)
+
+    def subscribe(
+        self,
+        websocket: WebSocket,
+        agents: Optional[List[str]] = None,
+        event_types: Optional[List[str]] = None,
+    ) -> Optional[List[str]]:
+        """
+        Replace a connection's subscription; None means all agents / event types.
+
+        Returns the agents the connection now receives events for, or None
+        for an admin receiving every agent.
+        """
+        info = self.connections.get(websocket)
+        if info is None:
+            return []
+        self._unindex(websocket)
+        info["agents"] = set(agents) if agents is not None else None
+        info["event_types"] = set(event_types) if event_types is not None else None
+        self._index(websocket)
+        effective = self._subscribed_agents(info)
+        return sorted(effective) if effective is not None else None
+
+    # -------------------------------------------------------------------------
+    # Access changes (sharing, agent create/delete/rename)
+    # -------------------------------------------------------------------------
+
+    def grant_agent(self, email: str, agent_name: str):
+        """A user gained access to an agent (owner of a new agent, or shared)."""
+        self.apply_access_change("grant", [email, agent_name])
+
+    def revoke_agent(self, email: str, agent_name: str):
+        """A user lost access to an agent (unshared)."""
+        self.apply_access_change("revoke", [email, agent_name])
+
+    def remove_agent(self, agent_name: str):
+        """An agent was deleted: nobody can access it any more."""
+        self.apply_access_change("remove", [agent_name])
+
+    def rename_agent(self, old_name: str, new_name: str):
+        """An agent was renamed: access and subscriptions follow the new name."""
+        self.apply_access_change("rename", [old_name, new_name])
+
+    def apply_access_change(self, op: str, args: List[str], relay: bool = True):
+        """Apply an access change here and, unless relayed from elsewhere, on other workers."""
+        handler = {
+            "grant": self._grant_agent,
+            "revoke": self._revoke_agent,
+            "remove": self._remove_agent,
+            "rename": self._rename_agent,
+        }.get(op)
+        if handler is None:
+            return
+        handler(*args)
+        if relay and self.relay is not None:
+            self.relay.publish(WS_RELAY_TOPIC, {"kind": "access", "op": op, "args": args})
+
+    def _grant_agent(self, email: str, agent_name: str):
+        for websocket in list(self._by_email.get((email or "").lower(), ())):
+            info = self.connections[websocket]
+            if agent_name not in info["accessible_agents"]:
+                self._unindex(websocket)
+                info["accessible_agents"].add(agent_name)
+                self._index(websocket)
+
+    def _revoke_agent(self, email: str, agent_name: str):
+        for websocket in list(self._by_email.get((email or "").lower(), ())):
+            info = self.connections[websocket]
+            if agent_name in info["accessible_agents"]:
+                self._unindex(websocket)
+                info["accessible_agents"].discard(agent_name)
+                self._index(websocket)
+
+    def _remove_agent(self, agent_name: str):
+        for websocket, info in self.connections.items():
+            if agent_name in info["accessible_agents"]:
+                self._unindex(websocket)
+                info["accessible_agents"].discard(agent_name)
+                self._index(websocket)
+
+    def _rename_agent(self, old_name: str, new_name: str):
+        for websocket, info in self.connections.items():
+            renamed = False
+            for names in (info["accessible_agents"], info["agents"]):
+                if names is not None and old_name in names:
+                    names.discard(old_name)
+                    names.add(new_name)
+                    renamed = True
+            if renamed:
+                self._index(websocket)
+        self._by_agent.pop(old_name, None)
+
+    # -------------------------------------------------------------------------
+    # Index maintenance
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _subscribed_agents(info: Dict) -> Optional[Set[str]]:
+        """Agents a connection receives events for (None: every agent)."""
+        if info["is_admin"]:
+            return info["agents"]
+        if info["agents"] is None:
+            return info["accessible_agents"]
+        return info["accessible_agents"] & info["agents"]
+
+    def _index(self, websocket: WebSocket):
+        agents = self._subscribed_agents(self.connections[websocket])
+        if agents is None:
+            self._all_agents.add(websocket)
+            return
+        for agent_name in agents:
+            self._by_agent.setdefault(agent_name, set()).add(websocket)
+
+    def _unindex(self, websocket: WebSocket):
+        self._all_agents.discard(websocket)
+        agents = self._subscribed_agents(self.connections[websocket])
+        for agent_name in agents or ():
+            sockets = self._by_agent.get(agent_name)
+            if sockets is not None:
+                sockets.discard(websocket)
+                if not sockets:
+                    del self._by_agent[agent_name]
+
+    def send(self, websocket: WebSocket, message: str) -> None:
+        """Queue a message for one connection (keeps it ordered with broadcasts)."""
+        info = self.connections.get(websocket)
+        if info is not None:
+            info["client"].enqueue(message)
+
+    async def broadcast_filtered(self, event: dict, coalesce_key: Optional[str] = None):
+        """
+        Broadcast event only to users who can access the event's agent,
+        on every worker.
+        """
+        if self.deliver_filtered(event, coalesce_key) and self.relay is not None:
+            self.relay.publish(WS_RELAY_TOPIC, {
+                "kind": "filtered", "event": event, "coalesce_key": coalesce_key,
+            })
+
+    def deliver_filtered(self, event: dict, coalesce_key: Optional[str] = None) -> bool:
+        """
+        Deliver event to this worker's connections that can access its agent.
+
+        Extracts agent name from various event fields and looks up the
+        connections subscribed to that agent. The event is serialized
+        once, and only if someone receives it. Returns False if the event
+        names no agent (nobody can receive it).
+        """
+        # Extract agent name from event (different fields for different event types)
+        agent_name = (
+            event.get("agent_name") or
+            event.get("agent") or
+            event.get("name") or  # agent_started/agent_stopped events
+            event.get("source_agent") or
+            (event.get("details") or {}).get("source_agent") or
+            (event.get("details") or {}).get("target_agent")
+        )
+
+        if not agent_name:
+            return False  # Can't filter without agent name
+
+        recipients = self._by_agent.get(agent_name)
+        if self._all_agents:
+            recipients = self._all_agents | recipients if recipients else self._all_agents
+        if not recipients:
+            return True
+
+        event_type = event.get("type") or event.get("event")
+        message = None
+        for websocket in list(recipients):
+            info = self.connections[websocket]
+            if info["event_types"] is not None and event_type not in info["event_types"]:
+                continue
+            if message is None:
+                message = serialize_event(event)
+            info["client"].enqueue(message, coalesce_key)
+        return True
+
+
+def attach_relay(
+    relay: "EventRelay",
+    manager: ConnectionManager,
+    filtered_manager: FilteredWebSocketManager,
+):
+    """
+    Share broadcasts and access changes with the other backend workers.
+
+    Relayed events are delivered to this worker's connections only (the
+    publishing worker already delivered its own). Events the dedicated
+    scheduler publishes to Redis go to both managers of every worker.
+    """
+    manager.relay = relay
+    filtered_manager.relay = relay
+
+    def on_relayed(payload: dict):
+        kind = payload.get("kind")
+        if kind == "broadcast":
+            manager.deliver(payload["message"], payload.get("coalesce_key"))
+        elif kind == "filtered":
+            filtered_manager.deliver_filtered(payload["event"], payload.get("coalesce_key"))
+        elif kind == "access":
+            filtered_manager.apply_access_change(payload["op"], payload["args"], relay=False)
+
+    def on_scheduler_event(event: dict):
+        manager.deliver(serialize_event(event))
+        filtered_manager.deliver_filtered(event)
+
+    relay.add_handler(WS_RELAY_TOPIC, on_relayed)
+    relay.add_channel(SCHEDULER_EVENTS_CHANNEL, on_scheduler_event)
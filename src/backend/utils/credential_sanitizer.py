@@ -6,6 +6,10 @@ This catches any credentials that may have bypassed agent-side sanitization.
 
 Note: The primary sanitization should happen on the agent side. This backend
 layer is a safety net for cases where the agent may not have sanitized properly.
+
+Performance: each redaction pass is guarded by one precompiled combined pattern
+and only runs its per-pattern substitutions when the guard matches. Results are
+identical to running every pass unconditionally (see the agent-side module).
 """
 
 import re
@@ -51,11 +55,36 @@ SENSITIVE_KEY_PATTERNS = [
     r'TRINITY_MCP.*',
 ]
 
+REDACTION_PLACEHOLDER = "***REDACTED***"
+
 # Compiled patterns
 _secret_value_re = [re.compile(p) for p in SECRET_VALUE_PATTERNS]
 _sensitive_key_re = [re.compile(p, re.IGNORECASE) for p in SENSITIVE_KEY_PATTERNS]
 
-REDACTION_PLACEHOLDER = "***REDACTED***"
+# Matches wherever any secret value pattern matches
+_secret_value_any_re = re.compile("|".join(f"(?:{p})" for p in SECRET_VALUE_PATTERNS))
+
+
+# KEY=value redaction: one (guard, pattern) pair per sensitive key pattern.
+# A guard is the key pattern without its leading/trailing ".*" followed by a
+# "=" later on the same line; the leading ".*" otherwise makes every search
+# quadratic in the line length.
+def _sensitive_key_guard(pattern: str) -> str:
+    return pattern.removeprefix('.*').removesuffix('.*')
+
+
+_sensitive_kv_re = [
+    (
+        re.compile(_sensitive_key_guard(p) + r'[^\n]*=', re.IGNORECASE),
+        re.compile(r'(' + p + r')=(["\']?)([^\s"\']+)\2', re.IGNORECASE),
+    )
+    for p in SENSITIVE_KEY_PATTERNS
+]
+_sensitive_kv_any_re = re.compile(
+    "(?:" + "|".join(_sensitive_key_guard(p) for p in SENSITIVE_KEY_PATTERNS) + r')[^\n]*=',
+    re.IGNORECASE
+)
+_kv_replacement = r'\1=' + REDACTION_PLACEHOLDER
 
 
 def sanitize_text(text: str) -> str:
@@ -73,17 +102,19 @@ def sanitize_text(text: str) -> str:
 
     result = text
 
+    # Each pass is skipped when its guard does not match, i.e. when every
+    # pattern in the pass would leave the text unchanged.
+
     # Replace values matching secret patterns
-    for pattern in _secret_value_re:
-        result = pattern.sub(REDACTION_PLACEHOLDER, result)
+    if _secret_value_any_re.search(result):
+        for pattern in _secret_value_re:
+            result = pattern.sub(REDACTION_PLACEHOLDER, result)
 
     # Redact key=value pairs where key is sensitive
-    for key_pattern in _sensitive_key_re:
-        kv_pattern = re.compile(
-            r'(' + key_pattern.pattern + r')=(["\']?)([^\s"\']+)\2',
-            re.IGNORECASE
-        )
-        result = kv_pattern.sub(r'\1=' + REDACTION_PLACEHOLDER, result)
+    if '=' in result and _sensitive_kv_any_re.search(result):
+        for guard, kv_pattern in _sensitive_kv_re:
+            if guard.search(result):
+                result = kv_pattern.sub(_kv_replacement, result)
 
     return result
 
@@ -50,6 +50,9 @@ import { ref, computed, onUnmounted } from 'vue'
  * - Activity timeline
  * =============================================================================
  */
+// Tool calls kept in the merged timeline (the agent keeps its own bounded window)
+const MAX_TIMELINE_ENTRIES = 500
+
 export function useSessionActivity(agentRef, agentsStore) {
   /**
    * Session info containing cost and context window tracking data.
@@ -78,6 +81,9 @@ export function useSessionActivity(agentRef, agentsStore) {
   })
 
   let activityRefreshInterval = null
+  // Cursor of the last activity response: polls fetch only changed tool calls
+  let activityCursor = null
+  let activityCursorAgent = null
 
   const currentToolDisplay = computed(() => {
     if (sessionActivity.value?.active_tool) {
@@ -102,10 +108,25 @@ export function useSessionActivity(agentRef, agentsStore) {
     }
   }
 
+  const mergeTimeline = (current, changed) => {
+    const changedIds = new Set(changed.map(entry => entry.id))
+    return [...changed, ...current.filter(entry => !changedIds.has(entry.id))]
+      .sort((a, b) => (b.seq ?? 0) - (a.seq ?? 0))
+      .slice(0, MAX_TIMELINE_ENTRIES)
+  }
+
   const loadSessionActivity = async () => {
     if (!agentRef.value || agentRef.value.status !== 'running') return
+    const name = agentRef.value.name
+    const since = activityCursorAgent === name ? activityCursor : null
     try {
-      sessionActivity.value = await agentsStore.getSessionActivity(agentRef.value.name)
+      const activity = await agentsStore.getSessionActivity(name, since)
+      if (since && !activity.reset && activity.cursor) {
+        activity.timeline = mergeTimeline(sessionActivity.value.timeline || [], activity.timeline || [])
+      }
+      sessionActivity.value = activity
+      activityCursor = activity.cursor || null
+      activityCursorAgent = name
     } catch (err) {
       // Don't log errors - activity endpoint may fail during startup
       console.debug('Failed to load session activity:', err)
@@ -128,6 +149,7 @@ export function useSessionActivity(agentRef, agentsStore) {
     if (!agentRef.value) return
     try {
       await agentsStore.clearSessionActivity(agentRef.value.name)
+      activityCursor = null
       sessionActivity.value = {
         status: 'idle',
         active_tool: null,
@@ -151,6 +173,7 @@ export function useSessionActivity(agentRef, agentsStore) {
   }
 
   const resetSessionActivity = () => {
+    activityCursor = null
     sessionActivity.value = {
       status: 'idle',
       active_tool: null,
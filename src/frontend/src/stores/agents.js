@@ -2,6 +2,13 @@ import { defineStore } from 'pinia'
 import axios from 'axios'
 import { useAuthStore } from './auth'
 
+// Listing options for the file browsers: page size per folder, and folders
+// that are shown but only read when expanded
+export const FILE_TREE_OPTIONS = {
+  limit: 1000,
+  ignore: 'node_modules,__pycache__,.git,.venv,venv,.cache'
+}
+
 export const useAgentsStore = defineStore('agents', {
   state: () => ({
     agents: [],
@@ -400,10 +407,11 @@ export const useAgentsStore = defineStore('agents', {
     },
 
     // Session Activity Actions
-    async getSessionActivity(name) {
+    async getSessionActivity(name, since = null) {
       const authStore = useAuthStore()
       const response = await axios.get(`/api/agents/${name}/activity`, {
-        headers: authStore.authHeader
+        headers: authStore.authHeader,
+        params: since ? { since } : undefined
       })
       return response.data
     },
@@ -480,10 +488,11 @@ export const useAgentsStore = defineStore('agents', {
       return response.data
     },
 
-    async listAgentFiles(name, path = '/home/developer', showHidden = false) {
+    // options: { depth, offset, limit, ignore } for lazy and paged listings
+    async listAgentFiles(name, path = '/home/developer', showHidden = false, options = {}) {
       const authStore = useAuthStore()
       const response = await axios.get(`/api/agents/${name}/files`, {
-        params: { path, show_hidden: showHidden },
+        params: { path, show_hidden: showHidden, ...options },
         headers: authStore.authHeader
       })
       return response.data
@@ -0,0 +1,134 @@
+"""
+Execution completion listener (SCHED-ASYNC-002).
+
+The backend publishes to `trinity:executions:completed` whenever a schedule
+execution reaches a terminal status. One pub/sub subscription per scheduler
+process wakes the coroutines waiting in `_poll_execution_completion`, so a
+completion is observed within milliseconds and the DB is read once per
+completion instead of every poll interval.
+
+Events are hints, not the source of truth: waiters always re-read the
+execution from the DB, and fall back to polling while Redis is unreachable.
+
+The same subscription carries other backend notifications; handlers for extra
+channels (e.g. schedule changes, SCHED-SYNC-001) are added with add_handler().
+"""
+
+import asyncio
+import json
+import logging
+from typing import Callable, Dict, Optional
+
+import redis.asyncio as aioredis
+
+logger = logging.getLogger(__name__)
+
+# Must match backend db/scheduler_events.py
+EXECUTION_EVENTS_CHANNEL = "trinity:executions:completed"
+SCHEDULE_EVENTS_CHANNEL = "trinity:schedules:changed"
+
+
+class CompletionListener:
+    """Subscribes to execution completion events and wakes registered waiters."""
+
+    def __init__(self, redis_url: str, reconnect_delay: float = 5.0):
+        self.redis_url = redis_url
+        self.reconnect_delay = reconnect_delay
+        self._waiters: Dict[str, asyncio.Event] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._connected = False
+        self._handlers: Dict[str, Callable[[str], None]] = {
+            EXECUTION_EVENTS_CHANNEL: self.handle_message,
+        }
+        self.events_received = 0
+
+    @property
+    def is_connected(self) -> bool:
+        """True while the pub/sub subscription is live."""
+        return self._connected
+
+    def add_handler(self, channel: str, handler: Callable[[str], None]):
+        """Dispatch raw payloads from another channel to handler. Call before start()."""
+        self._handlers[channel] = handler
+
+    def start(self):
+        """Start the subscriber task on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def stop(self):
+        """Cancel the subscriber task and release all waiters."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._set_disconnected()
+
+    def register(self, execution_id: str) -> asyncio.Event:
+        """
+        Get the wake-up event for an execution.
+
+        Register before dispatching the task so a fast completion is not missed.
+        Calling again for the same execution returns the same event.
+        """
+        event = self._waiters.get(execution_id)
+        if event is None:
+            event = self._waiters[execution_id] = asyncio.Event()
+        return event
+
+    def unregister(self, execution_id: str):
+        self._waiters.pop(execution_id, None)
+
+    def notify(self, execution_id: str):
+        """Wake the waiter for an execution, if any."""
+        event = self._waiters.get(execution_id)
+        if event is not None:
+            event.set()
+
+    def handle_message(self, data: str):
+        """Handle a raw pub/sub payload."""
+        try:
+            execution_id = json.loads(data)["execution_id"]
+        except (ValueError, KeyError, TypeError):
+            logger.warning(f"Ignoring malformed completion event: {data!r}")
+            return
+        self.events_received += 1
+        self.notify(execution_id)
+
+    def _set_disconnected(self):
+        self._connected = False
+        # Events may have been missed - make every waiter re-check the DB
+        for event in self._waiters.values():
+            event.set()
+
+    async def _run(self):
+        while True:
+            client = aioredis.from_url(self.redis_url, decode_responses=True)
+            pubsub = client.pubsub()
+            try:
+                await pubsub.subscribe(*self._handlers)
+                self._connected = True
+                logger.info(f"Subscribed to {', '.join(self._handlers)}")
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    handler = self._handlers.get(message["channel"])
+                    if handler:
+                        try:
+                            handler(message["data"])
+                        except Exception as e:
+                            logger.error(f"Handler for {message['channel']} failed: {e}")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(
+                    f"Completion listener disconnected ({e}), "
+                    f"falling back to polling; retrying in {self.reconnect_delay}s"
+                )
+            finally:
+                self._set_disconnected()
+                try:
+                    await pubsub.aclose()
+                    await client.aclose()
+                except Exception:
+                    pass
+            await asyncio.sleep(self.reconnect_delay)
@@ -46,6 +46,9 @@ class SchedulerConfig:
     schedule_reload_interval: int = field(default_factory=lambda: int(os.getenv(
         "SCHEDULE_RELOAD_INTERVAL", "60"
     )))  # seconds
+    schedule_full_sync_interval: int = field(default_factory=lambda: int(os.getenv(
+        "SCHEDULE_FULL_SYNC_INTERVAL", "3600"
+    )))  # seconds between full reloads; other syncs read only the change feed (SCHED-SYNC-001)
 
     # Agent communication
     agent_timeout: float = field(default_factory=lambda: float(os.getenv(
@@ -57,6 +60,16 @@ class SchedulerConfig:
         "POLL_INTERVAL", "10"
     )))  # seconds between DB polls while waiting for task completion
 
+    # Completion events (SCHED-ASYNC-002): wait on the backend's Redis
+    # completion events instead of polling; poll only as a safety net.
+    # The same subscription delivers schedule-change wakeups (SCHED-SYNC-001).
+    completion_events: bool = field(default_factory=lambda: os.getenv(
+        "COMPLETION_EVENTS", "true"
+    ).lower() == "true")
+    completion_fallback_interval: int = field(default_factory=lambda: int(os.getenv(
+        "COMPLETION_FALLBACK_INTERVAL", "60"
+    )))  # seconds between safety-net DB checks while events are flowing
+
     # Misfire grace time — how long after a missed trigger APScheduler will
     # still execute the job.  Default 30s is far too low for weekly cron jobs
     # whose container may restart.  3600s (1 hour) gives ample runway.
@@ -11,13 +11,17 @@ import sqlite3
 import logging
 from contextlib import contextmanager
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
 from .config import config
 from .models import Schedule, ScheduleExecution, ExecutionStatus, ProcessSchedule, ProcessScheduleExecution
 
 logger = logging.getLogger(__name__)
 
+# IDs per IN (...) query: well below SQLite's bound-parameter limit (999 on
+# older builds)
+ID_CHUNK_SIZE = 500
+
 
 class SchedulerDatabase:
     """
@@ -739,3 +743,109 @@ class SchedulerDatabase:
             ))
             conn.commit()
             return cursor.rowcount > 0
+
+    # =========================================================================
+    # Schedule Change Feed (SCHED-SYNC-001)
+    # =========================================================================
+    #
+    # The backend migration (src/backend/db/migrations.py,
+    # ensure_schedule_change_feed) owns the schedule_changes table and the
+    # triggers on agent_schedules and process_schedules that append to it.
+    # Each row's AUTOINCREMENT revision orders the changes, and deletes are
+    # kept as tombstones, so sync only reads schedules changed since the last
+    # revision it applied.
+
+    _CHANGE_FEED_TRIGGERS = (
+        "trg_agent_schedules_insert",
+        "trg_agent_schedules_update",
+        "trg_agent_schedules_delete",
+        "trg_process_schedules_replace",
+        "trg_process_schedules_insert",
+        "trg_process_schedules_update",
+        "trg_process_schedules_delete",
+    )
+
+    def has_schedule_change_feed(self) -> bool:
+        """
+        Check that the schedule_changes table and all of its triggers exist.
+
+        Returns False (callers fall back to full sync) until the backend has
+        created the feed, or if it cannot be read.
+        """
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT name FROM sqlite_master
+                    WHERE (type = 'table' AND name = 'schedule_changes') OR type = 'trigger'
+                """)
+                names = {row["name"] for row in cursor.fetchall()}
+        except sqlite3.Error as e:
+            logger.warning(f"Schedule change feed unavailable, using full sync: {e}")
+            return False
+        return "schedule_changes" in names and names.issuperset(self._CHANGE_FEED_TRIGGERS)
+
+    def get_schedule_revision(self) -> int:
+        """Get the latest schedule revision (0 if no change was ever recorded)."""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            # sqlite_sequence survives pruning, unlike MAX(revision)
+            cursor.execute("SELECT seq FROM sqlite_sequence WHERE name = 'schedule_changes'")
+            row = cursor.fetchone()
+            return row["seq"] if row else 0
+
+    def get_schedule_changes(self, since_revision: int) -> Tuple[int, List[Tuple[str, str]]]:
+        """
+        Get schedules changed after a revision.
+
+        Returns:
+            (latest revision seen, [(schedule_type, schedule_id), ...]) with
+            one entry per schedule, in order of its latest change.
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT schedule_type, schedule_id, MAX(revision) AS revision
+                FROM schedule_changes
+                WHERE revision > ?
+                GROUP BY schedule_type, schedule_id
+                ORDER BY revision
+            """, (since_revision,))
+            rows = cursor.fetchall()
+        if not rows:
+            return since_revision, []
+        return rows[-1]["revision"], [(row["schedule_type"], row["schedule_id"]) for row in rows]
+
+    def _select_by_ids(self, table: str, ids: List[str]) -> List[sqlite3.Row]:
+        """SELECT * rows of a table by ID, ID_CHUNK_SIZE IDs per query."""
+        rows = []
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            for start in range(0, len(ids), ID_CHUNK_SIZE):
+                chunk = ids[start:start + ID_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                cursor.execute(f"SELECT * FROM {table} WHERE id IN ({placeholders})", chunk)
+                rows.extend(cursor.fetchall())
+        return rows
+
+    def list_schedules_by_ids(self, schedule_ids: List[str]) -> List[Schedule]:
+        """List agent schedules by ID (missing IDs are omitted)."""
+        return [self._row_to_schedule(row) for row in self._select_by_ids("agent_schedules", schedule_ids)]
+
+    def list_process_schedules_by_ids(self, schedule_ids: List[str]) -> List[ProcessSchedule]:
+        """List process schedules by ID (missing IDs are omitted)."""
+        return [
+            self._row_to_process_schedule(row)
+            for row in self._select_by_ids("process_schedules", schedule_ids)
+        ]
+
+    def prune_schedule_changes(self, up_to_revision: int, older_than: datetime) -> int:
+        """Delete applied change rows older than a cutoff (UTC). Returns rows deleted."""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                DELETE FROM schedule_changes
+                WHERE revision <= ? AND changed_at < ?
+            """, (up_to_revision, older_than.isoformat()))
+            conn.commit()
+            return cursor.rowcount
@@ -9,7 +9,7 @@ import asyncio
 import logging
 import json
 import time
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Dict, Optional, List, Callable
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
@@ -26,6 +26,7 @@ from .config import config
 from .models import Schedule, ScheduleExecution, ExecutionStatus, SchedulerStatus, ProcessSchedule
 from .database import SchedulerDatabase
 from .locking import get_lock_manager, LockManager
+from .completion import CompletionListener, SCHEDULE_EVENTS_CHANNEL
 
 logger = logging.getLogger(__name__)
 
@@ -66,10 +67,21 @@ class SchedulerService:
         self._instance_id: str = f"scheduler-{datetime.utcnow().strftime('%Y%m%d%H%M%S')}"
 
         # Schedule state snapshots for sync detection
-        # Maps schedule_id -> (enabled, updated_at_iso)
+        # Maps schedule_id -> job-defining fields (see _schedule_state)
         self._schedule_snapshot: Dict[str, tuple] = {}
         self._process_schedule_snapshot: Dict[str, tuple] = {}
 
+        # Incremental sync via the schedule_changes feed (SCHED-SYNC-001).
+        # _schedule_revision is the last feed revision applied; None means
+        # the feed is unavailable and every sync is a full reload.
+        self._schedule_revision: Optional[int] = None
+        self._last_full_sync: float = 0.0
+        self._sync_lock = asyncio.Lock()
+        self._sync_requested = False
+
+        # Wakes async-dispatch waiters on backend completion events (SCHED-ASYNC-002)
+        self.completion_listener: Optional[CompletionListener] = None
+
     @property
     def redis(self) -> redis.Redis:
         """Get or create Redis connection for events."""
@@ -86,6 +98,11 @@ class SchedulerService:
         # Ensure process schedules table exists
         self.db.ensure_process_schedules_table()
 
+        # Take the change-feed revision before loading so no write is missed
+        if self.db.has_schedule_change_feed():
+            self._schedule_revision = self.db.get_schedule_revision()
+        self._last_full_sync = time.monotonic()
+
         # Create scheduler with memory job store
         jobstores = {
             'default': MemoryJobStore()
@@ -107,20 +124,14 @@ class SchedulerService:
         for schedule in schedules:
             self._add_job(schedule)
             # Capture snapshot for sync detection
-            self._schedule_snapshot[schedule.id] = (
-                schedule.enabled,
-                schedule.updated_at.isoformat() if schedule.updated_at else None
-            )
+            self._schedule_snapshot[schedule.id] = self._schedule_state(schedule)
 
         # Load all enabled process schedules from database
         process_schedules = self.db.list_all_enabled_process_schedules()
         for process_schedule in process_schedules:
             self._add_process_job(process_schedule)
             # Capture snapshot for sync detection
-            self._process_schedule_snapshot[process_schedule.id] = (
-                process_schedule.enabled,
-                process_schedule.updated_at.isoformat() if process_schedule.updated_at else None
-            )
+            self._process_schedule_snapshot[process_schedule.id] = self._process_schedule_state(process_schedule)
 
         # Add listener for skipped executions (max_instances reached)
         # This records when a scheduled job is dropped because previous execution is still running
@@ -131,6 +142,7 @@ class SchedulerService:
 
         # Start the scheduler
         self.scheduler.start()
+        self._start_completion_listener()
         self._initialized = True
         self._start_time = datetime.utcnow()
 
@@ -139,6 +151,21 @@ class SchedulerService:
         logger.info(f"Schedule sync interval: {config.schedule_reload_interval}s")
         logger.info(f"Misfire grace time: {config.misfire_grace_time}s")
 
+    def _start_completion_listener(self):
+        """Subscribe to backend execution completion events (SCHED-ASYNC-002)."""
+        if not config.completion_events or self.completion_listener is not None:
+            return
+        try:
+            listener = CompletionListener(self.redis_url)
+            # Schedule writes in the backend trigger an immediate sync (SCHED-SYNC-001)
+            listener.add_handler(SCHEDULE_EVENTS_CHANNEL, self._on_schedules_changed)
+            listener.start()
+        except RuntimeError:
+            # No running event loop (sync callers) - keep pure polling
+            logger.debug("No running event loop, completion events disabled")
+            return
+        self.completion_listener = listener
+
     def _get_missed_schedules(self, schedules: List[Schedule]) -> List[Schedule]:
         """
         Detect schedules that missed their last expected run (Issue #145).
@@ -200,6 +227,10 @@ class SchedulerService:
             self._initialized = False
             logger.info("Scheduler shutdown")
 
+        if self.completion_listener:
+            self.completion_listener.stop()
+            self.completion_listener = None
+
         if self._redis:
             self._redis.close()
             self._redis = None
@@ -346,140 +377,202 @@ class SchedulerService:
         """
         Sync in-memory APScheduler jobs with database schedules.
 
-        This is called periodically to detect:
+        This is called periodically (and on backend schedule-change events)
+        to detect:
         - New schedules created since last sync
         - Deleted schedules
         - Updated schedules (cron, timezone, enabled status changed)
 
+        Normally only schedules recorded in the schedule_changes feed since
+        the last applied revision are read (SCHED-SYNC-001). A full reload
+        runs when the feed is unavailable and every
+        config.schedule_full_sync_interval seconds as a safety net.
+
         This allows new schedules to work without restarting the scheduler container.
         """
-        try:
-            await self._sync_agent_schedules()
-            await self._sync_process_schedules()
-        except Exception as e:
-            logger.error(f"Schedule sync failed: {e}")
+        async with self._sync_lock:
+            self._sync_requested = False
+            try:
+                full_sync_due = (
+                    time.monotonic() - self._last_full_sync >= config.schedule_full_sync_interval
+                )
+                if self._schedule_revision is None or full_sync_due:
+                    await self._full_sync_schedules()
+                else:
+                    await self._incremental_sync_schedules()
+            except Exception as e:
+                logger.error(f"Schedule sync failed: {e}")
 
-    async def _sync_agent_schedules(self):
-        """Sync agent schedules with database."""
-        # Get all schedules from database (enabled and disabled)
-        all_schedules = self.db.list_all_schedules()
-
-        # Build current state map
-        current_state: Dict[str, tuple] = {}
-        schedule_map: Dict[str, Schedule] = {}
-        for schedule in all_schedules:
-            current_state[schedule.id] = (
-                schedule.enabled,
-                schedule.updated_at.isoformat() if schedule.updated_at else None
-            )
-            schedule_map[schedule.id] = schedule
+    def _on_schedules_changed(self, data: str):
+        """Schedule-change event from the backend: sync now (coalesces bursts)."""
+        if self._sync_requested:
+            return
+        self._sync_requested = True
+        asyncio.get_running_loop().create_task(self._sync_schedules())
+
+    async def _full_sync_schedules(self):
+        """Reload all schedules and reconcile them with the snapshots."""
+        # Also picks up a feed the backend created after this service started
+        revision = self.db.get_schedule_revision() if self.db.has_schedule_change_feed() else None
+
+        await self._sync_agent_schedules()
+        await self._sync_process_schedules()
+        self._last_full_sync = time.monotonic()
+
+        if revision is not None:
+            self._schedule_revision = revision
+            # Changes up to the revision are applied; keep an hour for debugging
+            self.db.prune_schedule_changes(revision, datetime.utcnow() - timedelta(hours=1))
+
+    async def _incremental_sync_schedules(self):
+        """Apply only schedules changed since the last applied feed revision."""
+        revision, changes = self.db.get_schedule_changes(self._schedule_revision)
+        if not changes:
+            return
+
+        agent_ids = [schedule_id for kind, schedule_id in changes if kind == "agent"]
+        process_ids = [schedule_id for kind, schedule_id in changes if kind == "process"]
+
+        agent_schedules = {s.id: s for s in self.db.list_schedules_by_ids(agent_ids)}
+        for schedule_id in agent_ids:
+            self._apply_schedule_change(schedule_id, agent_schedules.get(schedule_id))
+
+        process_schedules = {s.id: s for s in self.db.list_process_schedules_by_ids(process_ids)}
+        for schedule_id in process_ids:
+            self._apply_process_schedule_change(schedule_id, process_schedules.get(schedule_id))
 
-        # Detect changes
-        snapshot_ids = set(self._schedule_snapshot.keys())
-        current_ids = set(current_state.keys())
+        self._schedule_revision = revision
+        logger.info(
+            f"Sync: applied {len(agent_ids)} agent / {len(process_ids)} process "
+            f"schedule change(s) up to revision {revision}"
+        )
+
+    @staticmethod
+    def _schedule_state(schedule: Schedule) -> tuple:
+        """Fields an agent schedule's APScheduler job depends on."""
+        return (schedule.enabled, schedule.cron_expression, schedule.timezone,
+                schedule.agent_name, schedule.name)
+
+    @staticmethod
+    def _process_schedule_state(schedule: ProcessSchedule) -> tuple:
+        """Fields a process schedule's APScheduler job depends on."""
+        return (schedule.enabled, schedule.cron_expression, schedule.timezone,
+                schedule.process_name, schedule.trigger_id)
+
+    def _apply_schedule_change(self, schedule_id: str, schedule: Optional[Schedule]) -> Optional[str]:
+        """
+        Reconcile one agent schedule with its snapshot.
+
+        Args:
+            schedule: Current database row, or None if the schedule was deleted
+
+        Returns:
+            "added", "removed", "updated" or None if nothing changed
+        """
+        old_state = self._schedule_snapshot.get(schedule_id)
 
-        # New schedules (in database but not in snapshot)
-        new_ids = current_ids - snapshot_ids
-        for schedule_id in new_ids:
-            schedule = schedule_map[schedule_id]
+        if schedule is None:
+            # Deleted schedule (in snapshot but not in database)
+            if old_state is None:
+                return None
+            logger.info(f"Sync: Removing deleted schedule {schedule_id}")
+            self._remove_job(schedule_id)
+            del self._schedule_snapshot[schedule_id]
+            return "removed"
+
+        new_state = self._schedule_state(schedule)
+
+        if old_state is None:
+            # New schedule (in database but not in snapshot)
             if schedule.enabled:
                 logger.info(f"Sync: Adding new schedule {schedule.name} for agent {schedule.agent_name}")
                 self._add_job(schedule)
-            self._schedule_snapshot[schedule_id] = current_state[schedule_id]
+            self._schedule_snapshot[schedule_id] = new_state
+            return "added"
 
-        # Deleted schedules (in snapshot but not in database)
-        deleted_ids = snapshot_ids - current_ids
-        for schedule_id in deleted_ids:
-            logger.info(f"Sync: Removing deleted schedule {schedule_id}")
+        if old_state == new_state:
+            return None
+
+        old_enabled, new_enabled = old_state[0], new_state[0]
+        if old_enabled and not new_enabled:
+            # Schedule was disabled
+            logger.info(f"Sync: Disabling schedule {schedule.name}")
             self._remove_job(schedule_id)
-            del self._schedule_snapshot[schedule_id]
+        elif not old_enabled and new_enabled:
+            # Schedule was enabled
+            logger.info(f"Sync: Enabling schedule {schedule.name}")
+            self._add_job(schedule)
+        elif new_enabled:
+            # Schedule was updated (and still enabled)
+            logger.info(f"Sync: Updating schedule {schedule.name}")
+            self._remove_job(schedule_id)
+            self._add_job(schedule)
 
-        # Updated schedules (still exists but state changed)
-        for schedule_id in (snapshot_ids & current_ids):
-            old_state = self._schedule_snapshot[schedule_id]
-            new_state = current_state[schedule_id]
-
-            if old_state != new_state:
-                schedule = schedule_map[schedule_id]
-                old_enabled, old_updated = old_state
-                new_enabled, new_updated = new_state
-
-                if old_enabled and not new_enabled:
-                    # Schedule was disabled
-                    logger.info(f"Sync: Disabling schedule {schedule.name}")
-                    self._remove_job(schedule_id)
-                elif not old_enabled and new_enabled:
-                    # Schedule was enabled
-                    logger.info(f"Sync: Enabling schedule {schedule.name}")
-                    self._add_job(schedule)
-                elif new_enabled and old_updated != new_updated:
-                    # Schedule was updated (and still enabled)
-                    logger.info(f"Sync: Updating schedule {schedule.name}")
-                    self._remove_job(schedule_id)
-                    self._add_job(schedule)
-
-                self._schedule_snapshot[schedule_id] = new_state
-
-        if new_ids or deleted_ids:
-            logger.info(f"Sync complete: {len(new_ids)} added, {len(deleted_ids)} removed")
+        self._schedule_snapshot[schedule_id] = new_state
+        return "updated"
 
-    async def _sync_process_schedules(self):
-        """Sync process schedules with database."""
-        # Get all process schedules from database
-        all_schedules = self.db.list_all_process_schedules()
-
-        # Build current state map
-        current_state: Dict[str, tuple] = {}
-        schedule_map: Dict[str, ProcessSchedule] = {}
-        for schedule in all_schedules:
-            current_state[schedule.id] = (
-                schedule.enabled,
-                schedule.updated_at.isoformat() if schedule.updated_at else None
-            )
-            schedule_map[schedule.id] = schedule
+    def _apply_process_schedule_change(
+        self, schedule_id: str, schedule: Optional[ProcessSchedule]
+    ) -> Optional[str]:
+        """Reconcile one process schedule with its snapshot (see _apply_schedule_change)."""
+        old_state = self._process_schedule_snapshot.get(schedule_id)
+
+        if schedule is None:
+            if old_state is None:
+                return None
+            logger.info(f"Sync: Removing deleted process schedule {schedule_id}")
+            self._remove_process_job(schedule_id)
+            del self._process_schedule_snapshot[schedule_id]
+            return "removed"
 
-        # Detect changes
-        snapshot_ids = set(self._process_schedule_snapshot.keys())
-        current_ids = set(current_state.keys())
+        new_state = self._process_schedule_state(schedule)
+        label = f"{schedule.process_name}/{schedule.trigger_id}"
 
-        # New schedules
-        new_ids = current_ids - snapshot_ids
-        for schedule_id in new_ids:
-            schedule = schedule_map[schedule_id]
+        if old_state is None:
             if schedule.enabled:
-                logger.info(f"Sync: Adding new process schedule {schedule.process_name}/{schedule.trigger_id}")
+                logger.info(f"Sync: Adding new process schedule {label}")
                 self._add_process_job(schedule)
-            self._process_schedule_snapshot[schedule_id] = current_state[schedule_id]
+            self._process_schedule_snapshot[schedule_id] = new_state
+            return "added"
 
-        # Deleted schedules
-        deleted_ids = snapshot_ids - current_ids
-        for schedule_id in deleted_ids:
-            logger.info(f"Sync: Removing deleted process schedule {schedule_id}")
+        if old_state == new_state:
+            return None
+
+        old_enabled, new_enabled = old_state[0], new_state[0]
+        if old_enabled and not new_enabled:
+            logger.info(f"Sync: Disabling process schedule {label}")
             self._remove_process_job(schedule_id)
-            del self._process_schedule_snapshot[schedule_id]
+        elif not old_enabled and new_enabled:
+            logger.info(f"Sync: Enabling process schedule {label}")
+            self._add_process_job(schedule)
+        elif new_enabled:
+            logger.info(f"Sync: Updating process schedule {label}")
+            self._remove_process_job(schedule_id)
+            self._add_process_job(schedule)
 
-        # Updated schedules
-        for schedule_id in (snapshot_ids & current_ids):
-            old_state = self._process_schedule_snapshot[schedule_id]
-            new_state = current_state[schedule_id]
-
-            if old_state != new_state:
-                schedule = schedule_map[schedule_id]
-                old_enabled, old_updated = old_state
-                new_enabled, new_updated = new_state
-
-                if old_enabled and not new_enabled:
-                    logger.info(f"Sync: Disabling process schedule {schedule.process_name}/{schedule.trigger_id}")
-                    self._remove_process_job(schedule_id)
-                elif not old_enabled and new_enabled:
-                    logger.info(f"Sync: Enabling process schedule {schedule.process_name}/{schedule.trigger_id}")
-                    self._add_process_job(schedule)
-                elif new_enabled and old_updated != new_updated:
-                    logger.info(f"Sync: Updating process schedule {schedule.process_name}/{schedule.trigger_id}")
-                    self._remove_process_job(schedule_id)
-                    self._add_process_job(schedule)
-
-                self._process_schedule_snapshot[schedule_id] = new_state
+        self._process_schedule_snapshot[schedule_id] = new_state
+        return "updated"
+
+    async def _sync_agent_schedules(self):
+        """Full sync of agent schedules with database."""
+        # Get all schedules from database (enabled and disabled)
+        schedule_map = {schedule.id: schedule for schedule in self.db.list_all_schedules()}
+
+        results = [
+            self._apply_schedule_change(schedule_id, schedule_map.get(schedule_id))
+            for schedule_id in set(self._schedule_snapshot) | set(schedule_map)
+        ]
+
+        added, removed = results.count("added"), results.count("removed")
+        if added or removed:
+            logger.info(f"Sync complete: {added} added, {removed} removed")
+
+    async def _sync_process_schedules(self):
+        """Full sync of process schedules with database."""
+        schedule_map = {schedule.id: schedule for schedule in self.db.list_all_process_schedules()}
+
+        for schedule_id in set(self._process_schedule_snapshot) | set(schedule_map):
+            self._apply_process_schedule_change(schedule_id, schedule_map.get(schedule_id))
 
     # =========================================================================
     # Skipped Execution Tracking (Issue #46)
@@ -770,9 +863,10 @@ class SchedulerService:
         """
         Execute a task via the backend's internal TaskExecutionService endpoint.
 
-        Uses async fire-and-forget dispatch with DB polling (SCHED-ASYNC-001):
+        Uses async fire-and-forget dispatch (SCHED-ASYNC-001):
         1. POST with async_mode=True and 30s timeout (dispatch only)
-        2. If backend accepts, poll DB every poll_interval seconds until done
+        2. If backend accepts, wait for its completion event (SCHED-ASYNC-002)
+           or poll DB every poll_interval seconds until done
         3. Backward compatible: if backend returns sync result, use it directly
 
         Returns:
@@ -802,35 +896,45 @@ class SchedulerService:
         # Step 1: Dispatch with short timeout (30s max for the HTTP round-trip)
         dispatch_timeout = 30.0
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{config.backend_url}/api/internal/execute-task",
-                headers=headers,
-                json=payload,
-                timeout=dispatch_timeout,
-            )
+        # Register for the completion event before dispatch so a task that
+        # finishes during the HTTP round-trip is not missed
+        listener = self.completion_listener
+        if listener and execution_id:
+            listener.register(execution_id)
 
-            if response.status_code != 200:
-                error_text = response.text[:500] if response.text else f"HTTP {response.status_code}"
-                raise Exception(f"Backend execute-task returned {response.status_code}: {error_text}")
+        try:
+            async with httpx.AsyncClient() as client:
+                response = await client.post(
+                    f"{config.backend_url}/api/internal/execute-task",
+                    headers=headers,
+                    json=payload,
+                    timeout=dispatch_timeout,
+                )
 
-            result = response.json()
+                if response.status_code != 200:
+                    error_text = response.text[:500] if response.text else f"HTTP {response.status_code}"
+                    raise Exception(f"Backend execute-task returned {response.status_code}: {error_text}")
 
-        # Step 2: Check if backend accepted async mode
-        if result.get("status") == "accepted" and result.get("async_mode"):
-            # Async accepted — poll DB for completion
-            logger.info(
-                f"Backend accepted async execution for {agent_name}, "
-                f"execution_id={execution_id}, polling every {config.poll_interval}s"
-            )
-            return await self._poll_execution_completion(
-                execution_id=execution_id,
-                timeout_seconds=timeout_seconds,
-            )
+                result = response.json()
 
-        # Backward compatibility: backend returned a sync result (old backend
-        # without async_mode support). Use the result directly.
-        return result
+            # Step 2: Check if backend accepted async mode
+            if result.get("status") == "accepted" and result.get("async_mode"):
+                # Async accepted — wait for completion
+                logger.info(
+                    f"Backend accepted async execution for {agent_name}, "
+                    f"execution_id={execution_id}, waiting for completion"
+                )
+                return await self._poll_execution_completion(
+                    execution_id=execution_id,
+                    timeout_seconds=timeout_seconds,
+                )
+
+            # Backward compatibility: backend returned a sync result (old backend
+            # without async_mode support). Use the result directly.
+            return result
+        finally:
+            if listener and execution_id:
+                listener.unregister(execution_id)
 
     async def _poll_execution_completion(
         self,
@@ -838,10 +942,13 @@ class SchedulerService:
         timeout_seconds: int,
     ) -> dict:
         """
-        Poll the DB for execution completion (SCHED-ASYNC-001).
+        Wait for execution completion (SCHED-ASYNC-001, SCHED-ASYNC-002).
 
-        Polls every config.poll_interval seconds until the execution status
-        is no longer 'running', or the deadline is exceeded.
+        While the completion listener is connected, sleeps until the backend's
+        completion event arrives (re-checking the DB every
+        config.completion_fallback_interval seconds as a safety net).
+        Otherwise polls every config.poll_interval seconds. Either way the DB
+        record is the source of truth for the result.
 
         Returns:
             dict with status, response, error, cost, etc. from the execution record.
@@ -853,33 +960,51 @@ class SchedulerService:
         deadline = time.monotonic() + float(timeout_seconds) + 60
         poll_count = 0
 
-        while time.monotonic() < deadline:
-            await asyncio.sleep(config.poll_interval)
-            poll_count += 1
-
-            execution = self.db.get_execution(execution_id)
-            if not execution:
-                logger.warning(f"Execution {execution_id} not found in DB during polling (poll #{poll_count})")
-                continue
-
-            if execution.status != ExecutionStatus.RUNNING:
-                logger.info(
-                    f"Execution {execution_id} completed: status={execution.status} "
-                    f"(polled {poll_count} times)"
-                )
-                return {
-                    "execution_id": execution.id,
-                    "status": execution.status,
-                    "response": execution.response,
-                    "error": execution.error,
-                    "cost": execution.cost,
-                    "context_used": execution.context_used,
-                    "context_max": execution.context_max,
-                }
+        listener = self.completion_listener
+        completed_event = listener.register(execution_id) if listener else None
 
-            if poll_count % 6 == 0:  # Log every ~60s at default 10s interval
-                elapsed = int(time.monotonic() - (deadline - float(timeout_seconds) - 60))
-                logger.info(f"Execution {execution_id} still running ({elapsed}s elapsed, poll #{poll_count})")
+        try:
+            while time.monotonic() < deadline:
+                if completed_event is not None and listener.is_connected:
+                    # Event-driven: wake on completion, re-check DB as safety net
+                    try:
+                        await asyncio.wait_for(
+                            completed_event.wait(),
+                            timeout=min(config.completion_fallback_interval, deadline - time.monotonic()),
+                        )
+                    except asyncio.TimeoutError:
+                        pass
+                    completed_event.clear()
+                else:
+                    await asyncio.sleep(config.poll_interval)
+                poll_count += 1
+
+                execution = self.db.get_execution(execution_id)
+                if not execution:
+                    logger.warning(f"Execution {execution_id} not found in DB during polling (poll #{poll_count})")
+                    continue
+
+                if execution.status != ExecutionStatus.RUNNING:
+                    logger.info(
+                        f"Execution {execution_id} completed: status={execution.status} "
+                        f"(polled {poll_count} times)"
+                    )
+                    return {
+                        "execution_id": execution.id,
+                        "status": execution.status,
+                        "response": execution.response,
+                        "error": execution.error,
+                        "cost": execution.cost,
+                        "context_used": execution.context_used,
+                        "context_max": execution.context_max,
+                    }
+
+                if poll_count % 6 == 0:  # Log every ~60s at default 10s interval
+                    elapsed = int(time.monotonic() - (deadline - float(timeout_seconds) - 60))
+                    logger.info(f"Execution {execution_id} still running ({elapsed}s elapsed, poll #{poll_count})")
+        finally:
+            if listener:
+                listener.unregister(execution_id)
 
         raise Exception(
             f"Polling deadline exceeded for execution {execution_id} "
@@ -5,6 +5,8 @@ Tests the analytics calculations for process executions.
 Reference: BACKLOG_ADVANCED.md - E11-02
 """
 
+import sqlite3
+
 import pytest
 from datetime import datetime, timezone, timedelta
 from decimal import Decimal
@@ -308,3 +310,162 @@ class TestSuccessRateCalculation:
             success_rate=70.0,
         )
         assert metrics.success_rate == 70.0
+
+
+# =============================================================================
+# Repository Aggregation Tests
+# =============================================================================
+
+
+class TestRepositoryAggregation:
+    """SQL aggregation over the daily rollups matches in-memory aggregation."""
+
+    @pytest.fixture
+    def definitions(self):
+        from services.process_engine.domain import StepDefinition
+
+        definitions = []
+        for name in ("billing", "onboarding"):
+            definition = ProcessDefinition.create(name=name)
+            definition.steps = [
+                StepDefinition.from_dict({
+                    "id": step_id,
+                    "type": "agent_task",
+                    "agent": "test-agent",
+                    "message": step_id,
+                })
+                for step_id in ("fetch", "review")
+            ]
+            definitions.append(definition)
+        return definitions
+
+    @pytest.fixture
+    def definition_repo(self, definitions):
+        repo = Mock()
+        by_id = {str(d.id): d for d in definitions}
+        repo.get_by_id.side_effect = lambda process_id: by_id.get(str(process_id))
+        repo.list_all.return_value = definitions
+        return repo
+
+    @pytest.fixture
+    def repository(self, tmp_path):
+        from services.process_engine.repositories import SqliteProcessExecutionRepository
+
+        return SqliteProcessExecutionRepository(tmp_path / "executions.db")
+
+    def _seed(self, repository, definitions, count=120):
+        """Save executions spread over 40 days in every state."""
+        now = datetime.now(timezone.utc)
+        statuses = [
+            ExecutionStatus.COMPLETED, ExecutionStatus.COMPLETED, ExecutionStatus.FAILED,
+            ExecutionStatus.CANCELLED, ExecutionStatus.RUNNING, ExecutionStatus.PENDING,
+        ]
+        executions = []
+        for i in range(count):
+            execution = ProcessExecution.create(definitions[i % 2])
+            status = statuses[i % len(statuses)]
+            execution.status = status
+            if status != ExecutionStatus.PENDING:
+                execution.started_at = now - timedelta(hours=8 * i, seconds=i)
+            if status in (ExecutionStatus.COMPLETED, ExecutionStatus.FAILED):
+                execution.completed_at = execution.started_at + timedelta(seconds=30 + i % 7, milliseconds=250)
+            if i % 3:
+                execution.total_cost = Money(Decimal(i) / 10, "USD")
+            for j, step_exec in enumerate(execution.step_executions.values()):
+                if execution.started_at:
+                    step_exec.started_at = execution.started_at
+                    step_exec.completed_at = execution.started_at + timedelta(seconds=i % 5 + j, milliseconds=500)
+                    step_exec.status = StepStatus.FAILED if (i + j) % 4 == 0 else StepStatus.COMPLETED
+                if (i + j) % 2:
+                    step_exec.cost = Money(Decimal(i + j) / 100, "USD")
+            repository.save(execution)
+            executions.append(execution)
+        return executions
+
+    def _assert_matches_loaded(self, repository, definition_repo, definitions):
+        """Compare the SQL path with aggregation over loaded executions."""
+        sql = ProcessAnalytics(definition_repo, repository)
+        loaded = ProcessAnalytics(definition_repo, Mock(wraps=repository))
+        assert sql._aggregates is repository and loaded._aggregates is None
+
+        for days in (1, 7, 30):
+            assert [m.to_dict() for m in sql.get_all_process_metrics(days)] == \
+                [m.to_dict() for m in loaded.get_all_process_metrics(days)]
+            for definition in definitions:
+                assert sql.get_process_metrics(definition.id, days).to_dict() == \
+                    loaded.get_process_metrics(definition.id, days).to_dict()
+                assert sql.get_trend_data(days, definition.id).to_dict() == \
+                    loaded.get_trend_data(days, definition.id).to_dict()
+            assert sql.get_trend_data(days).to_dict() == loaded.get_trend_data(days).to_dict()
+
+            sql_steps = sql.get_step_performance(days, limit=50).to_dict()
+            loaded_steps = loaded.get_step_performance(days, limit=50).to_dict()
+            for category in ("slowest_steps", "most_expensive_steps"):
+                key = lambda s: (s["process_name"], s["step_id"])
+                assert sorted(sql_steps[category], key=key) == sorted(loaded_steps[category], key=key)
+
+    def test_matches_loaded_executions(self, repository, definition_repo, definitions):
+        self._seed(repository, definitions)
+
+        self._assert_matches_loaded(repository, definition_repo, definitions)
+        metrics = ProcessAnalytics(definition_repo, repository).get_process_metrics(definitions[0].id)
+        assert metrics.running_count > 0 and metrics.min_cost is not None
+
+    def test_reopened_and_deleted_executions(self, repository, definition_repo, definitions):
+        executions = self._seed(repository, definitions, count=30)
+        finished = [e for e in executions if e.status == ExecutionStatus.COMPLETED]
+
+        reopened = repository.get_by_id(finished[0].id)
+        reopened.status = ExecutionStatus.RUNNING
+        reopened.completed_at = None
+        repository.save(reopened)
+
+        moved = repository.get_by_id(finished[1].id)
+        moved.started_at -= timedelta(days=2)
+        moved.total_cost = Money(Decimal("9.99"), "USD")
+        repository.save(moved)
+
+        repository.delete(finished[2].id)
+
+        self._assert_matches_loaded(repository, definition_repo, definitions)
+
+    def test_backfills_database_without_rollups(self, tmp_path, definition_repo, definitions):
+        from services.process_engine.repositories import SqliteProcessExecutionRepository
+
+        path = tmp_path / "legacy.db"
+        self._seed(SqliteProcessExecutionRepository(path), definitions, count=60)
+        conn = sqlite3.connect(path)
+        conn.executescript("""
+            DROP TABLE process_execution_daily;
+            DROP TABLE step_execution_daily;
+            DROP INDEX idx_exec_not_rolled_up;
+            ALTER TABLE process_executions DROP COLUMN rolled_up;
+        """)
+        conn.close()
+
+        repository = SqliteProcessExecutionRepository(path)
+
+        daily_rows = repository._get_connection().execute(
+            "SELECT COUNT(*) FROM process_execution_daily"
+        ).fetchone()[0]
+        assert daily_rows > 0
+        self._assert_matches_loaded(repository, definition_repo, definitions)
+
+    def test_reads_rollups_instead_of_executions(self, repository, definitions):
+        """Whole days are read from the rollups, not the execution rows."""
+        self._seed(repository, definitions, count=120)
+        conn = repository._get_connection()
+
+        finished_rows = conn.execute(
+            "SELECT COUNT(*) FROM process_executions WHERE rolled_up = 1"
+        ).fetchone()[0]
+        rollup_rows = conn.execute("SELECT COUNT(*) FROM process_execution_daily").fetchone()[0]
+        assert rollup_rows < finished_rows
+
+        plan = " ".join(
+            row[-1] for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT COUNT(*) FROM process_executions e "
+                "WHERE e.rolled_up = 0 AND e.started_at >= ?", ("2026-01-01",)
+            )
+        )
+        assert "idx_exec_not_rolled_up" in plan
@@ -1,11 +1,12 @@
 """
 Unit tests for Domain Events and Event Bus.
 
-Tests for: Domain events, InMemoryEventBus
+Tests for: Domain events, InMemoryEventBus, RedisEventBus (EVENT-RELAY-001)
 Reference: E15-01 Acceptance Criteria
 """
 
 import asyncio
+import json
 import pytest
 from datetime import datetime, timezone
 from decimal import Decimal
@@ -29,7 +30,7 @@ from services.process_engine.domain import (
     ApprovalDecided,
     DomainEvent,
 )
-from services.process_engine.events import InMemoryEventBus
+from services.process_engine.events import InMemoryEventBus, RedisEventBus, decode_event, encode_event
 
 
 # =============================================================================
@@ -477,3 +478,184 @@ class TestInMemoryEventBus:
         # Both should complete
         assert "slow" in order
         assert "fast" in order
+
+
+class LoopbackRelay:
+    """Stands in for the Redis event relay: delivers to the other workers' handlers."""
+
+    def __init__(self, network: list):
+        self.network = network
+        self.handlers = {}
+        network.append(self)
+
+    def add_handler(self, topic, handler):
+        self.handlers[topic] = handler
+
+    def publish(self, topic, payload):
+        message = json.loads(json.dumps(payload))  # Crosses the wire as JSON
+        for relay in self.network:
+            if relay is not self and topic in relay.handlers:
+                asyncio.get_running_loop().create_task(relay.handlers[topic](message))
+
+
+class TestRedisEventBus:
+    """Tests for RedisEventBus and event serialization."""
+
+    @pytest.fixture
+    def workers(self):
+        """Two workers' buses joined by a loopback relay."""
+        network = []
+        return RedisEventBus(LoopbackRelay(network)), RedisEventBus(LoopbackRelay(network))
+
+    def test_encode_decode_round_trip(self):
+        """Events survive JSON exactly, including value objects."""
+        events = [
+            ProcessStarted(
+                execution_id=ExecutionId.generate(),
+                process_id=ProcessId.generate(),
+                process_name="test-process",
+                triggered_by="schedule",
+            ),
+            ProcessCompleted(
+                execution_id=ExecutionId.generate(),
+                process_id=ProcessId.generate(),
+                process_name="test-process",
+                total_cost=Money(Decimal("1.2345")),
+                total_duration=Duration(seconds=12.5),
+                output_data={"summary": "ok", "items": [1, {"nested": True}]},
+            ),
+            StepFailed(
+                execution_id=ExecutionId.generate(),
+                step_id=StepId("research"),
+                step_name="Research",
+                error_message="timeout",
+                error_code="TIMEOUT",
+                retry_count=2,
+                will_retry=True,
+            ),
+            ApprovalRequested(
+                execution_id=ExecutionId.generate(),
+                step_id=StepId("review"),
+                step_name="Manager Review",
+                title="Document Review Required",
+                description="Please review",
+                assignees=["manager@example.com"],
+            ),
+        ]
+        for event in events:
+            decoded = decode_event(json.loads(json.dumps(encode_event(event))))
+            assert decoded == event
+            assert type(decoded) is type(event)
+
+    def test_decode_rejects_unknown_classes(self):
+        with pytest.raises(ValueError):
+            decode_event({"__dataclass__": "Popen", "fields": {}})
+        with pytest.raises(ValueError):
+            decode_event({"__dataclass__": "ProcessId", "fields": {"value": str(ProcessId.generate())}})
+
+    @pytest.mark.asyncio
+    async def test_broadcast_handlers_receive_other_workers_events(self, workers):
+        """Broadcast handlers run in every worker; others only where published."""
+        bus_a, bus_b = workers
+        received = {"a_local": [], "a_broadcast": [], "b_local": [], "b_broadcast": [], "b_all": []}
+
+        def recorder(key):
+            async def handler(event: DomainEvent):
+                received[key].append(event)
+            return handler
+
+        bus_a.subscribe(ProcessStarted, recorder("a_local"))
+        bus_a.subscribe(ProcessStarted, recorder("a_broadcast"), broadcast=True)
+        bus_b.subscribe(ProcessStarted, recorder("b_local"))
+        bus_b.subscribe(ProcessStarted, recorder("b_broadcast"), broadcast=True)
+        bus_b.subscribe_all(recorder("b_all"), broadcast=True)
+
+        event = ProcessStarted(
+            execution_id=ExecutionId.generate(),
+            process_id=ProcessId.generate(),
+            process_name="test-process",
+        )
+        await bus_a.publish(event)
+        await asyncio.sleep(0.01)
+        await bus_b.wait_for_pending()
+        await bus_a.wait_for_pending()
+
+        assert received["a_local"] == [event]
+        assert received["a_broadcast"] == [event]
+        assert received["b_local"] == []
+        assert received["b_broadcast"] == [event]
+        assert received["b_all"] == [event]
+
+    @pytest.mark.asyncio
+    async def test_local_dispatch_runs_each_handler_once(self, workers):
+        """In the publishing worker a broadcast handler is not called twice."""
+        bus_a, _ = workers
+        received = []
+
+        async def handler(event: DomainEvent):
+            received.append(event)
+
+        bus_a.subscribe(ProcessStarted, handler, broadcast=True)
+        await bus_a.publish(ProcessStarted(
+            execution_id=ExecutionId.generate(),
+            process_id=ProcessId.generate(),
+            process_name="test-process",
+        ))
+        await asyncio.sleep(0.01)
+        await bus_a.wait_for_pending()
+
+        assert len(received) == 1
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_stops_remote_delivery(self, workers):
+        bus_a, bus_b = workers
+        received = []
+
+        async def handler(event: DomainEvent):
+            received.append(event)
+
+        bus_a.subscribe(ProcessStarted, handler, broadcast=True)
+        bus_b.subscribe(ProcessStarted, handler, broadcast=True)
+        bus_b.unsubscribe(ProcessStarted, handler)
+        await bus_a.publish(ProcessStarted(
+            execution_id=ExecutionId.generate(),
+            process_id=ProcessId.generate(),
+            process_name="test-process",
+        ))
+        await asyncio.sleep(0.01)
+        await bus_b.wait_for_pending()
+        await bus_a.wait_for_pending()
+
+        assert len(received) == 1  # Only bus_a's own handler
+        assert bus_b.handler_count == 0
+
+    @pytest.mark.asyncio
+    async def test_events_without_broadcast_handlers_are_not_relayed(self):
+        """Only events some worker subscribed to with broadcast=True cross the relay."""
+        network = []
+        relay = LoopbackRelay(network)
+        published = []
+        relay.publish = lambda topic, payload: published.append(payload)
+        bus = RedisEventBus(relay)
+
+        async def handler(event: DomainEvent):
+            pass
+
+        bus.subscribe(ProcessStarted, handler)
+        bus.subscribe(ProcessCompleted, handler, broadcast=True)
+        await bus.publish(ProcessStarted(
+            execution_id=ExecutionId.generate(),
+            process_id=ProcessId.generate(),
+            process_name="test-process",
+        ))
+        assert published == []
+
+        await bus.publish(ProcessCompleted(
+            execution_id=ExecutionId.generate(),
+            process_id=ProcessId.generate(),
+            process_name="test-process",
+            total_cost=Money(Decimal("0.10")),
+            total_duration=Duration(seconds=1),
+        ))
+        await bus.wait_for_pending()
+        assert len(published) == 1
@@ -570,3 +570,215 @@ class TestParallelExecution:
         assert execution.status == ExecutionStatus.COMPLETED
         for step_id in ["step-a", "step-b", "step-c", "step-d"]:
             assert execution.step_executions[step_id].status == StepStatus.COMPLETED
+
+
+# =============================================================================
+# Completion-driven scheduling
+# =============================================================================
+
+
+class DelayedHandler(StepHandler):
+    """Handler that sleeps per step and records start/finish times."""
+
+    def __init__(self, delays: dict[str, float] = None, default_delay: float = 0.0):
+        self.delays = delays or {}
+        self.default_delay = default_delay
+        self.started: dict[str, float] = {}
+        self.finished: dict[str, float] = {}
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    @property
+    def step_type(self) -> StepType:
+        return StepType.AGENT_TASK
+
+    async def execute(self, context: StepContext, config: StepConfig) -> StepResult:
+        loop = asyncio.get_running_loop()
+        step_id = str(context.step_definition.id)
+        self.started[step_id] = loop.time()
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays.get(step_id, self.default_delay))
+        finally:
+            self.in_flight -= 1
+        self.finished[step_id] = loop.time()
+        return StepResult.ok({"step_id": step_id})
+
+
+def _dag_definition(name: str, edges: dict[str, list[str]]) -> ProcessDefinition:
+    """Build a process from {step_id: [dependency ids]} in insertion order."""
+    definition = ProcessDefinition.create(name=name)
+    definition.steps = [
+        StepDefinition.from_dict({
+            "id": step_id,
+            "type": "agent_task",
+            "agent": "test-agent",
+            "message": f"Do {step_id}",
+            "depends_on": deps,
+        })
+        for step_id, deps in edges.items()
+    ]
+    return definition
+
+
+def _chains(width: int, depth: int) -> dict[str, list[str]]:
+    """`width` independent chains of `depth` steps each."""
+    edges = {}
+    for chain in range(width):
+        for level in range(depth):
+            edges[f"c{chain}-{level}"] = [f"c{chain}-{level - 1}"] if level else []
+    return edges
+
+
+def _engine(execution_repo, handler: StepHandler, **config) -> ExecutionEngine:
+    from services.process_engine.engine.execution_engine import ExecutionConfig
+
+    registry = StepHandlerRegistry()
+    registry.register(handler)
+    return ExecutionEngine(
+        execution_repo=execution_repo,
+        handler_registry=registry,
+        config=ExecutionConfig(**config),
+    )
+
+
+class TestDependencyCounts:
+    """In-degree helpers used by the completion-driven scheduler."""
+
+    def test_dependents_and_counts(self):
+        definition = _dag_definition("counts", {
+            "a": [],
+            "b": ["a"],
+            "c": ["a"],
+            "d": ["b", "c"],
+        })
+        resolver = DependencyResolver(definition)
+        dependents = resolver.get_dependents()
+        assert [str(s) for s in dependents["a"]] == ["b", "c"]
+        assert [str(s) for s in dependents["d"]] == []
+
+        execution = ProcessExecution.create(definition)
+        assert resolver.get_unsatisfied_dependency_counts(execution) == {
+            "a": 0, "b": 1, "c": 1, "d": 2,
+        }
+
+        execution.start_step(StepId("a"))
+        execution.complete_step(StepId("a"), {})
+        execution.step_executions["b"].skip("test")
+        assert resolver.get_unsatisfied_dependency_counts(execution) == {
+            "a": 0, "b": 0, "c": 0, "d": 1,
+        }
+
+
+class TestCompletionDrivenScheduling:
+    """A finished step releases its dependents without waiting for siblings."""
+
+    @pytest.mark.asyncio
+    async def test_fast_branch_does_not_wait_for_slow_sibling(self, execution_repo):
+        definition = _dag_definition("fast-slow", {
+            "a": [],
+            "slow": ["a"],
+            "fast": ["a"],
+            "after-fast": ["fast"],
+            "join": ["slow", "after-fast"],
+        })
+        handler = DelayedHandler({"slow": 0.3, "fast": 0.01, "after-fast": 0.01})
+        engine = _engine(execution_repo, handler)
+
+        execution = await engine.start(definition)
+
+        assert execution.status == ExecutionStatus.COMPLETED
+        assert handler.finished["after-fast"] < handler.finished["slow"]
+        assert handler.started["join"] >= handler.finished["slow"]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit_is_global(self, execution_repo):
+        handler = DelayedHandler(default_delay=0.02)
+        engine = _engine(execution_repo, handler, max_concurrent_steps=2)
+
+        execution = await engine.start(_dag_definition("limited", _chains(width=5, depth=3)))
+
+        assert execution.status == ExecutionStatus.COMPLETED
+        assert handler.peak_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_sequential_mode_runs_one_step_at_a_time(self, execution_repo):
+        handler = DelayedHandler(default_delay=0.01)
+        engine = _engine(execution_repo, handler, parallel_execution=False)
+
+        execution = await engine.start(_dag_definition("sequential", _chains(width=3, depth=2)))
+
+        assert execution.status == ExecutionStatus.COMPLETED
+        assert handler.peak_in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_failure_stops_launching_new_steps(self, execution_repo):
+        definition = _dag_definition("failing", {
+            "a": [],
+            "b": [],
+            "after-a": ["a"],
+            "after-b": ["b"],
+        })
+        handler = MockAgentHandler({"a": StepResult.fail("boom")})
+        registry = StepHandlerRegistry()
+        registry.register(handler)
+        engine = ExecutionEngine(execution_repo=execution_repo, handler_registry=registry)
+
+        execution = await engine.start(definition)
+
+        assert execution.status == ExecutionStatus.FAILED
+        assert execution.step_executions["a"].status == StepStatus.FAILED
+        assert "after-a" not in handler.executed_steps
+        assert execution.step_executions["after-a"].status == StepStatus.PENDING
+
+
+class GatedHandler(DelayedHandler):
+    """DelayedHandler whose gated steps wait for their event before running."""
+
+    def __init__(self, gates: dict[str, asyncio.Event]):
+        super().__init__()
+        self.gates = gates
+
+    async def execute(self, context: StepContext, config: StepConfig) -> StepResult:
+        gate = self.gates.get(str(context.step_definition.id))
+        if gate is not None:
+            await gate.wait()
+        return await super().execute(context, config)
+
+
+class TestBlockedChain:
+    """
+    A blocked step holds back only its own chain. A level-synchronous
+    scheduler would stall every chain at the blocked step's level.
+    """
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("width,depth", [(4, 4), (8, 8)])
+    async def test_other_chains_finish_while_one_step_is_blocked(
+        self, execution_repo, width, depth
+    ):
+        gate = asyncio.Event()
+        handler = GatedHandler({"c0-0": gate})
+        engine = _engine(execution_repo, handler)
+        run = asyncio.create_task(
+            engine.start(_dag_definition(f"blocked-{width}x{depth}", _chains(width, depth)))
+        )
+
+        last_steps = [f"c{chain}-{depth - 1}" for chain in range(1, width)]
+
+        async def other_chains_done():
+            while not all(step in handler.finished for step in last_steps):
+                await asyncio.sleep(0.001)
+
+        try:
+            await asyncio.wait_for(other_chains_done(), timeout=5)
+            assert "c0-0" not in handler.finished
+            assert "c0-1" not in handler.started
+        finally:
+            gate.set()
+        execution = await run
+
+        assert execution.status == ExecutionStatus.COMPLETED
+        assert handler.started["c0-1"] >= handler.finished["c0-0"]
+        assert len(handler.finished) == width * depth
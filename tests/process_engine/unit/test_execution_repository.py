@@ -4,6 +4,8 @@ Unit tests for ProcessExecution Repository.
 Tests for: E2-02 Execution Repository
 """
 
+import re
+
 import pytest
 from datetime import datetime, timezone
 
@@ -364,3 +366,148 @@ class TestConcurrency:
         assert retrieved.status == ExecutionStatus.COMPLETED
         assert retrieved.step_executions["step-a"].status == StepStatus.COMPLETED
         assert retrieved.step_executions["step-b"].status == StepStatus.COMPLETED
+
+
+# =============================================================================
+# Delta Persistence Tests
+# =============================================================================
+
+
+def _trace_writes(repository) -> list[tuple[str, str]]:
+    """Record (verb, table) for each write issued on the repository connection."""
+    statements = []
+
+    def trace(sql: str) -> None:
+        match = re.match(r"\s*(INSERT OR REPLACE INTO|UPDATE|DELETE FROM)\s+(\w+)", sql)
+        if match:
+            statements.append((match.group(1).split()[0], match.group(2)))
+
+    repository._get_connection().set_trace_callback(trace)
+    return statements
+
+
+def _step_writes(statements) -> int:
+    return sum(1 for _, table in statements if table == "step_executions")
+
+
+def _root_writes(statements) -> int:
+    return sum(1 for _, table in statements if table == "process_executions")
+
+
+class TestDeltaPersistence:
+    """Saves write only the rows that changed since the last save."""
+
+    @pytest.fixture
+    def wide_definition(self):
+        definition = ProcessDefinition.create(name="wide-process")
+        definition.steps = [
+            StepDefinition.from_dict({
+                "id": f"step-{i}",
+                "type": "agent_task",
+                "agent": "test-agent",
+                "message": f"Step {i}",
+            })
+            for i in range(20)
+        ]
+        return definition
+
+    def test_first_save_writes_everything(self, repository, wide_definition):
+        execution = ProcessExecution.create(wide_definition)
+        statements = _trace_writes(repository)
+
+        repository.save(execution)
+
+        assert _root_writes(statements) == 1
+        assert _step_writes(statements) == 20
+
+    def test_step_change_writes_only_that_step(self, repository, wide_definition):
+        execution = ProcessExecution.create(wide_definition)
+        repository.save(execution)
+        statements = _trace_writes(repository)
+
+        execution.start_step(StepId("step-3"))
+        repository.save(execution)
+
+        assert _step_writes(statements) == 1
+        assert statements[0] == ("UPDATE", "process_executions")  # updated_at bump only
+        retrieved = repository.get_by_id(execution.id)
+        assert retrieved.step_executions["step-3"].status == StepStatus.RUNNING
+
+    def test_unchanged_save_writes_nothing(self, repository, wide_definition):
+        execution = ProcessExecution.create(wide_definition)
+        repository.save(execution)
+        statements = _trace_writes(repository)
+
+        repository.save(execution)
+
+        assert statements == []
+
+    def test_root_change_writes_main_row(self, repository, wide_definition):
+        execution = ProcessExecution.create(wide_definition)
+        repository.save(execution)
+        statements = _trace_writes(repository)
+
+        execution.start()
+        repository.save(execution)
+
+        assert _root_writes(statements) == 1
+        assert _step_writes(statements) == 0
+        assert repository.get_by_id(execution.id).status == ExecutionStatus.RUNNING
+
+    def test_direct_attribute_assignment_is_tracked(self, repository, wide_definition):
+        execution = ProcessExecution.create(wide_definition)
+        repository.save(execution)
+
+        execution.step_executions["step-7"].cost = Money.from_string("$1.25")
+        repository.save(execution)
+
+        retrieved = repository.get_by_id(execution.id)
+        assert str(retrieved.step_executions["step-7"].cost) == "$1.25"
+
+    def test_loaded_execution_is_clean(self, repository, wide_definition):
+        execution = ProcessExecution.create(wide_definition)
+        repository.save(execution)
+        loaded = repository.get_by_id(execution.id)
+        statements = _trace_writes(repository)
+
+        repository.save(loaded)
+        assert statements == []
+
+        loaded.complete_step(StepId("step-0"), {"ok": True})
+        repository.save(loaded)
+        assert _step_writes(statements) == 1
+
+    def test_other_object_with_same_id_writes_in_full(self, repository, wide_definition):
+        execution = ProcessExecution.create(wide_definition)
+        repository.save(execution)
+        other = repository.get_by_id(execution.id)
+        other.cancel("stop")
+        repository.save(other)
+        statements = _trace_writes(repository)
+
+        # The original object no longer matches what was last written
+        repository.save(execution)
+
+        assert _root_writes(statements) == 1
+        assert _step_writes(statements) == 20
+        assert repository.get_by_id(execution.id).status == ExecutionStatus.PENDING
+
+    def test_save_after_delete_writes_in_full(self, repository, wide_definition):
+        execution = ProcessExecution.create(wide_definition)
+        repository.save(execution)
+        repository.delete(execution.id)
+
+        repository.save(execution)
+
+        retrieved = repository.get_by_id(execution.id)
+        assert len(retrieved.step_executions) == 20
+
+    def test_file_database_reuses_connection(self, tmp_path, sample_execution):
+        repository = SqliteProcessExecutionRepository(tmp_path / "executions.db")
+
+        repository.save(sample_execution)
+        sample_execution.start()
+        repository.save(sample_execution)
+
+        assert repository._get_connection() is repository._get_connection()
+        assert repository.get_by_id(sample_execution.id).status == ExecutionStatus.RUNNING
@@ -10,6 +10,10 @@ from services.process_engine.services import (
     ExpressionEvaluator,
     EvaluationContext,
     ExpressionError,
+    ConditionEvaluator,
+    LazyStepOutputs,
+    compile_condition,
+    compile_template,
 )
 
 
@@ -303,3 +307,190 @@ class TestEdgeCases:
             context,
         )
         assert "1000" in result
+
+
+# =============================================================================
+# Condition Evaluation Tests
+# =============================================================================
+
+
+@pytest.fixture
+def conditions():
+    """Create condition evaluator."""
+    return ConditionEvaluator()
+
+
+@pytest.fixture
+def gateway_context():
+    """Context with hyphenated step ids, as used by process templates."""
+    return EvaluationContext(
+        input_data={"priority": "high", "urgent": True, "score": 75, "tags": ["a", "b"]},
+        step_outputs={
+            "analyze-ticket": {"needs_escalation": True, "priority": "urgent", "quality_score": 85},
+            "step-analyze": "This is urgent and needs immediate attention",
+        },
+    )
+
+
+class TestConditionEvaluator:
+    """Tests for ConditionEvaluator parsing and semantics."""
+
+    @pytest.mark.parametrize("condition, expected", [
+        ("input.score >= 70", True),
+        ("input.score > 75", False),
+        ("input.priority == 'high'", True),
+        ('input.priority != "high"', False),
+        ("input.urgent == True", True),
+        ("input.urgent", True),
+        ("input.missing", False),
+        ("input.missing == null", True),
+        ("not input.urgent", False),
+        ("steps.analyze-ticket.output.priority == 'urgent'", True),
+        ("steps['analyze-ticket'].output.quality_score >= 80", True),
+        ("{{steps.analyze-ticket.output.needs_escalation}} == true", True),
+        ("{{steps.analyze-ticket.output.quality_score}} >= 90", False),
+        ("'urgent' in steps['step-analyze'].output", True),
+        ("'normal' in steps['step-analyze'].output", False),
+        ("'a' in input.tags", True),
+        ("'c' not in input.tags", True),
+        ("'x' in input.missing", False),
+        ("input.priority == 'a == b'", False),
+        ("", True),
+    ])
+    def test_conditions(self, conditions, gateway_context, condition, expected):
+        assert conditions.evaluate(condition, gateway_context) is expected
+
+    def test_and_binds_tighter_than_or(self, conditions, gateway_context):
+        """a and b or c is (a and b) or c."""
+        assert conditions.evaluate(
+            "input.score == 1 and input.urgent or input.priority == 'high'", gateway_context
+        ) is True
+        assert conditions.evaluate(
+            "input.priority == 'high' or input.urgent and input.score == 1", gateway_context
+        ) is True
+
+    def test_parentheses(self, conditions, gateway_context):
+        assert conditions.evaluate(
+            "input.score == 1 and (input.urgent or input.priority == 'high')", gateway_context
+        ) is False
+        assert conditions.evaluate(
+            "not (input.score > 80 or input.score < 50)", gateway_context
+        ) is True
+
+    def test_short_circuit(self, conditions):
+        """The right side is not evaluated when the left decides."""
+        outputs = LazyStepOutputs(lambda: pytest.fail("step outputs loaded"))
+        context = EvaluationContext(input_data={"go": False}, step_outputs=outputs)
+        assert conditions.evaluate("input.go and steps.x.output.y == 1", context) is False
+        assert not outputs.loaded
+
+    @pytest.mark.parametrize("condition", [
+        "input.score >=",
+        "(input.score > 1",
+        "input.score > 1 1",
+        "input.score ~ 1",
+        "steps[analyze].output",
+        "and input.score",
+    ])
+    def test_syntax_errors(self, conditions, gateway_context, condition):
+        with pytest.raises(ExpressionError):
+            conditions.evaluate(condition, gateway_context)
+        assert conditions.validate(condition) is not None
+
+    def test_validate_valid(self, conditions):
+        assert conditions.validate("input.a == 1 and (steps.b.output or not input.c)") is None
+
+
+class TestCompilation:
+    """Tests for compiled template/condition caching."""
+
+    def test_condition_compiled_once(self, conditions, gateway_context):
+        condition = "input.score >= 42 and input.urgent"
+        compile_condition.cache_clear()
+        for _ in range(10):
+            conditions.evaluate(condition, gateway_context)
+        info = compile_condition.cache_info()
+        assert (info.misses, info.hits) == (1, 9)
+
+    def test_template_compiled_once(self, evaluator, context):
+        template = "Topic {{input.topic}} for {{execution.id}}"
+        compile_template.cache_clear()
+        results = {evaluator.evaluate(template, context) for _ in range(10)}
+        assert results == {"Topic Artificial Intelligence for exec-123"}
+        info = compile_template.cache_info()
+        assert (info.misses, info.hits) == (1, 9)
+
+    def test_cache_is_bounded(self):
+        assert compile_condition.cache_info().maxsize is not None
+        assert compile_template.cache_info().maxsize is not None
+
+    def test_template_segments(self):
+        segments = compile_template("a {{ input.x }} b {{steps.s.output}}")
+        assert segments[0] == "a "
+        assert segments[1].text == "{{ input.x }}"
+        assert segments[1].path == ("input", "x")
+        assert segments[2] == " b "
+        assert segments[3].path == ("steps", "s", "output")
+
+
+class TestLazyStepOutputs:
+    """Tests for lazily loaded step outputs."""
+
+    def test_loaded_on_first_access_only(self):
+        loads = []
+
+        def loader():
+            loads.append(1)
+            return {"research": {"summary": "done"}}
+
+        outputs = LazyStepOutputs(loader)
+        context = EvaluationContext(input_data={"topic": "AI"}, step_outputs=outputs)
+        evaluator = ExpressionEvaluator()
+
+        assert evaluator.evaluate("{{input.topic}}", context) == "AI"
+        assert loads == []
+        assert evaluator.evaluate("{{steps.research.output.summary}}", context) == "done"
+        assert context.get("steps.research.output.summary") == "done"
+        assert loads == [1]
+        assert dict(outputs) == {"research": {"summary": "done"}}
+
+
+# =============================================================================
+# Many Gateways
+# =============================================================================
+
+
+class TestManyGateways:
+    """Processes with hundreds of conditional gateway steps."""
+
+    STEPS = 400
+
+    def _gateway_conditions(self):
+        conditions = []
+        for i in range(self.STEPS):
+            conditions.append(
+                f"(steps.step-{i}.output.score >= {i % 100} and input.region == 'eu') "
+                f"or 'escalate' in steps['step-{i}'].output.tags "
+                f"or not {{{{steps.step-{i}.output.ok}}}} == true"
+            )
+        return conditions
+
+    def test_hundreds_of_gateway_conditions(self, conditions):
+        step_outputs = {
+            f"step-{i}": {"score": i % 120, "tags": ["x"], "ok": True} for i in range(self.STEPS)
+        }
+        context = EvaluationContext(input_data={"region": "eu"}, step_outputs=step_outputs)
+        gateway_conditions = self._gateway_conditions()
+        compile_condition.cache_clear()
+
+        first = [conditions.evaluate(c, context) for c in gateway_conditions]
+
+        # A long-running process re-evaluates the same definitions
+        for _ in range(10):
+            again = [conditions.evaluate(c, context) for c in gateway_conditions]
+
+        assert again == first
+        assert sum(first) == sum(1 for i in range(self.STEPS) if i % 120 >= i % 100)
+        info = compile_condition.cache_info()
+        # Each condition is compiled once; every re-evaluation is a cache hit
+        assert info.misses == self.STEPS and info.hits == 10 * self.STEPS
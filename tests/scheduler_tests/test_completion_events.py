@@ -0,0 +1,220 @@
+"""
+Tests for SCHED-ASYNC-002: Event-driven execution completion.
+
+Covers:
+- CompletionListener waiter registration and message handling
+- Fallback polls and DB query count, polling vs. completion events
+- Fallback to polling when the listener is disconnected
+"""
+
+# Path setup must happen before scheduler imports
+import sys
+from pathlib import Path
+_this_file = Path(__file__).resolve()
+_src_path = str(_this_file.parent.parent.parent / 'src')
+if _src_path not in sys.path:
+    sys.path.insert(0, _src_path)
+
+import asyncio
+import json
+
+import pytest
+from unittest.mock import patch
+
+from scheduler.completion import CompletionListener
+from scheduler.service import SchedulerService
+from scheduler.database import SchedulerDatabase
+from scheduler.models import ExecutionStatus
+from scheduler.locking import LockManager
+
+
+def _connected_listener() -> CompletionListener:
+    """A listener that behaves as if its Redis subscription is live."""
+    listener = CompletionListener("redis://unused")
+    listener._connected = True
+    return listener
+
+
+def _counting_get_execution(db: SchedulerDatabase) -> list:
+    """Wrap db.get_execution and return the list its calls are recorded in."""
+    calls = []
+    original = db.get_execution
+
+    def get_execution(execution_id):
+        calls.append(execution_id)
+        return original(execution_id)
+
+    db.get_execution = get_execution
+    return calls
+
+
+class _RecordingAsyncio:
+    """Stands in for asyncio in scheduler.service and counts fallback polls."""
+
+    def __init__(self):
+        self.fallback_polls = 0
+
+    def __getattr__(self, name):
+        return getattr(asyncio, name)
+
+    async def sleep(self, delay):
+        self.fallback_polls += 1
+        await asyncio.sleep(delay)
+
+    async def wait_for(self, awaitable, timeout):
+        try:
+            return await asyncio.wait_for(awaitable, timeout)
+        except asyncio.TimeoutError:
+            self.fallback_polls += 1
+            raise
+
+
+async def _wait_and_measure(service, db, listener, poll_interval, complete_after):
+    """Complete an execution after `complete_after`s; return (fallback_polls, db_queries)."""
+    execution = db.create_execution(
+        schedule_id="schedule-1",
+        agent_name="test-agent",
+        message="Test",
+    )
+    queries = _counting_get_execution(db)
+
+    async def backend_completes():
+        await asyncio.sleep(complete_after)
+        db.update_execution_status(execution.id, ExecutionStatus.SUCCESS, response="Done")
+        if listener:
+            listener.handle_message(json.dumps({"execution_id": execution.id, "status": "success"}))
+
+    recorder = _RecordingAsyncio()
+    with patch("scheduler.service.config") as mock_config, \
+            patch("scheduler.service.asyncio", recorder):
+        mock_config.poll_interval = poll_interval
+        mock_config.completion_fallback_interval = 60
+        completer = asyncio.create_task(backend_completes())
+        result = await service._poll_execution_completion(execution.id, timeout_seconds=10)
+        await completer
+
+    assert result["status"] == ExecutionStatus.SUCCESS
+    return recorder.fallback_polls, len(queries)
+
+
+class TestCompletionListener:
+    """Tests for the completion event listener."""
+
+    @pytest.mark.asyncio
+    async def test_notify_wakes_registered_waiter(self):
+        listener = CompletionListener("redis://unused")
+        event = listener.register("exec-1")
+        assert listener.register("exec-1") is event
+
+        listener.handle_message(json.dumps({"execution_id": "exec-1", "status": "success"}))
+        assert event.is_set()
+        assert listener.events_received == 1
+
+    @pytest.mark.asyncio
+    async def test_unrelated_and_malformed_messages_are_ignored(self):
+        listener = CompletionListener("redis://unused")
+        event = listener.register("exec-1")
+
+        listener.handle_message(json.dumps({"execution_id": "exec-2"}))
+        listener.handle_message("not json")
+        listener.handle_message(json.dumps({"status": "success"}))
+        assert not event.is_set()
+
+        listener.unregister("exec-1")
+        listener.notify("exec-1")  # no waiter - no error
+
+    @pytest.mark.asyncio
+    async def test_stop_releases_waiters(self):
+        listener = _connected_listener()
+        event = listener.register("exec-1")
+        listener.stop()
+        assert not listener.is_connected
+        assert event.is_set()
+
+    def test_start_requires_running_loop(self, db_with_data, mock_lock_manager):
+        service = SchedulerService(database=db_with_data, lock_manager=mock_lock_manager)
+        service._start_completion_listener()
+        assert service.completion_listener is None
+
+
+class TestCompletionWakeups:
+    """Polling vs. completion events: fallback polls and DB query count."""
+
+    @pytest.mark.asyncio
+    async def test_event_wakes_waiter_without_polling(
+        self,
+        db_with_data: SchedulerDatabase,
+        mock_lock_manager: LockManager,
+    ):
+        poll_interval = 0.25
+        complete_after = 0.6
+
+        # Before: pure DB polling
+        polling_service = SchedulerService(database=db_with_data, lock_manager=mock_lock_manager)
+        poll_wakeups, poll_queries = await _wait_and_measure(
+            polling_service, db_with_data, None, poll_interval, complete_after
+        )
+
+        # After: completion events (fallback interval far longer than the task)
+        event_service = SchedulerService(database=db_with_data, lock_manager=mock_lock_manager)
+        event_service.completion_listener = _connected_listener()
+        event_wakeups, event_queries = await _wait_and_measure(
+            event_service, db_with_data, event_service.completion_listener, poll_interval, complete_after
+        )
+
+        assert poll_queries >= 3
+        assert poll_wakeups == poll_queries
+        assert event_queries == 1
+        assert event_wakeups == 0  # Woken by the event, not by the fallback poll
+
+    @pytest.mark.asyncio
+    async def test_waiter_unregistered_after_completion(
+        self,
+        db_with_data: SchedulerDatabase,
+        mock_lock_manager: LockManager,
+    ):
+        service = SchedulerService(database=db_with_data, lock_manager=mock_lock_manager)
+        listener = service.completion_listener = _connected_listener()
+        await _wait_and_measure(service, db_with_data, listener, 0.25, 0.01)
+        assert listener._waiters == {}
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_polling_when_disconnected(
+        self,
+        db_with_data: SchedulerDatabase,
+        mock_lock_manager: LockManager,
+    ):
+        service = SchedulerService(database=db_with_data, lock_manager=mock_lock_manager)
+        service.completion_listener = CompletionListener("redis://unused")  # never connects
+
+        # No event is delivered; the poll loop must still observe completion
+        wakeups, queries = await _wait_and_measure(service, db_with_data, None, 0.02, 0.1)
+        assert queries >= 2
+        assert wakeups == queries
+
+    @pytest.mark.asyncio
+    async def test_completion_during_dispatch_is_not_missed(
+        self,
+        db_with_data: SchedulerDatabase,
+        mock_lock_manager: LockManager,
+    ):
+        """An event that arrives before polling starts still wakes the waiter."""
+        service = SchedulerService(database=db_with_data, lock_manager=mock_lock_manager)
+        listener = service.completion_listener = _connected_listener()
+
+        execution = db_with_data.create_execution(
+            schedule_id="schedule-1", agent_name="test-agent", message="Test",
+        )
+        listener.register(execution.id)
+        db_with_data.update_execution_status(execution.id, ExecutionStatus.SUCCESS, response="Done")
+        listener.notify(execution.id)
+
+        recorder = _RecordingAsyncio()
+        with patch("scheduler.service.config") as mock_config, \
+                patch("scheduler.service.asyncio", recorder):
+            mock_config.poll_interval = 10
+            mock_config.completion_fallback_interval = 60
+            result = await service._poll_execution_completion(execution.id, timeout_seconds=10)
+
+        assert result["status"] == ExecutionStatus.SUCCESS
+        assert recorder.fallback_polls == 0
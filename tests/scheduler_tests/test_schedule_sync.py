@@ -0,0 +1,305 @@
+"""
+Tests for SCHED-SYNC-001: Incremental schedule sync via the schedule_changes feed.
+
+Covers:
+- Trigger-maintained change feed (revisions, tombstones, ignored run-time writes)
+- Incremental sync reads only changed rows
+- New/updated/deleted agent and process schedules applied from the feed
+- Full reload fallback and coalesced schedule-change events
+"""
+
+# Path setup must happen before scheduler imports
+import sys
+from pathlib import Path
+_this_file = Path(__file__).resolve()
+_src_path = str(_this_file.parent.parent.parent / 'src')
+if _src_path not in sys.path:
+    sys.path.insert(0, _src_path)
+
+import asyncio
+import importlib.util
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+from scheduler.config import config
+from scheduler.service import SchedulerService
+from scheduler import database as scheduler_database
+from scheduler.database import SchedulerDatabase
+from scheduler.locking import LockManager
+
+# The change feed is created by a backend migration (stdlib only)
+_spec = importlib.util.spec_from_file_location(
+    "backend_migrations", _this_file.parent.parent.parent / "src" / "backend" / "db" / "migrations.py"
+)
+backend_migrations = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(backend_migrations)
+
+
+def _insert_schedule(db_path: str, schedule_id: str, cron: str = "0 9 * * *", enabled: int = 1):
+    now = datetime.utcnow().isoformat()
+    conn = sqlite3.connect(db_path)
+    conn.execute("""
+        INSERT INTO agent_schedules (
+            id, agent_name, name, cron_expression, message, enabled,
+            timezone, owner_id, created_at, updated_at
+        ) VALUES (?, 'test-agent', ?, ?, 'Run', ?, 'UTC', 1, ?, ?)
+    """, (schedule_id, f"Task {schedule_id}", cron, enabled, now, now))
+    conn.commit()
+    conn.close()
+
+
+def _execute(db_path: str, sql: str, params: tuple = ()):
+    conn = sqlite3.connect(db_path)
+    conn.execute(sql, params)
+    conn.commit()
+    conn.close()
+
+
+class _QueryCounter:
+    """Counts calls to the schedule read methods of a SchedulerDatabase."""
+
+    METHODS = (
+        "list_all_schedules", "list_all_process_schedules",
+        "list_schedules_by_ids", "list_process_schedules_by_ids",
+    )
+
+    def __init__(self, db: SchedulerDatabase):
+        self.calls = {name: 0 for name in self.METHODS}
+        self.rows = 0
+        for name in self.METHODS:
+            setattr(db, name, self._wrap(name, getattr(db, name)))
+
+    def _wrap(self, name, method):
+        def wrapper(*args, **kwargs):
+            self.calls[name] += 1
+            result = method(*args, **kwargs)
+            self.rows += len(result)
+            return result
+        return wrapper
+
+
+@pytest.fixture
+def change_feed(initialized_db: str):
+    """Run the backend's change-feed migration on the test database."""
+    conn = sqlite3.connect(initialized_db)
+    backend_migrations.ensure_schedule_change_feed(conn.cursor(), conn)
+    conn.close()
+
+
+@pytest.fixture
+async def service(db_with_data: SchedulerDatabase, mock_lock_manager: LockManager, change_feed, monkeypatch):
+    monkeypatch.setattr(config, "completion_events", False)
+    svc = SchedulerService(database=db_with_data, lock_manager=mock_lock_manager)
+    svc.initialize()
+    yield svc
+    svc.shutdown()
+
+
+def _job_ids(service: SchedulerService) -> set:
+    return {job.id for job in service.scheduler.get_jobs()}
+
+
+class TestScheduleChangeFeed:
+    """Tests for the trigger-maintained change feed."""
+
+    def test_feed_records_inserts_updates_and_tombstones(self, db_with_data, initialized_db):
+        assert not db_with_data.has_schedule_change_feed()
+        conn = sqlite3.connect(initialized_db)
+        backend_migrations.ensure_schedule_change_feed(conn.cursor(), conn)
+        conn.close()
+        assert db_with_data.has_schedule_change_feed()
+        base = db_with_data.get_schedule_revision()
+
+        _insert_schedule(initialized_db, "s-new")
+        _execute(initialized_db, "UPDATE agent_schedules SET cron_expression = '*/5 * * * *' WHERE id = 'schedule-1'")
+        _execute(initialized_db, "DELETE FROM agent_schedules WHERE id = 'schedule-2'")
+
+        revision, changes = db_with_data.get_schedule_changes(base)
+        assert revision == base + 3
+        assert changes == [("agent", "s-new"), ("agent", "schedule-1"), ("agent", "schedule-2")]
+        assert db_with_data.get_schedule_revision() == revision
+
+    def test_run_time_bookkeeping_is_not_recorded(self, db_with_data, change_feed):
+        base = db_with_data.get_schedule_revision()
+
+        db_with_data.update_schedule_run_times(
+            "schedule-1", last_run_at=datetime.utcnow(), next_run_at=datetime.utcnow()
+        )
+        assert db_with_data.get_schedule_changes(base) == (base, [])
+
+    def test_process_replace_records_tombstone(self, db_with_data, change_feed):
+        old = db_with_data.create_process_schedule(
+            process_id="proc-1", process_name="Proc", trigger_id="t1", cron_expression="0 * * * *",
+        )
+        base = db_with_data.get_schedule_revision()
+
+        # Process publishing re-registers triggers with INSERT OR REPLACE and a new id
+        now = datetime.utcnow().isoformat()
+        with db_with_data.get_connection() as conn:
+            conn.execute("""
+                INSERT OR REPLACE INTO process_schedules (
+                    id, process_id, process_name, trigger_id, cron_expression,
+                    enabled, timezone, created_at, updated_at
+                ) VALUES ('new-id', 'proc-1', 'Proc', 't1', '0 * * * *', 1, 'UTC', ?, ?)
+            """, (now, now))
+            conn.commit()
+
+        _, changes = db_with_data.get_schedule_changes(base)
+        assert ("process", old.id) in changes
+        assert ("process", "new-id") in changes
+
+    def test_prune_keeps_unapplied_and_recent_changes(self, db_with_data, initialized_db, change_feed):
+        _insert_schedule(initialized_db, "s-a")
+        applied = db_with_data.get_schedule_revision()
+        _insert_schedule(initialized_db, "s-b")
+
+        assert db_with_data.prune_schedule_changes(applied, datetime.utcnow() - timedelta(hours=1)) == 0
+        assert db_with_data.prune_schedule_changes(applied, datetime.utcnow() + timedelta(seconds=1)) >= 1
+        # Revisions keep increasing after pruning
+        assert db_with_data.get_schedule_changes(applied)[1] == [("agent", "s-b")]
+        assert db_with_data.get_schedule_revision() > applied
+
+    def test_lookup_by_ids_is_chunked(self, db_with_data, initialized_db, monkeypatch):
+        monkeypatch.setattr(scheduler_database, "ID_CHUNK_SIZE", 2)
+        ids = [f"c-{i}" for i in range(5)]
+        for schedule_id in ids:
+            _insert_schedule(initialized_db, schedule_id)
+
+        found = db_with_data.list_schedules_by_ids(ids + ["missing"])
+        assert sorted(s.id for s in found) == ids
+
+
+class TestIncrementalSync:
+    """Tests for applying feed changes to APScheduler jobs."""
+
+    @pytest.mark.asyncio
+    async def test_sync_without_changes_reads_no_schedules(self, service, db_with_data):
+        counter = _QueryCounter(db_with_data)
+        await service._sync_schedules()
+        assert counter.rows == 0
+        assert counter.calls["list_all_schedules"] == 0
+
+    @pytest.mark.asyncio
+    async def test_add_update_disable_delete(self, service, initialized_db):
+        job_id = service._get_job_id("s-new")
+
+        _insert_schedule(initialized_db, "s-new")
+        await service._sync_schedules()
+        assert job_id in _job_ids(service)
+
+        _execute(initialized_db, "UPDATE agent_schedules SET cron_expression = '30 6 * * *' WHERE id = 's-new'")
+        await service._sync_schedules()
+        assert str(service.scheduler.get_job(job_id).trigger.fields[5]) == "6"  # hour
+
+        _execute(initialized_db, "UPDATE agent_schedules SET enabled = 0 WHERE id = 's-new'")
+        await service._sync_schedules()
+        assert job_id not in _job_ids(service)
+
+        _execute(initialized_db, "UPDATE agent_schedules SET enabled = 1 WHERE id = 's-new'")
+        await service._sync_schedules()
+        assert job_id in _job_ids(service)
+
+        _execute(initialized_db, "DELETE FROM agent_schedules WHERE id = 's-new'")
+        await service._sync_schedules()
+        assert job_id not in _job_ids(service)
+        assert "s-new" not in service._schedule_snapshot
+
+    @pytest.mark.asyncio
+    async def test_process_schedules(self, service, db_with_data):
+        created = db_with_data.create_process_schedule(
+            process_id="proc-1", process_name="Proc", trigger_id="t1", cron_expression="0 * * * *",
+        )
+        await service._sync_schedules()
+        assert service._get_process_job_id(created.id) in _job_ids(service)
+
+        db_with_data.delete_process_schedule(created.id)
+        await service._sync_schedules()
+        assert service._get_process_job_id(created.id) not in _job_ids(service)
+
+    @pytest.mark.asyncio
+    async def test_sync_cost_scales_with_changes(self, service, initialized_db, db_with_data):
+        """Before: every sync read all N rows. After: only the changed rows."""
+        for i in range(200):
+            _insert_schedule(initialized_db, f"bulk-{i}")
+        await service._sync_schedules()
+
+        _execute(initialized_db, "UPDATE agent_schedules SET cron_expression = '15 * * * *' WHERE id = 'bulk-7'")
+
+        counter = _QueryCounter(db_with_data)
+        await service._sync_schedules()
+        incremental_rows = counter.rows
+
+        counter = _QueryCounter(db_with_data)
+        await service._full_sync_schedules()
+        full_rows = counter.rows
+
+        assert incremental_rows == 1
+        assert full_rows >= 203
+
+    @pytest.mark.asyncio
+    async def test_full_sync_does_not_churn_unchanged_jobs(self, service, db_with_data):
+        removed = []
+        original = service._remove_job
+        service._remove_job = lambda schedule_id: (removed.append(schedule_id), original(schedule_id))
+
+        # _add_job rewrites updated_at/next_run_at; that must not look like an edit
+        await service._full_sync_schedules()
+        await service._full_sync_schedules()
+        assert removed == []
+
+    @pytest.mark.asyncio
+    async def test_full_sync_when_feed_unavailable(self, service, db_with_data, initialized_db):
+        service._schedule_revision = None
+        counter = _QueryCounter(db_with_data)
+
+        _insert_schedule(initialized_db, "s-new")
+        await service._sync_schedules()
+
+        assert counter.calls["list_all_schedules"] == 1
+        assert service._get_job_id("s-new") in _job_ids(service)
+
+    @pytest.mark.asyncio
+    async def test_feed_created_after_start_is_picked_up(
+        self, db_with_data, mock_lock_manager, initialized_db, monkeypatch
+    ):
+        monkeypatch.setattr(config, "completion_events", False)
+        svc = SchedulerService(database=db_with_data, lock_manager=mock_lock_manager)
+        svc.initialize()
+        try:
+            assert svc._schedule_revision is None
+
+            # The backend migrates while the scheduler is running
+            conn = sqlite3.connect(initialized_db)
+            backend_migrations.ensure_schedule_change_feed(conn.cursor(), conn)
+            conn.close()
+            await svc._sync_schedules()
+            assert svc._schedule_revision is not None
+
+            _insert_schedule(initialized_db, "s-late")
+            counter = _QueryCounter(db_with_data)
+            await svc._sync_schedules()
+            assert counter.calls["list_all_schedules"] == 0
+            assert svc._get_job_id("s-late") in _job_ids(svc)
+        finally:
+            svc.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_full_sync_safety_net_interval(self, service, db_with_data, monkeypatch):
+        monkeypatch.setattr(config, "schedule_full_sync_interval", 0)
+        counter = _QueryCounter(db_with_data)
+        await service._sync_schedules()
+        assert counter.calls["list_all_schedules"] == 1
+
+    @pytest.mark.asyncio
+    async def test_schedule_events_coalesce(self, service, initialized_db):
+        _insert_schedule(initialized_db, "s-event")
+
+        for _ in range(5):
+            service._on_schedules_changed('{"schedule_id": "s-event"}')
+        pending = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        assert len(pending) == 1
+
+        await asyncio.gather(*pending)
+        assert service._get_job_id("s-event") in _job_ids(service)
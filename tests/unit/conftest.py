@@ -1,9 +1,30 @@
 """
 Minimal conftest for unit tests that don't need backend fixtures.
+
+Puts src/backend on sys.path for tests that import backend modules, and
+imports the backend database once against a scratch file (database.py
+initializes the schema on import). Importing it here also caches the
+backend's `utils` package before pytest puts tests/ (with its own utils)
+first on sys.path for each test module.
 """
 
+import os
+import sys
+import tempfile
+
 import pytest
 
+_BACKEND = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), '..', '..', 'src', 'backend'
+))
+if _BACKEND not in sys.path:
+    sys.path.insert(0, _BACKEND)
+
+if "database" not in sys.modules:
+    _tmpdir = tempfile.mkdtemp(prefix="trinity-test-db-")
+    os.environ["TRINITY_DB_PATH"] = os.path.join(_tmpdir, "trinity.db")
+    import database  # noqa: E402,F401
+
 
 def pytest_configure(config):
     """Configure custom markers."""
@@ -0,0 +1,149 @@
+"""
+Unit tests for the agent-side bounded session activity store.
+
+Covers the ring-buffer timeline and its id index, cursor-based deltas,
+status and totals bookkeeping, and the size-capped tool output store with
+optional disk spill.
+
+Module: docker/base-image/agent_server/activity_store.py
+"""
+
+import importlib.util
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+_AGENT_SERVER = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), '..', '..', 'docker', 'base-image', 'agent_server'
+))
+
+_spec = importlib.util.spec_from_file_location(
+    "activity_store_under_test",
+    os.path.join(_AGENT_SERVER, "activity_store.py"),
+)
+activity_store = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(activity_store)
+ActivityStore = activity_store.ActivityStore
+
+T0 = datetime(2026, 1, 1, 12, 0, 0)
+
+
+def _run(store, tool_id, seconds=0, output=None, success=True):
+    store.start(tool_id, "Bash", {"command": tool_id}, tool_id, T0)
+    store.complete(tool_id, success, T0 + timedelta(seconds=seconds), output_summary=output, output=output)
+
+
+@pytest.mark.unit
+class TestTimeline:
+
+    def test_start_and_complete(self):
+        store = ActivityStore()
+        store.start("t1", "Read", {"path": "a"}, "a", T0)
+        store.start("t2", "Bash", {"command": "ls"}, "ls", T0)
+        snapshot = store.snapshot()
+        assert snapshot["status"] == "running"
+        assert snapshot["active_tool"]["name"] == "Bash"
+        assert [e["id"] for e in snapshot["timeline"]] == ["t2", "t1"]
+
+        store.complete("t1", True, T0 + timedelta(seconds=2), output_summary="ok")
+        assert store.snapshot()["status"] == "running"  # t2 still running
+        store.complete("t2", False, T0 + timedelta(seconds=1))
+
+        snapshot = store.snapshot()
+        assert snapshot["status"] == "idle"
+        assert snapshot["active_tool"] is None
+        assert snapshot["tool_counts"] == {"Read": 1, "Bash": 1}
+        assert snapshot["totals"] == {"calls": 2, "duration_ms": 3000, "started_at": T0.isoformat()}
+        entry = store.get("t1")
+        assert (entry["status"], entry["success"], entry["duration_ms"]) == ("completed", True, 2000)
+
+    def test_ring_buffer_evicts_oldest(self):
+        store = ActivityStore(timeline_size=3)
+        for i in range(5):
+            _run(store, f"t{i}", output=f"out{i}")
+
+        assert [e["id"] for e in store.snapshot()["timeline"]] == ["t4", "t3", "t2"]
+        assert store.get("t0") is None and store.get_output("t0") is None
+        assert store.get_output("t4") == "out4"
+        assert store.snapshot()["totals"]["calls"] == 5
+        # Completing an evicted call is ignored
+        store.complete("t1", True, T0)
+        assert store.snapshot()["status"] == "idle"
+
+    def test_evicted_running_call_does_not_stay_running(self):
+        store = ActivityStore(timeline_size=2)
+        store.start("stuck", "Bash", {}, "", T0)
+        _run(store, "a")
+        _run(store, "b")
+        assert store.snapshot()["status"] == "idle"
+
+    def test_limit(self):
+        store = ActivityStore()
+        for i in range(10):
+            _run(store, f"t{i}")
+        assert [e["id"] for e in store.snapshot(limit=2)["timeline"]] == ["t9", "t8"]
+
+
+@pytest.mark.unit
+class TestCursor:
+
+    def test_delta_contains_started_and_completed_calls(self):
+        store = ActivityStore()
+        _run(store, "old")
+        store.start("slow", "Bash", {}, "", T0)
+        cursor = store.snapshot()["cursor"]
+
+        _run(store, "new")
+        store.complete("slow", True, T0 + timedelta(seconds=5))
+        delta = store.snapshot(since=cursor)
+
+        assert delta["reset"] is False
+        # Ordered by start, newest first; "old" is unchanged
+        assert [e["id"] for e in delta["timeline"]] == ["new", "slow"]
+        assert delta["totals"]["calls"] == 3
+
+        assert store.snapshot(since=delta["cursor"])["timeline"] == []
+
+    def test_cleared_or_unknown_cursor_resets(self):
+        store = ActivityStore()
+        _run(store, "a")
+        cursor = store.snapshot()["cursor"]
+        store.clear()
+        _run(store, "b")
+
+        snapshot = store.snapshot(since=cursor)
+        assert snapshot["reset"] is True
+        assert [e["id"] for e in snapshot["timeline"]] == ["b"]
+        assert store.snapshot(since="garbage")["reset"] is True
+        assert store.get("a") is None
+
+    def test_snapshot_is_a_copy(self):
+        store = ActivityStore()
+        store.start("t1", "Bash", {}, "", T0)
+        store.snapshot()["timeline"][0]["status"] = "mutated"
+        assert store.get("t1")["status"] == "running"
+
+
+@pytest.mark.unit
+class TestOutputs:
+
+    def test_outputs_are_size_capped(self):
+        store = ActivityStore(output_cache_bytes=10)
+        _run(store, "a", output="x" * 6)
+        _run(store, "b", output="y" * 6)
+        assert store.get_output("a") is None  # dropped, summary remains
+        assert store.get("a")["output_summary"] == "x" * 6
+        assert store.get_output("b") == "y" * 6
+
+    def test_outputs_spill_to_disk(self, tmp_path):
+        store = ActivityStore(timeline_size=2, output_cache_bytes=10, spill_dir=str(tmp_path))
+        _run(store, "a/1", output="x" * 6)
+        _run(store, "b", output="y" * 6)
+        assert store.get_output("a/1") == "x" * 6
+        assert len(list(tmp_path.iterdir())) == 1
+
+        # Evicting the call deletes its spilled output
+        _run(store, "c", output="z")
+        assert store.get_output("a/1") is None
+        assert list(tmp_path.iterdir()) == []
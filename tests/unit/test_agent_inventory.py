@@ -0,0 +1,271 @@
+"""
+Unit tests for the Docker-events-driven agent inventory (INVENTORY-001).
+
+A fake Docker client serves a container listing and a controllable events
+stream. Covers: events applied in order, reconciliation keeping newer
+observations, stale events/observations ignored, removal tombstones, and
+the direct-listing fallback while the inventory is not live.
+
+Module: src/backend/services/agent_inventory.py
+"""
+
+import os
+import queue
+import sys
+import time
+
+import docker
+import pytest
+
+_BACKEND = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), '..', '..', 'src', 'backend'
+))
+if _BACKEND not in sys.path:
+    sys.path.insert(0, _BACKEND)
+
+from services.agent_inventory import AgentInventory  # noqa: E402
+from services import docker_service  # noqa: E402
+
+NS = 1_000_000_000
+
+
+def _labels(**extra):
+    labels = {
+        "trinity.platform": "agent",
+        "trinity.agent-type": "worker",
+        "trinity.ssh-port": "2222",
+        "trinity.created": "2026-01-01T00:00:00",
+    }
+    labels.update(extra)
+    return labels
+
+
+class FakeContainer:
+    def __init__(self, container_id, name, status="running", labels=None, client=None):
+        self.id = container_id
+        self.name = name
+        self.status = status
+        self.labels = labels if labels is not None else _labels()
+        self._client = client
+
+    def reload(self):
+        if self._client is not None and self.id not in self._client.existing:
+            raise docker.errors.NotFound("gone")
+
+
+class FakeEventStream:
+    """Blocking iterator fed by the test; close() ends it."""
+
+    _END = object()
+
+    def __init__(self):
+        self.queue = queue.Queue()
+
+    def __iter__(self):
+        while True:
+            item = self.queue.get()
+            if item is self._END:
+                return
+            yield item
+
+    def close(self):
+        self.queue.put(self._END)
+
+
+class FakeContainers:
+    def __init__(self, client):
+        self.client = client
+        self.list_calls = 0
+
+    def list(self, all=False, filters=None):
+        self.list_calls += 1
+        return [self.client.existing[cid] for cid in self.client.existing]
+
+
+class FakeDockerClient:
+    def __init__(self, containers=()):
+        self.existing = {c.id: c for c in containers}
+        self.containers = FakeContainers(self)
+        self.streams = queue.Queue()
+
+    def events(self, **kwargs):
+        stream = FakeEventStream()
+        self.streams.put(stream)
+        return stream
+
+
+def _event(action, container_id, name, at, **labels):
+    attributes = dict(_labels(**labels), name=name)
+    return {
+        "Type": "container",
+        "Action": action,
+        "Actor": {"ID": container_id, "Attributes": attributes},
+        "timeNano": at,
+    }
+
+
+def _wait(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return
+        time.sleep(0.005)
+    raise AssertionError("condition not reached")
+
+
+def _by_name(inventory):
+    return {a.name: a for a in inventory.list_agents()}
+
+
+@pytest.fixture
+def running():
+    """Start an inventory on a fake client; yields (inventory, client, stream)."""
+    client = FakeDockerClient([
+        FakeContainer("c1", "agent-alpha", "running"),
+        FakeContainer("c2", "agent-beta", "exited"),
+    ])
+    inventory = AgentInventory(client, reconcile_interval=60, reconnect_delay=0.01)
+    inventory.start()
+    stream = client.streams.get(timeout=2)
+    _wait(lambda: inventory.is_live)
+    yield inventory, client, stream
+    inventory.stop()
+
+
+@pytest.mark.unit
+class TestAgentInventory:
+
+    def test_initial_listing(self, running):
+        inventory, client, _ = running
+        agents = _by_name(inventory)
+        assert set(agents) == {"alpha", "beta"}
+        assert agents["alpha"].status == "running"
+        assert agents["beta"].status == "stopped"
+        assert agents["alpha"].port == 2222
+        assert client.containers.list_calls == 1
+
+    def test_events_update_status(self, running):
+        inventory, _, stream = running
+        now = time.time_ns()
+        stream.queue.put(_event("die", "c1", "agent-alpha", now + 1))
+        stream.queue.put(_event("start", "c2", "agent-beta", now + 2))
+        stream.queue.put(_event("create", "c3", "agent-gamma", now + 3))
+        stream.queue.put(_event("pause", "c3", "agent-gamma", now + 4))
+        stream.queue.put(_event("exec_start: bash", "c3", "agent-gamma", now + 5))
+        _wait(lambda: inventory.events_applied == 4)
+
+        agents = _by_name(inventory)
+        assert agents["alpha"].status == "stopped"
+        assert agents["beta"].status == "running"
+        assert agents["gamma"].status == "paused"
+        assert agents["gamma"].container_id == "c3"
+
+    def test_rename_keeps_status(self, running):
+        inventory, _, stream = running
+        stream.queue.put(_event("rename", "c1", "agent-renamed", time.time_ns()))
+        _wait(lambda: inventory.events_applied == 1)
+
+        agents = _by_name(inventory)
+        assert "alpha" not in agents
+        assert agents["renamed"].status == "running"
+
+    def test_destroy_and_stale_event(self, running):
+        inventory, _, stream = running
+        now = time.time_ns()
+        stream.queue.put(_event("destroy", "c2", "agent-beta", now + 2))
+        # Delivered late: older than the removal, must not resurrect it
+        stream.queue.put(_event("die", "c2", "agent-beta", now + 1))
+        stream.queue.put(_event("stop", "c1", "agent-alpha", now + 3))
+        _wait(lambda: _by_name(inventory)["alpha"].status == "stopped")
+
+        assert set(_by_name(inventory)) == {"alpha"}
+
+    def test_observe_reads_own_write(self, running):
+        inventory, client, stream = running
+        container = client.existing["c1"]
+        container.status = "exited"
+        inventory.observe(container)
+        assert _by_name(inventory)["alpha"].status == "stopped"
+
+        # The event for an earlier state arrives after the observation
+        stream.queue.put(_event("start", "c1", "agent-alpha", time.time_ns() - NS))
+        stream.queue.put(_event("create", "c9", "agent-marker", time.time_ns()))
+        _wait(lambda: "marker" in _by_name(inventory))
+        assert _by_name(inventory)["alpha"].status == "stopped"
+
+        container._client = client
+        del client.existing["c1"]
+        inventory.observe(container)
+        assert "alpha" not in _by_name(inventory)
+
+    def test_reconcile_keeps_newer_observations(self, running):
+        inventory, client, _ = running
+        client.existing["c1"].status = "exited"
+        inventory.observe(client.existing["c1"])
+        del client.existing["c2"]
+        inventory.observe(FakeContainer("c2", "agent-beta", client=client))
+        client.existing["c4"] = FakeContainer("c4", "agent-delta", "running")
+
+        # Listing taken a minute ago: the observations above are newer
+        inventory._reload(int(time.time()) - 60)
+        agents = _by_name(inventory)
+        assert agents["alpha"].status == "stopped"
+        assert "beta" not in agents
+        assert "delta" in agents
+
+        # A later listing is authoritative and clears the tombstones
+        inventory._reload(int(time.time()) + 1)
+        assert inventory._removed == {}
+        assert set(_by_name(inventory)) == {"alpha", "delta"}
+
+    def test_list_returns_copies(self, running):
+        inventory, _, _ = running
+        inventory.list_agents()[0].status = "mutated"
+        assert {a.status for a in inventory.list_agents()} == {"running", "stopped"}
+
+    def test_stream_end_reconciles(self, running):
+        inventory, client, stream = running
+        client.existing["c5"] = FakeContainer("c5", "agent-epsilon", "restarting")
+        stream.close()  # `until` reached
+        client.streams.get(timeout=2)
+        _wait(lambda: inventory.reloads == 2 and inventory.is_live)
+        assert _by_name(inventory)["epsilon"].status == "restarting"
+
+
+@pytest.mark.unit
+class TestFallback:
+
+    def test_not_live_returns_none(self):
+        inventory = AgentInventory(FakeDockerClient([FakeContainer("c1", "agent-alpha")]))
+        assert inventory.list_agents() is None
+        inventory.observe(FakeContainer("c1", "agent-alpha"))
+        assert inventory._agents == {}
+
+    def test_docker_error_goes_offline_and_recovers(self):
+        client = FakeDockerClient([FakeContainer("c1", "agent-alpha")])
+        failures = []
+
+        def events(**kwargs):
+            if not failures:
+                failures.append(1)
+                raise docker.errors.APIError("daemon restarting")
+            return FakeDockerClient.events(client, **kwargs)
+
+        client.events = events
+        inventory = AgentInventory(client, reconnect_delay=0.01)
+        inventory.start()
+        try:
+            client.streams.get(timeout=2)
+            _wait(lambda: inventory.is_live)
+            assert set(_by_name(inventory)) == {"alpha"}
+        finally:
+            inventory.stop()
+        assert not inventory.is_live
+
+    def test_list_all_agents_fast_falls_back(self, monkeypatch):
+        from services import agent_inventory as module
+
+        offline = AgentInventory(None)
+        monkeypatch.setattr(module, "agent_inventory", offline)
+        monkeypatch.setattr(docker_service, "list_agent_containers_fast", lambda: ["direct"])
+        assert docker_service.list_all_agents_fast() == ["direct"]
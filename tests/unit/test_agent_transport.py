@@ -0,0 +1,114 @@
+"""
+Unit tests for the shared agent HTTP transport.
+
+Runs a local keep-alive HTTP server and verifies that pooled per-agent
+clients reuse connections and report pool hit rates.
+
+Module: src/backend/services/agent_transport.py
+"""
+
+import importlib.util
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+_BACKEND = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), '..', '..', 'src', 'backend'
+))
+
+_spec = importlib.util.spec_from_file_location(
+    "agent_transport_under_test",
+    os.path.join(_BACKEND, "services", "agent_transport.py"),
+)
+agent_transport = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(agent_transport)
+AgentTransport = agent_transport.AgentTransport
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+@pytest.mark.unit
+class TestAgentTransport:
+
+    @pytest.mark.asyncio
+    async def test_same_client_per_agent(self):
+        transport = AgentTransport()
+        assert transport.client("alpha") is transport.client("alpha")
+        assert transport.client("alpha") is not transport.client("beta")
+        assert str(transport.client("alpha").base_url) == "http://agent-alpha:8000"
+        await transport.aclose()
+
+    @pytest.mark.asyncio
+    async def test_connections_are_reused(self, server_url):
+        transport = AgentTransport()
+        client = transport.client("alpha")
+        for _ in range(5):
+            response = await client.get(f"{server_url}/api/activity", timeout=5.0)
+            assert response.status_code == 200
+
+        metrics = transport.get_metrics()
+        assert metrics["agents"]["alpha"]["requests"] == 5
+        assert metrics["agents"]["alpha"]["new_connections"] == 1
+        assert metrics["agents"]["alpha"]["hit_rate"] == pytest.approx(0.8)
+        await transport.aclose()
+
+    @pytest.mark.asyncio
+    async def test_request_helper(self, server_url):
+        transport = AgentTransport()
+        response = await transport.request("alpha", "GET", f"{server_url}/api/model")
+        assert response.json() == {"ok": True}
+        assert transport.get_metrics()["requests"] == 1
+        await transport.aclose()
+
+    @pytest.mark.asyncio
+    async def test_close_agent(self, server_url):
+        transport = AgentTransport()
+        client = transport.client("alpha")
+        await client.get(f"{server_url}/", timeout=5.0)
+        await transport.close_agent("alpha")
+
+        assert client.is_closed
+        assert "alpha" not in transport.get_metrics()["agents"]
+        assert transport.client("alpha") is not client
+        await transport.aclose()
+
+    @pytest.mark.asyncio
+    async def test_closed_client_is_replaced(self):
+        transport = AgentTransport()
+        client = transport.client("alpha")
+        await client.aclose()
+        assert transport.client("alpha") is not client
+        await transport.aclose()
+
+    def test_limits_and_http2_fallback(self):
+        transport = AgentTransport(max_connections=4, max_keepalive_connections=2, http2=True)
+        metrics = transport.get_metrics()
+        assert metrics["limits"]["max_connections"] == 4
+        assert metrics["limits"]["max_keepalive_connections"] == 2
+        # http2 is only enabled when the h2 package is importable
+        assert metrics["http2"] == transport._h2_available()
+        assert metrics["hit_rate"] == 0.0
@@ -0,0 +1,99 @@
+"""
+Unit tests for the async database facade.
+
+Verifies that AsyncDatabaseManager exposes DatabaseManager methods as
+coroutines that run off the event loop thread.
+
+Module: src/backend/database.py
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+import database
+from database import AsyncDatabaseManager
+
+
+class _FakeManager:
+    """Stand-in DatabaseManager with controllable latency."""
+
+    setting_name = "not-a-method"
+
+    def __init__(self):
+        self.calls = []
+
+    def slow_lookup(self, key, delay=0.2):
+        self.calls.append(threading.current_thread().name)
+        time.sleep(delay)
+        return {"key": key}
+
+    def meet(self, barrier):
+        # Breaks (BrokenBarrierError) unless all parties run at the same time
+        barrier.wait(timeout=2)
+        return barrier.parties
+
+    def failing(self):
+        raise ValueError("boom")
+
+
+@pytest.mark.unit
+class TestAsyncDatabaseManager:
+
+    @pytest.mark.asyncio
+    async def test_returns_method_result(self):
+        facade = AsyncDatabaseManager(_FakeManager())
+        assert await facade.slow_lookup("a", delay=0) == {"key": "a"}
+
+    @pytest.mark.asyncio
+    async def test_runs_on_db_executor_thread(self):
+        manager = _FakeManager()
+        facade = AsyncDatabaseManager(manager)
+        await facade.slow_lookup("a", delay=0)
+        assert manager.calls[0].startswith("trinity-db")
+
+    @pytest.mark.asyncio
+    async def test_event_loop_stays_responsive(self):
+        facade = AsyncDatabaseManager(_FakeManager())
+        ticks = 0
+
+        async def heartbeat():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        hb = asyncio.create_task(heartbeat())
+        await facade.slow_lookup("a", delay=0.2)
+        hb.cancel()
+
+        # A blocking call would have frozen the heartbeat entirely
+        assert ticks >= 5
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_overlap(self):
+        facade = AsyncDatabaseManager(_FakeManager(), max_workers=4)
+        barrier = threading.Barrier(4)
+        assert await asyncio.gather(*(facade.meet(barrier) for _ in range(4))) == [4] * 4
+
+    @pytest.mark.asyncio
+    async def test_exceptions_propagate(self):
+        facade = AsyncDatabaseManager(_FakeManager())
+        with pytest.raises(ValueError):
+            await facade.failing()
+
+    def test_private_and_missing_attributes(self):
+        facade = AsyncDatabaseManager(_FakeManager())
+        with pytest.raises(AttributeError):
+            facade._private
+        with pytest.raises(AttributeError):
+            facade.does_not_exist
+        with pytest.raises(AttributeError):
+            facade.setting_name
+
+    @pytest.mark.asyncio
+    async def test_real_manager_surface(self):
+        assert await database.async_db.get_user_by_username("nobody") is None
+        assert await database.async_db.get_setting_value("missing", "fallback") == "fallback"
@@ -0,0 +1,178 @@
+"""
+Unit tests for the authentication principal cache and batched MCP key usage.
+
+Module: src/backend/db/auth_cache.py, src/backend/db/mcp_keys.py
+"""
+
+import time
+
+import pytest
+
+from database import db
+from db.auth_cache import PrincipalCache, UsageBuffer, principal_cache, hash_token
+from db_models import McpApiKeyCreate, UserCreate
+
+
+@pytest.mark.unit
+class TestPrincipalCache:
+
+    def test_get_put(self):
+        cache = PrincipalCache()
+        assert cache.get("a") is None
+        cache.put("a", {"user": "alice"})
+        assert cache.get("a") == {"user": "alice"}
+        assert cache.hits == 1 and cache.misses == 1
+
+    def test_ttl_expiry(self):
+        cache = PrincipalCache(ttl=0.05)
+        cache.put("a", 1)
+        time.sleep(0.06)
+        assert cache.get("a") is None
+
+    def test_ttl_capped_by_entry_ttl(self):
+        cache = PrincipalCache(ttl=60)
+        cache.put("a", 1, ttl=0.05)
+        time.sleep(0.06)
+        assert cache.get("a") is None
+
+    def test_non_positive_ttl_is_not_cached(self):
+        cache = PrincipalCache()
+        cache.put("a", 1, ttl=-5)
+        assert cache.get("a") is None
+
+    def test_lru_eviction(self):
+        cache = PrincipalCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")  # a is now most recently used
+        cache.put("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_invalidation_by_tag(self):
+        cache = PrincipalCache()
+        cache.put("jwt", 1, username="alice")
+        cache.put("key", 2, username="alice", key_id="k1", agent_name="agent-a")
+        cache.put("other", 3, username="bob", key_id="k2")
+
+        assert cache.invalidate_key("k1") == 1
+        assert cache.get("key") is None
+        assert cache.invalidate_user("alice") == 1
+        assert cache.get("jwt") is None
+        assert cache.invalidate_agent("agent-a") == 0
+        assert cache.get("other") == 3
+
+    def test_invalidation_reaches_other_workers(self):
+        class FakeRelay:
+            """Delivers published payloads to the peer workers' handlers."""
+            def __init__(self):
+                self.handlers, self.peers, self.is_connected = {}, [], True
+
+            def add_handler(self, topic, handler):
+                self.handlers[topic] = handler
+
+            def publish(self, topic, payload):
+                for peer in self.peers:
+                    peer.handlers[topic](payload)
+
+        relays = [FakeRelay(), FakeRelay()]
+        relays[0].peers, relays[1].peers = [relays[1]], [relays[0]]
+        caches = [PrincipalCache(), PrincipalCache()]
+        for cache, relay in zip(caches, relays):
+            cache.attach_relay(relay)
+            cache.put("key", 1, key_id="k1")
+            cache.put("jwt", 2, username="alice")
+
+        caches[0].invalidate_key("k1")
+        assert caches[1].get("key") is None
+        assert caches[1].get("jwt") == 2
+
+        # Invalidations could be missed while the relay is down: nothing is served
+        relays[1].is_connected = False
+        assert caches[1].get("jwt") is None
+        relays[1].is_connected = True
+        assert caches[1].get("jwt") is None
+
+    def test_hash_token(self):
+        assert hash_token("abc") == hash_token("abc")
+        assert hash_token("abc") != hash_token("abd")
+        assert "abc" not in hash_token("abc")
+
+
+@pytest.mark.unit
+class TestUsageBuffer:
+
+    def test_accumulates_and_flushes(self):
+        flushed = []
+        buffer = UsageBuffer(flushed.append, interval=3600)
+        buffer.record("k1", "2026-01-01T00:00:00")
+        buffer.record("k1", "2026-01-01T00:00:05")
+        buffer.record("k2", "2026-01-01T00:00:01")
+
+        assert buffer.flush() == 2
+        assert flushed == [{
+            "k1": (2, "2026-01-01T00:00:05"),
+            "k2": (1, "2026-01-01T00:00:01"),
+        }]
+        assert buffer.flush() == 0
+        buffer.stop()
+
+    def test_failed_flush_is_retried(self):
+        calls = []
+
+        def flaky(batch):
+            calls.append(batch)
+            if len(calls) == 1:
+                raise RuntimeError("database is locked")
+
+        buffer = UsageBuffer(flaky, interval=3600)
+        buffer.record("k1", "2026-01-01T00:00:00")
+        assert buffer.flush() == 0
+        buffer.record("k1", "2026-01-01T00:00:09")
+        assert buffer.flush() == 1
+        assert calls[-1] == {"k1": (2, "2026-01-01T00:00:09")}
+        buffer.stop()
+
+
+@pytest.mark.unit
+class TestMcpKeyValidationCache:
+
+    @pytest.fixture
+    def api_key(self):
+        username = f"cache-user-{time.time_ns()}"
+        db.create_user(UserCreate(username=username, password="x", role="user", email=f"{username}@example.com"))
+        created = db.create_mcp_api_key(username, McpApiKeyCreate(name="test"))
+        yield username, created
+        principal_cache.clear()
+
+    def test_repeat_validation_is_cached(self, api_key):
+        _, created = api_key
+        first = db.validate_mcp_api_key(created.api_key)
+        assert first["key_id"] == created.id
+        assert principal_cache.get(f"mcp:{hash_token(created.api_key)}") is not None
+
+        second = db.validate_mcp_api_key(created.api_key)
+        assert second == first
+
+    def test_usage_is_batched(self, api_key):
+        username, created = api_key
+        for _ in range(3):
+            db.validate_mcp_api_key(created.api_key)
+
+        # Reads flush pending counters first
+        key = db.get_mcp_api_key(created.id, username)
+        assert key.usage_count == 3
+        assert key.last_used_at is not None
+
+    def test_revoke_invalidates_cache(self, api_key):
+        username, created = api_key
+        assert db.validate_mcp_api_key(created.api_key)
+        db.revoke_mcp_api_key(created.id, username)
+        assert db.validate_mcp_api_key(created.api_key) is None
+
+    def test_user_update_invalidates_cache(self, api_key):
+        username, created = api_key
+        db.validate_mcp_api_key(created.api_key)
+        db.update_user(username, {"email": "changed@example.com"})
+        assert db.validate_mcp_api_key(created.api_key)["user_email"] == "changed@example.com"
@@ -0,0 +1,203 @@
+"""
+Unit tests for the streaming container stats collector (STATS-001).
+
+Covers Docker stats parsing (cgroup v1 and v2 documents), the bounded
+ring buffer and its sampling interval, stale-sample handling, and stream
+threads following the set of running agents.
+
+Module: src/backend/services/container_stats.py
+"""
+
+import os
+import queue
+import sys
+import time
+
+import pytest
+
+_BACKEND = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), '..', '..', 'src', 'backend'
+))
+if _BACKEND not in sys.path:
+    sys.path.insert(0, _BACKEND)
+
+from services.container_stats import ContainerStatsCollector, StatsSample, _StatsStream, parse_stats  # noqa: E402
+
+MB = 1024 * 1024
+
+
+def _stats(total=2_000, pre_total=1_000, system=20_000, pre_system=10_000, **memory):
+    return {
+        "cpu_stats": {
+            "cpu_usage": {"total_usage": total},
+            "system_cpu_usage": system,
+            "online_cpus": 2,
+        },
+        "precpu_stats": {
+            "cpu_usage": {"total_usage": pre_total},
+            "system_cpu_usage": pre_system,
+        },
+        "memory_stats": {
+            "usage": memory.get("usage", 300 * MB),
+            "limit": memory.get("limit", 1024 * MB),
+            "stats": memory.get("detail", {"cache": 100 * MB}),
+        },
+        "networks": {
+            "eth0": {"rx_bytes": 10, "tx_bytes": 20},
+            "eth1": {"rx_bytes": 1, "tx_bytes": 2},
+        },
+        "blkio_stats": {"io_service_bytes_recursive": [
+            {"op": "Read", "value": 4096},
+            {"op": "Write", "value": 8192},
+            {"op": "read", "value": 4096},
+        ]},
+    }
+
+
+def _sample(timestamp, cpu=1.0):
+    return StatsSample(timestamp, cpu, 1, 2, 3, 0, 0, 0, 0)
+
+
+def _wait(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return
+        time.sleep(0.005)
+    raise AssertionError("condition not reached")
+
+
+class FakeApi:
+    """Docker low-level API: one queue-fed stats stream per container."""
+
+    def __init__(self):
+        self.feeds = {}
+        self.opened = []
+
+    def feed(self, container_id):
+        return self.feeds.setdefault(container_id, queue.Queue())
+
+    def stats(self, container_id, stream=True, decode=True):
+        self.opened.append(container_id)
+        feed = self.feed(container_id)
+        while True:
+            item = feed.get()
+            if item is None:
+                return
+            yield item
+
+
+class FakeClient:
+    def __init__(self):
+        self.api = FakeApi()
+
+
+@pytest.mark.unit
+class TestParseStats:
+
+    def test_cgroup_v1_document(self):
+        sample = parse_stats(_stats(), timestamp=1.0)
+        assert sample.cpu_percent == pytest.approx(20.0)  # 1000/10000 * 2 cpus
+        assert sample.memory_used_bytes == 200 * MB
+        assert sample.memory_percent == pytest.approx(200 / 1024 * 100)
+        assert sample.memory_usage_bytes == 300 * MB
+        assert (sample.network_rx_bytes, sample.network_tx_bytes) == (11, 22)
+        assert (sample.block_read_bytes, sample.block_write_bytes) == (8192, 8192)
+
+    def test_cgroup_v2_inactive_file(self):
+        sample = parse_stats(_stats(detail={"inactive_file": 50 * MB}))
+        assert sample.memory_used_bytes == 250 * MB
+
+    def test_percpu_fallback_for_cpu_count(self):
+        stats = _stats()
+        del stats["cpu_stats"]["online_cpus"]
+        stats["cpu_stats"]["cpu_usage"]["percpu_usage"] = [1, 1, 1, 1]
+        assert parse_stats(stats).cpu_percent == pytest.approx(40.0)
+
+    def test_first_streamed_and_stopped_documents(self):
+        assert parse_stats(_stats(pre_system=0)) is None
+        assert parse_stats({"cpu_stats": {}, "precpu_stats": {}, "memory_stats": {}}) is None
+
+
+@pytest.mark.unit
+class TestRingBuffer:
+
+    def test_history_is_bounded_and_sampled(self):
+        collector = ContainerStatsCollector(history_size=3, sample_interval=5.0)
+        stream = _StatsStream(collector, "alpha", "c1")
+        for t in range(0, 30):  # one document per second
+            stream.record(_sample(1000.0 + t, cpu=t))
+
+        history = [s.cpu_percent for s in stream.history]
+        assert history == [15, 20, 25]
+        assert stream.latest.cpu_percent == 29
+
+    def test_latest_is_not_served_when_stale(self):
+        collector = ContainerStatsCollector(stale_after=10.0)
+        stream = _StatsStream(collector, "alpha", "c1")
+        collector._streams["alpha"] = stream
+
+        stream.record(_sample(time.time() - 30))
+        assert collector.get_latest("alpha") is None
+        stream.record(_sample(time.time()))
+        assert collector.get_latest("alpha") is not None
+        assert collector.get_latest("unknown") is None
+
+    def test_history_window(self):
+        collector = ContainerStatsCollector(sample_interval=5.0)
+        stream = _StatsStream(collector, "alpha", "c1")
+        collector._streams["alpha"] = stream
+        now = time.time()
+        for age in (300, 200, 100, 5):
+            stream.record(_sample(now - age))
+
+        assert len(collector.get_history("alpha")) == 4
+        assert len(collector.get_history("alpha", seconds=150)) == 2
+        assert collector.get_history("unknown") == []
+
+
+@pytest.mark.unit
+class TestStreams:
+
+    def test_sync_follows_running_agents(self):
+        client = FakeClient()
+        collector = ContainerStatsCollector(client, reconnect_delay=0.01)
+        try:
+            collector.sync({"alpha": "c1", "beta": "c2"})
+            client.api.feed("c1").put(_stats(total=1_500))
+            client.api.feed("c2").put(_stats(total=2_000))
+            _wait(lambda: collector.get_latest("alpha") and collector.get_latest("beta"))
+            assert collector.get_latest("alpha").cpu_percent == pytest.approx(10.0)
+            assert collector.get_latest("beta").cpu_percent == pytest.approx(20.0)
+
+            # beta stopped, alpha recreated with a new container id
+            collector.sync({"alpha": "c3"})
+            assert set(collector._streams) == {"alpha"}
+            assert collector._streams["alpha"].container_id == "c3"
+            assert collector.get_latest("beta") is None
+            client.api.feed("c3").put(_stats())
+            _wait(lambda: collector.get_latest("alpha") is not None)
+        finally:
+            collector.stop()
+            for feed in client.api.feeds.values():
+                feed.put(None)
+
+    def test_stream_reopens_after_end(self):
+        client = FakeClient()
+        collector = ContainerStatsCollector(client, reconnect_delay=0.01)
+        try:
+            collector.sync({"alpha": "c1"})
+            _wait(lambda: client.api.opened == ["c1"])
+            client.api.feed("c1").put(None)  # stream ended
+            _wait(lambda: client.api.opened == ["c1", "c1"])
+            client.api.feed("c1").put(_stats())
+            _wait(lambda: collector.get_latest("alpha") is not None)
+        finally:
+            collector.stop()
+            client.api.feed("c1").put(None)
+
+    def test_without_docker_nothing_starts(self):
+        collector = ContainerStatsCollector(None)
+        collector.start()
+        assert not collector.is_running
+        assert collector.get_latest("alpha") is None
@@ -0,0 +1,211 @@
+"""
+Differential and guard tests for the guarded credential sanitizer.
+
+The guarded sanitize_text() must redact exactly like the original algorithm,
+which ran every literal replacement and every regex substitution on every
+call. The reference implementations below are that original algorithm; both
+the agent-side and backend-side modules are compared against them on a
+seeded random corpus built from fragments that exercise every pattern.
+
+Modules: docker/base-image/agent_server/utils/credential_sanitizer.py
+         src/backend/utils/credential_sanitizer.py
+"""
+
+import importlib.util
+import json
+import os
+import random
+import re
+
+import pytest
+
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+
+def _load(name: str, *path: str):
+    spec = importlib.util.spec_from_file_location(name, os.path.join(_ROOT, *path))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+agent_sanitizer = _load(
+    "agent_credential_sanitizer_under_test",
+    "docker", "base-image", "agent_server", "utils", "credential_sanitizer.py",
+)
+backend_sanitizer = _load(
+    "backend_credential_sanitizer_under_test",
+    "src", "backend", "utils", "credential_sanitizer.py",
+)
+
+
+def _reference_sanitize(text, credential_values, secret_patterns, key_patterns, placeholder):
+    """The original unguarded algorithm."""
+    if not text:
+        return text
+    result = text
+    for value in credential_values:
+        if value in result:
+            result = result.replace(value, placeholder)
+    for pattern in secret_patterns:
+        result = re.sub(pattern, placeholder, result)
+    for key_pattern in key_patterns:
+        kv_pattern = re.compile(r'(' + key_pattern + r')=(["\']?)([^\s"\']+)\2', re.IGNORECASE)
+        result = kv_pattern.sub(r'\1=' + placeholder, result)
+    return result
+
+
+def reference_agent(text):
+    return _reference_sanitize(
+        text,
+        agent_sanitizer.get_credential_values(),
+        agent_sanitizer.SECRET_VALUE_PATTERNS,
+        agent_sanitizer.SENSITIVE_VAR_PATTERNS,
+        agent_sanitizer.REDACTION_PLACEHOLDER,
+    )
+
+
+def reference_backend(text):
+    return _reference_sanitize(
+        text,
+        (),
+        backend_sanitizer.SECRET_VALUE_PATTERNS,
+        backend_sanitizer.SENSITIVE_KEY_PATTERNS,
+        backend_sanitizer.REDACTION_PLACEHOLDER,
+    )
+
+
+CREDENTIAL_ENV = {
+    "ANTHROPIC_API_KEY": "sk-ant-REDACTED",
+    "MY_SERVICE_TOKEN": "plain-token-value-42",
+    "DB_PASSWORD": "hunter2hunter2",
+    "GITHUB_PAT_SHORT": "hunter2hunter2-and-more",  # overlaps DB_PASSWORD
+}
+
+FRAGMENTS = [
+    # secret value shapes
+    "sk-" + "a1" * 12, "sk-proj-" + "Ab_-" * 6, "sk-ant-" + "x9-" * 8,
+    "ghp_" + "Z" * 36, "github_pat_" + "a_" * 12, "gho_" + "1" * 40, "ghs_" + "b" * 36,
+    "ghr_" + "c" * 35, "xoxb-123-abc", "xoxp-", "xoxa-9", "AKIA" + "ABCDEFGHIJ123456",
+    "AKIA" + "abc", "trinity_mcp_" + "q" * 16, "Bearer eyJhbGciOi.J9-x_", "Bearer\t\tabc",
+    "Basic dXNlcjpwYXNz==", "Basic ", "sk-short",
+    # key=value shapes
+    "API_KEY=", "api_key='v4lue'", 'OPENAI_API_KEY="abc def"', "github_token=", "GH_X=1",
+    "password = nope", "Authorization=Bearer", "x_secret_y=", "db_url=postgres://u:p@h/d",
+    "REDIS_URL=redis://redis:6379", "token", "TOKEN=", "=", "'", '"', "auth", "ANTHROPIC_",
+    "MySQL_HOST=db", "aws_region=eu-west-1", "ſecret=ı",
+    # credential literals
+    *CREDENTIAL_ENV.values(), "hunter2", "plain-token",
+    # filler
+    "hello", "world", "def f(x):", "{\"type\": \"tool_result\"}", "ünïcödé", "😀", "\\n",
+    "tool output line", "path/to/file.py", "SELECT * FROM t WHERE a=1",
+]
+SEPARATORS = ["", " ", "  ", "\n", "\t", "=", "'", '"', ",", ":", "-", "_"]
+
+
+def _corpus(size: int, seed: int):
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(size):
+        parts = []
+        for _ in range(rng.randint(1, 12)):
+            parts.append(rng.choice(FRAGMENTS))
+            parts.append(rng.choice(SEPARATORS))
+        corpus.append("".join(parts))
+    return corpus
+
+
+@pytest.fixture
+def credential_env(monkeypatch, tmp_path):
+    monkeypatch.setattr(os.path, "expanduser", lambda path: str(tmp_path / "missing.env"))
+    for name, value in CREDENTIAL_ENV.items():
+        monkeypatch.setenv(name, value)
+    agent_sanitizer.refresh_credential_values()
+    yield
+    for name in CREDENTIAL_ENV:
+        monkeypatch.delenv(name)
+    agent_sanitizer.refresh_credential_values()
+
+
+@pytest.mark.unit
+class TestDifferential:
+
+    def test_agent_matches_reference(self, credential_env):
+        mismatches = [
+            text for text in _corpus(2000, seed=1)
+            if agent_sanitizer.sanitize_text(text) != reference_agent(text)
+        ]
+        assert mismatches == []
+
+    def test_backend_matches_reference(self):
+        mismatches = [
+            text for text in _corpus(2000, seed=2)
+            if backend_sanitizer.sanitize_text(text) != reference_backend(text)
+        ]
+        assert mismatches == []
+
+    def test_corpus_exercises_every_pass(self, credential_env):
+        corpus = _corpus(2000, seed=1)
+        changed = [text for text in corpus if reference_agent(text) != text]
+        untouched = [text for text in corpus if reference_agent(text) == text]
+        assert len(changed) > 400 and len(untouched) > 40
+
+    def test_refresh_rebuilds_literal_matcher(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(os.path, "expanduser", lambda path: str(tmp_path / "missing.env"))
+        monkeypatch.delenv("LATE_SECRET", raising=False)
+        agent_sanitizer.refresh_credential_values()
+        text = "value: injected-later-value-123"
+        assert agent_sanitizer.sanitize_text(text) == text
+
+        monkeypatch.setenv("LATE_SECRET", "injected-later-value-123")
+        agent_sanitizer.refresh_credential_values()
+        assert agent_sanitizer.sanitize_text(text) == "value: ***REDACTED***"
+
+        monkeypatch.delenv("LATE_SECRET")
+        agent_sanitizer.refresh_credential_values()
+
+    def test_sanitize_subprocess_line_matches_reference(self, credential_env):
+        for text in _corpus(500, seed=3):
+            line = json.dumps({"type": "user", "message": {"content": [{"type": "text", "text": text}]}})
+            expected = json.dumps(
+                {"type": "user", "message": {"content": [{"type": "text", "text": reference_agent(text)}]}}
+            )
+            assert agent_sanitizer.sanitize_subprocess_line(line) == expected
+
+
+class _CountingPattern:
+    """Wraps a compiled pattern and counts sub() calls."""
+
+    def __init__(self, pattern, calls):
+        self.pattern = pattern
+        self.calls = calls
+
+    def sub(self, *args, **kwargs):
+        self.calls.append(self.pattern.pattern)
+        return self.pattern.sub(*args, **kwargs)
+
+
+@pytest.mark.unit
+class TestGuards:
+
+    def test_guards_skip_substitutions(self, credential_env, monkeypatch):
+        """Verbose tool output: long lines with nothing (or little) to redact."""
+        calls = []
+        monkeypatch.setattr(agent_sanitizer, "_secret_value_re", [
+            _CountingPattern(p, calls) for p in agent_sanitizer._secret_value_re
+        ])
+        monkeypatch.setattr(agent_sanitizer, "_sensitive_kv_re", [
+            (guard, _CountingPattern(p, calls)) for guard, p in agent_sanitizer._sensitive_kv_re
+        ])
+
+        rng = random.Random(4)
+        words = ["def", "return", "self.value", "x", "for", "in", "range(10)", "# comment", "path/to/file"]
+        for _ in range(100):
+            line = " ".join(rng.choice(words) for _ in range(rng.randint(20, 120)))
+            assert agent_sanitizer.sanitize_text(line) == line
+        assert calls == []
+
+        # One sensitive key: only the key=value patterns whose guard matches run
+        line = "export API_KEY=abc123 " + "y" * 200
+        assert agent_sanitizer.sanitize_text(line) == reference_agent(line)
+        assert 0 < len(calls) < len(agent_sanitizer._sensitive_kv_re)
@@ -0,0 +1,179 @@
+"""
+Unit tests for the pooled SQLite connection layer.
+
+Covers transaction semantics of get_db_connection(), WAL/pragma setup,
+connection reuse (no connections opened per lookup) and read-only
+connections.
+
+Module: src/backend/db/connection.py
+"""
+
+import importlib.util
+import os
+import sqlite3
+import threading
+
+import pytest
+
+_BACKEND = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), '..', '..', 'src', 'backend'
+))
+
+_spec = importlib.util.spec_from_file_location(
+    "db_connection_under_test",
+    os.path.join(_BACKEND, "db", "connection.py"),
+)
+connection = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(connection)
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    path = str(tmp_path / "trinity.db")
+    monkeypatch.setattr(connection, "DB_PATH", path)
+    with connection.get_db_connection() as conn:
+        conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+    yield path
+    connection.close_db_connections()
+
+
+@pytest.mark.unit
+class TestTransactions:
+    def test_commits_on_success(self, db_path):
+        with connection.get_db_connection() as conn:
+            conn.execute("INSERT INTO items (name) VALUES ('a')")
+
+        check = sqlite3.connect(db_path)
+        assert check.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 1
+        check.close()
+
+    def test_rolls_back_on_error(self, db_path):
+        with pytest.raises(RuntimeError):
+            with connection.get_db_connection() as conn:
+                conn.execute("INSERT INTO items (name) VALUES ('a')")
+                raise RuntimeError("boom")
+
+        with connection.get_db_connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 0
+
+    def test_rows_are_sqlite_rows(self, db_path):
+        with connection.get_db_connection() as conn:
+            conn.execute("INSERT INTO items (name) VALUES ('a')")
+            row = conn.execute("SELECT name FROM items").fetchone()
+            assert row["name"] == "a"
+
+
+@pytest.mark.unit
+class TestPooling:
+    def test_wal_mode_enabled(self, db_path):
+        with connection.get_db_connection() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+
+    def test_connection_is_reused(self, db_path):
+        with connection.get_db_connection() as first:
+            pass
+        with connection.get_db_connection() as second:
+            pass
+        assert first is second
+
+    def test_nested_checkouts_get_distinct_connections(self, db_path):
+        with connection.get_db_connection() as outer:
+            with connection.get_db_connection() as inner:
+                assert outer is not inner
+
+    def test_open_transaction_is_not_leaked(self, db_path):
+        pool = connection.get_connection_pool()
+        conn = pool.acquire()
+        conn.execute("INSERT INTO items (name) VALUES ('uncommitted')")
+        assert conn.in_transaction
+        pool.release(conn)
+        assert not conn.in_transaction
+
+        with connection.get_db_connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 0
+
+    def test_idle_connections_are_bounded(self, db_path):
+        pool = connection.ConnectionPool(db_path, max_idle=2)
+        conns = [pool.acquire() for _ in range(4)]
+        for conn in conns:
+            pool.release(conn)
+        assert len(pool._idle) == 2
+        pool.close_all()
+
+    def test_pool_follows_db_path_change(self, db_path, tmp_path, monkeypatch):
+        first = connection.get_connection_pool()
+        monkeypatch.setattr(connection, "DB_PATH", str(tmp_path / "other.db"))
+        assert connection.get_connection_pool() is not first
+
+    def test_concurrent_threads(self, db_path):
+        errors = []
+
+        def worker():
+            try:
+                for _ in range(50):
+                    with connection.get_db_connection() as conn:
+                        conn.execute("INSERT INTO items (name) VALUES ('t')")
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert not errors
+        with connection.get_db_connection(readonly=True) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 400
+
+
+@pytest.mark.unit
+class TestReadOnly:
+    def test_readonly_rejects_writes(self, db_path):
+        with pytest.raises(sqlite3.OperationalError):
+            with connection.get_db_connection(readonly=True) as conn:
+                conn.execute("INSERT INTO items (name) VALUES ('a')")
+
+    def test_readonly_uses_separate_pool(self, db_path):
+        with connection.get_db_connection() as writer:
+            pass
+        with connection.get_db_connection(readonly=True) as reader:
+            assert reader is not writer
+
+    def test_reader_sees_committed_writes(self, db_path):
+        with connection.get_db_connection(readonly=True) as reader:
+            reader.execute("SELECT COUNT(*) FROM items").fetchone()
+        with connection.get_db_connection() as conn:
+            conn.execute("INSERT INTO items (name) VALUES ('a')")
+        with connection.get_db_connection(readonly=True) as reader:
+            assert reader.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 1
+
+
+@pytest.mark.unit
+class TestConnectionCount:
+    """Repeated lookups reuse pooled connections instead of connect-per-call."""
+
+    ITERATIONS = 200
+
+    def test_lookups_do_not_open_connections(self, db_path, monkeypatch):
+        with connection.get_db_connection() as conn:
+            conn.execute("INSERT INTO items (name) VALUES ('a')")
+        with connection.get_db_connection(readonly=True):
+            pass
+
+        opened = []
+        real_connect = sqlite3.connect
+
+        def counting_connect(*args, **kwargs):
+            opened.append(args)
+            return real_connect(*args, **kwargs)
+
+        monkeypatch.setattr(connection.sqlite3, "connect", counting_connect)
+        for _ in range(self.ITERATIONS):
+            with connection.get_db_connection(readonly=True) as conn:
+                conn.execute("SELECT id, name FROM items WHERE id = ?", (1,)).fetchone()
+            with connection.get_db_connection() as conn:
+                conn.execute("UPDATE items SET name = 'b' WHERE id = 1")
+
+        assert opened == []
@@ -0,0 +1,220 @@
+"""
+Unit tests for the cross-worker event relay (EVENT-RELAY-001).
+
+Two "workers" (each an EventRelay plus its own WebSocket managers) share
+one fakeredis server: broadcasts, filtered events and access changes made
+in one worker reach the other worker's connections exactly once, the
+dedicated scheduler's events reach every worker, and local delivery keeps
+working when Redis is unavailable.
+
+Module: src/backend/services/event_relay.py
+"""
+
+import asyncio
+import json
+import os
+import sys
+from contextlib import asynccontextmanager
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+_BACKEND = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), '..', '..', 'src', 'backend'
+))
+if _BACKEND not in sys.path:
+    sys.path.insert(0, _BACKEND)
+
+from services.event_relay import RELAY_CHANNEL, EventRelay  # noqa: E402
+from services.websocket_manager import (  # noqa: E402
+    SCHEDULER_EVENTS_CHANNEL,
+    ConnectionManager,
+    FilteredWebSocketManager,
+    attach_relay,
+)
+
+
+class FakeWebSocket:
+    """Records sent frames."""
+
+    def __init__(self):
+        self.sent = []
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, message: str):
+        self.sent.append(message)
+
+    async def close(self, code: int = 1000):
+        pass
+
+    @property
+    def received(self) -> list:
+        return [json.loads(m) for m in self.sent]
+
+
+class Worker:
+    """One backend worker: relay plus both managers."""
+
+    def __init__(self, server):
+        self.relay = EventRelay(
+            redis_client=fakeredis.FakeAsyncRedis(server=server, decode_responses=True),
+            reconnect_delay=0.05,
+        )
+        self.manager = ConnectionManager()
+        self.filtered = FilteredWebSocketManager()
+        attach_relay(self.relay, self.manager, self.filtered)
+
+
+async def _wait_connected(*workers):
+    for _ in range(100):
+        if all(w.relay.is_connected for w in workers):
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("relay did not subscribe")
+
+
+async def _settle():
+    """Let the relay round trip and the writer tasks drain."""
+    await asyncio.sleep(0.1)
+
+
+@asynccontextmanager
+async def _workers():
+    server = fakeredis.FakeServer()
+    pair = [Worker(server), Worker(server)]
+    for worker in pair:
+        worker.relay.start()
+    await _wait_connected(*pair)
+    yield pair
+    for worker in pair:
+        await worker.relay.stop()
+
+
+@pytest.mark.unit
+class TestRelay:
+
+    @pytest.mark.asyncio
+    async def test_broadcast_reaches_every_worker_once(self):
+        async with _workers() as (a, b):
+            ws_a, ws_b = FakeWebSocket(), FakeWebSocket()
+            await a.manager.connect(ws_a)
+            await b.manager.connect(ws_b)
+
+            for i in range(3):
+                await a.manager.broadcast(json.dumps({"seq": i}))
+            await b.manager.broadcast(json.dumps({"seq": "from-b"}))
+            await _settle()
+
+            # Local connections get events at once, other workers' after the
+            # relay round trip; order is kept per publishing worker
+            assert [e["seq"] for e in ws_a.received] == [0, 1, 2, "from-b"]
+            assert [e["seq"] for e in ws_b.received] == ["from-b", 0, 1, 2]
+            assert a.relay.published == 3 and b.relay.received == 3
+
+    @pytest.mark.asyncio
+    async def test_filtered_events_and_access_changes(self):
+        async with _workers() as (a, b):
+            owner_b, friend_b = FakeWebSocket(), FakeWebSocket()
+            await b.filtered.connect(owner_b, "owner@x", False, ["alpha"])
+            await b.filtered.connect(friend_b, "friend@x", False, [])
+
+            # Share handled by worker A; the listener is connected to worker B
+            a.filtered.grant_agent("friend@x", "alpha")
+            await _settle()
+            await a.filtered.broadcast_filtered({"agent_name": "alpha", "seq": 1})
+            a.filtered.rename_agent("alpha", "beta")
+            await _settle()
+            await a.filtered.broadcast_filtered({"agent_name": "beta", "seq": 2})
+            await a.filtered.broadcast_filtered({"agent_name": "alpha", "seq": 3})
+            await _settle()
+
+            assert [e["seq"] for e in owner_b.received] == [1, 2]
+            assert [e["seq"] for e in friend_b.received] == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_scheduler_events_reach_every_worker(self):
+        async with _workers() as (a, b):
+            ui_a, ui_b, listener_b = FakeWebSocket(), FakeWebSocket(), FakeWebSocket()
+            await a.manager.connect(ui_a)
+            await b.manager.connect(ui_b)
+            await b.filtered.connect(listener_b, "owner@x", False, ["alpha"])
+
+            event = {"type": "schedule_execution_completed", "agent": "alpha", "status": "success"}
+            await a.relay.redis.publish(SCHEDULER_EVENTS_CHANNEL, json.dumps(event))
+            await _settle()
+
+            assert ui_a.received == [event]
+            assert ui_b.received == [event]
+            assert listener_b.received == [event]
+
+    @pytest.mark.asyncio
+    async def test_malformed_and_foreign_messages_are_ignored(self):
+        async with _workers() as (a, b):
+            ws_b = FakeWebSocket()
+            await b.manager.connect(ws_b)
+
+            await a.relay.redis.publish(RELAY_CHANNEL, "not json")
+            await a.relay.redis.publish(RELAY_CHANNEL, json.dumps({"origin": "x", "topic": "unknown", "payload": {}}))
+            await a.relay.redis.publish(RELAY_CHANNEL, json.dumps(["list"]))
+            await a.manager.broadcast(json.dumps({"seq": "ok"}))
+            await _settle()
+
+            assert ws_b.received == [{"seq": "ok"}]
+            assert b.relay.is_connected
+
+    @pytest.mark.asyncio
+    async def test_publish_from_worker_thread(self):
+        async with _workers() as (a, b):
+            received = []
+            b.relay.add_handler("auth.invalidate", received.append)
+
+            # DB writes (and their cache invalidations) run in worker threads
+            await asyncio.to_thread(a.relay.publish, "auth.invalidate", {"tag": "key_id", "value": "k1"})
+            await _settle()
+
+            assert received == [{"tag": "key_id", "value": "k1"}]
+
+
+@pytest.mark.unit
+class TestLocalFallback:
+
+    @pytest.mark.asyncio
+    async def test_not_started_delivers_locally_only(self):
+        worker = Worker(fakeredis.FakeServer())
+        ws = FakeWebSocket()
+        await worker.manager.connect(ws)
+
+        await worker.manager.broadcast(json.dumps({"seq": 1}))
+        await _settle()
+
+        assert ws.received == [{"seq": 1}]
+        assert worker.relay.published == 0
+
+    @pytest.mark.asyncio
+    async def test_redis_down_keeps_local_delivery(self):
+        server = fakeredis.FakeServer()
+        worker = Worker(server)
+        worker.relay.start()
+        await _wait_connected(worker)
+        server.connected = False
+        ws = FakeWebSocket()
+        await worker.manager.connect(ws)
+
+        await worker.manager.broadcast(json.dumps({"seq": 1}))
+        await _settle()
+
+        assert ws.received == [{"seq": 1}]
+        assert worker.relay.dropped == 1
+        await worker.relay.stop()
+
+    @pytest.mark.asyncio
+    async def test_unserializable_payload_is_not_relayed(self):
+        worker = Worker(fakeredis.FakeServer())
+        worker.relay.start()
+        worker.relay.publish("websocket", {"kind": "filtered", "event": {"at": object()}})
+        await _settle()
+        assert worker.relay.published == 0 and worker.relay.dropped == 0
+        await worker.relay.stop()
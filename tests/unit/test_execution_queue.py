@@ -0,0 +1,310 @@
+"""
+Unit tests for the weighted fair-share execution queue (QUEUE-FAIR-001).
+
+Runs the Lua scripts against fakeredis (with Lua support): submit/complete
+hand-off, per-agent depth, source-class weights, fair share across callers,
+blocking-pop waiters, and a simulated burst checking run order per source
+class.
+
+Module: src/backend/services/execution_queue.py
+"""
+
+import asyncio
+import os
+import statistics
+import sys
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+pytest.importorskip("lupa")
+
+_BACKEND = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), '..', '..', 'src', 'backend'
+))
+if _BACKEND not in sys.path:
+    sys.path.insert(0, _BACKEND)
+
+from models import ExecutionSource, QueueItemStatus  # noqa: E402
+from services.execution_queue import (  # noqa: E402
+    AgentBusyError,
+    ExecutionQueue,
+    QueueFullError,
+    QueueWaitError,
+)
+
+USER = ExecutionSource.USER
+AGENT = ExecutionSource.AGENT
+SCHEDULE = ExecutionSource.SCHEDULE
+
+
+@pytest.fixture
+def queue():
+    return ExecutionQueue(redis_client=fakeredis.FakeAsyncRedis(decode_responses=True))
+
+
+def _request(queue, source, caller="u1", message="hi", agent="alpha"):
+    return queue.create_execution(
+        agent_name=agent,
+        message=message,
+        source=source,
+        source_agent=caller if source == AGENT else None,
+        source_user_id=caller,
+    )
+
+
+async def _drain(queue, agent="alpha"):
+    """Complete executions until idle; returns messages in run order."""
+    order = []
+    while True:
+        nxt = await queue.complete(agent)
+        if nxt is None:
+            return order
+        order.append(nxt.message)
+
+
+@pytest.mark.unit
+class TestSubmitComplete:
+
+    @pytest.mark.asyncio
+    async def test_idle_agent_runs_immediately(self, queue):
+        result, execution = await queue.submit(_request(queue, USER))
+        assert result == "running"
+        assert execution.status == QueueItemStatus.RUNNING
+        assert await queue.is_busy("alpha")
+
+        result, _ = await queue.submit(_request(queue, USER))
+        assert result == "queued:1"
+
+        status = await queue.get_status("alpha", max_queue_depth=5)
+        assert status.is_busy and status.queue_length == 1
+        assert status.max_queue_depth == 5
+
+    @pytest.mark.asyncio
+    async def test_complete_promotes_next_and_goes_idle(self, queue):
+        await queue.submit(_request(queue, USER, message="first"))
+        _, waiting = await queue.submit(_request(queue, USER, message="second"))
+
+        nxt = await queue.complete("alpha")
+        assert nxt.id == waiting.id
+        assert nxt.status == QueueItemStatus.RUNNING and nxt.started_at is not None
+        status = await queue.get_status("alpha")
+        assert status.current_execution.id == waiting.id
+        assert status.current_execution.status == QueueItemStatus.RUNNING
+
+        assert await queue.complete("alpha") is None
+        assert not await queue.is_busy("alpha")
+        assert await queue.redis.keys("agent:queue:*") == ["agent:queue:ready:" + waiting.id]
+
+    @pytest.mark.asyncio
+    async def test_depth_is_per_call(self, queue):
+        await queue.submit(_request(queue, USER))
+        for _ in range(5):
+            await queue.submit(_request(queue, SCHEDULE), max_queue_depth=5)
+        with pytest.raises(QueueFullError) as exc:
+            await queue.submit(_request(queue, USER), max_queue_depth=5)
+        assert exc.value.queue_length == 5
+        with pytest.raises(QueueFullError):
+            await queue.submit(_request(queue, USER))  # default depth 3
+
+    @pytest.mark.asyncio
+    async def test_busy_without_wait(self, queue):
+        _, running = await queue.submit(_request(queue, USER))
+        with pytest.raises(AgentBusyError) as exc:
+            await queue.submit(_request(queue, USER), wait_if_busy=False)
+        assert exc.value.current_execution.id == running.id
+        assert (await queue.get_status("alpha")).queue_length == 0
+
+    @pytest.mark.asyncio
+    async def test_stale_complete_leaves_new_holder_alone(self, queue):
+        _, first = await queue.submit(_request(queue, USER))
+        await queue.force_release("alpha")
+        _, second = await queue.submit(_request(queue, USER))
+        await queue.submit(_request(queue, USER, message="waiting"))
+
+        assert await queue.complete("alpha", execution_id=first.id) is None
+        status = await queue.get_status("alpha")
+        assert status.current_execution.id == second.id
+        assert status.queue_length == 1
+
+    @pytest.mark.asyncio
+    async def test_lapsed_running_state_hands_agent_to_queue_head(self, queue):
+        await queue.submit(_request(queue, USER))
+        _, waiting = await queue.submit(_request(queue, SCHEDULE))
+        await queue.redis.delete("agent:running:alpha")  # TTL expiry
+
+        result, _ = await queue.submit(_request(queue, USER))
+        assert result == "queued:1"
+        status = await queue.get_status("alpha")
+        assert status.current_execution.id == waiting.id
+        assert await queue.redis.lrange("agent:queue:ready:" + waiting.id, 0, -1) == ["run"]
+
+
+@pytest.mark.unit
+class TestFairShare:
+
+    @pytest.mark.asyncio
+    async def test_user_jumps_queued_schedules(self, queue):
+        await queue.submit(_request(queue, SCHEDULE, message="running"))
+        for i in range(3):
+            await queue.submit(_request(queue, SCHEDULE, caller="cron", message=f"s{i}"), max_queue_depth=10)
+        await queue.submit(_request(queue, AGENT, caller="peer", message="a0"), max_queue_depth=10)
+        result, _ = await queue.submit(_request(queue, USER, message="u0"), max_queue_depth=10)
+
+        assert result == "queued:1"
+        assert await _drain(queue) == ["u0", "a0", "s0", "s1", "s2"]
+
+    @pytest.mark.asyncio
+    async def test_callers_share_instead_of_fifo(self, queue):
+        await queue.submit(_request(queue, USER, message="running"))
+        for i in range(4):
+            await queue.submit(_request(queue, USER, caller="alice", message=f"alice{i}"), max_queue_depth=10)
+        await queue.submit(_request(queue, USER, caller="bob", message="bob0"), max_queue_depth=10)
+
+        status = await queue.get_status("alpha")
+        assert [e.message for e in status.queued_executions][:2] == ["alice0", "bob0"]
+        assert await _drain(queue) == ["alice0", "bob0", "alice1", "alice2", "alice3"]
+
+    @pytest.mark.asyncio
+    async def test_schedules_are_not_starved(self, queue):
+        await queue.submit(_request(queue, USER, message="running"))
+        await queue.submit(_request(queue, SCHEDULE, caller="cron", message="sched"), max_queue_depth=50)
+        order = []
+        # Users keep the queue backlogged; the schedule still gets its 1/(4+1) share
+        for i in range(12):
+            await queue.submit(_request(queue, USER, caller="alice", message=f"u{i}"), max_queue_depth=50)
+            if i % 2:
+                order.append((await queue.complete("alpha")).message)
+        order += await _drain(queue)
+        assert order.index("sched") == 3
+
+
+@pytest.mark.unit
+class TestWaiters:
+
+    @pytest.mark.asyncio
+    async def test_waiter_woken_by_complete(self, queue):
+        await queue.submit(_request(queue, USER))
+        _, waiting = await queue.submit(_request(queue, USER))
+        waiter = asyncio.create_task(queue.wait_for_turn(waiting, timeout=5))
+        await asyncio.sleep(0.05)
+        assert not waiter.done()
+
+        await queue.complete("alpha")
+        execution = await asyncio.wait_for(waiter, 1)
+        assert execution.status == QueueItemStatus.RUNNING
+        assert await queue.redis.exists("agent:queue:ready:" + waiting.id) == 0
+
+    @pytest.mark.asyncio
+    async def test_wait_timeout_withdraws_request(self, queue):
+        await queue.submit(_request(queue, USER))
+        _, waiting = await queue.submit(_request(queue, USER))
+        with pytest.raises(QueueWaitError) as exc:
+            await queue.wait_for_turn(waiting, timeout=0.1)
+        assert exc.value.reason == "timeout"
+        assert (await queue.get_status("alpha")).queue_length == 0
+        assert await queue.complete("alpha") is None
+
+    @pytest.mark.asyncio
+    async def test_promotion_wins_race_with_timeout(self, queue):
+        await queue.submit(_request(queue, USER))
+        _, waiting = await queue.submit(_request(queue, USER))
+        await queue.complete("alpha")
+        await queue.redis.delete("agent:queue:ready:" + waiting.id)
+        await queue.redis.rpush("agent:queue:ready:" + waiting.id, "run")
+        # Token already present: returns without blocking
+        execution = await queue.wait_for_turn(waiting, timeout=0.1)
+        assert execution.status == QueueItemStatus.RUNNING
+
+    @pytest.mark.asyncio
+    async def test_promoted_waiter_runs_when_wake_up_is_lost(self, queue):
+        await queue.submit(_request(queue, USER))
+        _, waiting = await queue.submit(_request(queue, USER))
+        await queue.complete("alpha")
+        await queue.redis.delete("agent:queue:ready:" + waiting.id)
+
+        # Promoted but never woken: the timeout finds it holding the agent
+        execution = await queue.wait_for_turn(waiting, timeout=0.1)
+        assert execution.status == QueueItemStatus.RUNNING
+        assert (await queue.get_status("alpha")).current_execution.id == waiting.id
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_withdraws_request(self, queue):
+        await queue.submit(_request(queue, USER))
+        _, waiting = await queue.submit(_request(queue, USER))
+        waiter = asyncio.create_task(queue.wait_for_turn(waiting, timeout=5))
+        await asyncio.sleep(0.05)
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert (await queue.get_status("alpha")).queue_length == 0
+        assert await queue.complete("alpha") is None
+
+    @pytest.mark.asyncio
+    async def test_waiter_cancelled_after_promotion_hands_agent_on(self, queue):
+        await queue.submit(_request(queue, USER))
+        _, waiting = await queue.submit(_request(queue, USER))
+        _, last = await queue.submit(_request(queue, USER, message="last"))
+
+        async def promoted_then_lost(*args, **kwargs):
+            # The agent is handed over but the waiter never sees the token
+            await queue.complete("alpha")
+            await asyncio.Event().wait()
+
+        queue.redis.blpop = promoted_then_lost
+        waiter = asyncio.create_task(queue.wait_for_turn(waiting, timeout=5))
+        await asyncio.sleep(0.05)
+        assert (await queue.get_status("alpha")).current_execution.id == waiting.id
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert (await queue.get_status("alpha")).current_execution.id == last.id
+        assert await queue.redis.exists("agent:queue:ready:" + waiting.id) == 0
+
+    @pytest.mark.asyncio
+    async def test_clear_wakes_waiters(self, queue):
+        await queue.submit(_request(queue, USER))
+        waiting = [(await queue.submit(_request(queue, USER)))[1] for _ in range(2)]
+        waiters = [asyncio.create_task(queue.wait_for_turn(e, timeout=5)) for e in waiting]
+        await asyncio.sleep(0.05)
+
+        assert await queue.clear_queue("alpha") == 2
+        for waiter in waiters:
+            with pytest.raises(QueueWaitError) as exc:
+                await asyncio.wait_for(waiter, 1)
+            assert exc.value.reason == "cleared"
+        assert await queue.is_busy("alpha")
+
+
+@pytest.mark.unit
+class TestBurst:
+
+    @pytest.mark.asyncio
+    async def test_burst_run_order(self, queue):
+        """30 requests hit one agent at once: none rejected, users run first."""
+        sources = [SCHEDULE] * 10 + [AGENT] * 10 + [USER] * 10
+        positions = {USER: [], AGENT: [], SCHEDULE: []}
+        run_order = []
+        peak_depth = 0
+
+        async def caller(i, source):
+            nonlocal peak_depth
+            execution = _request(queue, source, caller=f"{source.value}-{i % 3}", message=str(i))
+            result, execution = await queue.submit(execution, max_queue_depth=50)
+            if result.startswith("queued:"):
+                execution = await queue.wait_for_turn(execution, timeout=10)
+            positions[source].append(len(run_order))
+            run_order.append(execution.id)
+            peak_depth = max(peak_depth, (await queue.get_status("alpha")).queue_length)
+            await asyncio.sleep(0)
+            await queue.complete("alpha", execution_id=execution.id)
+
+        await asyncio.gather(*(caller(i, source) for i, source in enumerate(sources)))
+
+        mean = {source: statistics.mean(values) for source, values in positions.items()}
+        assert len(run_order) == len(set(run_order)) == len(sources)
+        assert peak_depth == len(sources) - 1
+        assert mean[USER] < mean[AGENT] < mean[SCHEDULE]
+        assert not await queue.is_busy("alpha")
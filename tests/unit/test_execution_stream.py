@@ -0,0 +1,199 @@
+"""
+Unit tests for the backend execution log stream multiplexer (LOG-STREAM-001).
+
+The agent is replaced by an httpx MockTransport serving scripted SSE
+bodies. Covers: one upstream shared by several viewers, replay for late
+joiners, Last-Event-ID resume for viewers and for the upstream after it
+drops, errors, closing the upstream when the last viewer leaves, and gaps
+for viewers that fall behind the ring buffer.
+
+Module: src/backend/services/execution_stream.py
+"""
+
+import asyncio
+import json
+import os
+import sys
+
+import httpx
+import pytest
+
+_BACKEND = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), '..', '..', 'src', 'backend'
+))
+if _BACKEND not in sys.path:
+    sys.path.insert(0, _BACKEND)
+
+from services import execution_stream  # noqa: E402
+from services.execution_stream import ExecutionStreamMux, _ExecutionStream  # noqa: E402
+
+
+def _event(seq, **data):
+    event_id = f"id: {seq}\n" if seq is not None else ""
+    return f"{event_id}data: {json.dumps(data)}\n\n"
+
+
+END = _event(None, type="stream_end")
+
+
+class FakeAgent:
+    """Agent transport stand-in; each request gets the next scripted response."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    async def _handle(self, request):
+        self.requests.append(request)
+        status, body = self.responses.pop(0)
+        if isinstance(body, asyncio.Queue):
+            async def stream():
+                while (chunk := await body.get()) is not None:
+                    yield chunk.encode()
+            return httpx.Response(status, content=stream())
+        return httpx.Response(status, content="".join(body).encode())
+
+    def client(self, agent_name):
+        return httpx.AsyncClient(transport=httpx.MockTransport(self._handle))
+
+
+@pytest.fixture
+def agent(monkeypatch):
+    holder = {}
+    monkeypatch.setattr(execution_stream, "get_agent_transport", lambda: holder["agent"])
+
+    def install(*responses):
+        holder["agent"] = FakeAgent(*responses)
+        return holder["agent"]
+
+    return install
+
+
+async def _read_all(stream):
+    return [chunk async for chunk in stream]
+
+
+def _seqs(chunks):
+    """Event ids and types of SSE chunks, e.g. [(1, 'log'), (None, 'stream_end')]."""
+    result = []
+    for chunk in chunks:
+        if chunk.startswith(":"):
+            continue
+        lines = chunk.strip().split("\n")
+        seq = int(lines[0][4:]) if lines[0].startswith("id: ") else None
+        result.append((seq, json.loads(lines[-1][6:])["type"]))
+    return result
+
+
+@pytest.mark.unit
+class TestMultiplexer:
+
+    @pytest.mark.asyncio
+    async def test_viewers_share_one_upstream(self, agent):
+        feed = asyncio.Queue()
+        fake = agent((200, feed))
+        mux = ExecutionStreamMux()
+
+        first = asyncio.create_task(_read_all(mux.subscribe("a1", "exec-1")))
+        feed.put_nowait(_event(1, type="log") + ": keepalive\n\n")
+        await asyncio.sleep(0.05)
+        second = asyncio.create_task(_read_all(mux.subscribe("a1", "exec-1")))
+        await asyncio.sleep(0.05)
+        assert mux.viewer_count("a1", "exec-1") == 2
+
+        # Events may arrive split across chunks
+        feed.put_nowait(_event(2, type="log")[:5])
+        feed.put_nowait(_event(2, type="log")[5:] + END)
+
+        expected = [(1, "log"), (2, "log"), (None, "stream_end")]
+        assert _seqs(await first) == expected
+        assert _seqs(await second) == expected  # late joiner got the replay
+        assert len(fake.requests) == 1
+        assert mux._streams == {}
+
+    @pytest.mark.asyncio
+    async def test_viewer_resumes_after_last_event_id(self, agent):
+        agent((200, [_event(1, type="log"), _event(2, type="log"), _event(3, type="log"), END]))
+        mux = ExecutionStreamMux()
+
+        chunks = await _read_all(mux.subscribe("a1", "exec-1", last_event_id="2"))
+        assert _seqs(chunks) == [(3, "log"), (None, "stream_end")]
+
+    @pytest.mark.asyncio
+    async def test_dropped_upstream_reconnects_with_last_event_id(self, agent):
+        fake = agent(
+            (200, [_event(1, type="log"), _event(2, type="log")]),  # drops without stream_end
+            (200, [_event(2, type="log"), _event(3, type="log"), END]),
+        )
+        mux = ExecutionStreamMux(reconnect_delay=0)
+
+        chunks = await _read_all(mux.subscribe("a1", "exec-1"))
+        assert _seqs(chunks) == [(1, "log"), (2, "log"), (3, "log"), (None, "stream_end")]
+        assert "last-event-id" not in fake.requests[0].headers
+        assert fake.requests[1].headers["last-event-id"] == "2"
+
+    @pytest.mark.asyncio
+    async def test_upstream_gives_up_after_retries(self, agent):
+        agent(*[(200, [_event(1, type="log")])] * 3)
+        mux = ExecutionStreamMux(upstream_retries=2, reconnect_delay=0)
+
+        chunks = await _read_all(mux.subscribe("a1", "exec-1"))
+        assert _seqs(chunks) == [(1, "log"), (None, "error"), (None, "stream_end")]
+
+    @pytest.mark.asyncio
+    async def test_execution_not_on_agent(self, agent):
+        agent((404, ['{"detail": "Execution not found"}']))
+        mux = ExecutionStreamMux()
+
+        chunks = await _read_all(mux.subscribe("a1", "exec-1"))
+        error = json.loads(chunks[0].strip()[6:])
+        assert error == {"type": "error", "message": "Execution not yet available on agent", "retryable": True}
+        assert _seqs(chunks)[-1] == (None, "stream_end")
+
+    @pytest.mark.asyncio
+    async def test_last_viewer_leaving_closes_upstream(self, agent):
+        feed = asyncio.Queue()
+        agent((200, feed))
+        mux = ExecutionStreamMux()
+
+        viewer = mux.subscribe("a1", "exec-1")
+        feed.put_nowait(_event(1, type="log"))
+        assert (await viewer.__anext__()).startswith("id: 1\n")
+        upstream = mux._streams[("a1", "exec-1")].task
+
+        await viewer.aclose()
+        await asyncio.sleep(0)
+        assert upstream.cancelled() or upstream.done()
+        assert mux._streams == {}
+
+    @pytest.mark.asyncio
+    async def test_idle_viewer_gets_keepalive(self, agent):
+        feed = asyncio.Queue()
+        agent((200, feed))
+        mux = ExecutionStreamMux(keepalive_interval=0.01)
+
+        viewer = mux.subscribe("a1", "exec-1")
+        assert await viewer.__anext__() == ": keepalive\n\n"
+        await viewer.aclose()
+
+
+@pytest.mark.unit
+class TestRingBuffer:
+
+    def test_viewer_behind_the_ring_loses_oldest_events(self):
+        stream = _ExecutionStream("a1", "exec-1", replay_size=2)
+        for seq in range(1, 6):
+            stream.append(json.dumps({"type": "log"}), seq)
+
+        events, position, lost = stream.read(1)
+        assert [seq for _, seq, _ in events] == [4, 5]
+        assert (position, lost) == (5, 2)
+
+    def test_start_position(self):
+        stream = _ExecutionStream("a1", "exec-1", replay_size=10)
+        for seq in range(1, 4):
+            stream.append(json.dumps({"type": "log"}), seq)
+
+        assert stream.start_position(0) == 0
+        assert stream.start_position(2) == 2
+        assert stream.start_position(9) == 3
@@ -0,0 +1,177 @@
+"""
+Unit tests for the agent-side lazy workspace file tree (FILE-TREE-001).
+
+Covers depth-limited walks, per-directory pagination, ignore patterns and
+hidden entries, the mtime-keyed directory cache, and ETags.
+
+Module: docker/base-image/agent_server/services/file_tree.py
+"""
+
+import importlib.util
+import os
+
+import pytest
+
+_AGENT_SERVER = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), '..', '..', 'docker', 'base-image', 'agent_server'
+))
+
+_spec = importlib.util.spec_from_file_location(
+    "file_tree_under_test",
+    os.path.join(_AGENT_SERVER, "services", "file_tree.py"),
+)
+file_tree = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(file_tree)
+FileTree = file_tree.FileTree
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    (tmp_path / "README.md").write_text("hello")
+    (tmp_path / "b.txt").write_text("b")
+    (tmp_path / ".env").write_text("SECRET=1")
+    (tmp_path / "src" / "lib").mkdir(parents=True)
+    (tmp_path / "src" / "main.py").write_text("print()")
+    (tmp_path / "src" / "lib" / "util.py").write_text("pass")
+    (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+    (tmp_path / "node_modules" / "pkg" / "index.js").write_text("")
+    return tmp_path
+
+
+IGNORE = file_tree.parse_ignore("node_modules,.git")
+
+
+def _names(items):
+    return [item["name"] for item in items]
+
+
+def _find(items, name):
+    return next(item for item in items if item["name"] == name)
+
+
+@pytest.mark.unit
+class TestListing:
+
+    def test_full_walk(self, workspace):
+        listing, _ = FileTree(workspace).list(workspace)
+
+        # Directories first, then files; hidden entries left out
+        assert _names(listing["tree"]) == ["node_modules", "src", "b.txt", "README.md"]
+        src = _find(listing["tree"], "src")
+        assert src["loaded"] is True and src["file_count"] == 2
+        assert _find(src["children"], "lib")["children"][0]["path"] == "src/lib/util.py"
+        # No depth, paging or ignore patterns unless asked for
+        assert _find(listing["tree"], "node_modules")["loaded"] is True
+        assert listing["requested_path"] == "."
+        assert listing["total_files"] == 5
+        assert listing["has_more"] is False
+
+    def test_ignored_directories_are_not_walked(self, workspace):
+        tree = FileTree(workspace)
+        listing, _ = tree.list(workspace, ignore=IGNORE)
+
+        node_modules = _find(listing["tree"], "node_modules")
+        assert node_modules["loaded"] is False
+        assert node_modules["children"] == [] and node_modules["file_count"] is None
+
+        # Listing it on its own expands it
+        listing, _ = tree.list(workspace / "node_modules")
+        assert listing["requested_path"] == "node_modules"
+        assert _find(listing["tree"], "pkg")["children"][0]["path"] == "node_modules/pkg/index.js"
+
+    def test_ignore_patterns(self, workspace):
+        tree = FileTree(workspace)
+
+        assert file_tree.parse_ignore(None) == file_tree.parse_ignore("") == ()
+
+        listing, _ = tree.list(workspace, ignore=file_tree.parse_ignore("*.md, lib"))
+        assert "README.md" not in _names(listing["tree"])
+        assert _find(_find(listing["tree"], "src")["children"], "lib")["loaded"] is False
+
+    def test_hidden_entries(self, workspace):
+        listing, _ = FileTree(workspace).list(workspace, show_hidden=True)
+        assert ".env" in _names(listing["tree"])
+
+    def test_depth(self, workspace):
+        listing, _ = FileTree(workspace).list(workspace, depth=1)
+        src = _find(listing["tree"], "src")
+        assert src["loaded"] is False and src["children"] == []
+
+        listing, _ = FileTree(workspace).list(workspace, depth=2)
+        src = _find(listing["tree"], "src")
+        assert src["loaded"] is True
+        assert _find(src["children"], "lib")["loaded"] is False
+
+    def test_pagination(self, workspace):
+        tree = FileTree(workspace)
+
+        listing, _ = tree.list(workspace, limit=3)
+        assert _names(listing["tree"]) == ["node_modules", "src", "b.txt"]
+        assert (listing["total_entries"], listing["has_more"]) == (4, True)
+
+        listing, _ = tree.list(workspace, offset=3, limit=3)
+        assert _names(listing["tree"]) == ["README.md"]
+        assert listing["has_more"] is False
+
+        # Nested directories are cut off at the same page size
+        listing, _ = tree.list(workspace, limit=1, offset=1)
+        src = listing["tree"][0]
+        assert _names(src["children"]) == ["lib"]
+        assert (src["has_more"], src["total_entries"]) == (True, 2)
+
+    def test_symlinked_directories_are_not_walked(self, workspace):
+        os.symlink(workspace, workspace / "loop")
+        listing, _ = FileTree(workspace).list(workspace)
+        assert _find(listing["tree"], "loop")["loaded"] is False
+
+
+@pytest.mark.unit
+class TestCacheAndEtag:
+
+    def test_unchanged_directories_are_served_from_cache(self, workspace):
+        tree = FileTree(workspace, cache_ttl=60)
+        _, etag = tree.list(workspace)
+        scans = tree.scans
+
+        _, again = tree.list(workspace)
+        assert tree.scans == scans
+        assert again == etag
+
+    def test_changed_directory_is_read_again(self, workspace):
+        tree = FileTree(workspace, cache_ttl=60)
+        _, etag = tree.list(workspace)
+        scans = tree.scans
+
+        (workspace / "src" / "new.py").write_text("")
+        listing, changed = tree.list(workspace)
+
+        assert tree.scans == scans + 1  # only src
+        assert "new.py" in _names(_find(listing["tree"], "src")["children"])
+        assert changed != etag
+
+    def test_ttl_refreshes_in_place_edits(self, workspace):
+        tree = FileTree(workspace, cache_ttl=0)
+        _, etag = tree.list(workspace, depth=1)
+        (workspace / "README.md").write_text("hello, world")
+
+        listing, changed = tree.list(workspace, depth=1)
+
+        assert _find(listing["tree"], "README.md")["size"] == 12
+        assert changed != etag
+
+    def test_etag_depends_on_parameters(self, workspace):
+        tree = FileTree(workspace)
+        assert tree.list(workspace)[1] != tree.list(workspace, depth=1)[1]
+
+    def test_cache_is_bounded(self, workspace):
+        tree = FileTree(workspace, cache_size=2)
+        tree.list(workspace)
+        assert len(tree._cache) == 2
+
+    def test_etag_matches(self):
+        etag = 'W/"abc"'
+        assert file_tree.etag_matches('W/"abc"', etag)
+        assert file_tree.etag_matches('"xyz", "abc"', etag)
+        assert file_tree.etag_matches('*', etag)
+        assert not file_tree.etag_matches('W/"xyz"', etag)
+        assert not file_tree.etag_matches(None, etag)
@@ -0,0 +1,151 @@
+"""
+Unit tests for the agent-side cached git status service (GIT-STATUS-001).
+
+Covers porcelain v2 parsing, status of real repositories (changes,
+ahead/behind from the upstream), and the cache: reuse while git metadata
+is unchanged, recomputation after staging or invalidation, and one
+computation shared by concurrent callers.
+
+Module: docker/base-image/agent_server/services/git_status.py
+"""
+
+import asyncio
+import importlib.util
+import os
+import subprocess
+
+import pytest
+
+_AGENT_SERVER = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), '..', '..', 'docker', 'base-image', 'agent_server'
+))
+
+_spec = importlib.util.spec_from_file_location(
+    "git_status_under_test",
+    os.path.join(_AGENT_SERVER, "services", "git_status.py"),
+)
+git_status = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(git_status)
+GitStatusService = git_status.GitStatusService
+
+
+def _git(cwd, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+        cwd=str(cwd), check=True, capture_output=True,
+    )
+
+
+@pytest.fixture
+def repo(tmp_path):
+    path = tmp_path / "repo"
+    path.mkdir()
+    _git(path, "init", "-q", "-b", "main")
+    (path / "README.md").write_text("hello\n")
+    _git(path, "add", "README.md")
+    _git(path, "commit", "-q", "-m", "Initial commit")
+    return path
+
+
+@pytest.mark.unit
+class TestPorcelainV2:
+
+    def test_branch_and_changes(self):
+        output = "\n".join([
+            "# branch.oid 1234567890abcdef",
+            "# branch.head main",
+            "# branch.upstream origin/main",
+            "# branch.ab +2 -1",
+            "1 .M N... 100644 100644 100644 aaa bbb notes/todo.md",
+            "1 A. N... 000000 100644 100644 000 ccc new file.txt",
+            "2 R. N... 100644 100644 100644 ddd ddd R100 docs/new.md\tdocs/old.md",
+            "u UU N... 100644 100644 100644 100644 e f g conflict.py",
+            "? scratch.txt",
+            "! ignored.log",
+        ])
+
+        parsed = git_status.parse_porcelain_v2(output)
+
+        assert (parsed["branch"], parsed["upstream"]) == ("main", "origin/main")
+        assert (parsed["ahead"], parsed["behind"]) == (2, 1)
+        assert parsed["changes"] == [
+            {"status": "M", "path": "notes/todo.md"},
+            {"status": "A", "path": "new file.txt"},
+            {"status": "R", "path": "docs/old.md -> docs/new.md"},
+            {"status": "UU", "path": "conflict.py"},
+            {"status": "??", "path": "scratch.txt"},
+        ]
+
+    def test_detached_head_without_upstream(self):
+        parsed = git_status.parse_porcelain_v2("# branch.oid abc\n# branch.head (detached)\n")
+        assert parsed["branch"] == "HEAD"
+        assert parsed["ahead"] is None and parsed["upstream"] is None
+
+
+@pytest.mark.unit
+class TestGitStatusService:
+
+    @pytest.mark.asyncio
+    async def test_not_a_repository(self, tmp_path):
+        status = await GitStatusService(tmp_path).get_status()
+        assert status["git_enabled"] is False
+
+    @pytest.mark.asyncio
+    async def test_clean_repository(self, repo):
+        status = await GitStatusService(repo).get_status()
+
+        assert status["branch"] == "main"
+        assert status["last_commit"]["message"] == "Initial commit"
+        assert status["changes"] == [] and status["changes_count"] == 0
+        assert (status["ahead"], status["behind"]) == (0, 0)
+        assert status["sync_status"] == "up_to_date"
+
+    @pytest.mark.asyncio
+    async def test_ahead_of_upstream(self, repo, tmp_path):
+        remote = tmp_path / "remote.git"
+        _git(tmp_path, "init", "-q", "--bare", str(remote))
+        _git(repo, "remote", "add", "origin", str(remote))
+        _git(repo, "push", "-q", "-u", "origin", "main")
+        _git(repo, "commit", "-q", "--allow-empty", "-m", "Local work")
+
+        status = await GitStatusService(repo).get_status()
+
+        assert status["remote_url"] == str(remote)
+        assert (status["ahead"], status["behind"]) == (1, 0)
+        assert status["sync_status"] == "pending_sync"
+
+    @pytest.mark.asyncio
+    async def test_cached_until_git_metadata_changes(self, repo):
+        service = GitStatusService(repo, ttl=60)
+        assert (await service.get_status())["changes_count"] == 0
+
+        # A working tree edit alone is served from cache until the TTL
+        (repo / "notes.md").write_text("draft\n")
+        assert (await service.get_status())["changes_count"] == 0
+        assert service.computed == 1
+
+        _git(repo, "add", "notes.md")
+        status = await service.get_status()
+        assert status["changes"] == [{"status": "A", "path": "notes.md"}]
+        assert service.computed == 2
+
+    @pytest.mark.asyncio
+    async def test_ttl_and_invalidate(self, repo):
+        service = GitStatusService(repo, ttl=0)
+        await service.get_status()
+        (repo / "notes.md").write_text("draft\n")
+        assert (await service.get_status())["changes"] == [{"status": "??", "path": "notes.md"}]
+
+        service.ttl = 60
+        (repo / "more.md").write_text("draft\n")
+        service.invalidate()
+        assert (await service.get_status())["changes_count"] == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_computation(self, repo):
+        service = GitStatusService(repo)
+
+        results = await asyncio.gather(*(service.get_status() for _ in range(5)))
+
+        assert service.computed == 1
+        assert all(result == results[0] for result in results)
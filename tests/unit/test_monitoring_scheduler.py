@@ -0,0 +1,282 @@
+"""
+Unit tests for the adaptive health check scheduler (MON-SCHED-001).
+
+The three check layers are replaced with fakes; records go to a scratch
+database. Covers: per-tier due times scaled by status with jitter, only
+due tiers running, only-on-change persistence with heartbeats, batched
+writes, status change alerts, cycle metrics, and time-weighted uptime.
+
+Module: src/backend/services/monitoring_service.py, src/backend/db/monitoring.py
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from database import db
+from db.connection import get_db_connection
+from db_models import (
+    BusinessHealthCheck,
+    DockerHealthCheck,
+    MonitoringConfig,
+    NetworkHealthCheck,
+)
+from services import monitoring_service
+from services.monitoring_service import MonitoringService, interval_multiplier
+
+NOW = "2026-01-01T00:00:00Z"
+
+
+class FakeAgent:
+    def __init__(self, name, status="running"):
+        self.name = name
+        self.status = status
+
+
+class FakeChecks:
+    """Stand-ins for the three check layers; results set per agent."""
+
+    def __init__(self):
+        self.calls = []
+        self.cpu = {}
+        self.reachable = {}
+
+    def docker(self, agent_name):
+        self.calls.append(("docker", agent_name))
+        return DockerHealthCheck(
+            agent_name=agent_name, container_status="running",
+            cpu_percent=self.cpu.get(agent_name, 10.0), memory_percent=20.0, checked_at=NOW
+        )
+
+    async def network(self, agent_name, timeout=10.0):
+        self.calls.append(("network", agent_name))
+        reachable = self.reachable.get(agent_name, True)
+        return NetworkHealthCheck(
+            agent_name=agent_name, reachable=reachable,
+            latency_ms=12.0 if reachable else None,
+            error=None if reachable else "Connection refused", checked_at=NOW
+        )
+
+    async def business(self, agent_name, timeout=10.0):
+        self.calls.append(("business", agent_name))
+        return BusinessHealthCheck(
+            agent_name=agent_name, status="healthy", runtime_available=True, checked_at=NOW
+        )
+
+    def tiers(self, agent_name):
+        return sorted(tier for tier, name in self.calls if name == agent_name)
+
+
+@pytest.fixture
+def fleet(monkeypatch):
+    """Fake checks and agents; returns (checks, agents list, alerts list)."""
+    from services import docker_service
+
+    checks = FakeChecks()
+    agents = []
+    alerts = []
+
+    async def record_alerts(agent_name, previous, status, *args, **kwargs):
+        if previous is not None and previous != status.value:
+            alerts.append((agent_name, previous, status.value))
+
+    monkeypatch.setattr(monitoring_service, "check_docker_health", checks.docker)
+    monkeypatch.setattr(monitoring_service, "check_network_health", checks.network)
+    monkeypatch.setattr(monitoring_service, "check_business_health", checks.business)
+    monkeypatch.setattr(monitoring_service, "_send_health_alerts", record_alerts)
+    monkeypatch.setattr(docker_service, "list_all_agents_fast", lambda: list(agents))
+    return checks, agents, alerts
+
+
+def _service(**overrides):
+    config = MonitoringConfig(interval_jitter=0.0, **overrides)
+    return MonitoringService(config)
+
+
+def _expire(service, agent_name, *tiers):
+    for tier in tiers:
+        service._schedules[agent_name].due[tier] = 0.0
+
+
+def _rows(agent_name, check_type=None):
+    query = "SELECT check_type, status FROM agent_health_checks WHERE agent_name = ?"
+    params = [agent_name]
+    if check_type:
+        query += " AND check_type = ?"
+        params.append(check_type)
+    with get_db_connection() as conn:
+        return conn.execute(query, params).fetchall()
+
+
+@pytest.mark.unit
+class TestScheduling:
+
+    def test_interval_multiplier(self):
+        config = MonitoringConfig()
+        assert interval_multiplier("healthy", config) == config.healthy_interval_multiplier
+        assert interval_multiplier("degraded", config) == 1.0
+        assert interval_multiplier("critical", config) == config.unhealthy_interval_multiplier
+        assert interval_multiplier(None, config) == config.unhealthy_interval_multiplier
+
+    @pytest.mark.asyncio
+    async def test_healthy_agents_back_off_per_tier(self, fleet):
+        checks, agents, _ = fleet
+        agents.append(FakeAgent("sched-a"))
+        service = _service()
+
+        await service._run_check_cycle()
+        assert checks.tiers("sched-a") == ["business", "docker", "network"]
+        schedule = service._schedules["sched-a"]
+        config = service.config
+        gaps = {tier: due - min(schedule.due.values()) for tier, due in schedule.due.items()}
+        # healthy: business interval x2 is 60s later than docker/network (30 x 2)
+        assert gaps["business"] == pytest.approx(
+            (config.business_check_interval - config.docker_check_interval) * 2, abs=0.5
+        )
+
+        # Nothing due: nothing runs
+        checks.calls.clear()
+        await service._run_check_cycle()
+        assert checks.calls == []
+
+        # Only the network tier is due: docker/business results are reused
+        _expire(service, "sched-a", "network")
+        await service._run_check_cycle()
+        assert checks.tiers("sched-a") == ["network"]
+
+    @pytest.mark.asyncio
+    async def test_status_change_brings_checks_forward(self, fleet):
+        checks, agents, alerts = fleet
+        agents.append(FakeAgent("sched-b"))
+        service = _service()
+        await service._run_check_cycle()
+        schedule = service._schedules["sched-b"]
+        business_due = schedule.due["business"]
+
+        checks.reachable["sched-b"] = False
+        _expire(service, "sched-b", "network")
+        await service._run_check_cycle()
+
+        assert schedule.status == "unhealthy"
+        assert alerts == [("sched-b", "healthy", "unhealthy")]
+        # Unhealthy: x0.5 instead of x2, the business tier is pulled in too
+        assert schedule.due["business"] < business_due - 60
+
+    @pytest.mark.asyncio
+    async def test_jitter_spreads_due_times(self, fleet):
+        _, agents, _ = fleet
+        agents.extend(FakeAgent(f"sched-j{i}") for i in range(20))
+        service = MonitoringService(MonitoringConfig(interval_jitter=0.2))
+        await service._run_check_cycle()
+        due = {round(s.due["docker"], 3) for s in service._schedules.values()}
+        assert len(due) > 1
+
+    @pytest.mark.asyncio
+    async def test_stopped_agents_are_dropped(self, fleet):
+        _, agents, _ = fleet
+        agents.extend([FakeAgent("sched-c"), FakeAgent("sched-d")])
+        service = _service()
+        await service._run_check_cycle()
+        agents[1] = FakeAgent("sched-d", status="stopped")
+        await service._run_check_cycle()
+        assert set(service._schedules) == {"sched-c"}
+
+
+@pytest.mark.unit
+class TestPersistence:
+
+    @pytest.mark.asyncio
+    async def test_only_changes_and_heartbeats_are_written(self, fleet):
+        checks, agents, _ = fleet
+        agents.append(FakeAgent("sched-p"))
+        service = _service()
+
+        await service._run_check_cycle()
+        assert len(_rows("sched-p")) == 4
+
+        # New CPU reading, same state: nothing written
+        checks.cpu["sched-p"] = 42.0
+        _expire(service, "sched-p", "docker", "network", "business")
+        await service._run_check_cycle()
+        assert len(_rows("sched-p")) == 4
+        assert service.records_skipped == 4
+
+        # Network goes down: network and aggregate records written
+        checks.reachable["sched-p"] = False
+        _expire(service, "sched-p", "network")
+        await service._run_check_cycle()
+        assert len(_rows("sched-p", "network")) == 2
+        assert [r[1] for r in _rows("sched-p", "aggregate")] == ["healthy", "unhealthy"]
+        assert len(_rows("sched-p")) == 6
+
+        # Heartbeat: unchanged records written again once it is due
+        service.config = MonitoringConfig(interval_jitter=0.0, heartbeat_interval=0)
+        _expire(service, "sched-p", "docker")
+        await service._run_check_cycle()
+        assert len(_rows("sched-p", "docker")) == 2
+
+    @pytest.mark.asyncio
+    async def test_cycle_is_written_in_one_batch(self, fleet, monkeypatch):
+        _, agents, _ = fleet
+        agents.extend(FakeAgent(f"sched-batch{i}") for i in range(5))
+        batches = []
+        monkeypatch.setattr(db, "create_health_checks", lambda records: batches.append(len(records)))
+        service = _service()
+        await service._run_check_cycle()
+        assert batches == [20]
+        assert service.records_written == 20
+
+    @pytest.mark.asyncio
+    async def test_failed_write_is_retried(self, fleet, monkeypatch):
+        _, agents, _ = fleet
+        agents.append(FakeAgent("sched-f"))
+
+        def fail(records):
+            raise RuntimeError("database is locked")
+
+        monkeypatch.setattr(db, "create_health_checks", fail)
+        service = _service()
+        await service._run_check_cycle()
+        assert service._schedules["sched-f"].persisted == {}
+
+    @pytest.mark.asyncio
+    async def test_cycle_metrics(self, fleet):
+        _, agents, _ = fleet
+        agents.append(FakeAgent("sched-m"))
+        service = _service(scheduler_tick_interval=5)
+        await service._run_check_cycle()
+        service._record_cycle(0.5)
+        service._record_cycle(7.5)
+
+        metrics = service.metrics()
+        assert metrics["cycles"] == 2
+        assert metrics["overruns"] == 1
+        assert metrics["last_cycle_seconds"] == 7.5
+        assert metrics["avg_cycle_seconds"] == 4.0
+        assert metrics["max_cycle_seconds"] == 7.5
+        assert metrics["checks_run"] == {"docker": 1, "network": 1, "business": 1}
+        assert metrics["agents_scheduled"] == 1
+
+
+@pytest.mark.unit
+class TestUptime:
+
+    def _insert(self, agent_name, status, minutes_ago):
+        checked_at = (datetime.now(timezone.utc) - timedelta(minutes=minutes_ago)) \
+            .strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+        with get_db_connection() as conn:
+            conn.execute(
+                "INSERT INTO agent_health_checks (id, agent_name, check_type, status, checked_at) "
+                "VALUES (?, ?, 'aggregate', ?, ?)",
+                (f"hc_{agent_name}_{minutes_ago}", agent_name, status, checked_at)
+            )
+            conn.commit()
+
+    def test_uptime_is_time_weighted(self):
+        # Down for 10 minutes, then up for 30: one record each
+        self._insert("uptime-a", "critical", 40)
+        self._insert("uptime-a", "healthy", 30)
+        assert db.calculate_uptime_percent("uptime-a", hours=1) == pytest.approx(75.0, abs=1.0)
+
+    def test_no_records(self):
+        assert db.calculate_uptime_percent("uptime-none") is None
@@ -0,0 +1,345 @@
+"""
+Unit tests for the agent-side process registry with asyncio subprocesses.
+
+Covers backpressured log publishing to slow subscribers, sequence ids with
+ring-buffer replay and resume, and process supervision: exit reaping,
+non-blocking termination of asyncio and Popen handles, and process group
+cleanup.
+
+Module: docker/base-image/agent_server/services/process_registry.py
+"""
+
+import asyncio
+import importlib.util
+import os
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pytest
+
+_AGENT_SERVER = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), '..', '..', 'docker', 'base-image', 'agent_server'
+))
+
+_spec = importlib.util.spec_from_file_location(
+    "process_registry_under_test",
+    os.path.join(_AGENT_SERVER, "services", "process_registry.py"),
+)
+process_registry = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(process_registry)
+ProcessRegistry = process_registry.ProcessRegistry
+
+
+async def _start_sleeper(seconds: int = 30) -> asyncio.subprocess.Process:
+    return await asyncio.create_subprocess_exec(
+        sys.executable, "-c", f"import time; time.sleep({seconds})",
+        stdout=asyncio.subprocess.PIPE,
+    )
+
+
+@pytest.mark.unit
+class TestBackpressure:
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_receives_every_entry(self):
+        registry = ProcessRegistry()
+        registry.register("exec-1", process=None)
+        queue = asyncio.Queue(maxsize=2)
+        registry._log_subscribers["exec-1"].append(queue)
+
+        received = []
+
+        async def consume():
+            while len(received) < 20:
+                received.append(await queue.get())
+                await asyncio.sleep(0.005)
+
+        consumer = asyncio.create_task(consume())
+        for i in range(20):
+            await registry.publish_log_entry_async("exec-1", {"seq": i})
+        await consumer
+
+        assert [seq for seq, _ in received] == list(range(1, 21))
+        assert [entry["seq"] for _, entry in received] == list(range(20))
+
+    @pytest.mark.asyncio
+    async def test_stalled_subscriber_costs_one_timeout(self):
+        registry = ProcessRegistry()
+        registry._publish_timeout = 0.05
+        registry.register("exec-1", process=None)
+        stalled = asyncio.Queue(maxsize=1)
+        healthy = asyncio.Queue()
+        registry._log_subscribers["exec-1"].extend([stalled, healthy])
+
+        with patch.object(process_registry.logger, "warning") as lagging_warning:
+            for i in range(50):
+                await registry.publish_log_entry_async("exec-1", {"seq": i})
+
+        assert lagging_warning.call_count == 1  # One timeout, then drops
+        assert stalled.qsize() == 1
+        assert healthy.qsize() == 50
+        assert len(registry.get_buffered_logs("exec-1")) == 50
+
+    @pytest.mark.asyncio
+    async def test_lagging_subscriber_gets_backpressure_again_after_catching_up(self):
+        registry = ProcessRegistry()
+        registry._publish_timeout = 0.05
+        registry.register("exec-1", process=None)
+        queue = asyncio.Queue(maxsize=1)
+        registry._log_subscribers["exec-1"].append(queue)
+
+        await registry.publish_log_entry_async("exec-1", {"seq": 0})
+        await registry.publish_log_entry_async("exec-1", {"seq": 1})  # times out
+        assert id(queue) in registry._lagging_subscribers["exec-1"]
+
+        queue.get_nowait()
+        await registry.publish_log_entry_async("exec-1", {"seq": 2})
+        assert id(queue) not in registry._lagging_subscribers["exec-1"]
+
+
+async def _collect(registry, execution_id, after_seq=0):
+    return [item async for item in registry.iter_logs(execution_id, after_seq=after_seq, idle_timeout=1.0)]
+
+
+@pytest.mark.unit
+class TestLogSequencing:
+
+    def test_sequence_ids_and_ring_buffer(self):
+        registry = ProcessRegistry()
+        registry._max_buffer_size = 3
+        registry.register("exec-1", process=None)
+        for i in range(5):
+            registry.publish_log_entry("exec-1", {"n": i})
+
+        assert [seq for seq, _ in registry.get_buffered_logs("exec-1")] == [3, 4, 5]
+        assert registry.get_buffered_logs("exec-1", after_seq=4) == [(5, {"n": 4})]
+        assert registry.get_buffered_logs("exec-2") is None
+
+    @pytest.mark.asyncio
+    async def test_resume_after_execution_finished(self):
+        registry = ProcessRegistry()
+        registry.register("exec-1", process=None)
+        for i in range(3):
+            await registry.publish_log_entry_async("exec-1", {"n": i})
+        registry.unregister("exec-1")
+
+        # Buffer kept for reconnects; entries after the end are ignored
+        registry.publish_log_entry("exec-1", {"n": 99})
+        assert registry.has_logs("exec-1")
+        items = await _collect(registry, "exec-1", after_seq=1)
+        assert items == [(2, {"n": 1}), (3, {"n": 2}), (None, {"type": "stream_end"})]
+
+    @pytest.mark.asyncio
+    async def test_live_entries_are_not_duplicated(self):
+        registry = ProcessRegistry()
+        registry.register("exec-1", process=None)
+        registry.publish_log_entry("exec-1", {"n": 0})
+
+        consumer = asyncio.create_task(_collect(registry, "exec-1"))
+        await asyncio.sleep(0.01)
+        registry.publish_log_entry("exec-1", {"n": 1})
+        registry.unregister("exec-1")
+
+        assert [seq for seq, _ in await consumer] == [1, 2, None]
+
+    @pytest.mark.asyncio
+    async def test_dropped_entries_are_backfilled(self):
+        registry = ProcessRegistry()
+        registry._subscriber_queue_size = 2
+        registry.register("exec-1", process=None)
+
+        consumer = asyncio.create_task(_collect(registry, "exec-1"))
+        await asyncio.sleep(0.01)
+        for i in range(5):
+            registry.publish_log_entry("exec-1", {"n": i})  # 3 dropped, queue full
+        registry.unregister("exec-1")  # stream_end dropped too
+
+        items = await consumer
+        assert [seq for seq, _ in items] == [1, 2, 3, 4, 5, None]
+        assert items[-1] == (None, {"type": "stream_end"})
+
+    @pytest.mark.asyncio
+    async def test_entries_gone_from_buffer_are_reported_as_gap(self):
+        registry = ProcessRegistry()
+        registry._subscriber_queue_size = 2
+        registry._max_buffer_size = 2
+        registry.register("exec-1", process=None)
+
+        consumer = asyncio.create_task(_collect(registry, "exec-1"))
+        await asyncio.sleep(0.01)
+        for i in range(5):
+            registry.publish_log_entry("exec-1", {"n": i})
+        registry.unregister("exec-1")
+
+        items = await consumer
+        assert items[2] == (None, {"type": "stream_gap", "missed": 1})
+        assert [seq for seq, _ in items] == [1, 2, None, 4, 5, None]
+
+    @pytest.mark.asyncio
+    async def test_idle_stream_yields_keepalive(self):
+        registry = ProcessRegistry()
+        registry.register("exec-1", process=None)
+        stream = registry.iter_logs("exec-1", idle_timeout=0.01)
+        assert await stream.__anext__() is None
+        await stream.aclose()
+        assert registry._log_subscribers["exec-1"] == []
+
+    def test_finished_buffers_are_bounded(self):
+        registry = ProcessRegistry()
+        registry._max_finished_buffers = 1
+        for execution_id in ("exec-1", "exec-2"):
+            registry.register(execution_id, process=None)
+            registry.publish_log_entry(execution_id, {"n": 0})
+            registry.unregister(execution_id)
+
+        assert not registry.has_logs("exec-1")
+        assert registry.has_logs("exec-2")
+
+
+@pytest.mark.unit
+class TestAsyncProcessHandles:
+
+    @pytest.mark.asyncio
+    async def test_status_and_listing(self):
+        registry = ProcessRegistry()
+        process = await _start_sleeper()
+        registry.register("exec-1", process)
+        try:
+            assert registry.get_status("exec-1")["running"] is True
+            assert [e["execution_id"] for e in registry.list_running()] == ["exec-1"]
+        finally:
+            process.kill()
+            await process.wait()
+
+        assert registry.get_status("exec-1")["running"] is False
+        assert registry.cleanup_finished() == 1
+
+    @pytest.mark.asyncio
+    async def test_terminate_does_not_block_event_loop(self):
+        registry = ProcessRegistry()
+        # Ignores SIGINT, so termination must escalate to SIGKILL
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, "-c",
+            "import signal, time; signal.signal(signal.SIGINT, signal.SIG_IGN); time.sleep(30)",
+        )
+        await asyncio.sleep(0.2)
+        registry.register("exec-1", process)
+
+        result = registry.terminate("exec-1", graceful_timeout=0.2)
+        assert result == {"success": True, "returncode": None}
+        assert process.returncode is None  # Returned before the process exited
+
+        returncode = await asyncio.wait_for(process.wait(), timeout=5)
+        assert returncode == -9
+
+    @pytest.mark.asyncio
+    async def test_terminate_finished_process(self):
+        registry = ProcessRegistry()
+        process = await _start_sleeper(0)
+        await process.wait()
+        registry.register("exec-1", process)
+
+        result = registry.terminate("exec-1")
+        assert result == {"success": False, "reason": "already_finished", "returncode": 0}
+
+
+# Leads its own process group and starts a grandchild that ignores SIGINT
+_GROUP_LEADER = (
+    "import subprocess, sys, time; "
+    "child = subprocess.Popen(['sh', '-c', 'trap \"\" INT; sleep 30']); "
+    "print(child.pid, flush=True); time.sleep(30)"
+)
+
+
+def _alive(pid: int) -> bool:
+    """True if pid exists and is not a zombie."""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().rsplit(")", 1)[1].split()[0] != "Z"
+    except FileNotFoundError:
+        return False
+
+
+@pytest.mark.unit
+class TestSupervision:
+
+    @pytest.mark.asyncio
+    async def test_popen_exit_is_reaped_without_blocking(self):
+        registry = ProcessRegistry()
+        process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(0.3)"])
+        registry.register("exec-1", process)
+
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticker = asyncio.create_task(tick())
+        assert await asyncio.wait_for(process_registry.wait_for_exit(process), timeout=5) == 0
+        ticker.cancel()
+
+        assert ticks > 10  # the loop kept running while waiting
+        assert registry.get_status("exec-1")["returncode"] == 0
+        assert registry.list_running() == []
+
+    @pytest.mark.asyncio
+    async def test_popen_terminate_does_not_block_event_loop(self):
+        registry = ProcessRegistry()
+        process = subprocess.Popen([
+            sys.executable, "-c",
+            "import signal, time; signal.signal(signal.SIGINT, signal.SIG_IGN); time.sleep(30)",
+        ])
+        await asyncio.sleep(0.2)
+        registry.register("exec-1", process)
+
+        result = registry.terminate("exec-1", graceful_timeout=0.2)
+        assert result == {"success": True, "returncode": None}
+        assert process.poll() is None  # Returned before the process exited
+
+        assert await asyncio.wait_for(process_registry.wait_for_exit(process), timeout=5) == -9
+        await asyncio.sleep(0.05)
+        assert registry.get_status("exec-1") is None  # Popen entries are dropped once killed
+
+    @pytest.mark.asyncio
+    async def test_terminate_kills_whole_process_group(self):
+        registry = ProcessRegistry()
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, "-c", _GROUP_LEADER,
+            stdout=asyncio.subprocess.PIPE, start_new_session=True,
+        )
+        grandchild = int(await asyncio.wait_for(process.stdout.readline(), timeout=5))
+        registry.register("exec-1", process)
+
+        assert registry.terminate("exec-1", graceful_timeout=2)["success"] is True
+        await asyncio.wait_for(process.wait(), timeout=5)
+        await asyncio.sleep(0.2)
+
+        # The CLI exited on SIGINT; the grandchild ignoring it was killed with the group
+        assert process.returncode != -9
+        assert not _alive(grandchild)
+
+    @pytest.mark.asyncio
+    async def test_terminate_all(self):
+        registry = ProcessRegistry()
+        processes = [await _start_sleeper() for _ in range(3)]
+        for i, process in enumerate(processes):
+            registry.register(f"exec-{i}", process)
+        registry.register("exec-idle", process=None)
+        await asyncio.sleep(0.3)  # let the interpreters start up
+
+        results = registry.terminate_all(graceful_timeout=1)
+
+        assert set(results) == {"exec-0", "exec-1", "exec-2"}
+        assert all(result["success"] for result in results.values())
+        codes = await asyncio.wait_for(asyncio.gather(*(p.wait() for p in processes)), timeout=5)
+        assert codes == [-2, -2, -2]  # all got SIGINT at once, none needed SIGKILL
+
+    def test_signal_process_raises_for_finished_popen(self):
+        process = subprocess.Popen([sys.executable, "-c", "pass"])
+        process.wait()
+        with pytest.raises(ProcessLookupError):
+            process_registry.signal_process(process, 2)
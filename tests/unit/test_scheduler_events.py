@@ -0,0 +1,105 @@
+"""
+Unit tests for backend-to-scheduler notifications (SCHED-ASYNC-002, SCHED-SYNC-001).
+
+Module: src/backend/db/scheduler_events.py
+"""
+
+import asyncio
+import json
+import os
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from database import db, init_database
+from db import scheduler_events
+from db.scheduler_events import (
+    EXECUTION_EVENTS_CHANNEL,
+    SCHEDULE_EVENTS_CHANNEL,
+    SchedulerEventPublisher,
+)
+
+
+@pytest.fixture
+def publisher():
+    publisher = SchedulerEventPublisher("redis://unused")
+    publisher._redis = MagicMock()
+    with patch.object(scheduler_events, "_publisher", publisher):
+        yield publisher
+
+
+def _published(publisher):
+    return [(c.args[0], json.loads(c.args[1])) for c in publisher._redis.publish.call_args_list]
+
+
+@pytest.mark.unit
+class TestSchedulerEventPublisher:
+
+    def test_publishes_completion(self):
+        publisher = SchedulerEventPublisher("redis://unused")
+        publisher._redis = MagicMock()
+
+        assert publisher.publish_completed("exec-1", "success") is True
+        channel, payload = publisher._redis.publish.call_args.args
+        assert channel == EXECUTION_EVENTS_CHANNEL
+        assert json.loads(payload) == {"execution_id": "exec-1", "status": "success"}
+
+    def test_publishes_schedule_change(self):
+        publisher = SchedulerEventPublisher("redis://unused")
+        publisher._redis = MagicMock()
+
+        assert publisher.publish_schedules_changed("sched-1") is True
+        channel, payload = publisher._redis.publish.call_args.args
+        assert channel == SCHEDULE_EVENTS_CHANNEL
+        assert json.loads(payload) == {"schedule_id": "sched-1"}
+
+    def test_failure_is_swallowed_and_backs_off(self):
+        publisher = SchedulerEventPublisher("redis://unused")
+        publisher._redis = MagicMock()
+        publisher._redis.publish.side_effect = ConnectionError("redis down")
+
+        assert publisher.publish_completed("exec-1", "failed") is False
+        # Subsequent publishes skip Redis until the backoff expires
+        assert publisher.publish_completed("exec-2", "failed") is False
+        assert publisher._redis.publish.call_count == 1
+
+    def test_channels_match_scheduler(self):
+        scheduler_src = os.path.join(
+            os.path.dirname(__file__), '..', '..', 'src', 'scheduler', 'completion.py'
+        )
+        with open(scheduler_src) as f:
+            source = f.read()
+        assert f'EXECUTION_EVENTS_CHANNEL = "{EXECUTION_EVENTS_CHANNEL}"' in source
+        assert f'SCHEDULE_EVENTS_CHANNEL = "{SCHEDULE_EVENTS_CHANNEL}"' in source
+
+
+@pytest.mark.unit
+class TestPublishing:
+
+    @pytest.mark.asyncio
+    async def test_publish_runs_off_the_event_loop(self, publisher):
+        threads = []
+        publisher._redis.publish.side_effect = lambda *args: threads.append(threading.get_ident())
+
+        assert scheduler_events.publish_execution_completed("exec-1", "success") is True
+        for _ in range(100):
+            if threads:
+                break
+            await asyncio.sleep(0.01)
+        assert threads and threads[0] != threading.get_ident()
+
+    def test_only_terminal_schedule_executions_are_published(self, publisher):
+        # Second pass runs the column migrations on the freshly created tables
+        init_database()
+        scheduled = db.create_schedule_execution("sched-1", "alpha", "run", triggered_by="schedule")
+        chat = db.create_task_execution("alpha", "hi", triggered_by="chat")
+
+        db.update_execution_status(scheduled.id, "running")
+        db.update_execution_status(chat.id, "success")
+        assert _published(publisher) == []
+
+        db.update_execution_status(scheduled.id, "success")
+        assert _published(publisher) == [
+            (EXECUTION_EVENTS_CHANNEL, {"execution_id": scheduled.id, "status": "success"})
+        ]
@@ -0,0 +1,132 @@
+"""
+Unit tests for the Redis slot engine (CAPACITY-001).
+
+Runs the Lua scripts against fakeredis (with Lua support) and checks that
+concurrent acquires never exceed capacity and that fleet queries are a
+single pipelined round-trip.
+
+Module: src/backend/services/slot_service.py
+"""
+
+import asyncio
+import importlib.util
+import os
+import time
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+pytest.importorskip("lupa")
+
+_BACKEND = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), '..', '..', 'src', 'backend'
+))
+
+_spec = importlib.util.spec_from_file_location(
+    "slot_service_under_test",
+    os.path.join(_BACKEND, "services", "slot_service.py"),
+)
+slot_service = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(slot_service)
+SlotService = slot_service.SlotService
+
+
+@pytest.fixture
+def service():
+    return SlotService(redis_client=fakeredis.FakeAsyncRedis(decode_responses=True))
+
+
+@pytest.mark.unit
+class TestAcquireRelease:
+
+    @pytest.mark.asyncio
+    async def test_acquire_until_capacity(self, service):
+        assert await service.acquire_slot("alpha", "e1", 2, "first") is True
+        assert await service.acquire_slot("alpha", "e2", 2) is True
+        assert await service.acquire_slot("alpha", "e3", 2) is False
+        assert await service.get_active_count("alpha") == 2
+
+        metadata = await service.redis.hgetall("agent:slot:alpha:e1")
+        assert metadata["slot_number"] == "1"
+        assert metadata["message_preview"] == "first"
+        assert 0 < await service.redis.ttl("agent:slot:alpha:e1") <= 900 + slot_service.SLOT_TTL_BUFFER
+
+    @pytest.mark.asyncio
+    async def test_concurrent_acquires_never_exceed_capacity(self, service):
+        results = await asyncio.gather(*(
+            service.acquire_slot("alpha", f"e{i}", 3) for i in range(25)
+        ))
+        assert sum(results) == 3
+        assert await service.get_active_count("alpha") == 3
+
+    @pytest.mark.asyncio
+    async def test_release_frees_slot_and_metadata(self, service):
+        await service.acquire_slot("alpha", "e1", 1)
+        await service.release_slot("alpha", "e1")
+
+        assert await service.get_active_count("alpha") == 0
+        assert await service.redis.exists("agent:slot:alpha:e1") == 0
+        assert await service.acquire_slot("alpha", "e2", 1) is True
+
+    @pytest.mark.asyncio
+    async def test_acquire_cleans_stale_slots(self, service):
+        stale_started = time.time() - 10_000
+        await service.redis.zadd("agent:slots:alpha", {"stale": stale_started})
+        await service.redis.hset("agent:slot:alpha:stale", mapping={"slot_number": "1"})
+
+        assert await service.acquire_slot("alpha", "fresh", 1, timeout_seconds=60) is True
+        assert await service.redis.zrange("agent:slots:alpha", 0, -1) == ["fresh"]
+        assert await service.redis.exists("agent:slot:alpha:stale") == 0
+
+    @pytest.mark.asyncio
+    async def test_cleanup_and_force_clear(self, service):
+        await service.redis.zadd("agent:slots:alpha", {"old": time.time() - 10_000})
+        await service.acquire_slot("beta", "b1", 3)
+        await service.acquire_slot("beta", "b2", 3)
+
+        assert await service.cleanup_stale_slots() == 1
+        assert await service.force_clear_slots("beta") == 2
+        assert await service.redis.keys("agent:*") == []
+
+
+@pytest.mark.unit
+class TestSlotQueries:
+
+    @pytest.mark.asyncio
+    async def test_slot_state(self, service):
+        await service.acquire_slot("alpha", "e1", 3, "hello")
+        await service.acquire_slot("alpha", "e2", 3, "world")
+
+        state = await service.get_slot_state("alpha", 3)
+        assert state.active_slots == 2
+        assert state.available_slots == 1
+        assert [s.execution_id for s in state.slots] == ["e1", "e2"]
+        assert [s.message_preview for s in state.slots] == ["hello", "world"]
+
+        empty = await service.get_slot_state("nobody", 3)
+        assert empty.active_slots == 0 and empty.slots == []
+
+    @pytest.mark.asyncio
+    async def test_fleet_slot_state_is_one_round_trip(self, service, monkeypatch):
+        for i in range(3):
+            await service.acquire_slot("alpha", f"a{i}", 5)
+        await service.acquire_slot("beta", "b0", 5)
+
+        round_trips = 0
+        original = service.redis.connection_pool.get_connection
+
+        async def counting_get_connection(*args, **kwargs):
+            nonlocal round_trips
+            round_trips += 1
+            return await original(*args, **kwargs)
+
+        monkeypatch.setattr(service.redis.connection_pool, "get_connection", counting_get_connection)
+        fleet = await service.get_fleet_slot_state({"alpha": 5, "beta": 2, "gamma": 1})
+
+        assert fleet == {
+            "alpha": {"max": 5, "active": 3},
+            "beta": {"max": 2, "active": 1},
+            "gamma": {"max": 1, "active": 0},
+        }
+        assert round_trips == 1
+        assert await service.get_fleet_slot_state({}) == {}
@@ -0,0 +1,397 @@
+"""
+Unit tests for the WebSocket broadcast managers (WS-FANOUT-001).
+
+Covers per-connection writer queues: ordering, drop-oldest and coalescing
+for slow clients, eviction of dead and stalled sockets, one serialization
+per filtered broadcast, and a 1k-client load test where stalled clients
+do not delay fast ones. Also the agent-indexed routing of /ws/events
+(WS-ROUTE-001): subscriptions, access changes and index consistency.
+
+Module: src/backend/services/websocket_manager.py
+"""
+
+import asyncio
+import json
+import os
+import random
+import sys
+
+import pytest
+
+_BACKEND = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), '..', '..', 'src', 'backend'
+))
+if _BACKEND not in sys.path:
+    sys.path.insert(0, _BACKEND)
+
+from services import websocket_manager as ws_module  # noqa: E402
+from services.websocket_manager import (  # noqa: E402
+    EVICT_CLOSE_CODE,
+    ConnectionManager,
+    FilteredWebSocketManager,
+)
+
+
+class FakeWebSocket:
+    """Records sent frames; can be slow, stalled or broken."""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False, stall: bool = False):
+        self.delay = delay
+        self.fail = fail
+        self.stall = stall
+        self.sent = []
+        self.closed_with = None
+        self.accepted = False
+
+    async def accept(self):
+        self.accepted = True
+
+    async def send_text(self, message: str):
+        if self.fail:
+            raise RuntimeError("connection reset")
+        if self.stall:
+            await asyncio.Event().wait()
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.sent.append(message)
+
+    async def close(self, code: int = 1000):
+        self.closed_with = code
+
+
+async def _settle():
+    """Let the writer tasks drain their queues."""
+    await asyncio.sleep(0.02)
+
+
+@pytest.mark.unit
+class TestConnectionManager:
+
+    @pytest.mark.asyncio
+    async def test_broadcast_delivers_in_order(self):
+        manager = ConnectionManager()
+        sockets = [FakeWebSocket() for _ in range(3)]
+        for ws in sockets:
+            await manager.connect(ws)
+
+        for i in range(5):
+            await manager.broadcast(f"event-{i}")
+        manager.send(sockets[0], "pong")
+        await _settle()
+
+        assert all(ws.accepted for ws in sockets)
+        assert sockets[0].sent == [f"event-{i}" for i in range(5)] + ["pong"]
+        assert sockets[1].sent == [f"event-{i}" for i in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_connect_without_accept(self):
+        manager = ConnectionManager()
+        ws = FakeWebSocket()
+        await manager.connect(ws, accept=False)
+        assert not ws.accepted and ws in manager.clients
+
+    @pytest.mark.asyncio
+    async def test_slow_client_drops_oldest(self):
+        manager = ConnectionManager(queue_size=3)
+        slow = FakeWebSocket(delay=0.05)
+        await manager.connect(slow)
+
+        await manager.broadcast("event-0")
+        await _settle()  # "event-0" is now being sent
+        for i in range(1, 10):
+            await manager.broadcast(f"event-{i}")
+        client = manager.clients[slow]
+        assert client.pending <= 3
+
+        await asyncio.sleep(0.3)
+        # The in-flight event, then the newest three
+        assert slow.sent == ["event-0", "event-7", "event-8", "event-9"]
+        assert client.dropped == 6
+
+    @pytest.mark.asyncio
+    async def test_coalesce_replaces_queued_event(self):
+        manager = ConnectionManager()
+        slow = FakeWebSocket(delay=0.05)
+        await manager.connect(slow)
+
+        await manager.broadcast("first")
+        await _settle()  # "first" is now being sent
+        for status in ("degraded", "unhealthy", "healthy"):
+            await manager.broadcast(f"alpha:{status}", coalesce_key="health:alpha")
+        await manager.broadcast("beta:healthy", coalesce_key="health:beta")
+        await manager.broadcast("other")
+
+        await asyncio.sleep(0.3)
+        assert slow.sent == ["first", "alpha:healthy", "beta:healthy", "other"]
+
+    @pytest.mark.asyncio
+    async def test_failed_socket_is_evicted(self):
+        manager = ConnectionManager()
+        dead, alive = FakeWebSocket(fail=True), FakeWebSocket()
+        await manager.connect(dead)
+        await manager.connect(alive)
+
+        await manager.broadcast("event")
+        await _settle()
+
+        assert dead not in manager.clients
+        assert dead.closed_with == EVICT_CLOSE_CODE
+        assert alive in manager.clients and alive.sent == ["event"]
+
+    @pytest.mark.asyncio
+    async def test_stalled_socket_is_evicted(self):
+        manager = ConnectionManager(send_timeout=0.05)
+        stalled = FakeWebSocket(stall=True)
+        await manager.connect(stalled)
+
+        await manager.broadcast("event")
+        await asyncio.sleep(0.2)
+
+        assert stalled not in manager.clients
+        assert stalled.closed_with == EVICT_CLOSE_CODE
+
+    @pytest.mark.asyncio
+    async def test_disconnect_stops_writer(self):
+        manager = ConnectionManager()
+        ws = FakeWebSocket()
+        await manager.connect(ws)
+        task = manager.clients[ws]._task
+
+        manager.disconnect(ws)
+        manager.disconnect(ws)  # idempotent
+        await _settle()
+        await manager.broadcast("event")
+
+        assert task.cancelled()
+        assert ws.sent == []
+
+
+@pytest.mark.unit
+class TestFilteredWebSocketManager:
+
+    @pytest.mark.asyncio
+    async def test_filters_and_serializes_once(self, monkeypatch):
+        manager = FilteredWebSocketManager()
+        admin, owner, other = FakeWebSocket(), FakeWebSocket(), FakeWebSocket()
+        await manager.connect(admin, "admin@x", True, [])
+        await manager.connect(owner, "owner@x", False, ["alpha"])
+        await manager.connect(other, "other@x", False, ["beta"])
+
+        calls = []
+        original = ws_module.serialize_event
+        monkeypatch.setattr(ws_module, "serialize_event", lambda e: calls.append(e) or original(e))
+
+        event = {"type": "agent_activity", "agent_name": "alpha", "details": {"tool": "Read"}}
+        await manager.broadcast_filtered(event)
+        await manager.broadcast_filtered({"type": "no_agent"})
+        await manager.broadcast_filtered({"type": "agent_started", "name": "gamma"})
+        await _settle()
+
+        # Once per delivered event, not once per recipient
+        assert len(calls) == 2
+        assert [json.loads(m) for m in admin.sent] == [event, {"type": "agent_started", "name": "gamma"}]
+        assert [json.loads(m) for m in owner.sent] == [event]
+        assert other.sent == []
+
+    @pytest.mark.asyncio
+    async def test_refresh_and_eviction(self):
+        manager = FilteredWebSocketManager()
+        ws, dead = FakeWebSocket(), FakeWebSocket(fail=True)
+        await manager.connect(ws, "u@x", False, [])
+        await manager.connect(dead, "d@x", False, ["alpha"])
+
+        manager.update_accessible_agents(ws, ["alpha"])
+        manager.send(ws, "pong")
+        await manager.broadcast_filtered({"agent_name": "alpha"})
+        await _settle()
+
+        assert ws.sent == ["pong", '{"agent_name":"alpha"}']
+        assert dead not in manager.connections
+
+
+def _received(ws) -> list:
+    return [json.loads(m).get("seq", json.loads(m).get("type")) for m in ws.sent]
+
+
+@pytest.mark.unit
+class TestSubscriptionIndex:
+
+    @pytest.mark.asyncio
+    async def test_agent_and_event_type_subscriptions(self):
+        manager = FilteredWebSocketManager()
+        admin, admin_narrow, user, user_narrow, typed = (FakeWebSocket() for _ in range(5))
+        await manager.connect(admin, "admin@x", True, [])
+        await manager.connect(admin_narrow, "admin@x", True, [], agents=["beta"])
+        await manager.connect(user, "u@x", False, ["alpha", "beta"])
+        # Subscribing to an agent the user cannot access grants nothing
+        await manager.connect(user_narrow, "u@x", False, ["alpha", "beta"], agents=["beta", "secret"])
+        await manager.connect(typed, "u@x", False, ["alpha", "beta"], event_types=["agent_started"])
+
+        await manager.broadcast_filtered({"type": "agent_activity", "agent_name": "alpha", "seq": 1})
+        await manager.broadcast_filtered({"event": "agent_started", "name": "beta", "seq": 2})
+        await manager.broadcast_filtered({"type": "agent_activity", "agent_name": "secret", "seq": 3})
+        await _settle()
+
+        assert _received(admin) == [1, 2, 3]
+        assert _received(admin_narrow) == [2]
+        assert _received(user) == [1, 2]
+        assert _received(user_narrow) == [2]
+        assert _received(typed) == [2]
+
+        assert manager.subscribe(user_narrow, agents=None) == ["alpha", "beta"]
+        assert manager.subscribe(admin_narrow, agents=None) is None
+        await manager.broadcast_filtered({"type": "agent_activity", "agent_name": "alpha", "seq": 4})
+        await _settle()
+        assert _received(user_narrow) == [2, 4]
+        assert _received(admin_narrow) == [2, 4]
+
+    @pytest.mark.asyncio
+    async def test_access_changes(self):
+        manager = FilteredWebSocketManager()
+        owner, friend, narrowed = FakeWebSocket(), FakeWebSocket(), FakeWebSocket()
+        await manager.connect(owner, "Owner@X", False, ["alpha"])
+        await manager.connect(friend, "friend@x", False, [])
+        await manager.connect(narrowed, "owner@x", False, ["alpha"], agents=["alpha"])
+
+        manager.grant_agent("friend@X", "alpha")  # shared (case-insensitive email)
+        manager.grant_agent("owner@x", "gamma")  # owner created an agent
+        await manager.broadcast_filtered({"agent_name": "alpha", "seq": 1})
+        await manager.broadcast_filtered({"agent_name": "gamma", "seq": 2})
+
+        manager.revoke_agent("friend@x", "alpha")  # unshared
+        await manager.broadcast_filtered({"agent_name": "alpha", "seq": 3})
+
+        manager.rename_agent("alpha", "alpha2")
+        await manager.broadcast_filtered({"type": "agent_renamed", "name": "alpha2", "seq": 4})
+        await manager.broadcast_filtered({"agent_name": "alpha", "seq": 5})
+
+        manager.remove_agent("gamma")  # deleted
+        await manager.broadcast_filtered({"agent_name": "gamma", "seq": 6})
+        await _settle()
+
+        assert _received(owner) == [1, 2, 3, 4]
+        assert _received(friend) == [1]
+        assert _received(narrowed) == [1, 3, 4]
+        assert manager.connections[narrowed]["agents"] == {"alpha2"}
+        assert "alpha" not in manager._by_agent and "gamma" not in manager._by_agent
+
+    @pytest.mark.asyncio
+    async def test_index_matches_full_scan(self):
+        """Random connects, access changes and subscriptions keep the index exact."""
+        rng = random.Random(7)
+        agents = [f"agent-{i}" for i in range(8)]
+        emails = [f"user{i}@x" for i in range(4)]
+        manager = FilteredWebSocketManager()
+        sockets = []
+
+        def maybe(items):
+            return rng.sample(items, rng.randint(0, min(3, len(items)))) if rng.random() < 0.4 else None
+
+        for _ in range(400):
+            op = rng.randrange(8)
+            if op == 0 or not sockets:
+                ws = FakeWebSocket()
+                await manager.connect(
+                    ws, rng.choice(emails), rng.random() < 0.2, rng.sample(agents, 3),
+                    agents=maybe(agents), event_types=maybe(["a", "b"]),
+                )
+                sockets.append(ws)
+            elif op == 1:
+                manager.disconnect(sockets.pop(rng.randrange(len(sockets))))
+            elif op == 2:
+                manager.grant_agent(rng.choice(emails), rng.choice(agents))
+            elif op == 3:
+                manager.revoke_agent(rng.choice(emails), rng.choice(agents))
+            elif op == 4:
+                manager.update_accessible_agents(rng.choice(sockets), rng.sample(agents, 2))
+            elif op == 5:
+                manager.subscribe(rng.choice(sockets), agents=maybe(agents), event_types=maybe(["a", "b"]))
+            elif op == 6:
+                old = rng.choice(agents)
+                new = f"{old}-r"
+                manager.rename_agent(old, new)
+                agents[agents.index(old)] = new
+            else:
+                manager.remove_agent(rng.choice(agents))
+
+            for agent_name in agents:
+                for event_type in ("a", "b"):
+                    expected = {
+                        ws for ws, info in manager.connections.items()
+                        if (info["is_admin"] or agent_name in info["accessible_agents"])
+                        and (info["agents"] is None or agent_name in info["agents"])
+                        and (info["event_types"] is None or event_type in info["event_types"])
+                    }
+                    indexed = {
+                        ws for ws in manager._all_agents | manager._by_agent.get(agent_name, set())
+                        if manager.connections[ws]["event_types"] is None
+                        or event_type in manager.connections[ws]["event_types"]
+                    }
+                    assert indexed == expected
+
+        for ws in sockets:
+            manager.disconnect(ws)
+        assert not manager._by_agent and not manager._all_agents and not manager._by_email
+
+    @pytest.mark.asyncio
+    async def test_fanout_cost_follows_subscribers(self):
+        """An event is only looked at by the connections that can see its agent."""
+        manager = FilteredWebSocketManager()
+        sockets = [FakeWebSocket() for _ in range(5000)]
+        for i, ws in enumerate(sockets):
+            await manager.connect(ws, f"user{i}@x", False, [f"agent-{i}"])
+
+        looked_at = []
+        for info in manager.connections.values():
+            client = info["client"]
+            client.enqueue = lambda message, key=None, ws=client.websocket: looked_at.append(ws)
+
+        for i in range(1000):
+            await manager.broadcast_filtered({"agent_name": f"agent-{i}", "seq": i})
+
+        assert looked_at == sockets[:1000]
+
+        for ws in sockets:
+            manager.disconnect(ws)
+
+
+@pytest.mark.unit
+class TestLoad:
+
+    @pytest.mark.asyncio
+    async def test_thousand_clients_with_slow_consumers(self):
+        """1,000 clients, 5% stalled and 1% dead: broadcasts never wait on sockets."""
+        manager = ConnectionManager(queue_size=64, send_timeout=60.0)
+        fast = [FakeWebSocket() for _ in range(940)]
+        slow = [FakeWebSocket(stall=True) for _ in range(50)]
+        dead = [FakeWebSocket(fail=True) for _ in range(10)]
+        for ws in fast + slow + dead:
+            await manager.connect(ws)
+
+        events = 200
+
+        async def broadcast_all():
+            for i in range(events):
+                await manager.broadcast(json.dumps({"type": "agent_activity", "seq": i}))
+                await asyncio.sleep(0)  # events arrive over time, not in one tick
+
+        async def fast_clients_caught_up():
+            while any(len(ws.sent) < events for ws in fast):
+                await asyncio.sleep(0.005)
+
+        # Awaiting a stalled socket anywhere on the broadcast path would hang here
+        await asyncio.wait_for(broadcast_all(), timeout=5)
+        await asyncio.wait_for(fast_clients_caught_up(), timeout=5)
+
+        assert all([json.loads(m)["seq"] for m in ws.sent] == list(range(events)) for ws in fast)
+        assert all(ws not in manager.clients for ws in dead)
+        for ws in slow:
+            client = manager.clients[ws]
+            assert ws.sent == []
+            assert client.pending <= 64 and client.dropped > 0
+
+        for ws in fast + slow:
+            manager.disconnect(ws)
+
+        for ws in list(manager.clients):
+            manager.disconnect(ws)